@@ -0,0 +1,107 @@
+"""Benchmark comparing the growth of the Celery result backend over a
+long simulated run with three result policies: all task results are
+stored, the transfer tasks ignore their results, and additionally the
+transaction resubmission results of the blockchain utilities are
+deleted once the confirmation of their transfers is completed.
+
+Usage: python3 tests/benchmarks/benchmark_result_storage.py [hours]
+
+"""
+import contextlib
+import enum
+import pathlib
+import sqlite3
+import sys
+import tempfile
+import uuid
+
+import celery  # type: ignore
+import celery.states  # type: ignore
+from celery.backends.database import DatabaseBackend  # type: ignore
+
+_DEFAULT_NUMBER_HOURS = 720
+
+_TRANSFERS_PER_HOUR = 50
+
+_TRANSFER_TASKS_PER_TRANSFER = 2
+
+_CONFIRMATION_HOURS = 1
+
+_REPORT_INTERVAL_HOURS = 120
+
+
+class _ResultPolicy(enum.Enum):
+    STORE_ALL = 'all stored'
+    IGNORE_TRANSFER_RESULTS = 'transfers ignored'
+    FORGET_CONFIRMED_RESULTS = 'confirmed forgotten'
+
+
+def _store_task_result(backend):
+    task_id = str(uuid.uuid4())
+    backend.store_result(task_id, True, celery.states.SUCCESS)
+    return task_id
+
+
+def _clear_task_results(database_path):
+    with contextlib.closing(sqlite3.connect(database_path)) as connection:
+        with connection:
+            connection.execute('DELETE FROM celery_taskmeta')
+
+
+def _measure_task_results(database_path):
+    with contextlib.closing(sqlite3.connect(database_path)) as connection:
+        number_results, stored_bytes = connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(LENGTH(result)), 0) + '
+            'COALESCE(SUM(LENGTH(task_id)), 0) '
+            'FROM celery_taskmeta').fetchone()
+    return number_results, stored_bytes
+
+
+def _simulate(database_path, number_hours, result_policy):
+    app = celery.Celery('benchmark')
+    app.conf.result_expires = None
+    backend = DatabaseBackend(app=app, url=f'sqlite:///{database_path}')
+    # Celery creates the result tables only once per process (when
+    # opening the first session), so all simulations share the same
+    # database
+    backend.ResultSession().close()
+    _clear_task_results(database_path)
+    # Resubmission task IDs by the hour of their submission
+    pending_submissions: dict[int, list[str]] = {}
+    measurements = []
+    for hour in range(1, number_hours + 1):
+        if result_policy is _ResultPolicy.STORE_ALL:
+            for _ in range(_TRANSFERS_PER_HOUR * _TRANSFER_TASKS_PER_TRANSFER):
+                _store_task_result(backend)
+        pending_submissions[hour] = [
+            _store_task_result(backend) for _ in range(_TRANSFERS_PER_HOUR)
+        ]
+        confirmed_submissions = pending_submissions.pop(
+            hour - _CONFIRMATION_HOURS, [])
+        if result_policy is _ResultPolicy.FORGET_CONFIRMED_RESULTS:
+            for task_id in confirmed_submissions:
+                backend.forget(task_id)
+        if hour % _REPORT_INTERVAL_HOURS == 0 or hour == number_hours:
+            measurements.append((hour, *_measure_task_results(database_path)))
+    return measurements
+
+
+def _main(number_hours):
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = pathlib.Path(directory) / 'results.db'
+        all_measurements = [
+            _simulate(database_path, number_hours, result_policy)
+            for result_policy in _ResultPolicy
+        ]
+    print(f'simulated hours: {number_hours}')
+    print(f'transfers/hour:  {_TRANSFERS_PER_HOUR}')
+    print('hour' + ''.join(f'  {result_policy.value:>19} (results, KiB)'
+                           for result_policy in _ResultPolicy))
+    for measurements in zip(*all_measurements):
+        print(f'{measurements[0][0]:>4}' +
+              ''.join(f'  {measurement[1]:>19} {measurement[2] / 1024:>14.1f}'
+                      for measurement in measurements))
+
+
+if __name__ == '__main__':
+    _main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_NUMBER_HOURS)
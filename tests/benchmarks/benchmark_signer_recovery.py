@@ -0,0 +1,88 @@
+"""CPU benchmark comparing the sequential and the parallel recovery of
+the signers of Vision transferTo signatures.
+
+Usage: python3 tests/benchmarks/benchmark_signer_recovery.py [number]
+
+"""
+import sys
+import time
+
+import eth_account.messages
+import web3
+
+from vision.validatornode.blockchains.ethereum import \
+    _TRANSFER_TO_MESSAGE_TYPES
+from vision.validatornode.blockchains.ethereum import _recover_signer_address
+from vision.validatornode.blockchains.ethereum import \
+    _recover_signer_addresses_in_parallel
+
+_DEFAULT_NUMBER_SIGNATURES = 2000
+
+_NUMBER_SIGNERS = 10
+
+_DOMAIN_DATA = {
+    'name': 'Vision',
+    'version': '1',
+    'chainId': 1,
+    'verifyingContract': '0x8960647eC8CAd5fEBc919b255C9F739f17D91e8B'
+}
+
+
+def _create_message_data(validator_nonce):
+    return {
+        'request': {
+            'sourceBlockchainId': 0,
+            'sourceTransferId': validator_nonce,
+            'sourceTransactionId': '0x' + 64 * 'a',
+            'sender': '0x977E8f4ee5d2c6DF05941A5e3A54A808f87edDE4',
+            'recipient': '0x977E8f4ee5d2c6DF05941A5e3A54A808f87edDE4',
+            'sourceToken': '0x6308bBEA49dB0AE3461C87545857216b2F5Ce992',
+            'destinationToken': '0x6308bBEA49dB0AE3461C87545857216b2F5Ce992',
+            'amount': 10**18,
+            'nonce': validator_nonce
+        },
+        'destinationBlockchainId': 1,
+        'visionHub': '0xA7CD6BE13D729f371064b3eC933a4015D4B85Daa',
+        'visionForwarder': _DOMAIN_DATA['verifyingContract'],
+        'visionToken': '0x7C17b7A1B2128F97522b31Ada5fEeF26ff9dE38c'
+    }
+
+
+def _main(number_signatures):
+    accounts = [web3.Account.create() for _ in range(_NUMBER_SIGNERS)]
+    signable_messages = []
+    signatures = []
+    for i in range(number_signatures):
+        message_data = _create_message_data(i)
+        signable_messages.append(
+            eth_account.messages.encode_typed_data(_DOMAIN_DATA,
+                                                   _TRANSFER_TO_MESSAGE_TYPES,
+                                                   message_data))
+        signed_message = web3.Account.sign_typed_data(
+            accounts[i % _NUMBER_SIGNERS].key, _DOMAIN_DATA,
+            _TRANSFER_TO_MESSAGE_TYPES, message_data)
+        signatures.append(signed_message.signature.to_0x_hex())
+
+    start_time = time.perf_counter()
+    sequential_results = list(
+        map(_recover_signer_address, signable_messages, signatures))
+    sequential_time = time.perf_counter() - start_time
+
+    # Warm up the process pool before measuring
+    _recover_signer_addresses_in_parallel(signable_messages[:1],
+                                          signatures[:1])
+    start_time = time.perf_counter()
+    parallel_results = _recover_signer_addresses_in_parallel(
+        signable_messages, signatures)
+    parallel_time = time.perf_counter() - start_time
+
+    assert parallel_results == sequential_results
+    print(f'signatures: {number_signatures}')
+    print(f'sequential: {sequential_time:.3f}s')
+    print(f'parallel:   {parallel_time:.3f}s')
+    print(f'speedup:    {sequential_time / parallel_time:.2f}x')
+
+
+if __name__ == '__main__':
+    _main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_NUMBER_SIGNATURES)
@@ -30,6 +30,8 @@ _BLOCK_NUMBER = 8130014
 
 _DESTINATION_TRANSFER_ID = 9372
 
+_GAS_USED = 187315
+
 
 @pytest.fixture(scope='module')
 @unittest.mock.patch(
@@ -97,7 +99,8 @@ def test_get_transfer_to_submission_status_not_completed(
 @unittest.mock.patch.object(
     BlockchainClient, '_read_transfer_to_transaction_data',
     return_value=BlockchainClient._TransferToTransactionDataResponse(
-        _BLOCK_NUMBER, destination_transfer_id=_DESTINATION_TRANSFER_ID))
+        _BLOCK_NUMBER, destination_transfer_id=_DESTINATION_TRANSFER_ID,
+        gas_used=_GAS_USED))
 @unittest.mock.patch.object(BlockchainClient, 'get_utilities')
 def test_get_transfer_to_submission_status_completed(
         mock_get_utilities, mock_read_transfer_to_transaction_data,
@@ -114,6 +117,7 @@ def test_get_transfer_to_submission_status_completed(
     if transaction_status is TransactionStatus.CONFIRMED:
         assert (status_response.destination_transfer_id ==
                 _DESTINATION_TRANSFER_ID)
+        assert status_response.gas_used == _GAS_USED
 
 
 @unittest.mock.patch.object(BlockchainClient, 'get_utilities')
@@ -126,3 +130,64 @@ def test_get_transfer_to_submission_status_error(mock_get_error_class,
         BlockchainUtilitiesError('')
     with pytest.raises(UnresolvableTransferToSubmissionError):
         blockchain_client.get_transfer_to_submission_status(uuid.uuid4())
+
+
+@unittest.mock.patch.object(
+    BlockchainClient, '_read_transfer_to_transaction_data', side_effect=[
+        BlockchainClient._TransferToTransactionDataResponse(
+            _BLOCK_NUMBER, destination_transfer_id=_DESTINATION_TRANSFER_ID),
+        BlockchainClientError('')
+    ])
+@unittest.mock.patch.object(BlockchainClient, 'get_utilities')
+@unittest.mock.patch.object(BlockchainClient, 'get_error_class',
+                            return_value=BlockchainClientError)
+def test_get_transfer_to_submission_statuses_correct(
+        mock_get_error_class, mock_get_utilities,
+        mock_read_transfer_to_transaction_data, blockchain_client):
+    internal_transaction_ids = [uuid.uuid4() for _ in range(4)]
+    mock_get_utilities().get_transaction_submission_status.side_effect = [
+        BlockchainUtilities.TransactionSubmissionStatusResponse(False),
+        BlockchainUtilities.TransactionSubmissionStatusResponse(
+            True, TransactionStatus.CONFIRMED, _TRANSACTION_ID),
+        BlockchainUtilitiesError(''),
+        BlockchainUtilities.TransactionSubmissionStatusResponse(
+            True, TransactionStatus.CONFIRMED, _TRANSACTION_ID)
+    ]
+
+    status_responses = blockchain_client.get_transfer_to_submission_statuses(
+        internal_transaction_ids)
+
+    assert status_responses == {
+        internal_transaction_ids[0]: BlockchainClient.
+        TransferToSubmissionStatusResponse(False),
+        internal_transaction_ids[1]: BlockchainClient.
+        TransferToSubmissionStatusResponse(
+            True, transaction_status=TransactionStatus.CONFIRMED,
+            transaction_id=_TRANSACTION_ID, block_number=_BLOCK_NUMBER,
+            destination_transfer_id=_DESTINATION_TRANSFER_ID),
+        internal_transaction_ids[2]: None
+    }
+    # The status which cannot be retrieved does not affect the others
+    assert mock_read_transfer_to_transaction_data.call_count == 2
+
+
+def test_prefetch_transfer_to_transaction_data_correct(blockchain_client):
+    assert blockchain_client.prefetch_transfer_to_transaction_data()
+
+
+@unittest.mock.patch.object(BlockchainClient,
+                            'recover_transfer_to_signer_address')
+def test_recover_transfer_to_signer_addresses_correct(
+        mock_recover_transfer_to_signer_address, blockchain_client):
+    signer_address = '0x977E8f4ee5d2c6DF05941A5e3A54A808f87edDE4'
+    mock_recover_transfer_to_signer_address.side_effect = [
+        signer_address,
+        BlockchainClientError(''), signer_address
+    ]
+    requests = [unittest.mock.MagicMock() for _ in range(3)]
+
+    signer_addresses = \
+        blockchain_client.recover_transfer_to_signer_addresses(requests)
+
+    assert signer_addresses == [signer_address, None, signer_address]
+    assert mock_recover_transfer_to_signer_address.call_count == 3
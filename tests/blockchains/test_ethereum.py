@@ -1,11 +1,14 @@
 import atexit
+import concurrent.futures
 import pathlib
+import random
 import tempfile
 import unittest.mock
 import uuid
 
 import eth_account.account
 import eth_account.messages
+import eth_utils
 import hexbytes
 import pytest
 import semantic_version  # type: ignore
@@ -22,6 +25,8 @@ from vision.common.types import BlockchainAddress
 
 from vision.validatornode.blockchains.base import BlockchainClient
 from vision.validatornode.blockchains.base import NonMatchingForwarderError
+from vision.validatornode.blockchains.base import \
+    PendingTransactionsLimitReachedError
 from vision.validatornode.blockchains.base import \
     SourceTransferIdAlreadyUsedError
 from vision.validatornode.blockchains.ethereum import _EIP712_DOMAIN_NAME
@@ -29,10 +34,16 @@ from vision.validatornode.blockchains.ethereum import \
     _TRANSFER_TO_MESSAGE_TYPES
 from vision.validatornode.blockchains.ethereum import EthereumClient
 from vision.validatornode.blockchains.ethereum import EthereumClientError
+from vision.validatornode.blockchains.ethereum import \
+    _encode_transfer_to_message
+from vision.validatornode.blockchains.ethereum import _estimate_transfer_to_gas
+from vision.validatornode.blockchains.ethereum import _FeeHistoryOracle
 from vision.validatornode.entities import CrossChainTransfer
 
 _CHAIN_ID = 1638
 
+_DESTINATION_TRANSACTION_GAS_USED = 187315
+
 _DESTINATION_BLOCK_NUMBER = 20842624
 
 _DESTINATION_TRANSACTION_HASH = hexbytes.HexBytes(
@@ -301,7 +312,8 @@ def destination_transaction_receipt(destination_block_number,
                                     destination_transaction_hash):
     return {
         'blockNumber': destination_block_number,
-        'transactionHash': destination_transaction_hash
+        'transactionHash': destination_transaction_hash,
+        'gasUsed': _DESTINATION_TRANSACTION_GAS_USED
     }
 
 
@@ -442,6 +454,16 @@ def ethereum_client(mock_get_config, config_dict, chain_id, keystore_file_path,
     return ethereum_client
 
 
+@pytest.fixture(autouse=True)
+def fee_history_oracle():
+    with unittest.mock.patch(
+            'vision.validatornode.blockchains.ethereum._get_fee_history_oracle'
+    ) as mock_get_fee_history_oracle:
+        mock_fee_history_oracle = mock_get_fee_history_oracle.return_value
+        mock_fee_history_oracle.get_adaptable_fee_per_gas.return_value = None
+        yield mock_fee_history_oracle
+
+
 @unittest.mock.patch.object(EthereumClient, 'get_utilities')
 @unittest.mock.patch.object(EthereumClient, '_get_config',
                             return_value={'provider_timeout': None})
@@ -579,6 +601,50 @@ def test_is_equal_address(ethereum_client):
     assert ethereum_client.is_equal_address(address.lower(), address.lower())
 
 
+def test_read_block_hashes_correct(ethereum_client, w3):
+    genesis_block_hash = w3.eth.get_block(0)['hash'].to_0x_hex()
+    unknown_block_number = w3.eth.get_block_number() + 1000
+
+    block_hashes = ethereum_client.read_block_hashes(
+        [0, unknown_block_number, 0])
+
+    assert block_hashes == {0: genesis_block_hash}
+
+
+def test_read_block_hashes_shared_correct(ethereum_client, w3):
+    genesis_block_hash = w3.eth.get_block(0)['hash'].to_0x_hex()
+    block_hash_reads = ethereum_client._EthereumClient__block_hash_reads
+    # Block hash currently being read for another transfer
+    block_hash_read = concurrent.futures.Future()
+    block_hash_read.set_result('0x1234')
+    block_hash_reads[1] = block_hash_read
+
+    try:
+        with unittest.mock.patch.object(
+                w3.eth, 'get_block', wraps=w3.eth.get_block) as mock_get_block:
+            block_hashes = ethereum_client.read_block_hashes([0, 1])
+        assert 0 not in block_hash_reads
+    finally:
+        block_hash_reads.clear()
+
+    assert block_hashes == {0: genesis_block_hash, 1: '0x1234'}
+    mock_get_block.assert_called_once_with(0)
+
+
+def test_read_block_hashes_error(ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'get_block',
+                                    side_effect=Exception):
+        with pytest.raises(EthereumClientError):
+            ethereum_client.read_block_hashes([0])
+
+
+def test_read_block_hashes_results_not_matching_error(ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'get_block',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.read_block_hashes([0])
+
+
 @pytest.mark.parametrize('external_token_active',
                          [(Blockchain.ETHEREUM, True),
                           (Blockchain.AVALANCHE, False),
@@ -793,6 +859,79 @@ def test_read_transfer_to_transaction_data_correct(
     if read_destination_transfer_id:
         assert (
             data_response.destination_transfer_id == destination_transfer_id)
+        assert data_response.gas_used == _DESTINATION_TRANSACTION_GAS_USED
+    else:
+        assert data_response.gas_used is None
+
+
+def test_read_adaptable_fee_per_gas_correct(ethereum_client, w3):
+    fee_history = {'reward': [[3000000000], [1000000000], [], [2000000000]]}
+
+    with unittest.mock.patch.object(w3.eth, 'fee_history',
+                                    return_value=fee_history):
+        adaptable_fee_per_gas = ethereum_client._read_adaptable_fee_per_gas()
+
+    assert adaptable_fee_per_gas == 2000000000
+
+
+def test_read_adaptable_fee_per_gas_no_rewards(ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'fee_history',
+                                    return_value={'reward': [[], []]}):
+        adaptable_fee_per_gas = ethereum_client._read_adaptable_fee_per_gas()
+
+    assert adaptable_fee_per_gas is None
+
+
+def test_fee_history_oracle_correct():
+    mock_read_adaptable_fee_per_gas = unittest.mock.MagicMock(
+        side_effect=[2000000000, None])
+    fee_history_oracle = _FeeHistoryOracle(mock_read_adaptable_fee_per_gas, 14)
+    assert fee_history_oracle.get_adaptable_fee_per_gas() is None
+
+    fee_history_oracle.update()
+    assert fee_history_oracle.get_adaptable_fee_per_gas() == 2000000000
+
+    # The last sampled fee is kept if no new fee is available
+    fee_history_oracle.update()
+    assert fee_history_oracle.get_adaptable_fee_per_gas() == 2000000000
+
+
+@unittest.mock.patch('vision.validatornode.blockchains.ethereum.time')
+def test_fee_history_oracle_outdated_fee(mock_time):
+    mock_time.monotonic.return_value = 1000.0
+    fee_history_oracle = _FeeHistoryOracle(lambda: 2000000000, 14)
+    fee_history_oracle.update()
+
+    mock_time.monotonic.return_value = 1000.0 + 5 * 14 + 1
+
+    assert fee_history_oracle.get_adaptable_fee_per_gas() is None
+
+
+@pytest.mark.parametrize('number_signers_maximum_gas_used_gas',
+                         [(3, None, 450000), (3, 200000, 250000),
+                          (6, None, 750000), (1, 240000, 250000)])
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.ethereum.database_access')
+def test_estimate_transfer_to_gas_correct(mock_database_access,
+                                          number_signers_maximum_gas_used_gas):
+    number_signers, maximum_gas_used, gas = \
+        number_signers_maximum_gas_used_gas
+    mock_database_access.read_maximum_transfer_to_gas_usage.return_value = \
+        maximum_gas_used
+
+    assert _estimate_transfer_to_gas(Blockchain.ETHEREUM,
+                                     number_signers) == gas
+    mock_database_access.read_maximum_transfer_to_gas_usage.\
+        assert_called_once_with(Blockchain.ETHEREUM, number_signers)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.ethereum.database_access')
+def test_estimate_transfer_to_gas_database_error(mock_database_access):
+    mock_database_access.read_maximum_transfer_to_gas_usage.side_effect = \
+        Exception
+
+    assert _estimate_transfer_to_gas(Blockchain.ETHEREUM, 3) == 450000
 
 
 @pytest.mark.parametrize('errors',
@@ -807,6 +946,104 @@ def test_read_transfer_to_transaction_data_error(
                 destination_transaction_hash_str, True)
 
 
+@pytest.fixture
+def prefetching_ethereum_client(ethereum_client):
+    ethereum_client._EthereumClient__block_receipts_available = True
+    ethereum_client._EthereumClient__last_prefetched_block_number = None
+    ethereum_client._EthereumClient__transfer_to_receipts = {}
+    with unittest.mock.patch.object(
+            EthereumClient, '_get_config', return_value={
+                'confirmations': 12,
+                'hub': _HUB_ADDRESS
+            }):
+        yield ethereum_client
+    ethereum_client._EthereumClient__transfer_to_receipts = {}
+
+
+def test_prefetch_transfer_to_transaction_data_block_receipts_correct(
+        destination_block_number, destination_transaction_hash,
+        destination_transaction_hash_str, prefetching_ethereum_client, w3):
+    hub_receipt = {
+        'blockNumber': destination_block_number,
+        'transactionHash': destination_transaction_hash,
+        'to': _HUB_ADDRESS
+    }
+    other_receipt = {
+        'blockNumber': destination_block_number,
+        'transactionHash': _SOURCE_TRANSACTION_HASH,
+        'to': _TOKEN_ADDRESS
+    }
+    with unittest.mock.patch.object(w3.eth, 'get_block_number',
+                                    return_value=destination_block_number +
+                                    12):
+        with unittest.mock.patch.object(
+                w3.eth, 'get_block_receipts', create=True,
+                return_value=[hub_receipt,
+                              other_receipt]) as mock_get_block_receipts:
+            assert prefetching_ethereum_client.\
+                prefetch_transfer_to_transaction_data()
+            assert not prefetching_ethereum_client.\
+                prefetch_transfer_to_transaction_data()
+        with unittest.mock.patch.object(
+                w3.eth, 'get_transaction_receipt') as \
+                mock_get_transaction_receipt:
+            data_response = prefetching_ethereum_client.\
+                _read_transfer_to_transaction_data(
+                    destination_transaction_hash_str, False)
+
+    mock_get_block_receipts.assert_called_once_with(destination_block_number)
+    mock_get_transaction_receipt.assert_not_called()
+    assert data_response.block_number == destination_block_number
+
+
+def test_prefetch_transfer_to_transaction_data_no_block_receipts_correct(
+        destination_block_number, destination_transaction_hash,
+        prefetching_ethereum_client, w3):
+    block = {
+        'transactions': [{
+            'hash': destination_transaction_hash,
+            'to': _HUB_ADDRESS
+        }, {
+            'hash': _SOURCE_TRANSACTION_HASH,
+            'to': None
+        }]
+    }
+    hub_receipt = {
+        'blockNumber': destination_block_number,
+        'transactionHash': destination_transaction_hash,
+        'to': _HUB_ADDRESS
+    }
+    with unittest.mock.patch.object(w3.eth, 'get_block_number',
+                                    return_value=destination_block_number +
+                                    12):
+        with unittest.mock.patch.object(w3.eth, 'get_block_receipts',
+                                        create=True, side_effect=ValueError):
+            with unittest.mock.patch.object(w3.eth, 'get_block',
+                                            return_value=block):
+                with unittest.mock.patch.object(
+                        w3.eth, 'get_transaction_receipt',
+                        return_value=hub_receipt) as \
+                        mock_get_transaction_receipt:
+                    assert prefetching_ethereum_client.\
+                        prefetch_transfer_to_transaction_data()
+
+    mock_get_transaction_receipt.assert_called_once_with(
+        destination_transaction_hash)
+    assert not prefetching_ethereum_client.\
+        _EthereumClient__block_receipts_available
+
+
+@pytest.mark.parametrize('errors',
+                         [(ResultsNotMatchingError, ResultsNotMatchingError),
+                          (Exception, EthereumClientError)])
+def test_prefetch_transfer_to_transaction_data_error(
+        errors, prefetching_ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'get_block_number',
+                                    side_effect=errors[0]):
+        with pytest.raises(errors[1]):
+            prefetching_ethereum_client.prefetch_transfer_to_transaction_data()
+
+
 @unittest.mock.patch.object(EthereumClient, '_create_forwarder_contract')
 def test_read_validator_node_addresses_correct(mock_create_forwarder_contract,
                                                ethereum_client):
@@ -891,6 +1128,66 @@ def test_recover_transfer_to_signer_address_error(mock_get_config, chain_id,
         ethereum_client.recover_transfer_to_signer_address(request)
 
 
+@pytest.mark.parametrize('process_pool_available', [True, False])
+@pytest.mark.parametrize('number_requests', [1, 2, 40])
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_recover_transfer_to_signer_addresses_correct(
+        mock_get_config, number_requests, process_pool_available, chain_id,
+        eip712_domain_data, incoming_transfer_message_data, ethereum_client):
+    mock_config = {
+        'chain_id': chain_id,
+        'hub': _HUB_ADDRESS,
+        'forwarder': _FORWARDER_ADDRESS,
+        'vsn_token': _VSN_TOKEN_ADDRESS
+    }
+    mock_get_config.return_value = mock_config
+    signed_message = web3.Account.sign_typed_data(
+        _PRIVATE_KEY, eip712_domain_data, _TRANSFER_TO_MESSAGE_TYPES,
+        incoming_transfer_message_data)
+    requests = [
+        BlockchainClient.TransferToSignerAddressRecoveryRequest(
+            source_blockchain=_INCOMING_TRANSFER.source_blockchain,
+            source_transaction_id=_INCOMING_TRANSFER.source_transaction_id,
+            source_transfer_id=_INCOMING_TRANSFER.source_transfer_id,
+            sender_address=_INCOMING_TRANSFER.sender_address,
+            recipient_address=_INCOMING_TRANSFER.recipient_address,
+            source_token_address=_INCOMING_TRANSFER.source_token_address,
+            destination_token_address=_INCOMING_TRANSFER.
+            destination_token_address, amount=_INCOMING_TRANSFER.amount,
+            validator_nonce=_VALIDATOR_NONCE,
+            signature=(signed_message.signature.to_0x_hex() if i %
+                       2 == 0 else 'invalid_signature'))
+        for i in range(number_requests)
+    ]
+
+    if process_pool_available:
+        recovered_signer_addresses = \
+            ethereum_client.recover_transfer_to_signer_addresses(requests)
+    else:
+        with unittest.mock.patch(
+                'vision.validatornode.blockchains.ethereum.'
+                '_signer_recovery_executor', None), unittest.mock.patch(
+                    'vision.validatornode.blockchains.ethereum.'
+                    '_signer_recovery_executor_unavailable',
+                    False), unittest.mock.patch(
+                        'vision.validatornode.blockchains.ethereum.'
+                        'concurrent.futures.ProcessPoolExecutor',
+                        side_effect=OSError) as mock_process_pool_executor:
+            ethereum_client.recover_transfer_to_signer_addresses(requests)
+            recovered_signer_addresses = \
+                ethereum_client.recover_transfer_to_signer_addresses(
+                    requests)
+        # The unavailable process pool is not created again
+        parallel_recovery = number_requests >= 16
+        assert mock_process_pool_executor.call_count == int(parallel_recovery)
+
+    expected_signer_address = web3.Account.from_key(_PRIVATE_KEY).address
+    assert recovered_signer_addresses == [
+        expected_signer_address if i % 2 == 0 else None
+        for i in range(number_requests)
+    ]
+
+
 @unittest.mock.patch.object(
     EthereumClient, '_get_config', return_value={
         'chain_id': _CHAIN_ID,
@@ -915,6 +1212,95 @@ def test_sign_transfer_to_message_correct(mock_get_config, eip712_domain_data,
     assert signer_address == web3.Account.from_key(_PRIVATE_KEY).address
 
 
+def _random_uint256(random_generator):
+    return random_generator.choice([
+        0, 2**256 - 1,
+        random_generator.getrandbits(random_generator.choice([8, 64, 256]))
+    ])
+
+
+def _random_string(random_generator):
+    return ''.join(
+        chr(random_generator.randrange(0x20, 0x2fff))
+        for _ in range(random_generator.randrange(0, 100)))
+
+
+def _random_address(random_generator):
+    address = eth_utils.to_checksum_address(random_generator.randbytes(20))
+    return address if random_generator.random() < 0.5 else address.lower()
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_encode_transfer_to_message_matches_encode_typed_data(seed):
+    random_generator = random.Random(seed)
+    domain_data = {
+        'name': _EIP712_DOMAIN_NAME,
+        'version': str(random_generator.randrange(0, 10)),
+        'chainId': _random_uint256(random_generator),
+        'verifyingContract': _random_address(random_generator)
+    }
+    message_data = {
+        'request': {
+            'sourceBlockchainId': _random_uint256(random_generator),
+            'sourceTransferId': _random_uint256(random_generator),
+            'sourceTransactionId': _random_string(random_generator),
+            'sender': _random_string(random_generator),
+            'recipient': _random_address(random_generator),
+            'sourceToken': _random_string(random_generator),
+            'destinationToken': _random_address(random_generator),
+            'amount': _random_uint256(random_generator),
+            'nonce': _random_uint256(random_generator)
+        },
+        'destinationBlockchainId': _random_uint256(random_generator),
+        'visionHub': _random_address(random_generator),
+        'visionForwarder': domain_data['verifyingContract'],
+        'visionToken': _random_address(random_generator)
+    }
+
+    signable_message = _encode_transfer_to_message(domain_data, message_data)
+
+    expected_signable_message = eth_account.messages.encode_typed_data(
+        domain_data, _TRANSFER_TO_MESSAGE_TYPES, message_data)
+    assert signable_message.version == expected_signable_message.version
+    assert bytes(signable_message.header) == bytes(
+        expected_signable_message.header)
+    assert bytes(signable_message.body) == bytes(
+        expected_signable_message.body)
+
+
+@pytest.mark.parametrize('invalid_field',
+                         ['recipient', 'amount', 'sourceTransactionId'])
+def test_encode_transfer_to_message_invalid_message_data(
+        invalid_field, eip712_domain_data, incoming_transfer_message_data):
+    message_data = incoming_transfer_message_data | {
+        'request': incoming_transfer_message_data['request'] | {
+            invalid_field: None
+        }
+    }
+
+    with pytest.raises(Exception):
+        eth_account.messages.encode_typed_data(eip712_domain_data,
+                                               _TRANSFER_TO_MESSAGE_TYPES,
+                                               message_data)
+    with pytest.raises(Exception):
+        _encode_transfer_to_message(eip712_domain_data, message_data)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.ethereum.eth_account.messages.'
+    'encode_typed_data')
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.ethereum._hash_eip712_struct',
+    side_effect=RuntimeError)
+def test_encode_transfer_to_message_unexpected_error(
+        mock_hash_eip712_struct, mock_encode_typed_data, eip712_domain_data,
+        incoming_transfer_message_data):
+    with pytest.raises(RuntimeError):
+        _encode_transfer_to_message(eip712_domain_data,
+                                    incoming_transfer_message_data)
+    mock_encode_typed_data.assert_not_called()
+
+
 def test_sign_transfer_to_message_destination_blockchain_error(
         ethereum_client):
     incoming_transfer = _OUTGOING_TRANSFERS[0]
@@ -970,22 +1356,26 @@ def test_sort_validator_node_signatures_correct(ethereum_client):
     assert sorted_signatures[3] == _VALIDATOR_NODE_SIGNATURES[1]
 
 
+@pytest.mark.parametrize('sampled_adaptable_fee_per_gas',
+                         [None, 500000000, 2000000000])
 @unittest.mock.patch(
     'vision.validatornode.blockchains.ethereum.database_access')
 @unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
 @unittest.mock.patch.object(EthereumClient, '_get_config')
-def test_start_transfer_to_submission_correct(mock_get_config,
-                                              mock_create_hub_contract,
-                                              mock_database_access,
-                                              ethereum_client,
-                                              node_connections, w3):
+def test_start_transfer_to_submission_correct(
+        mock_get_config, mock_create_hub_contract, mock_database_access,
+        sampled_adaptable_fee_per_gas, ethereum_client, node_connections, w3,
+        fee_history_oracle):
+    fee_history_oracle.get_adaptable_fee_per_gas.return_value = \
+        sampled_adaptable_fee_per_gas
     mock_config = {
         'hub': '0xFB37499DC5401Dc39a0734df1fC7924d769721d5',
         'vsn_token': _INCOMING_TRANSFER.destination_token_address,
         'min_adaptable_fee_per_gas': 1000000000,
         'max_total_fee_per_gas': 50000000000,
         'adaptable_fee_increase_factor': 1.101,
-        'blocks_until_resubmission': 10
+        'blocks_until_resubmission': 10,
+        'max_pending_transactions': 16
     }
     mock_get_config.return_value = mock_config
     internal_transfer_id = 26849
@@ -1018,8 +1408,44 @@ def test_start_transfer_to_submission_correct(mock_get_config,
 
     assert response == internal_transaction_id
     mock_database_access.update_transfer_nonce.assert_called_once_with(
-        internal_transfer_id, Blockchain.ETHEREUM, blockchain_nonce)
+        internal_transfer_id, Blockchain.ETHEREUM, blockchain_nonce, 16)
     mock_start_transaction_submission.assert_called_once()
+    submission_request = mock_start_transaction_submission.call_args.args[0]
+    assert submission_request.min_adaptable_fee_per_gas == max(
+        mock_config['min_adaptable_fee_per_gas'], sampled_adaptable_fee_per_gas
+        or 0)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.ethereum.database_access')
+@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_start_transfer_to_submission_pending_transactions_limit_reached(
+        mock_get_config, mock_create_hub_contract, mock_database_access,
+        ethereum_client, w3):
+    mock_get_config.return_value = {
+        'hub': '0xFB37499DC5401Dc39a0734df1fC7924d769721d5',
+        'min_adaptable_fee_per_gas': 1000000000,
+        'max_total_fee_per_gas': 50000000000,
+        'max_pending_transactions': 16
+    }
+    internal_transfer_id = 61028
+    mock_database_access.update_transfer_nonce.return_value = False
+    mock_start_transaction_submission = unittest.mock.MagicMock()
+
+    request = BlockchainClient.TransferToSubmissionStartRequest(
+        internal_transfer_id, _INCOMING_TRANSFER, _VALIDATOR_NONCE,
+        dict(zip(_VALIDATOR_NODE_ADDRESSES, _VALIDATOR_NODE_SIGNATURES)))
+    with unittest.mock.patch.object(ethereum_client.get_utilities(),
+                                    'start_transaction_submission',
+                                    mock_start_transaction_submission):
+        with unittest.mock.patch.object(w3.eth, 'get_transaction_count',
+                                        return_value=4713):
+            with pytest.raises(PendingTransactionsLimitReachedError):
+                ethereum_client.start_transfer_to_submission(request)
+
+    mock_start_transaction_submission.assert_not_called()
+    mock_database_access.read_transfer_nonce.assert_not_called()
 
 
 @unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
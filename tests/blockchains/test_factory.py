@@ -1,3 +1,4 @@
+import threading
 import unittest.mock
 
 import pytest
@@ -43,6 +44,32 @@ def test_get_blockchain_client_correct(mock_blockchain_client_classes,
     assert isinstance(blockchain_client, blockchain_client_class)
 
 
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.factory.get_blockchain_config',
+    return_value={'active': True})
+@unittest.mock.patch(
+    'vision.validatornode.blockchains.factory._blockchain_client_classes')
+def test_get_blockchain_client_not_initialized(mock_blockchain_client_classes,
+                                               mock_get_blockchain_config):
+    mock_blockchain_client_class = \
+        mock_blockchain_client_classes.__getitem__.return_value
+    blockchain_clients = []
+
+    def get_client():
+        blockchain_clients.append(get_blockchain_client(Blockchain.ETHEREUM))
+
+    threads = [threading.Thread(target=get_client) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mock_blockchain_client_class.assert_called_once_with()
+    assert len(blockchain_clients) == 10
+    assert all(blockchain_client is mock_blockchain_client_class.return_value
+               for blockchain_client in blockchain_clients)
+
+
 def _get_blockchain_client_class(blockchain):
     if blockchain is Blockchain.AVALANCHE:
         return AvalancheClient
@@ -2,7 +2,6 @@ import unittest.mock
 
 import pytest
 
-from vision.validatornode.blockchains.base import BlockchainClientError
 from vision.validatornode.business.base import DuplicateSignatureError
 from vision.validatornode.business.base import InvalidSignatureError
 from vision.validatornode.business.base import InvalidSignerError
@@ -49,6 +48,8 @@ def transfer_to_data_response(internal_transfer_id, destination_blockchain,
         validator_nonce=validator_nonce)
 
 
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.TransferInteractor')
 @unittest.mock.patch(
     'vision.validatornode.business.signatures.get_blockchain_config',
     return_value={'forwarder': _FORWARDER_ADDRESS})
@@ -58,15 +59,16 @@ def transfer_to_data_response(internal_transfer_id, destination_blockchain,
     'vision.validatornode.business.signatures.database_access')
 def test_add_secondary_node_signature_correct(
         mock_database_access, mock_get_blockchain_client,
-        mock_get_blockchain_config, transfer_to_data_response,
-        secondary_node_signature_add_request, signature_interactor):
+        mock_get_blockchain_config, mock_transfer_interactor,
+        transfer_to_data_response, secondary_node_signature_add_request,
+        signature_interactor):
     mock_database_access.read_transfer_to_data.return_value = \
         transfer_to_data_response
     mock_database_access.read_validator_node_signature.return_value = None
     mock_get_blockchain_client().read_validator_node_addresses.return_value = \
         _VALIDATOR_NODE_ADDRESSES_WITH_SIGNER
-    mock_get_blockchain_client().recover_transfer_to_signer_address.\
-        return_value = _SIGNER_ADDRESS
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [_SIGNER_ADDRESS]
 
     signature_interactor.add_secondary_node_signature(
         secondary_node_signature_add_request)
@@ -76,7 +78,9 @@ def test_add_secondary_node_signature_correct(
             transfer_to_data_response.internal_transfer_id,
             transfer_to_data_response.destination_blockchain,
             _FORWARDER_ADDRESS, _SIGNER_ADDRESS,
-            secondary_node_signature_add_request.signature)
+            secondary_node_signature_add_request.signature, verified=True)
+    mock_transfer_interactor().schedule_transfer_onchain_submission.\
+        assert_called_once_with(transfer_to_data_response.internal_transfer_id)
 
 
 @unittest.mock.patch(
@@ -109,8 +113,8 @@ def test_add_secondary_node_signature_invalid_signature_error(
         secondary_node_signature_add_request, signature_interactor):
     mock_database_access.read_transfer_to_data.return_value = \
         transfer_to_data_response
-    mock_get_blockchain_client().recover_transfer_to_signer_address.\
-        side_effect = BlockchainClientError('')
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [None]
 
     with pytest.raises(InvalidSignatureError) as exception_info:
         signature_interactor.add_secondary_node_signature(
@@ -137,8 +141,8 @@ def test_add_secondary_node_signature_duplicate_signature_error(
         transfer_to_data_response
     mock_database_access.read_validator_node_signature.return_value = \
         secondary_node_signature_add_request.signature
-    mock_get_blockchain_client().recover_transfer_to_signer_address.\
-        return_value = _SIGNER_ADDRESS
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [_SIGNER_ADDRESS]
 
     with pytest.raises(DuplicateSignatureError) as exception_info:
         signature_interactor.add_secondary_node_signature(
@@ -166,8 +170,8 @@ def test_add_secondary_node_signature_invalid_signer_error(
     mock_database_access.read_validator_node_signature.return_value = None
     mock_get_blockchain_client().read_validator_node_addresses.return_value = \
         _VALIDATOR_NODE_ADDRESSES_WITHOUT_SIGNER
-    mock_get_blockchain_client().recover_transfer_to_signer_address.\
-        return_value = _SIGNER_ADDRESS
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [_SIGNER_ADDRESS]
 
     with pytest.raises(InvalidSignerError) as exception_info:
         signature_interactor.add_secondary_node_signature(
@@ -194,3 +198,33 @@ def test_add_secondary_node_signature_database_error(
     assert not isinstance(exception_info.value, InvalidSignatureError)
     assert not isinstance(exception_info.value, InvalidSignerError)
     assert not isinstance(exception_info.value, UnknownTransferError)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.TransferInteractor')
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_config',
+    return_value={'forwarder': _FORWARDER_ADDRESS})
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.database_access')
+def test_add_secondary_node_signature_scheduling_error(
+        mock_database_access, mock_get_blockchain_client,
+        mock_get_blockchain_config, mock_transfer_interactor,
+        transfer_to_data_response, secondary_node_signature_add_request,
+        signature_interactor):
+    mock_database_access.read_transfer_to_data.return_value = \
+        transfer_to_data_response
+    mock_database_access.read_validator_node_signature.return_value = None
+    mock_get_blockchain_client().read_validator_node_addresses.return_value = \
+        _VALIDATOR_NODE_ADDRESSES_WITH_SIGNER
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [_SIGNER_ADDRESS]
+    mock_transfer_interactor().schedule_transfer_onchain_submission.\
+        side_effect = Exception
+
+    signature_interactor.add_secondary_node_signature(
+        secondary_node_signature_add_request)
+
+    mock_database_access.create_validator_node_signature.assert_called_once()
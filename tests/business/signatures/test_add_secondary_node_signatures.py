@@ -0,0 +1,125 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.base import InvalidSignatureError
+from vision.validatornode.business.base import UnknownTransferError
+from vision.validatornode.business.signatures import SignatureInteractor
+from vision.validatornode.business.signatures import SignatureInteractorError
+from vision.validatornode.database.access import TransferToDataResponse
+
+_FORWARDER_ADDRESS = '0x8960647eC8CAd5fEBc919b255C9F739f17D91e8B'
+
+_SIGNER_ADDRESS = '0x977E8f4ee5d2c6DF05941A5e3A54A808f87edDE4'
+
+_UNKNOWN_SOURCE_TRANSACTION_ID = \
+    '0x3f0ff8e4c6d4a1b3a0e0d8ef6c8a0e7c3d1f2b9e4a5c6d7e8f9a0b1c2d3e4f5a'
+
+
+@pytest.fixture
+def secondary_node_signature_add_requests(source_blockchain,
+                                          source_transaction_id, signature):
+    return [
+        SignatureInteractor.SecondaryNodeSignatureAddRequest(
+            source_blockchain=source_blockchain,
+            source_transaction_id=source_transaction_id, signature=signature),
+        SignatureInteractor.SecondaryNodeSignatureAddRequest(
+            source_blockchain=source_blockchain,
+            source_transaction_id=_UNKNOWN_SOURCE_TRANSACTION_ID,
+            signature=signature),
+        SignatureInteractor.SecondaryNodeSignatureAddRequest(
+            source_blockchain=source_blockchain,
+            source_transaction_id=source_transaction_id,
+            signature=signature[:-1])
+    ]
+
+
+@pytest.fixture
+def transfer_to_data_response(internal_transfer_id, destination_blockchain,
+                              source_transfer_id, sender_address,
+                              recipient_address, source_token_address,
+                              destination_token_address, amount,
+                              validator_nonce):
+    return TransferToDataResponse(
+        internal_transfer_id=internal_transfer_id,
+        destination_blockchain=destination_blockchain,
+        source_transfer_id=source_transfer_id, sender_address=sender_address,
+        recipient_address=recipient_address,
+        source_token_address=source_token_address,
+        destination_token_address=destination_token_address, amount=amount,
+        validator_nonce=validator_nonce)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.TransferInteractor')
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_config',
+    return_value={'forwarder': _FORWARDER_ADDRESS})
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.database_access')
+def test_add_secondary_node_signatures_correct(
+        mock_database_access, mock_get_blockchain_client,
+        mock_get_blockchain_config, mock_transfer_interactor,
+        transfer_to_data_response, secondary_node_signature_add_requests,
+        signature_interactor):
+    mock_database_access.read_transfer_to_data.side_effect = \
+        lambda source_blockchain, source_transaction_id: (
+            None if source_transaction_id == _UNKNOWN_SOURCE_TRANSACTION_ID
+            else transfer_to_data_response)
+    mock_database_access.read_validator_node_signature.return_value = None
+    mock_get_blockchain_client().read_validator_node_addresses.return_value = \
+        [_SIGNER_ADDRESS]
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        return_value = [_SIGNER_ADDRESS, None]
+
+    errors = signature_interactor.add_secondary_node_signatures(
+        secondary_node_signature_add_requests)
+
+    assert errors[0] is None
+    assert isinstance(errors[1], UnknownTransferError)
+    assert isinstance(errors[1], SignatureInteractorError)
+    assert isinstance(errors[2], InvalidSignatureError)
+    assert isinstance(errors[2], SignatureInteractorError)
+    recovery_requests = mock_get_blockchain_client().\
+        recover_transfer_to_signer_addresses.call_args.args[0]
+    assert [request.signature for request in recovery_requests] == [
+        secondary_node_signature_add_requests[0].signature,
+        secondary_node_signature_add_requests[2].signature
+    ]
+    mock_database_access.create_validator_node_signature.\
+        assert_called_once_with(
+            transfer_to_data_response.internal_transfer_id,
+            transfer_to_data_response.destination_blockchain,
+            _FORWARDER_ADDRESS, _SIGNER_ADDRESS,
+            secondary_node_signature_add_requests[0].signature, verified=True)
+    mock_transfer_interactor().schedule_transfer_onchain_submission.\
+        assert_called_once_with(transfer_to_data_response.internal_transfer_id)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_config',
+    return_value={'forwarder': _FORWARDER_ADDRESS})
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.signatures.database_access')
+def test_add_secondary_node_signatures_blockchain_error(
+        mock_database_access, mock_get_blockchain_client,
+        mock_get_blockchain_config, transfer_to_data_response,
+        secondary_node_signature_add_requests, signature_interactor):
+    mock_database_access.read_transfer_to_data.return_value = \
+        transfer_to_data_response
+    mock_get_blockchain_client().recover_transfer_to_signer_addresses.\
+        side_effect = Exception
+
+    errors = signature_interactor.add_secondary_node_signatures(
+        secondary_node_signature_add_requests)
+
+    assert len(errors) == len(secondary_node_signature_add_requests)
+    for error in errors:
+        assert isinstance(error, SignatureInteractorError)
+        assert not isinstance(error, InvalidSignatureError)
+        assert not isinstance(error, UnknownTransferError)
+    mock_database_access.create_validator_node_signature.assert_not_called()
@@ -1,3 +1,5 @@
+import unittest.mock
+
 import pytest
 
 from vision.validatornode.business.transfers import TransferInteractor
@@ -73,3 +75,11 @@ def validator_node_signatures():
 @pytest.fixture
 def transfer_interactor():
     return TransferInteractor()
+
+
+@pytest.fixture(autouse=True)
+def empty_minimum_signatures_cache():
+    with unittest.mock.patch.dict(
+            'vision.validatornode.business.transfers.'
+            '_minimum_signatures_cache', clear=True):
+        yield
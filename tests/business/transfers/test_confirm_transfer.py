@@ -10,6 +10,7 @@ from vision.validatornode.blockchains.base import \
     UnresolvableTransferToSubmissionError
 from vision.validatornode.business.transfers import TransferInteractorError
 from vision.validatornode.business.transfers import confirm_transfer_task
+from vision.validatornode.celery import get_task_routing_headers
 from vision.validatornode.database.enums import TransferStatus
 
 _INTERNAL_TRANSACTION_ID = uuid.uuid4()
@@ -21,21 +22,48 @@ _DESTINATION_TRANSACTION_ID = \
 
 _DESTINATION_BLOCK_NUMBER = 170842
 
+_GAS_USED = 187315
+
+_VALIDATOR_NODE_SIGNATURES = {
+    '0x5FbDB2315678afecb367f032d93F642f64180aa3': '0x1',
+    '0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512': '0x2'
+}
+
 _TASK_INTERVAL = 120
 
+_RETRY_POLICIES = dict.fromkeys(
+    [
+        'transitory_state', 'rpc_failure', 'primary_node_unreachable',
+        'database_conflict', 'unknown_error'
+    ], {
+        'backoff_factor': 1.0,
+        'max_interval_in_seconds': _TASK_INTERVAL,
+        'jitter': 0.0
+    })
+
+
+@pytest.fixture(autouse=True)
+def forget_task_results():
+    with unittest.mock.patch(
+            'vision.validatornode.business.transfers.forget_task_results'
+    ) as mock_forget_task_results:
+        yield mock_forget_task_results
+
 
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_client')
 def test_confirm_transfer_unconfirmed_correct(mock_get_blockchain_client,
                                               transfer_interactor,
                                               internal_transfer_id,
-                                              cross_chain_transfer):
+                                              cross_chain_transfer,
+                                              forget_task_results):
     mock_blockchain_client = mock_get_blockchain_client()
     mock_blockchain_client.get_transfer_to_submission_status.return_value = \
         BlockchainClient.TransferToSubmissionStatusResponse(False)
     confirmation_completed = transfer_interactor.confirm_transfer(
         internal_transfer_id, _INTERNAL_TRANSACTION_ID, cross_chain_transfer)
     assert not confirmation_completed
+    forget_task_results.assert_not_called()
 
 
 @unittest.mock.patch(
@@ -43,17 +71,21 @@ def test_confirm_transfer_unconfirmed_correct(mock_get_blockchain_client,
 @unittest.mock.patch('vision.validatornode.business.transfers.database_access')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_client')
-@unittest.mock.patch('vision.validatornode.business.transfers.config', {
-    'tasks': {
-        'validate_transfer': {
-            'retry_interval_in_seconds': _TASK_INTERVAL
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
         }
-    }
-})
+    })
 def test_confirm_transfer_reverted_correct(
         mock_get_blockchain_client, mock_database_access,
         mock_validate_transfer_task, transfer_interactor, internal_transfer_id,
-        cross_chain_transfer, cross_chain_transfer_dict):
+        cross_chain_transfer, forget_task_results):
     mock_blockchain_client = mock_get_blockchain_client()
     mock_blockchain_client.get_transfer_to_submission_status.return_value = \
         BlockchainClient.TransferToSubmissionStatusResponse(
@@ -71,32 +103,47 @@ def test_confirm_transfer_reverted_correct(
         internal_transfer_id)
     mock_database_access.update_transfer_task_id.assert_called_once()
     mock_validate_transfer_task.apply_async.assert_called_once_with(
-        args=(internal_transfer_id, cross_chain_transfer_dict),
-        countdown=_TASK_INTERVAL)
+        args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+        countdown=_TASK_INTERVAL,
+        headers=get_task_routing_headers(cross_chain_transfer))
+    forget_task_results.assert_called_once_with([_INTERNAL_TRANSACTION_ID])
 
 
+@pytest.mark.parametrize('gas_usage_error', [False, True])
 @pytest.mark.parametrize('is_reversal_transfer', [True, False])
 @unittest.mock.patch('vision.validatornode.business.transfers.database_access')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_client')
 def test_confirm_transfer_confirmed_correct(
         mock_get_blockchain_client, mock_database_access, is_reversal_transfer,
-        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+        gas_usage_error, transfer_interactor, internal_transfer_id,
+        cross_chain_transfer, forget_task_results):
     mock_blockchain_client = mock_get_blockchain_client()
     mock_blockchain_client.get_transfer_to_submission_status.return_value = \
         BlockchainClient.TransferToSubmissionStatusResponse(
             True, TransactionStatus.CONFIRMED, _DESTINATION_TRANSACTION_ID,
             _DESTINATION_BLOCK_NUMBER,
-            destination_transfer_id=_DESTINATION_TRANSFER_ID)
+            destination_transfer_id=_DESTINATION_TRANSFER_ID,
+            gas_used=_GAS_USED)
+    mock_database_access.read_validator_node_signatures.return_value = \
+        _VALIDATOR_NODE_SIGNATURES
+    if gas_usage_error:
+        mock_database_access.create_transfer_to_gas_usage.side_effect = \
+            Exception
     cross_chain_transfer.is_reversal_transfer = is_reversal_transfer
     confirmation_completed = transfer_interactor.confirm_transfer(
         internal_transfer_id, _INTERNAL_TRANSACTION_ID, cross_chain_transfer)
     assert confirmation_completed
+    mock_database_access.create_transfer_to_gas_usage.assert_called_once_with(
+        cross_chain_transfer.eventual_destination_blockchain,
+        len(_VALIDATOR_NODE_SIGNATURES), _GAS_USED, 20)
+    # Failing to record the gas usage does not prevent the confirmation
     mock_database_access.update_transfer_status.assert_called_once_with(
         internal_transfer_id,
         TransferStatus.SOURCE_REVERSAL_TRANSACTION_CONFIRMED
         if is_reversal_transfer else
         TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+    forget_task_results.assert_called_once_with([_INTERNAL_TRANSACTION_ID])
 
 
 @unittest.mock.patch(
@@ -104,17 +151,23 @@ def test_confirm_transfer_confirmed_correct(
 @unittest.mock.patch('vision.validatornode.business.transfers.database_access')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_client')
-@unittest.mock.patch('vision.validatornode.business.transfers.config', {
-    'tasks': {
-        'validate_transfer': {
-            'retry_interval_in_seconds': _TASK_INTERVAL
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
         }
-    }
-})
-def test_confirm_transfer_unresolvable_error(
-        mock_get_blockchain_client, mock_database_access,
-        mock_validate_transfer_task, transfer_interactor, internal_transfer_id,
-        cross_chain_transfer, cross_chain_transfer_dict):
+    })
+def test_confirm_transfer_unresolvable_error(mock_get_blockchain_client,
+                                             mock_database_access,
+                                             mock_validate_transfer_task,
+                                             transfer_interactor,
+                                             internal_transfer_id,
+                                             cross_chain_transfer):
     mock_blockchain_client = mock_get_blockchain_client()
     mock_blockchain_client.get_transfer_to_submission_status.side_effect = \
         UnresolvableTransferToSubmissionError
@@ -130,8 +183,9 @@ def test_confirm_transfer_unresolvable_error(
         internal_transfer_id)
     mock_database_access.update_transfer_task_id.assert_called_once()
     mock_validate_transfer_task.apply_async.assert_called_once_with(
-        args=(internal_transfer_id, cross_chain_transfer_dict),
-        countdown=_TASK_INTERVAL)
+        args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+        countdown=_TASK_INTERVAL,
+        headers=get_task_routing_headers(cross_chain_transfer))
 
 
 @unittest.mock.patch(
@@ -152,13 +206,15 @@ def test_confirm_transfer_error(mock_get_blockchain_client,
 
 
 @pytest.mark.parametrize('confirmation_completed', [True, False])
-@unittest.mock.patch('vision.validatornode.business.transfers.config', {
-    'tasks': {
-        'confirm_transfer': {
-            'retry_interval_in_seconds': _TASK_INTERVAL
-        }
-    }
-})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'tasks': {
+            'confirm_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        },
+        'retries': _RETRY_POLICIES
+    })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
 def test_confirm_transfer_task_correct(mock_transfer_interactor,
@@ -173,10 +229,11 @@ def test_confirm_transfer_task_correct(mock_transfer_interactor,
                               str(_INTERNAL_TRANSACTION_ID),
                               cross_chain_transfer_dict)
     else:
-        with pytest.raises(celery.exceptions.Retry):
+        with pytest.raises(celery.exceptions.Retry) as exception_info:
             confirm_transfer_task(internal_transfer_id,
                                   str(_INTERNAL_TRANSACTION_ID),
                                   cross_chain_transfer_dict)
+        assert exception_info.value.when == _TASK_INTERVAL
     mock_transfer_interactor().confirm_transfer.assert_called_once_with(
         internal_transfer_id, _INTERNAL_TRANSACTION_ID, cross_chain_transfer)
 
@@ -187,7 +244,8 @@ def test_confirm_transfer_task_correct(mock_transfer_interactor,
             'confirm_transfer': {
                 'retry_interval_after_error_in_seconds': _TASK_INTERVAL
             }
-        }
+        },
+        'retries': _RETRY_POLICIES
     })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
@@ -0,0 +1,265 @@
+import unittest.mock
+import uuid
+
+import pytest
+from vision.common.entities import TransactionStatus
+
+from vision.validatornode.blockchains.base import BlockchainClient
+from vision.validatornode.business import transfers
+from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.database.access import TransferConfirmationRequest
+from vision.validatornode.database.access import UnconfirmedTransferResponse
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.entities import CrossChainTransfer
+
+_INTERNAL_TRANSACTION_IDS = [uuid.uuid4() for _ in range(4)]
+
+_DESTINATION_TRANSFER_ID = 55409
+
+_DESTINATION_TRANSACTION_ID = \
+    '0x82f5a0189d88bd241064a4a1f346826d99f613ccbe41abb0c18f2d8739ca03f6'
+
+_DESTINATION_BLOCK_NUMBER = 170842
+
+_GAS_USED = 187315
+
+_TASK_INTERVAL = 120
+
+
+@pytest.fixture(autouse=True)
+def clear_confirmation_retry_blockchains():
+    transfers._confirmation_retry_blockchains.clear()
+    yield
+    transfers._confirmation_retry_blockchains.clear()
+
+
+@pytest.fixture(autouse=True)
+def forget_task_results():
+    with unittest.mock.patch(
+            'vision.validatornode.business.transfers.forget_task_results'
+    ) as mock_forget_task_results:
+        yield mock_forget_task_results
+
+
+@pytest.fixture
+def unconfirmed_transfers(internal_transfer_id):
+    return [
+        UnconfirmedTransferResponse(internal_transfer_id + index,
+                                    internal_transaction_id) for index,
+        internal_transaction_id in enumerate(_INTERNAL_TRANSACTION_IDS)
+    ]
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+def test_confirm_transfers_no_unconfirmed_transfers_correct(
+        mock_get_blockchain_client, mock_database_access, transfer_interactor,
+        destination_blockchain):
+    mock_database_access.read_unconfirmed_transfers.return_value = []
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    mock_database_access.read_unconfirmed_transfers.assert_called_once_with(
+        destination_blockchain)
+    mock_get_blockchain_client.assert_not_called()
+    mock_database_access.update_transfer_confirmations.assert_not_called()
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+def test_confirm_transfers_no_new_block_correct(mock_get_blockchain_client,
+                                                mock_database_access,
+                                                transfer_interactor,
+                                                destination_blockchain,
+                                                unconfirmed_transfers):
+    mock_database_access.read_unconfirmed_transfers.return_value = \
+        unconfirmed_transfers
+    mock_blockchain_client = mock_get_blockchain_client()
+    mock_blockchain_client.prefetch_transfer_to_transaction_data.\
+        return_value = False
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    mock_blockchain_client.get_transfer_to_submission_statuses.\
+        assert_not_called()
+    mock_database_access.update_transfer_confirmations.assert_not_called()
+
+
+@pytest.mark.parametrize('is_reversal_transfer', [True, False])
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.validate_transfer_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        }
+    })
+def test_confirm_transfers_correct(
+        mock_get_blockchain_client, mock_database_access,
+        mock_validate_transfer_task, is_reversal_transfer, transfer_interactor,
+        destination_blockchain, unconfirmed_transfers,
+        cross_chain_transfer_dict, forget_task_results):
+    cross_chain_transfer_dict['is_reversal_transfer'] = is_reversal_transfer
+    mock_database_access.read_unconfirmed_transfers.return_value = \
+        unconfirmed_transfers
+    mock_database_access.read_transfer_data.return_value = {
+        unconfirmed_transfer.internal_transfer_id: cross_chain_transfer_dict
+        for unconfirmed_transfer in unconfirmed_transfers
+    }
+    mock_blockchain_client = mock_get_blockchain_client()
+    mock_blockchain_client.prefetch_transfer_to_transaction_data.\
+        return_value = True
+    mock_blockchain_client.get_transfer_to_submission_statuses.return_value = {
+        _INTERNAL_TRANSACTION_IDS[0]: BlockchainClient.
+        TransferToSubmissionStatusResponse(False),
+        _INTERNAL_TRANSACTION_IDS[1]: BlockchainClient.
+        TransferToSubmissionStatusResponse(
+            True, TransactionStatus.CONFIRMED, _DESTINATION_TRANSACTION_ID,
+            _DESTINATION_BLOCK_NUMBER,
+            destination_transfer_id=_DESTINATION_TRANSFER_ID,
+            gas_used=_GAS_USED),
+        _INTERNAL_TRANSACTION_IDS[2]: BlockchainClient.
+        TransferToSubmissionStatusResponse(True, TransactionStatus.REVERTED,
+                                           _DESTINATION_TRANSACTION_ID,
+                                           _DESTINATION_BLOCK_NUMBER),
+        _INTERNAL_TRANSACTION_IDS[3]: None
+    }
+    mock_database_access.read_validator_node_signatures.return_value = {
+        '0x5FbDB2315678afecb367f032d93F642f64180aa3': '0x1'
+    }
+    mock_validate_transfer_task.__name__ = 'validate_transfer_task'
+    mock_validate_transfer_task.apply_async().id = str(uuid.uuid4())
+    mock_validate_transfer_task.apply_async.call_count = 0
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    mock_blockchain_client.get_transfer_to_submission_statuses.\
+        assert_called_once_with(_INTERNAL_TRANSACTION_IDS)
+    mock_database_access.update_transfer_confirmations.\
+        assert_called_once_with([
+            TransferConfirmationRequest(
+                unconfirmed_transfers[1].internal_transfer_id,
+                _DESTINATION_TRANSFER_ID, _DESTINATION_TRANSACTION_ID,
+                _DESTINATION_BLOCK_NUMBER,
+                TransferStatus.SOURCE_REVERSAL_TRANSACTION_CONFIRMED
+                if is_reversal_transfer else
+                TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+        ])
+    mock_database_access.create_transfer_to_gas_usage.assert_called_once_with(
+        CrossChainTransfer.from_dict(
+            cross_chain_transfer_dict).eventual_destination_blockchain, 1,
+        _GAS_USED, 20)
+    restarted_internal_transfer_ids = [
+        unconfirmed_transfer.internal_transfer_id
+        for unconfirmed_transfer in unconfirmed_transfers[2:]
+    ]
+    mock_database_access.reset_transfer_submission.assert_has_calls([
+        unittest.mock.call(internal_transfer_id)
+        for internal_transfer_id in restarted_internal_transfer_ids
+    ])
+    mock_database_access.update_transfer_status.assert_has_calls([
+        unittest.mock.call(internal_transfer_id,
+                           TransferStatus.SOURCE_TRANSACTION_DETECTED)
+        for internal_transfer_id in restarted_internal_transfer_ids
+    ])
+    assert mock_validate_transfer_task.apply_async.call_count == 2
+    # Only the results of the pending submission are kept
+    forget_task_results.assert_called_once_with(_INTERNAL_TRANSACTION_IDS[1:])
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+def test_confirm_transfers_single_transfer_error(
+        mock_get_blockchain_client, mock_database_access, transfer_interactor,
+        destination_blockchain, unconfirmed_transfers,
+        cross_chain_transfer_dict, forget_task_results):
+    mock_database_access.read_unconfirmed_transfers.return_value = \
+        unconfirmed_transfers[:2]
+    # The data of the first transfer cannot be read
+    confirmed_transfer_id = unconfirmed_transfers[1].internal_transfer_id
+    mock_database_access.read_transfer_data.return_value = {
+        confirmed_transfer_id: cross_chain_transfer_dict
+    }
+    mock_blockchain_client = mock_get_blockchain_client()
+    mock_blockchain_client.prefetch_transfer_to_transaction_data.\
+        side_effect = [True, False]
+    mock_blockchain_client.get_transfer_to_submission_statuses.return_value = {
+        _INTERNAL_TRANSACTION_IDS[0]: BlockchainClient.
+        TransferToSubmissionStatusResponse(False),
+        _INTERNAL_TRANSACTION_IDS[1]: BlockchainClient.
+        TransferToSubmissionStatusResponse(
+            True, TransactionStatus.CONFIRMED, _DESTINATION_TRANSACTION_ID,
+            _DESTINATION_BLOCK_NUMBER,
+            destination_transfer_id=_DESTINATION_TRANSFER_ID)
+    }
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    # The other transfers are still confirmed
+    mock_database_access.update_transfer_confirmations.\
+        assert_called_once_with([
+            TransferConfirmationRequest(
+                confirmed_transfer_id, _DESTINATION_TRANSFER_ID,
+                _DESTINATION_TRANSACTION_ID, _DESTINATION_BLOCK_NUMBER,
+                TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+        ])
+    forget_task_results.assert_called_once_with([_INTERNAL_TRANSACTION_IDS[1]])
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    # The transfers are checked again even without a new block
+    assert (mock_blockchain_client.get_transfer_to_submission_statuses.
+            call_count == 2)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+def test_confirm_transfers_forget_task_results_error(
+        mock_get_blockchain_client, mock_database_access, transfer_interactor,
+        destination_blockchain, unconfirmed_transfers,
+        cross_chain_transfer_dict, forget_task_results):
+    mock_database_access.read_unconfirmed_transfers.return_value = \
+        unconfirmed_transfers[1:2]
+    internal_transfer_id = unconfirmed_transfers[1].internal_transfer_id
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+    mock_blockchain_client = mock_get_blockchain_client()
+    mock_blockchain_client.get_transfer_to_submission_statuses.return_value = {
+        _INTERNAL_TRANSACTION_IDS[1]: BlockchainClient.
+        TransferToSubmissionStatusResponse(
+            True, TransactionStatus.CONFIRMED, _DESTINATION_TRANSACTION_ID,
+            _DESTINATION_BLOCK_NUMBER,
+            destination_transfer_id=_DESTINATION_TRANSFER_ID)
+    }
+    forget_task_results.side_effect = Exception
+
+    transfer_interactor.confirm_transfers(destination_blockchain)
+
+    # The transfer is still confirmed
+    mock_database_access.update_transfer_confirmations.assert_called_once()
+    forget_task_results.assert_called_once_with([_INTERNAL_TRANSACTION_IDS[1]])
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_confirm_transfers_error(mock_database_access, transfer_interactor,
+                                 destination_blockchain):
+    mock_database_access.read_unconfirmed_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError) as exception_info:
+        transfer_interactor.confirm_transfers(destination_blockchain)
+
+    assert (exception_info.value.details['destination_blockchain'] ==
+            destination_blockchain)
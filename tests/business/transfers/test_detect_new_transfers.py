@@ -7,6 +7,7 @@ from vision.common.blockchains.enums import Blockchain
 
 from vision.validatornode.blockchains.base import BlockchainClient
 from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.celery import get_task_routing_headers
 from vision.validatornode.entities import CrossChainTransfer
 
 _SOURCE_BLOCKCHAIN = list(Blockchain)[0]
@@ -41,13 +42,17 @@ _TASK_INTERVAL = 120
     'vision.validatornode.business.transfers.get_blockchain_client')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_config')
-@unittest.mock.patch('vision.validatornode.business.transfers.config', {
-    'tasks': {
-        'validate_transfer': {
-            'retry_interval_in_seconds': _TASK_INTERVAL
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
         }
-    }
-})
+    })
 def test_detect_new_transfers_correct(
         mock_get_blockchain_config, mock_get_blockchain_client,
         mock_database_access, mock_validate_transfer_task, mock_random,
@@ -89,9 +94,10 @@ def test_detect_new_transfers_correct(
         validate_transfer_task_calls = []
         for transfer in outgoing_transfers_response.outgoing_transfers:
             validate_transfer_task_calls.append(
-                unittest.mock.call(
-                    args=(transfer.source_transfer_id, transfer.to_dict()),
-                    countdown=_TASK_INTERVAL))
+                unittest.mock.call(args=(transfer.source_transfer_id, ),
+                                   task_id=unittest.mock.ANY,
+                                   countdown=_TASK_INTERVAL,
+                                   headers=get_task_routing_headers(transfer)))
         mock_validate_transfer_task.apply_async.assert_has_calls(
             validate_transfer_task_calls, any_order=True)
 
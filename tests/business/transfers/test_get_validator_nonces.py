@@ -0,0 +1,39 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractorError
+
+_OTHER_SOURCE_TRANSACTION_ID = \
+    '0x3f0ff8e4c6d4a1b3a0e0d8ef6c8a0e7c3d1f2b9e4a5c6d7e8f9a0b1c2d3e4f5a'
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_get_validator_nonces_correct(mock_database_access, source_blockchain,
+                                      source_transaction_id, validator_nonce,
+                                      transfer_interactor):
+    source_transactions = [(source_blockchain, source_transaction_id),
+                           (source_blockchain, _OTHER_SOURCE_TRANSACTION_ID)]
+    mock_database_access.read_validator_nonces_by_source_transaction_ids.\
+        return_value = {
+            (source_blockchain, source_transaction_id): validator_nonce
+        }
+
+    result = transfer_interactor.get_validator_nonces(source_transactions)
+
+    assert result == [validator_nonce, None]
+    mock_database_access.read_validator_nonces_by_source_transaction_ids.\
+        assert_called_once_with(source_transactions)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_get_validator_nonces_database_error(mock_database_access,
+                                             source_blockchain,
+                                             source_transaction_id,
+                                             transfer_interactor):
+    mock_database_access.read_validator_nonces_by_source_transaction_ids.\
+        side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.get_validator_nonces([(source_blockchain,
+                                                   source_transaction_id)])
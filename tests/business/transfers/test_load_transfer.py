@@ -0,0 +1,87 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.base import UnknownTransferError
+from vision.validatornode.business.transfers import TransferInteractorError
+
+
+@pytest.mark.parametrize('task_transfer_dict_given', [True, False])
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_load_transfer_correct(mock_database_access, task_transfer_dict_given,
+                               transfer_interactor, internal_transfer_id,
+                               cross_chain_transfer,
+                               cross_chain_transfer_dict):
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: dict(cross_chain_transfer_dict)
+    }
+    # The stored transfer data takes precedence over the task's data
+    task_transfer_dict = (dict(cross_chain_transfer_dict, amount=0)
+                          if task_transfer_dict_given else None)
+
+    transfer = transfer_interactor.load_transfer(internal_transfer_id,
+                                                 task_transfer_dict)
+
+    assert transfer == cross_chain_transfer
+    mock_database_access.read_transfer_data.assert_called_once_with(
+        [internal_transfer_id])
+    mock_database_access.update_transfer_data.assert_not_called()
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_load_transfer_legacy_task_correct(mock_database_access,
+                                           transfer_interactor,
+                                           internal_transfer_id,
+                                           cross_chain_transfer,
+                                           cross_chain_transfer_dict):
+    mock_database_access.read_transfer_data.return_value = {}
+
+    transfer = transfer_interactor.load_transfer(internal_transfer_id,
+                                                 cross_chain_transfer_dict)
+
+    assert transfer == cross_chain_transfer
+    # The transfer data is stored for the subsequent processing steps
+    mock_database_access.update_transfer_data.assert_called_once_with(
+        internal_transfer_id, cross_chain_transfer_dict)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_load_transfer_legacy_task_database_error(mock_database_access,
+                                                  transfer_interactor,
+                                                  internal_transfer_id,
+                                                  cross_chain_transfer_dict):
+    mock_database_access.read_transfer_data.return_value = {}
+    mock_database_access.update_transfer_data.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError) as exception_info:
+        transfer_interactor.load_transfer(internal_transfer_id,
+                                          cross_chain_transfer_dict)
+
+    assert (exception_info.value.details['internal_transfer_id'] ==
+            internal_transfer_id)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_load_transfer_unknown_transfer_error(mock_database_access,
+                                              transfer_interactor,
+                                              internal_transfer_id):
+    mock_database_access.read_transfer_data.return_value = {}
+
+    with pytest.raises(UnknownTransferError) as exception_info:
+        transfer_interactor.load_transfer(internal_transfer_id)
+
+    assert (exception_info.value.details['internal_transfer_id'] ==
+            internal_transfer_id)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_load_transfer_database_error(mock_database_access,
+                                      transfer_interactor,
+                                      internal_transfer_id):
+    mock_database_access.read_transfer_data.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError) as exception_info:
+        transfer_interactor.load_transfer(internal_transfer_id)
+
+    assert (exception_info.value.details['internal_transfer_id'] ==
+            internal_transfer_id)
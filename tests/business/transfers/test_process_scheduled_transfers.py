@@ -0,0 +1,126 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.database.access import ScheduledTransferResponse
+from vision.validatornode.database.enums import TransferStep
+
+_TASK_INTERVAL = 120
+
+_BATCH_SIZE = 50
+
+_LEASE = 600
+
+_ATTEMPTS = 3
+
+_SCHEDULE_ID = uuid.UUID('9e0f6a57-2f0b-4b8c-a4c1-6d3e28b1f4a0')
+
+_RETRY_POLICIES = dict.fromkeys(
+    [
+        'transitory_state', 'rpc_failure', 'primary_node_unreachable',
+        'database_conflict', 'unknown_error'
+    ], {
+        'backoff_factor': 1.0,
+        'max_interval_in_seconds': _TASK_INTERVAL,
+        'jitter': 0.0
+    })
+
+_CONFIG = {
+    'scheduler': {
+        'batch_size': _BATCH_SIZE,
+        'lease_in_seconds': _LEASE
+    },
+    'tasks': {
+        step.name.lower(): {
+            'retry_interval_in_seconds': _TASK_INTERVAL,
+            'retry_interval_after_error_in_seconds': _TASK_INTERVAL
+        }
+        for step in TransferStep
+    },
+    'retries': _RETRY_POLICIES
+}
+
+_STEP_METHODS = {step: step.name.lower() for step in TransferStep}
+
+
+@pytest.mark.parametrize('step_completed', [True, False])
+@pytest.mark.parametrize('step', [step for step in TransferStep])
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_process_scheduled_transfers_correct(
+        mock_database_access, mock_load_transfer, step, step_completed,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_database_access.claim_scheduled_transfers.return_value = [
+        ScheduledTransferResponse(internal_transfer_id, _ATTEMPTS,
+                                  _SCHEDULE_ID)
+    ]
+    mock_load_transfer.return_value = cross_chain_transfer
+
+    with unittest.mock.patch.object(
+            TransferInteractor, _STEP_METHODS[step],
+            return_value=step_completed) as mock_step_method:
+        number_transfers = transfer_interactor.process_scheduled_transfers(
+            step)
+
+    assert number_transfers == 1
+    mock_database_access.claim_scheduled_transfers.assert_called_once_with(
+        step, _BATCH_SIZE, _LEASE)
+    mock_load_transfer.assert_called_once_with(internal_transfer_id)
+    if step is TransferStep.SUBMIT_TRANSFER_ONCHAIN:
+        # The submission is claimed for the scheduled step
+        mock_step_method.assert_called_once_with(internal_transfer_id,
+                                                 cross_chain_transfer,
+                                                 task_id=_SCHEDULE_ID)
+    else:
+        mock_step_method.assert_called_once_with(internal_transfer_id,
+                                                 cross_chain_transfer)
+    if step_completed:
+        mock_database_access.reset_transfer_schedule.assert_called_once_with(
+            internal_transfer_id, step)
+        mock_database_access.update_transfer_next_attempt.assert_not_called()
+    else:
+        mock_database_access.reset_transfer_schedule.assert_not_called()
+        mock_database_access.update_transfer_next_attempt.\
+            assert_called_once_with(internal_transfer_id, step,
+                                    _TASK_INTERVAL)
+
+
+@unittest.mock.patch.object(TransferInteractor, 'validate_transfer')
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_process_scheduled_transfers_step_error(
+        mock_database_access, mock_load_transfer, mock_validate_transfer,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_database_access.claim_scheduled_transfers.return_value = [
+        ScheduledTransferResponse(internal_transfer_id, _ATTEMPTS,
+                                  _SCHEDULE_ID),
+        ScheduledTransferResponse(internal_transfer_id + 1, 0, uuid.uuid4())
+    ]
+    mock_load_transfer.return_value = cross_chain_transfer
+    mock_validate_transfer.side_effect = [TransferInteractorError(''), True]
+
+    number_transfers = transfer_interactor.process_scheduled_transfers(
+        TransferStep.VALIDATE_TRANSFER)
+
+    # An error for one transfer does not affect the other transfers
+    assert number_transfers == 2
+    mock_database_access.update_transfer_next_attempt.assert_called_once_with(
+        internal_transfer_id, TransferStep.VALIDATE_TRANSFER, _TASK_INTERVAL)
+    mock_database_access.reset_transfer_schedule.assert_called_once_with(
+        internal_transfer_id + 1, TransferStep.VALIDATE_TRANSFER)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_process_scheduled_transfers_claim_error(mock_database_access,
+                                                 transfer_interactor):
+    mock_database_access.claim_scheduled_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.process_scheduled_transfers(
+            TransferStep.VALIDATE_TRANSFER)
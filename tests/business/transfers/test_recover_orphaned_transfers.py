@@ -0,0 +1,153 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.celery import get_task_routing_headers
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
+
+_TASK_INTERVAL = 120
+
+_STALE_AFTER = 3600
+
+_BATCH_SIZE = 500
+
+_MAX_TRANSFERS_PER_SECOND = 2
+
+_NUMBER_TRANSFERS = 5
+
+_RECOVERY_CONFIG = {
+    'stale_after_in_seconds': _STALE_AFTER,
+    'batch_size': _BATCH_SIZE,
+    'max_transfers_per_second': _MAX_TRANSFERS_PER_SECOND
+}
+
+_TASKS_CONFIG = {
+    'validate_transfer': {
+        'retry_interval_in_seconds': _TASK_INTERVAL
+    }
+}
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.validate_transfer_task')
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'recovery': _RECOVERY_CONFIG,
+        'tasks': _TASKS_CONFIG
+    })
+def test_recover_orphaned_transfers_correct(
+        mock_database_access, mock_load_transfer, mock_validate_transfer_task,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    internal_transfer_ids = [
+        internal_transfer_id + i for i in range(_NUMBER_TRANSFERS)
+    ]
+    mock_database_access.read_stale_transfers.return_value = \
+        internal_transfer_ids
+    mock_load_transfer.return_value = cross_chain_transfer
+    mock_validate_transfer_task.__name__ = 'validate_transfer_task'
+
+    number_transfers = transfer_interactor.recover_orphaned_transfers()
+
+    assert number_transfers == _NUMBER_TRANSFERS
+    mock_database_access.read_stale_transfers.assert_called_once_with(
+        (TransferStatus.SOURCE_TRANSACTION_DETECTED,
+         TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED),
+        _STALE_AFTER, _BATCH_SIZE)
+    # The re-enqueued transfers are spread over time
+    mock_validate_transfer_task.apply_async.assert_has_calls([
+        unittest.mock.call(
+            args=(internal_transfer_ids[i], ), task_id=unittest.mock.ANY,
+            countdown=_TASK_INTERVAL + i // _MAX_TRANSFERS_PER_SECOND,
+            headers=get_task_routing_headers(cross_chain_transfer))
+        for i in range(_NUMBER_TRANSFERS)
+    ])
+    mock_database_access.reset_transfer_submission.assert_has_calls(
+        [unittest.mock.call(id_) for id_ in internal_transfer_ids])
+    # Only the claims of the lost tasks are released
+    mock_database_access.release_stale_transfer_tasks.assert_has_calls([
+        unittest.mock.call(id_, _STALE_AFTER) for id_ in internal_transfer_ids
+    ])
+    mock_database_access.update_transfer_task_id.assert_has_calls([
+        unittest.mock.call(id_, unittest.mock.ANY)
+        for id_ in internal_transfer_ids
+    ])
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.validate_transfer_task')
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': True
+        },
+        'recovery': _RECOVERY_CONFIG,
+        'tasks': _TASKS_CONFIG
+    })
+def test_recover_orphaned_transfers_scheduler_correct(
+        mock_database_access, mock_load_transfer, mock_validate_transfer_task,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_database_access.read_stale_transfers.return_value = [
+        internal_transfer_id
+    ]
+    mock_load_transfer.return_value = cross_chain_transfer
+    mock_validate_transfer_task.__name__ = 'validate_transfer_task'
+
+    number_transfers = transfer_interactor.recover_orphaned_transfers()
+
+    assert number_transfers == 1
+    mock_database_access.update_transfer_schedule.assert_called_once_with(
+        internal_transfer_id, TransferStep.VALIDATE_TRANSFER, _TASK_INTERVAL)
+    mock_validate_transfer_task.apply_async.assert_not_called()
+    mock_database_access.update_transfer_task_id.assert_not_called()
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.validate_transfer_task')
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'recovery': _RECOVERY_CONFIG,
+        'tasks': _TASKS_CONFIG
+    })
+def test_recover_orphaned_transfers_transfer_error(
+        mock_database_access, mock_load_transfer, mock_validate_transfer_task,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_database_access.read_stale_transfers.return_value = [
+        internal_transfer_id, internal_transfer_id + 1
+    ]
+    mock_load_transfer.side_effect = [
+        TransferInteractorError(''), cross_chain_transfer
+    ]
+    mock_validate_transfer_task.__name__ = 'validate_transfer_task'
+
+    number_transfers = transfer_interactor.recover_orphaned_transfers()
+
+    # An error for one transfer does not affect the other transfers
+    assert number_transfers == 1
+    mock_database_access.reset_transfer_submission.assert_called_once_with(
+        internal_transfer_id + 1)
+
+
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config',
+                     {'recovery': _RECOVERY_CONFIG})
+def test_recover_orphaned_transfers_read_error(mock_database_access,
+                                               transfer_interactor):
+    mock_database_access.read_stale_transfers.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.recover_orphaned_transfers()
@@ -0,0 +1,206 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.celery import get_task_routing_headers
+from vision.validatornode.database.enums import TransferStep
+
+
+@unittest.mock.patch.object(
+    TransferInteractor,
+    '_TransferInteractor__sufficient_secondary_node_signatures',
+    return_value=True)
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.transfers.config',
+                     {'scheduler': {
+                         'enabled': False
+                     }})
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_schedule_transfer_onchain_submission_correct(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_sufficient_secondary_node_signatures, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, cross_chain_transfer_dict):
+    mock_database_access.read_transfer_awaiting_signatures.return_value = \
+        True
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+    mock_database_access.claim_transfer_submission.return_value = True
+
+    scheduled = transfer_interactor.schedule_transfer_onchain_submission(
+        internal_transfer_id)
+
+    assert scheduled
+    task_id = mock_database_access.claim_transfer_submission.call_args.args[1]
+    assert isinstance(task_id, uuid.UUID)
+    # The claim of the task polling for more signatures is taken over
+    mock_database_access.reassign_transfer_task.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN, task_id)
+    mock_submit_transfer_onchain_task.apply_async.assert_called_once_with(
+        args=(internal_transfer_id, ), task_id=str(task_id),
+        headers=get_task_routing_headers(cross_chain_transfer))
+    mock_database_access.release_transfer_submission.assert_not_called()
+    mock_database_access.release_transfer_task.assert_not_called()
+
+
+@unittest.mock.patch.object(
+    TransferInteractor,
+    '_TransferInteractor__sufficient_secondary_node_signatures',
+    return_value=True)
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.transfers.config',
+                     {'scheduler': {
+                         'enabled': True
+                     }})
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_schedule_transfer_onchain_submission_scheduler_correct(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_sufficient_secondary_node_signatures, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer_dict):
+    mock_database_access.read_transfer_awaiting_signatures.return_value = \
+        True
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+
+    scheduled = transfer_interactor.schedule_transfer_onchain_submission(
+        internal_transfer_id)
+
+    assert scheduled
+    mock_database_access.update_transfer_schedule.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN, 0)
+    mock_database_access.claim_transfer_submission.assert_not_called()
+    mock_submit_transfer_onchain_task.apply_async.assert_not_called()
+
+
+@pytest.mark.parametrize('awaiting_signatures, sufficient_signatures',
+                         [(False, True), (True, False)])
+@unittest.mock.patch.object(
+    TransferInteractor,
+    '_TransferInteractor__sufficient_secondary_node_signatures')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_schedule_transfer_onchain_submission_not_ready(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_sufficient_secondary_node_signatures, sufficient_signatures,
+        awaiting_signatures, transfer_interactor, internal_transfer_id,
+        cross_chain_transfer_dict):
+    mock_database_access.read_transfer_awaiting_signatures.return_value = \
+        awaiting_signatures
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+    mock_sufficient_secondary_node_signatures.return_value = \
+        sufficient_signatures
+
+    scheduled = transfer_interactor.schedule_transfer_onchain_submission(
+        internal_transfer_id)
+
+    assert not scheduled
+    mock_database_access.claim_transfer_submission.assert_not_called()
+    mock_submit_transfer_onchain_task.apply_async.assert_not_called()
+
+
+@unittest.mock.patch.object(
+    TransferInteractor,
+    '_TransferInteractor__sufficient_secondary_node_signatures',
+    return_value=True)
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.transfers.config',
+                     {'scheduler': {
+                         'enabled': False
+                     }})
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_schedule_transfer_onchain_submission_already_claimed(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_sufficient_secondary_node_signatures, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer_dict):
+    mock_database_access.read_transfer_awaiting_signatures.return_value = \
+        True
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+    mock_database_access.claim_transfer_submission.return_value = False
+
+    scheduled = transfer_interactor.schedule_transfer_onchain_submission(
+        internal_transfer_id)
+
+    assert not scheduled
+    mock_database_access.reassign_transfer_task.assert_not_called()
+    mock_submit_transfer_onchain_task.apply_async.assert_not_called()
+
+
+@unittest.mock.patch.object(
+    TransferInteractor,
+    '_TransferInteractor__sufficient_secondary_node_signatures',
+    return_value=True)
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.transfers.config',
+                     {'scheduler': {
+                         'enabled': False
+                     }})
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_schedule_transfer_onchain_submission_error(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_sufficient_secondary_node_signatures, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer_dict):
+    mock_database_access.read_transfer_awaiting_signatures.return_value = \
+        True
+    mock_database_access.read_transfer_data.return_value = {
+        internal_transfer_id: cross_chain_transfer_dict
+    }
+    mock_database_access.claim_transfer_submission.return_value = True
+    mock_submit_transfer_onchain_task.apply_async.side_effect = Exception
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.schedule_transfer_onchain_submission(
+            internal_transfer_id)
+
+    task_id = mock_database_access.claim_transfer_submission.call_args.args[1]
+    mock_database_access.release_transfer_submission.assert_called_once_with(
+        internal_transfer_id, task_id)
+    mock_database_access.release_transfer_task.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN, task_id)
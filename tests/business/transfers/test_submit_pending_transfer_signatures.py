@@ -0,0 +1,165 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.business.transfers import TransferInteractorError
+from vision.validatornode.celery import get_task_routing_headers
+from vision.validatornode.database.access import \
+    PendingTransferSignatureResponse
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.restclient import PrimaryNodeClient
+from vision.validatornode.restclient import PrimaryNodeClientError
+from vision.validatornode.restclient import PrimaryNodeDuplicateSignatureError
+
+_TASK_INTERVAL = 120
+
+_CONFIG = {
+    'application': {
+        'primary_url': 'https://some.url'
+    },
+    'scheduler': {
+        'enabled': False
+    },
+    'tasks': {
+        'submit_transfer_to_primary_node': {
+            'retry_interval_in_seconds': _TASK_INTERVAL
+        }
+    }
+}
+
+
+@pytest.mark.parametrize('duplicate_signature', [True, False])
+@pytest.mark.parametrize('is_reversal_transfer', [True, False])
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signatures')
+@unittest.mock.patch('vision.validatornode.business.transfers.'
+                     'submit_transfer_to_primary_node_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_config')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_submit_pending_transfer_signatures_correct(
+        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_database_access, mock_submit_transfer_to_primary_node_task,
+        mock_post_transfer_signatures, mock_load_transfer,
+        is_reversal_transfer, duplicate_signature, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, destination_hub_address,
+        destination_forwarder_address, validator_node_signatures):
+    mock_get_blockchain_config.return_value = {
+        'hub': destination_hub_address,
+        'forwarder': destination_forwarder_address
+    }
+    own_address = list(validator_node_signatures.keys())[0]
+    signature = list(validator_node_signatures.values())[0]
+    mock_get_blockchain_client().get_own_address.return_value = own_address
+    mock_database_access.read_pending_transfer_signatures.return_value = [
+        PendingTransferSignatureResponse(internal_transfer_id, signature)
+    ]
+    mock_database_access.read_validator_node_signature.return_value = None
+    cross_chain_transfer.is_reversal_transfer = is_reversal_transfer
+    mock_load_transfer.return_value = cross_chain_transfer
+    mock_post_transfer_signatures.return_value = [
+        PrimaryNodeDuplicateSignatureError() if duplicate_signature else None
+    ]
+
+    number_signatures = \
+        transfer_interactor.submit_pending_transfer_signatures()
+
+    assert number_signatures == 1
+    mock_load_transfer.assert_called_once_with(internal_transfer_id)
+    mock_post_transfer_signatures.assert_called_once_with([
+        PrimaryNodeClient.TransferSignaturePostRequest(
+            cross_chain_transfer.source_blockchain,
+            cross_chain_transfer.source_transaction_id, signature)
+    ])
+    mock_database_access.create_validator_node_signature.\
+        assert_called_once_with(
+            internal_transfer_id,
+            cross_chain_transfer.eventual_destination_blockchain,
+            destination_forwarder_address, own_address, signature,
+            verified=True)
+    mock_database_access.update_transfer_submitted_destination_transaction.\
+        assert_called_once_with(internal_transfer_id, destination_hub_address,
+                                destination_forwarder_address)
+    mock_database_access.update_transfer_status.assert_called_once_with(
+        internal_transfer_id,
+        TransferStatus.SOURCE_REVERSAL_TRANSACTION_SUBMITTED
+        if is_reversal_transfer else
+        TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
+    mock_database_access.delete_pending_transfer_signature.\
+        assert_called_once_with(internal_transfer_id)
+    mock_submit_transfer_to_primary_node_task.apply_async.assert_not_called()
+
+
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signatures')
+@unittest.mock.patch('vision.validatornode.business.transfers.'
+                     'submit_transfer_to_primary_node_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_submit_pending_transfer_signatures_rejected_correct(
+        mock_database_access, mock_submit_transfer_to_primary_node_task,
+        mock_post_transfer_signatures, mock_load_transfer, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, validator_node_signatures):
+    mock_submit_transfer_to_primary_node_task.__name__ = \
+        'submit_transfer_to_primary_node_task'
+    signature = list(validator_node_signatures.values())[0]
+    mock_database_access.read_pending_transfer_signatures.return_value = [
+        PendingTransferSignatureResponse(internal_transfer_id, signature)
+    ]
+    mock_load_transfer.return_value = cross_chain_transfer
+    mock_post_transfer_signatures.return_value = [PrimaryNodeClientError()]
+
+    number_signatures = \
+        transfer_interactor.submit_pending_transfer_signatures()
+
+    assert number_signatures == 1
+    mock_database_access.update_transfer_status.assert_not_called()
+    mock_database_access.delete_pending_transfer_signature.\
+        assert_called_once_with(internal_transfer_id)
+    # The regularly scheduled submission takes over
+    mock_submit_transfer_to_primary_node_task.apply_async.\
+        assert_called_once_with(
+            args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+            countdown=_TASK_INTERVAL,
+            headers=get_task_routing_headers(cross_chain_transfer))
+
+
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signatures')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_submit_pending_transfer_signatures_none_pending_correct(
+        mock_database_access, mock_post_transfer_signatures,
+        transfer_interactor):
+    mock_database_access.read_pending_transfer_signatures.return_value = []
+
+    number_signatures = \
+        transfer_interactor.submit_pending_transfer_signatures()
+
+    assert number_signatures == 0
+    mock_post_transfer_signatures.assert_not_called()
+
+
+@unittest.mock.patch.object(TransferInteractor, 'load_transfer')
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signatures',
+                            side_effect=PrimaryNodeClientError)
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch('vision.validatornode.business.transfers.config', _CONFIG)
+def test_submit_pending_transfer_signatures_primary_node_error(
+        mock_database_access, mock_post_transfer_signatures,
+        mock_load_transfer, transfer_interactor, internal_transfer_id,
+        cross_chain_transfer, validator_node_signatures):
+    signature = list(validator_node_signatures.values())[0]
+    mock_database_access.read_pending_transfer_signatures.return_value = [
+        PendingTransferSignatureResponse(internal_transfer_id, signature)
+    ]
+    mock_load_transfer.return_value = cross_chain_transfer
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.submit_pending_transfer_signatures()
+
+    # The pending signatures are posted again by the next flush
+    mock_database_access.delete_pending_transfer_signature.assert_not_called()
@@ -6,13 +6,27 @@ import pytest
 from vision.validatornode.business.transfers import TransferInteractorError
 from vision.validatornode.business.transfers import \
     submit_transfer_to_primary_node_task
+from vision.validatornode.celery import get_task_routing_headers
 from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
 from vision.validatornode.restclient import PrimaryNodeClient
 from vision.validatornode.restclient import PrimaryNodeClientError
 from vision.validatornode.restclient import PrimaryNodeDuplicateSignatureError
+from vision.validatornode.restclient import TransferSignatureBatcher
+from vision.validatornode.restclient import ValidatorNonceBatcher
 
 _TASK_INTERVAL = 120
 
+_RETRY_POLICIES = dict.fromkeys(
+    [
+        'transitory_state', 'rpc_failure', 'primary_node_unreachable',
+        'database_conflict', 'unknown_error'
+    ], {
+        'backoff_factor': 1.0,
+        'max_interval_in_seconds': _TASK_INTERVAL,
+        'jitter': 0.0
+    })
+
 
 @pytest.mark.parametrize('signature_in_database', [True, False])
 @pytest.mark.parametrize('duplicate_signature', [True, False])
@@ -24,10 +38,13 @@ _TASK_INTERVAL = 120
     'vision.validatornode.business.transfers.get_blockchain_client')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.get_blockchain_config')
-@unittest.mock.patch('vision.validatornode.business.transfers.config',
-                     {'application': {
-                         'primary_url': 'https://some.url'
-                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'primary_node_batch_window_in_seconds': 0
+        }
+    })
 @unittest.mock.patch('vision.validatornode.business.base.config',
                      {'application': {
                          'mode': 'secondary'
@@ -77,7 +94,8 @@ def test_submit_transfer_to_primary_node_correct(
             assert_called_once_with(
                 internal_transfer_id,
                 cross_chain_transfer.eventual_destination_blockchain,
-                destination_forwarder_address, own_address, signature)
+                destination_forwarder_address, own_address, signature,
+                verified=True)
     mock_database_access.update_transfer_submitted_destination_transaction.\
         assert_called_once_with(internal_transfer_id, destination_hub_address,
                                 destination_forwarder_address)
@@ -88,13 +106,136 @@ def test_submit_transfer_to_primary_node_correct(
         TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
 
 
+@unittest.mock.patch.dict(
+    'vision.validatornode.business.transfers._primary_node_batchers',
+    clear=True)
+@unittest.mock.patch.object(TransferSignatureBatcher,
+                            'post_transfer_signature')
+@unittest.mock.patch.object(ValidatorNonceBatcher, 'get_validator_nonce')
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signature')
+@unittest.mock.patch.object(PrimaryNodeClient, 'get_validator_nonce')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_config')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'primary_node_batch_window_in_seconds': 0.5
+        },
+        'celery': {
+            'worker_pool': 'threads'
+        }
+    })
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'secondary'
+                     }})
+def test_submit_transfer_to_primary_node_batched_correct(
+        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_database_access, mock_get_validator_nonce,
+        mock_post_transfer_signature, mock_batcher_get_validator_nonce,
+        mock_batcher_post_transfer_signature, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, validator_nonce,
+        destination_hub_address, destination_forwarder_address,
+        validator_node_signatures):
+    mock_get_blockchain_config.return_value = {
+        'hub': destination_hub_address,
+        'forwarder': destination_forwarder_address
+    }
+    signature = list(validator_node_signatures.values())[0]
+    mock_get_blockchain_client().sign_transfer_to_message.return_value = \
+        signature
+    mock_batcher_get_validator_nonce.return_value = validator_nonce
+
+    submission_completed = transfer_interactor.submit_transfer_to_primary_node(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert submission_completed
+    mock_get_validator_nonce.assert_not_called()
+    mock_post_transfer_signature.assert_not_called()
+    mock_batcher_get_validator_nonce.assert_called_once_with(
+        PrimaryNodeClient.ValidatorNonceGetRequest(
+            cross_chain_transfer.source_blockchain,
+            cross_chain_transfer.source_transaction_id))
+    mock_batcher_post_transfer_signature.assert_called_once_with(
+        PrimaryNodeClient.TransferSignaturePostRequest(
+            cross_chain_transfer.source_blockchain,
+            cross_chain_transfer.source_transaction_id, signature))
+
+
+@unittest.mock.patch.dict(
+    'vision.validatornode.business.transfers._primary_node_batchers',
+    clear=True)
+@unittest.mock.patch.object(TransferSignatureBatcher,
+                            'post_transfer_signature')
+@unittest.mock.patch.object(ValidatorNonceBatcher, 'get_validator_nonce')
 @unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signature')
 @unittest.mock.patch.object(PrimaryNodeClient, 'get_validator_nonce')
 @unittest.mock.patch('vision.validatornode.business.transfers.database_access')
-@unittest.mock.patch('vision.validatornode.business.transfers.config',
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_config')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'primary_node_batch_window_in_seconds': 0.5
+        },
+        'celery': {
+            'worker_pool': 'prefork'
+        }
+    })
+@unittest.mock.patch('vision.validatornode.business.base.config',
                      {'application': {
-                         'primary_url': 'https://some.url'
+                         'mode': 'secondary'
                      }})
+def test_submit_transfer_to_primary_node_batched_prefork_correct(
+        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_database_access, mock_get_validator_nonce,
+        mock_post_transfer_signature, mock_batcher_get_validator_nonce,
+        mock_batcher_post_transfer_signature, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, validator_nonce,
+        destination_hub_address, destination_forwarder_address,
+        validator_node_signatures):
+    mock_get_blockchain_config.return_value = {
+        'hub': destination_hub_address,
+        'forwarder': destination_forwarder_address
+    }
+    signature = list(validator_node_signatures.values())[0]
+    mock_get_blockchain_client().sign_transfer_to_message.return_value = \
+        signature
+    mock_get_validator_nonce.return_value = validator_nonce
+
+    submission_completed = transfer_interactor.submit_transfer_to_primary_node(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert submission_completed
+    mock_batcher_get_validator_nonce.assert_not_called()
+    mock_batcher_post_transfer_signature.assert_not_called()
+    mock_get_validator_nonce.assert_called_once_with(
+        PrimaryNodeClient.ValidatorNonceGetRequest(
+            cross_chain_transfer.source_blockchain,
+            cross_chain_transfer.source_transaction_id))
+    mock_post_transfer_signature.assert_called_once_with(
+        PrimaryNodeClient.TransferSignaturePostRequest(
+            cross_chain_transfer.source_blockchain,
+            cross_chain_transfer.source_transaction_id, signature))
+
+
+@unittest.mock.patch.object(PrimaryNodeClient, 'post_transfer_signature')
+@unittest.mock.patch.object(PrimaryNodeClient, 'get_validator_nonce')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'primary_node_batch_window_in_seconds': 0
+        }
+    })
 @unittest.mock.patch('vision.validatornode.business.base.config',
                      {'application': {
                          'mode': 'secondary'
@@ -125,6 +266,9 @@ def test_submit_transfer_to_primary_node_error(mock_database_access,
     'vision.validatornode.business.transfers.submit_transfer_onchain_task')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
         'tasks': {
             'submit_transfer_onchain': {
                 'retry_interval_in_seconds': _TASK_INTERVAL
@@ -145,8 +289,42 @@ def test_submit_transfer_to_primary_node_as_primary_node(
 
     assert submission_completed
     mock_submit_transfer_onchain_task.apply_async.assert_called_once_with(
-        args=(internal_transfer_id, cross_chain_transfer.to_dict()),
-        countdown=_TASK_INTERVAL)
+        args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+        countdown=_TASK_INTERVAL,
+        headers=get_task_routing_headers(cross_chain_transfer))
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': True
+        },
+        'tasks': {
+            'submit_transfer_onchain': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            },
+        }
+    })
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+def test_submit_transfer_to_primary_node_as_primary_node_scheduler(
+        mock_database_access, mock_submit_transfer_onchain_task,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_submit_transfer_onchain_task.__name__ = 'submit_transfer_onchain_task'
+
+    submission_completed = transfer_interactor.submit_transfer_to_primary_node(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert submission_completed
+    mock_database_access.update_transfer_schedule.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN,
+        _TASK_INTERVAL)
+    mock_submit_transfer_onchain_task.apply_async.assert_not_called()
 
 
 @pytest.mark.parametrize('submission_completed', [True, False])
@@ -156,24 +334,37 @@ def test_submit_transfer_to_primary_node_as_primary_node(
             'submit_transfer_to_primary_node': {
                 'retry_interval_in_seconds': _TASK_INTERVAL
             }
-        }
+        },
+        'retries': _RETRY_POLICIES
     })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
-def test_submit_transfer_to_primary_node_task_correct(
-        mock_transfer_interactor, submission_completed, internal_transfer_id,
-        cross_chain_transfer, cross_chain_transfer_dict):
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_submit_transfer_to_primary_node_task_correct(mock_database_access,
+                                                      mock_transfer_interactor,
+                                                      submission_completed,
+                                                      internal_transfer_id,
+                                                      cross_chain_transfer):
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
     mock_transfer_interactor().submit_transfer_to_primary_node.return_value = \
         submission_completed
     if submission_completed:
-        submit_transfer_to_primary_node_task(internal_transfer_id,
-                                             cross_chain_transfer_dict)
+        submit_transfer_to_primary_node_task(internal_transfer_id)
     else:
-        with pytest.raises(celery.exceptions.Retry):
-            submit_transfer_to_primary_node_task(internal_transfer_id,
-                                                 cross_chain_transfer_dict)
+        with pytest.raises(celery.exceptions.Retry) as exception_info:
+            submit_transfer_to_primary_node_task(internal_transfer_id)
+        assert exception_info.value.when == _TASK_INTERVAL
+    mock_transfer_interactor().load_transfer.assert_called_once_with(
+        internal_transfer_id, None)
     mock_transfer_interactor().submit_transfer_to_primary_node.\
         assert_called_once_with(internal_transfer_id, cross_chain_transfer)
+    if submission_completed:
+        mock_database_access.update_transfer_task_next_attempt.\
+            assert_not_called()
+    else:
+        mock_database_access.update_transfer_task_next_attempt.\
+            assert_called_once_with(internal_transfer_id, _TASK_INTERVAL)
 
 
 @unittest.mock.patch(
@@ -182,18 +373,23 @@ def test_submit_transfer_to_primary_node_task_correct(
             'submit_transfer_to_primary_node': {
                 'retry_interval_after_error_in_seconds': _TASK_INTERVAL
             }
-        }
+        },
+        'retries': _RETRY_POLICIES
     })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
-def test_submit_transfer_to_primary_node_task_error(mock_transfer_interactor,
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_submit_transfer_to_primary_node_task_error(mock_database_access,
+                                                    mock_transfer_interactor,
                                                     internal_transfer_id,
-                                                    cross_chain_transfer,
-                                                    cross_chain_transfer_dict):
+                                                    cross_chain_transfer):
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
     mock_transfer_interactor().submit_transfer_to_primary_node.side_effect = \
         TransferInteractorError('')
     with pytest.raises(TransferInteractorError):
-        submit_transfer_to_primary_node_task(internal_transfer_id,
-                                             cross_chain_transfer_dict)
+        submit_transfer_to_primary_node_task(internal_transfer_id)
     mock_transfer_interactor().submit_transfer_to_primary_node.\
         assert_called_once_with(internal_transfer_id, cross_chain_transfer)
+    mock_database_access.update_transfer_task_next_attempt.\
+        assert_called_once_with(internal_transfer_id, _TASK_INTERVAL)
@@ -1,5 +1,6 @@
 import dataclasses
 import unittest.mock
+import uuid
 
 import celery.exceptions  # type: ignore
 import pytest
@@ -7,10 +8,22 @@ from vision.common.entities import TransactionStatus
 
 from vision.validatornode.business.transfers import TransferInteractorError
 from vision.validatornode.business.transfers import validate_transfer_task
+from vision.validatornode.celery import get_task_routing_headers
 from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
 
 _TASK_INTERVAL = 120
 
+_RETRY_POLICIES = dict.fromkeys(
+    [
+        'transitory_state', 'rpc_failure', 'primary_node_unreachable',
+        'database_conflict', 'unknown_error'
+    ], {
+        'backoff_factor': 1.0,
+        'max_interval_in_seconds': _TASK_INTERVAL,
+        'jitter': 0.0
+    })
+
 
 @pytest.mark.parametrize('token_decimals_correct', [True, False])
 @pytest.mark.parametrize('external_token_address_correct', [True, False])
@@ -28,6 +41,9 @@ _TASK_INTERVAL = 120
 @unittest.mock.patch('vision.validatornode.business.base.config')
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
         'tasks': {
             'submit_transfer_onchain': {
                 'retry_interval_in_seconds': _TASK_INTERVAL
@@ -81,22 +97,216 @@ def test_validate_transfer_confirmed_correct(
             internal_transfer_id,
             cross_chain_transfer.eventual_destination_blockchain,
             cross_chain_transfer.eventual_recipient_address,
-            cross_chain_transfer.eventual_destination_token_address)
+            cross_chain_transfer.eventual_destination_token_address,
+            transfer_in_source_transaction.to_dict())
     mock_database_access.update_transfer_status.assert_not_called()
     if is_primary_node:
         mock_submit_transfer_onchain_task.apply_async.assert_called_once_with(
-            args=(internal_transfer_id,
-                  transfer_in_source_transaction.to_dict()),
-            countdown=_TASK_INTERVAL)
+            args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+            countdown=_TASK_INTERVAL,
+            headers=get_task_routing_headers(transfer_in_source_transaction))
         mock_submit_transfer_to_primary_node_task.apply_async.\
             assert_not_called()
     else:
         mock_submit_transfer_onchain_task.apply_async.assert_not_called()
         mock_submit_transfer_to_primary_node_task.apply_async.\
             assert_called_once_with(
-                args=(internal_transfer_id,
-                      transfer_in_source_transaction.to_dict()),
-                countdown=_TASK_INTERVAL)
+                args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+                countdown=_TASK_INTERVAL, headers=get_task_routing_headers(
+                    transfer_in_source_transaction))
+
+
+@pytest.mark.parametrize('block_canonical', [True, False])
+@unittest.mock.patch('vision.validatornode.business.transfers.'
+                     'submit_transfer_to_primary_node_task')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'submit_transfer_onchain': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        }
+    })
+def test_validate_transfer_source_block_canonical_correct(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task,
+        mock_submit_transfer_to_primary_node_task, block_canonical,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer):
+    mock_submit_transfer_onchain_task.__name__ = 'submit_transfer_onchain_task'
+    _initialize_mock_blockchain_client(mock_get_blockchain_client,
+                                       TransactionStatus.CONFIRMED,
+                                       cross_chain_transfer, True, True, True,
+                                       True, True)
+    mock_blockchain_client = mock_get_blockchain_client()
+    mock_blockchain_client.read_block_hashes.return_value = {
+        cross_chain_transfer.source_block_number: (
+            cross_chain_transfer.source_block_hash
+            if block_canonical else '0x' + 64 * '0')
+    }
+
+    validation_completed = transfer_interactor.validate_transfer(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert validation_completed
+    mock_blockchain_client.read_block_hashes.assert_called_once_with(
+        [cross_chain_transfer.source_block_number])
+    if block_canonical:
+        mock_blockchain_client.read_outgoing_transfers_in_transaction.\
+            assert_not_called()
+    else:
+        mock_blockchain_client.read_outgoing_transfers_in_transaction.\
+            assert_called_once_with(cross_chain_transfer.source_transaction_id,
+                                    cross_chain_transfer.source_hub_address)
+    mock_submit_transfer_onchain_task.apply_async.assert_called_once()
+
+
+@pytest.mark.parametrize('validator_nonce_prefetched', [True, False])
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers._get_validator_nonce')
+@unittest.mock.patch('vision.validatornode.business.transfers.'
+                     'submit_transfer_to_primary_node_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_config')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'secondary'
+                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'presign_transfers': True
+        },
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'submit_transfer_to_primary_node': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        }
+    })
+def test_validate_transfer_presigned_correct(
+        mock_get_blockchain_client, mock_get_blockchain_config,
+        mock_database_access, mock_submit_transfer_to_primary_node_task,
+        mock_get_validator_nonce, validator_nonce_prefetched,
+        transfer_interactor, internal_transfer_id, cross_chain_transfer,
+        validator_nonce, destination_hub_address,
+        destination_forwarder_address):
+    mock_get_blockchain_config.return_value = {
+        'hub': destination_hub_address,
+        'forwarder': destination_forwarder_address
+    }
+    mock_database_access.read_prefetched_validator_nonce.return_value = \
+        validator_nonce if validator_nonce_prefetched else None
+    mock_get_validator_nonce.return_value = validator_nonce
+    _initialize_mock_blockchain_client(mock_get_blockchain_client,
+                                       TransactionStatus.CONFIRMED,
+                                       cross_chain_transfer, True, True, True,
+                                       True, True)
+    signature = mock_get_blockchain_client().sign_transfer_to_message.\
+        return_value
+
+    validation_completed = transfer_interactor.validate_transfer(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert validation_completed
+    mock_database_access.read_prefetched_validator_nonce.\
+        assert_called_once_with(internal_transfer_id)
+    if validator_nonce_prefetched:
+        mock_get_validator_nonce.assert_not_called()
+        mock_database_access.update_transfer_prefetched_validator_nonce.\
+            assert_not_called()
+    else:
+        get_request = mock_get_validator_nonce.call_args.args[1]
+        assert get_request.source_blockchain == \
+            cross_chain_transfer.source_blockchain
+        assert get_request.source_transaction_id == \
+            cross_chain_transfer.source_transaction_id
+        mock_database_access.update_transfer_prefetched_validator_nonce.\
+            assert_called_once_with(internal_transfer_id, validator_nonce)
+    sign_request = mock_get_blockchain_client().sign_transfer_to_message.\
+        call_args.args[0]
+    assert sign_request.validator_nonce == validator_nonce
+    mock_database_access.create_pending_transfer_signature.\
+        assert_called_once_with(internal_transfer_id, signature)
+    mock_submit_transfer_to_primary_node_task.apply_async.assert_not_called()
+
+
+@pytest.mark.parametrize('prefetch_error', [True, False])
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers._get_validator_nonce')
+@unittest.mock.patch('vision.validatornode.business.transfers.'
+                     'submit_transfer_to_primary_node_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_config')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'secondary'
+                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'application': {
+            'primary_url': 'https://some.url',
+            'presign_transfers': True
+        },
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'submit_transfer_to_primary_node': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        }
+    })
+def test_validate_transfer_presigned_error(
+        mock_get_blockchain_client, mock_get_blockchain_config,
+        mock_database_access, mock_submit_transfer_to_primary_node_task,
+        mock_get_validator_nonce, prefetch_error, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer, validator_nonce):
+    mock_submit_transfer_to_primary_node_task.__name__ = \
+        'submit_transfer_to_primary_node_task'
+    mock_database_access.read_prefetched_validator_nonce.return_value = None
+    if prefetch_error:
+        mock_get_validator_nonce.side_effect = Exception
+    else:
+        mock_get_validator_nonce.return_value = validator_nonce
+    _initialize_mock_blockchain_client(mock_get_blockchain_client,
+                                       TransactionStatus.CONFIRMED,
+                                       cross_chain_transfer, True, True, True,
+                                       True, True)
+    if not prefetch_error:
+        mock_get_blockchain_client().sign_transfer_to_message.side_effect = \
+            Exception
+
+    validation_completed = transfer_interactor.validate_transfer(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert validation_completed
+    mock_database_access.create_pending_transfer_signature.assert_not_called()
+    mock_submit_transfer_to_primary_node_task.apply_async.\
+        assert_called_once_with(
+            args=(internal_transfer_id, ), task_id=unittest.mock.ANY,
+            countdown=_TASK_INTERVAL,
+            headers=get_task_routing_headers(cross_chain_transfer))
 
 
 @unittest.mock.patch('vision.validatornode.business.transfers.'
@@ -238,31 +448,135 @@ def test_validate_transfer_other_error(
     mock_submit_transfer_to_primary_node_task.apply_async.assert_not_called()
 
 
-@pytest.mark.parametrize('validation_completed', [True, False])
-@unittest.mock.patch('vision.validatornode.business.transfers.config', {
-    'tasks': {
-        'validate_transfer': {
-            'retry_interval_in_seconds': _TASK_INTERVAL
+@pytest.mark.parametrize('task_in_flight', [True, False])
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'submit_transfer_onchain': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
         }
-    }
-})
+    })
+def test_validate_transfer_task_deduplication_correct(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task, task_in_flight, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer):
+    mock_submit_transfer_onchain_task.__name__ = 'submit_transfer_onchain_task'
+    mock_database_access.claim_transfer_task.return_value = not task_in_flight
+    _initialize_mock_blockchain_client(mock_get_blockchain_client,
+                                       TransactionStatus.CONFIRMED,
+                                       cross_chain_transfer, True, True, True,
+                                       True, True)
+
+    validation_completed = transfer_interactor.validate_transfer(
+        internal_transfer_id, cross_chain_transfer)
+
+    assert validation_completed
+    mock_database_access.claim_transfer_task.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN,
+        unittest.mock.ANY)
+    task_id = mock_database_access.claim_transfer_task.call_args.args[2]
+    if task_in_flight:
+        # Scheduling the same step again is a no-op
+        mock_submit_transfer_onchain_task.apply_async.assert_not_called()
+    else:
+        mock_submit_transfer_onchain_task.apply_async.assert_called_once_with(
+            args=(internal_transfer_id, ), task_id=str(task_id),
+            countdown=_TASK_INTERVAL,
+            headers=get_task_routing_headers(cross_chain_transfer))
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.submit_transfer_onchain_task')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.business.base.config',
+                     {'application': {
+                         'mode': 'primary'
+                     }})
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'scheduler': {
+            'enabled': False
+        },
+        'tasks': {
+            'submit_transfer_onchain': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        }
+    })
+def test_validate_transfer_task_scheduling_error(
+        mock_get_blockchain_client, mock_database_access,
+        mock_submit_transfer_onchain_task, transfer_interactor,
+        internal_transfer_id, cross_chain_transfer):
+    mock_submit_transfer_onchain_task.__name__ = 'submit_transfer_onchain_task'
+    mock_submit_transfer_onchain_task.apply_async.side_effect = Exception
+    _initialize_mock_blockchain_client(mock_get_blockchain_client,
+                                       TransactionStatus.CONFIRMED,
+                                       cross_chain_transfer, True, True, True,
+                                       True, True)
+
+    with pytest.raises(TransferInteractorError):
+        transfer_interactor.validate_transfer(internal_transfer_id,
+                                              cross_chain_transfer)
+
+    # The claim is released for the step to be scheduled again
+    task_id = mock_database_access.claim_transfer_task.call_args.args[2]
+    mock_database_access.release_transfer_task.assert_called_once_with(
+        internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN, task_id)
+
+
+@pytest.mark.parametrize('validation_completed', [True, False])
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        },
+        'retries': _RETRY_POLICIES
+    })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
-def test_validate_transfer_task_correct(mock_transfer_interactor,
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_validate_transfer_task_correct(mock_database_access,
+                                        mock_transfer_interactor,
                                         validation_completed,
                                         internal_transfer_id,
-                                        cross_chain_transfer,
-                                        cross_chain_transfer_dict):
+                                        cross_chain_transfer):
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
     mock_transfer_interactor().validate_transfer.return_value = \
         validation_completed
     if validation_completed:
-        validate_transfer_task(internal_transfer_id, cross_chain_transfer_dict)
+        validate_transfer_task(internal_transfer_id)
     else:
-        with pytest.raises(celery.exceptions.Retry):
-            validate_transfer_task(internal_transfer_id,
-                                   cross_chain_transfer_dict)
+        with pytest.raises(celery.exceptions.Retry) as exception_info:
+            validate_transfer_task(internal_transfer_id)
+        assert exception_info.value.when == _TASK_INTERVAL
+    mock_transfer_interactor().load_transfer.assert_called_once_with(
+        internal_transfer_id, None)
     mock_transfer_interactor().validate_transfer.assert_called_once_with(
         internal_transfer_id, cross_chain_transfer)
+    if validation_completed:
+        mock_database_access.update_transfer_task_next_attempt.\
+            assert_not_called()
+    else:
+        mock_database_access.update_transfer_task_next_attempt.\
+            assert_called_once_with(internal_transfer_id, _TASK_INTERVAL)
 
 
 @unittest.mock.patch(
@@ -271,20 +585,114 @@ def test_validate_transfer_task_correct(mock_transfer_interactor,
             'validate_transfer': {
                 'retry_interval_after_error_in_seconds': _TASK_INTERVAL
             }
-        }
+        },
+        'retries': _RETRY_POLICIES
     })
 @unittest.mock.patch(
     'vision.validatornode.business.transfers.TransferInteractor')
-def test_validate_transfer_task_error(mock_transfer_interactor,
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_validate_transfer_task_error(mock_database_access,
+                                      mock_transfer_interactor,
                                       internal_transfer_id,
-                                      cross_chain_transfer,
-                                      cross_chain_transfer_dict):
+                                      cross_chain_transfer):
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
     mock_transfer_interactor().validate_transfer.side_effect = \
         TransferInteractorError('')
     with pytest.raises(TransferInteractorError):
-        validate_transfer_task(internal_transfer_id, cross_chain_transfer_dict)
+        validate_transfer_task(internal_transfer_id)
     mock_transfer_interactor().validate_transfer.assert_called_once_with(
         internal_transfer_id, cross_chain_transfer)
+    mock_database_access.update_transfer_task_next_attempt.\
+        assert_called_once_with(internal_transfer_id, _TASK_INTERVAL)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_validate_transfer_task_release_correct(mock_database_access,
+                                                mock_transfer_interactor,
+                                                internal_transfer_id,
+                                                cross_chain_transfer):
+    task_id = uuid.uuid4()
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
+    mock_transfer_interactor().validate_transfer.return_value = True
+
+    validate_transfer_task.apply(args=(internal_transfer_id, ),
+                                 task_id=str(task_id))
+
+    mock_database_access.update_transfer_task_heartbeat.\
+        assert_called_once_with(internal_transfer_id,
+                                TransferStep.VALIDATE_TRANSFER, task_id)
+    # The completed task no longer blocks the step from being scheduled
+    mock_database_access.release_transfer_task.assert_called_once_with(
+        internal_transfer_id, TransferStep.VALIDATE_TRANSFER, task_id)
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_validate_transfer_task_claim_released_correct(
+        mock_database_access, mock_transfer_interactor, internal_transfer_id,
+        cross_chain_transfer):
+    mock_database_access.update_transfer_task_heartbeat.return_value = False
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
+
+    validate_transfer_task.apply(args=(internal_transfer_id, ),
+                                 task_id=str(uuid.uuid4()))
+
+    # A task considered to be lost does not process the transfer
+    mock_transfer_interactor().validate_transfer.assert_not_called()
+    mock_database_access.release_transfer_task.assert_not_called()
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_in_seconds': _TASK_INTERVAL
+            }
+        },
+        'retries': _RETRY_POLICIES
+    })
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.business.transfers.database_access')
+def test_validate_transfer_task_next_attempt_error(mock_database_access,
+                                                   mock_transfer_interactor,
+                                                   internal_transfer_id,
+                                                   cross_chain_transfer):
+    mock_database_access.update_transfer_task_next_attempt.side_effect = \
+        Exception
+    mock_transfer_interactor().load_transfer.return_value = \
+        cross_chain_transfer
+    mock_transfer_interactor().validate_transfer.return_value = False
+    # The task is retried even if its next retry cannot be recorded
+    with pytest.raises(celery.exceptions.Retry) as exception_info:
+        validate_transfer_task(internal_transfer_id)
+    assert exception_info.value.when == _TASK_INTERVAL
+
+
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.config', {
+        'tasks': {
+            'validate_transfer': {
+                'retry_interval_after_error_in_seconds': _TASK_INTERVAL
+            }
+        },
+        'retries': _RETRY_POLICIES
+    })
+@unittest.mock.patch(
+    'vision.validatornode.business.transfers.TransferInteractor')
+def test_validate_transfer_task_load_transfer_error(mock_transfer_interactor,
+                                                    internal_transfer_id):
+    mock_transfer_interactor().load_transfer.side_effect = \
+        TransferInteractorError('')
+    with pytest.raises(TransferInteractorError):
+        validate_transfer_task(internal_transfer_id)
+    mock_transfer_interactor().validate_transfer.assert_not_called()
 
 
 def _initialize_mock_blockchain_client(
@@ -4,14 +4,20 @@ import pytest
 import sqlalchemy
 from vision.common.blockchains.enums import Blockchain
 
+from vision.validatornode.database import access
 from vision.validatornode.database.enums import TransferStatus
 from vision.validatornode.database.models import Blockchain as Blockchain_
+from vision.validatornode.database.models import ChainNonce
 from vision.validatornode.database.models import ForwarderContract
+from vision.validatornode.database.models import FreeNonce
 from vision.validatornode.database.models import HubContract
+from vision.validatornode.database.models import PerformanceMetric
 from vision.validatornode.database.models import TokenContract
 from vision.validatornode.database.models import Transfer
 from vision.validatornode.database.models import \
     TransferStatus as TransferStatus_
+from vision.validatornode.database.models import TransferTask
+from vision.validatornode.database.models import TransferToGasUsage
 from vision.validatornode.database.models import ValidatorNode
 from vision.validatornode.database.models import ValidatorNodeSignature
 
@@ -90,6 +96,14 @@ _TRANSFER_DESTINATION_BLOCK_NUMBERS = [9244759, 33624921]
 _TRANSFER_NONCES = [75594, 557502]
 
 
+@pytest.fixture(autouse=True)
+def clear_id_cache():
+    # The record IDs are not stable across the tests
+    access._id_cache.clear()
+    yield
+    access._id_cache.clear()
+
+
 @pytest.fixture
 def database_session(database_session_maker):
     with database_session_maker() as database_session:
@@ -367,7 +381,12 @@ def _create_database_records(database_session):
 def _delete_database_records(database_session):
     database_session.execute(sqlalchemy.delete(ValidatorNodeSignature))
     database_session.execute(sqlalchemy.delete(ValidatorNode))
+    database_session.execute(sqlalchemy.delete(TransferTask))
+    database_session.execute(sqlalchemy.delete(TransferToGasUsage))
+    database_session.execute(sqlalchemy.delete(PerformanceMetric))
     database_session.execute(sqlalchemy.delete(Transfer))
+    database_session.execute(sqlalchemy.delete(FreeNonce))
+    database_session.execute(sqlalchemy.delete(ChainNonce))
     database_session.execute(sqlalchemy.delete(TransferStatus_))
     database_session.execute(sqlalchemy.delete(TokenContract))
     database_session.execute(sqlalchemy.delete(ForwarderContract))
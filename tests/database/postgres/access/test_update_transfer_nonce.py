@@ -1,3 +1,4 @@
+import concurrent.futures
 import unittest.mock
 
 import pytest
@@ -7,6 +8,7 @@ from vision.common.blockchains.enums import Blockchain
 
 from tests.database.utilities import modify_model_instance
 from vision.validatornode.database.access import update_transfer_nonce
+from vision.validatornode.database.access import update_transfer_status
 from vision.validatornode.database.enums import TransferStatus
 from vision.validatornode.database.models import Transfer
 
@@ -238,6 +240,60 @@ def test_update_transfer_nonce_with_success_nonces_equal_nonce_received(
     assert transfer.nonce == 1
 
 
+@pytest.mark.parametrize('number_allocators', [2, 8])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_concurrent_allocators_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer, number_allocators):
+    mock_get_session.return_value = database_session_maker
+    number_transfers = 4 * number_allocators
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer,
+        [Blockchain.ETHEREUM] * number_transfers,
+        [TransferStatus.SOURCE_TRANSACTION_DETECTED] * number_transfers,
+        [None] * number_transfers)
+    with concurrent.futures.ThreadPoolExecutor(number_allocators) as executor:
+        list(
+            executor.map(
+                lambda id_: update_transfer_nonce(id_, Blockchain.ETHEREUM, 10
+                                                  ), internal_transfer_ids))
+    nonces = initialized_database_session.execute(
+        sqlalchemy.select(Transfer.nonce).filter(
+            Transfer.id.in_(internal_transfer_ids))).scalars().all()
+    assert sorted(nonces) == list(range(10, 10 + number_transfers))
+
+
+@pytest.mark.parametrize('number_allocators', [2, 8])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_concurrent_allocators_with_failed_nonces(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer, number_allocators):
+    mock_get_session.return_value = database_session_maker
+    number_transfers = 4 * number_allocators
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer,
+        [Blockchain.ETHEREUM] * number_transfers,
+        [TransferStatus.SOURCE_TRANSACTION_DETECTED] * number_transfers,
+        [None] * number_transfers)
+    for internal_transfer_id in internal_transfer_ids[:number_allocators]:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 10)
+        update_transfer_status(internal_transfer_id,
+                               TransferStatus.DESTINATION_TRANSACTION_FAILED)
+    with concurrent.futures.ThreadPoolExecutor(number_allocators) as executor:
+        list(
+            executor.map(
+                lambda id_: update_transfer_nonce(id_, Blockchain.ETHEREUM, 10
+                                                  ),
+                internal_transfer_ids[number_allocators:]))
+    nonces = initialized_database_session.execute(
+        sqlalchemy.select(Transfer.nonce).filter(
+            Transfer.id.in_(internal_transfer_ids)).filter(
+                Transfer.nonce.is_not(None))).scalars().all()
+    # The failed nonces have been reused without any gaps
+    assert sorted(nonces) == list(
+        range(10, 10 + number_transfers - number_allocators))
+
+
 def _create_database_records(database_session, transfer,
                              destination_blockchains, statuses, nonces):
     internal_transfer_ids = []
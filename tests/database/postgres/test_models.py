@@ -0,0 +1,55 @@
+import datetime
+
+import pytest
+import sqlalchemy
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.database.access import \
+    _build_failed_transfer_nonces_statement
+from vision.validatornode.database.access import \
+    _build_maximum_transfer_nonce_statement
+from vision.validatornode.database.access import \
+    _build_stale_transfers_statement
+from vision.validatornode.database.access import _build_transfer_id_statement
+from vision.validatornode.database.access import \
+    _build_unconfirmed_transfers_statement
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.models import FAILED_TRANSFER_NONCES_INDEX
+from vision.validatornode.database.models import TRANSFER_STATUS_INDEX
+from vision.validatornode.database.models import UNCONFIRMED_TRANSFERS_INDEX
+from vision.validatornode.database.models import \
+    UNIQUE_BLOCKCHAIN_NONCE_CONSTRAINT
+
+_SOURCE_TRANSACTION_INDEX = \
+    'transfers_source_blockchain_id_source_transaction_id_key'
+
+
+@pytest.mark.parametrize(
+    'statement_index',
+    [(_build_failed_transfer_nonces_statement(
+        Blockchain.ETHEREUM), FAILED_TRANSFER_NONCES_INDEX),
+     (_build_maximum_transfer_nonce_statement(
+         Blockchain.ETHEREUM), UNIQUE_BLOCKCHAIN_NONCE_CONSTRAINT),
+     (_build_unconfirmed_transfers_statement(
+         Blockchain.ETHEREUM), UNCONFIRMED_TRANSFERS_INDEX),
+     (_build_stale_transfers_statement([
+         TransferStatus.SOURCE_TRANSACTION_DETECTED,
+         TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED
+     ], datetime.datetime(2026, 1, 1), 500), TRANSFER_STATUS_INDEX),
+     (_build_transfer_id_statement(Blockchain.ETHEREUM,
+                                   '0x1'), _SOURCE_TRANSACTION_INDEX)])
+def test_transfer_index_used(migrated_database_session, statement_index):
+    statement, index = statement_index
+    # Without any sequential scans, the planner's choice among the
+    # indexes is decisive even for an (almost) empty table
+    migrated_database_session.execute(
+        sqlalchemy.text('SET LOCAL enable_seqscan = off'))
+    compiled_statement = statement.compile(
+        dialect=migrated_database_session.get_bind().dialect,
+        compile_kwargs={'literal_binds': True})
+
+    query_plan = '\n'.join(
+        migrated_database_session.execute(
+            sqlalchemy.text(f'EXPLAIN {compiled_statement}')).scalars())
+
+    assert index in query_plan
@@ -0,0 +1,68 @@
+import datetime
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.database.access import ScheduledTransferResponse
+from vision.validatornode.database.access import claim_scheduled_transfers
+from vision.validatornode.database.enums import TransferStep
+
+_STEP = TransferStep.VALIDATE_TRANSFER
+
+_BATCH_SIZE = 50
+
+_LEASE = 600
+
+_ATTEMPTS = 2
+
+_SCHEDULE_ID = uuid.UUID('9e0f6a57-2f0b-4b8c-a4c1-6d3e28b1f4a0')
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_claim_scheduled_transfers_correct(mock_get_session,
+                                           database_session_maker,
+                                           initialized_database_session,
+                                           transfer):
+    mock_get_session.return_value = database_session_maker
+    now = datetime.datetime.now(datetime.timezone.utc)
+    transfer.scheduled_step = _STEP.value
+    transfer.next_attempt_at = now - datetime.timedelta(seconds=1)
+    transfer.scheduled_attempts = _ATTEMPTS
+    transfer.schedule_id = str(_SCHEDULE_ID)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    scheduled_transfers = claim_scheduled_transfers(_STEP, _BATCH_SIZE, _LEASE)
+
+    assert scheduled_transfers == [
+        ScheduledTransferResponse(transfer.id, _ATTEMPTS, _SCHEDULE_ID)
+    ]
+    initialized_database_session.refresh(transfer)
+    # The transfer is not due again until its lease has expired
+    assert (transfer.next_attempt_at
+            >= now.replace(tzinfo=None) + datetime.timedelta(seconds=_LEASE))
+    assert transfer.leased_until == transfer.next_attempt_at
+    assert claim_scheduled_transfers(_STEP, _BATCH_SIZE, _LEASE) == []
+
+
+@pytest.mark.parametrize('scheduled_step, delay',
+                         [(None, -1),
+                          (TransferStep.SUBMIT_TRANSFER_ONCHAIN, -1),
+                          (_STEP, 60)])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_claim_scheduled_transfers_not_due_correct(
+        mock_get_session, database_session_maker, scheduled_step, delay,
+        initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    if scheduled_step is not None:
+        transfer.scheduled_step = scheduled_step.value
+        transfer.next_attempt_at = datetime.datetime.now(
+            datetime.timezone.utc) + datetime.timedelta(seconds=delay)
+        transfer.scheduled_attempts = 0
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    scheduled_transfers = claim_scheduled_transfers(_STEP, _BATCH_SIZE, _LEASE)
+
+    assert scheduled_transfers == []
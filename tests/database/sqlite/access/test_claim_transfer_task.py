@@ -0,0 +1,64 @@
+import unittest.mock
+import uuid
+
+import pytest
+import sqlalchemy
+
+from vision.validatornode.database.access import claim_transfer_task
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STEP = TransferStep.VALIDATE_TRANSFER
+
+_TASK_ID = uuid.UUID('618ce6a4-34c6-45cf-be75-ae8c46377b29')
+
+_OTHER_TASK_ID = uuid.UUID('4c76907e-7660-4195-8858-92e6426f55ea')
+
+
+@pytest.mark.parametrize('other_step',
+                         [None, TransferStep.SUBMIT_TRANSFER_ONCHAIN])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_claim_transfer_task_correct(mock_get_session, database_session_maker,
+                                     other_step, initialized_database_session,
+                                     transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    if other_step is not None:
+        initialized_database_session.add(
+            TransferTask(transfer_id=transfer.id, step=other_step.value,
+                         task_id=str(_OTHER_TASK_ID)))
+        initialized_database_session.commit()
+
+    claimed = claim_transfer_task(transfer.id, _STEP, _TASK_ID)
+
+    assert claimed
+    assert _read_task_id(initialized_database_session,
+                         transfer.id) == str(_TASK_ID)
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_claim_transfer_task_already_claimed(mock_get_session,
+                                             database_session_maker,
+                                             initialized_database_session,
+                                             transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    initialized_database_session.add(
+        TransferTask(transfer_id=transfer.id, step=_STEP.value,
+                     task_id=str(_OTHER_TASK_ID)))
+    initialized_database_session.commit()
+
+    claimed = claim_transfer_task(transfer.id, _STEP, _TASK_ID)
+
+    assert not claimed
+    assert _read_task_id(initialized_database_session,
+                         transfer.id) == str(_OTHER_TASK_ID)
+
+
+def _read_task_id(session, internal_transfer_id):
+    statement = sqlalchemy.select(TransferTask.task_id).where(
+        TransferTask.transfer_id == internal_transfer_id).where(
+            TransferTask.step == _STEP.value)
+    return session.execute(statement).scalar_one()
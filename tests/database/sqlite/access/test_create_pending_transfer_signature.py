@@ -0,0 +1,34 @@
+import unittest.mock
+
+import pytest
+import sqlalchemy
+
+from vision.validatornode.database.access import \
+    create_pending_transfer_signature
+from vision.validatornode.database.models import PendingTransferSignature
+
+_SIGNATURES = ['0x' + 'ab' * 65, '0x' + 'cd' * 65]
+
+
+@pytest.mark.parametrize('signature_queued', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_create_pending_transfer_signature_correct(
+        mock_get_session_maker, database_session_maker,
+        initialized_database_session, transfer, signature_queued):
+    mock_get_session_maker.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    if signature_queued:
+        initialized_database_session.add(
+            PendingTransferSignature(transfer_id=transfer.id,
+                                     signature=_SIGNATURES[0]))
+    initialized_database_session.commit()
+
+    create_pending_transfer_signature(transfer.id, _SIGNATURES[1])
+
+    pending_signatures = initialized_database_session.execute(
+        sqlalchemy.select(PendingTransferSignature)).scalars().all()
+    assert len(pending_signatures) == 1
+    assert pending_signatures[0].transfer_id == transfer.id
+    # A signature already queued for the transfer is kept
+    assert pending_signatures[0].signature == (
+        _SIGNATURES[0] if signature_queued else _SIGNATURES[1])
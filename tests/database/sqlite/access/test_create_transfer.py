@@ -6,6 +6,7 @@ import sqlalchemy
 import sqlalchemy.exc
 from vision.common.blockchains.enums import Blockchain
 
+from vision.validatornode.database import access
 from vision.validatornode.database.access import TransferCreationRequest
 from vision.validatornode.database.access import create_transfer
 from vision.validatornode.database.enums import TransferStatus
@@ -15,6 +16,8 @@ from vision.validatornode.database.models import \
     UNIQUE_VALIDATOR_NONCE_CONSTRAINT
 from vision.validatornode.database.models import Transfer
 
+_TRANSFER_DATA = {'amount': 1}
+
 
 @pytest.mark.parametrize('source_hub_contract_existent', [True, False])
 @pytest.mark.parametrize('destination_token_contract_existent', [True, False])
@@ -43,7 +46,7 @@ def test_create_transfer_correct(
         transfer.destination_token_contract.address, transfer.amount,
         transfer.validator_nonce, transfer.source_hub_contract.address,
         transfer.source_transfer_id, transfer.source_transaction_id,
-        transfer.source_block_number)
+        transfer.source_block_number, _TRANSFER_DATA)
     internal_transfer_id = create_transfer(transfer_creation_request)
 
     created_transfer = initialized_database_session.execute(
@@ -51,6 +54,36 @@ def test_create_transfer_correct(
     _check_created_transfer(created_transfer, transfer, internal_transfer_id)
 
 
+@pytest.mark.parametrize('contracts_existent', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_create_transfer_ids_cached(mock_get_session_maker,
+                                    database_session_maker, contracts_existent,
+                                    initialized_database_session, transfer,
+                                    source_token_contract,
+                                    destination_token_contract,
+                                    source_hub_contract):
+    mock_get_session_maker.return_value = database_session_maker
+    if contracts_existent:
+        initialized_database_session.add_all([
+            source_token_contract, destination_token_contract,
+            source_hub_contract
+        ])
+        initialized_database_session.commit()
+    transfer_creation_request = _create_transfer_creation_request(transfer)
+
+    create_transfer(transfer_creation_request)
+
+    # Records created within the same transaction are not cached yet
+    assert len(access._id_cache) == (3 if contracts_existent else 0)
+    initialized_database_session.execute(sqlalchemy.delete(Transfer))
+    initialized_database_session.commit()
+    internal_transfer_id = create_transfer(transfer_creation_request)
+    assert len(access._id_cache) == 3
+    created_transfer = initialized_database_session.execute(
+        sqlalchemy.select(Transfer)).one_or_none()[0]
+    _check_created_transfer(created_transfer, transfer, internal_transfer_id)
+
+
 @pytest.mark.parametrize('error', [
     (sqlalchemy.exc.IntegrityError(UNIQUE_VALIDATOR_NONCE_CONSTRAINT, None,
                                    Exception()), ValidatorNonceNotUniqueError),
@@ -69,11 +102,23 @@ def test_create_transfer_error(mock_get_session_maker, error, transfer):
         transfer.destination_token_contract.address, transfer.amount,
         transfer.validator_nonce, transfer.source_hub_contract.address,
         transfer.source_transfer_id, transfer.source_transaction_id,
-        transfer.source_block_number)
+        transfer.source_block_number, _TRANSFER_DATA)
     with pytest.raises(error[1]):
         create_transfer(transfer_creation_request)
 
 
+def _create_transfer_creation_request(transfer):
+    return TransferCreationRequest(
+        Blockchain(transfer.source_blockchain_id),
+        Blockchain(transfer.destination_blockchain_id),
+        transfer.sender_address, transfer.recipient_address,
+        transfer.source_token_contract.address,
+        transfer.destination_token_contract.address, transfer.amount,
+        transfer.validator_nonce, transfer.source_hub_contract.address,
+        transfer.source_transfer_id, transfer.source_transaction_id,
+        transfer.source_block_number, _TRANSFER_DATA)
+
+
 def _check_created_transfer(created_transfer, input_transfer,
                             internal_transfer_id):
     assert created_transfer.id == internal_transfer_id
@@ -121,6 +166,7 @@ def _check_created_transfer(created_transfer, input_transfer,
             input_transfer.source_block_number)
     assert created_transfer.destination_block_number is None
     assert created_transfer.nonce is None
+    assert created_transfer.transfer_data == _TRANSFER_DATA
     assert (created_transfer.status_id ==
             TransferStatus.SOURCE_TRANSACTION_DETECTED.value)
     assert (created_transfer.status.id ==
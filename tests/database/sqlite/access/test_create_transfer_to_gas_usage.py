@@ -0,0 +1,52 @@
+import unittest.mock
+
+import sqlalchemy
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.database.access import create_transfer_to_gas_usage
+from vision.validatornode.database.models import TransferToGasUsage
+
+_NUMBER_SIGNERS = 3
+
+_GAS_USED = 187315
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_create_transfer_to_gas_usage_correct(mock_get_session_maker,
+                                              database_session_maker,
+                                              initialized_database_session,
+                                              blockchain):
+    mock_get_session_maker.return_value = database_session_maker
+
+    create_transfer_to_gas_usage(Blockchain(blockchain.id), _NUMBER_SIGNERS,
+                                 _GAS_USED, 20)
+
+    gas_usage = initialized_database_session.execute(
+        sqlalchemy.select(TransferToGasUsage)).scalar_one()
+    assert gas_usage.blockchain_id == blockchain.id
+    assert gas_usage.number_signers == _NUMBER_SIGNERS
+    assert gas_usage.gas_used == _GAS_USED
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_create_transfer_to_gas_usage_oldest_removed(
+        mock_get_session_maker, database_session_maker,
+        initialized_database_session, blockchain):
+    mock_get_session_maker.return_value = database_session_maker
+
+    for gas_used in range(_GAS_USED, _GAS_USED + 5):
+        create_transfer_to_gas_usage(Blockchain(blockchain.id),
+                                     _NUMBER_SIGNERS, gas_used, 3)
+    # Records for another number of signers are kept
+    create_transfer_to_gas_usage(Blockchain(blockchain.id),
+                                 _NUMBER_SIGNERS + 1, _GAS_USED, 3)
+
+    gas_usages = initialized_database_session.execute(
+        sqlalchemy.select(TransferToGasUsage.number_signers,
+                          TransferToGasUsage.gas_used).order_by(
+                              TransferToGasUsage.id)).all()
+    assert [tuple(gas_usage)
+            for gas_usage in gas_usages] == [(_NUMBER_SIGNERS, _GAS_USED + 2),
+                                             (_NUMBER_SIGNERS, _GAS_USED + 3),
+                                             (_NUMBER_SIGNERS, _GAS_USED + 4),
+                                             (_NUMBER_SIGNERS + 1, _GAS_USED)]
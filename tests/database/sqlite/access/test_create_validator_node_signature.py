@@ -11,13 +11,14 @@ from vision.validatornode.database.access import \
 from vision.validatornode.database.models import ValidatorNodeSignature
 
 
+@pytest.mark.parametrize('verified', [True, False])
 @pytest.mark.parametrize('validator_node_existent', [True, False])
 @pytest.mark.parametrize('forwarder_contract_existent', [True, False])
 @unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
 def test_create_validator_node_signature_correct(
         mock_get_session, database_session_maker, forwarder_contract_existent,
-        validator_node_existent, initialized_database_session, transfer,
-        destination_forwarder_contract, validator_node, signatures):
+        validator_node_existent, verified, initialized_database_session,
+        transfer, destination_forwarder_contract, validator_node, signatures):
     mock_get_session.return_value = database_session_maker
     initialized_database_session.add(transfer)
     if forwarder_contract_existent:
@@ -29,7 +30,8 @@ def test_create_validator_node_signature_correct(
     create_validator_node_signature(
         transfer.id, Blockchain(destination_forwarder_contract.blockchain_id),
         BlockchainAddress(destination_forwarder_contract.address),
-        BlockchainAddress(validator_node.address), signature)
+        BlockchainAddress(validator_node.address), signature,
+        verified=verified)
     validator_node_signature = initialized_database_session.execute(
         sqlalchemy.select(ValidatorNodeSignature)).one()[0]
     assert validator_node_signature.transfer_id == transfer.id
@@ -38,3 +40,8 @@ def test_create_validator_node_signature_correct(
     assert validator_node_signature.signature == signature
     assert validator_node_signature.created < datetime.datetime.now(
         datetime.timezone.utc).replace(tzinfo=None)
+    if verified:
+        assert validator_node_signature.verified < datetime.datetime.now(
+            datetime.timezone.utc).replace(tzinfo=None)
+    else:
+        assert validator_node_signature.verified is None
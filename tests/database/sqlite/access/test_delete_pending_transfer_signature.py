@@ -0,0 +1,27 @@
+import unittest.mock
+
+import sqlalchemy
+
+from vision.validatornode.database.access import \
+    delete_pending_transfer_signature
+from vision.validatornode.database.models import PendingTransferSignature
+
+_SIGNATURE = '0x' + 'ab' * 65
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_delete_pending_transfer_signature_correct(
+        mock_get_session_maker, database_session_maker,
+        initialized_database_session, transfer):
+    mock_get_session_maker.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    initialized_database_session.add(
+        PendingTransferSignature(transfer_id=transfer.id,
+                                 signature=_SIGNATURE))
+    initialized_database_session.commit()
+
+    delete_pending_transfer_signature(transfer.id)
+
+    assert initialized_database_session.execute(
+        sqlalchemy.select(PendingTransferSignature)).first() is None
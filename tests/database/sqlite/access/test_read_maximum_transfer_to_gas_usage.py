@@ -0,0 +1,38 @@
+import unittest.mock
+
+import pytest
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.database.access import \
+    read_maximum_transfer_to_gas_usage
+from vision.validatornode.database.models import TransferToGasUsage
+
+_GAS_USAGES = [(3, 190000), (3, 200000), (5, 280000)]
+
+
+@pytest.mark.parametrize('number_signers_maximum_gas_used', [(1, 200000),
+                                                             (3, 200000),
+                                                             (4, 280000),
+                                                             (5, 280000),
+                                                             (6, None)])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_maximum_transfer_to_gas_usage_correct(
+        mock_get_session, database_session_maker,
+        number_signers_maximum_gas_used, initialized_database_session):
+    mock_get_session.side_effect = database_session_maker
+    number_signers, maximum_gas_used = number_signers_maximum_gas_used
+    for gas_usage_number_signers, gas_used in _GAS_USAGES:
+        initialized_database_session.add(
+            TransferToGasUsage(blockchain_id=Blockchain.ETHEREUM.value,
+                               number_signers=gas_usage_number_signers,
+                               gas_used=gas_used))
+    # Gas usages on other blockchains are ignored
+    initialized_database_session.add(
+        TransferToGasUsage(blockchain_id=Blockchain.BNB_CHAIN.value,
+                           number_signers=number_signers, gas_used=900000))
+    initialized_database_session.commit()
+
+    read_gas_used = read_maximum_transfer_to_gas_usage(Blockchain.ETHEREUM,
+                                                       number_signers)
+
+    assert read_gas_used == maximum_gas_used
@@ -0,0 +1,60 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import \
+    read_number_verified_validator_node_signatures
+from vision.validatornode.database.models import ValidatorNode
+from vision.validatornode.database.models import ValidatorNodeSignature
+
+
+@pytest.mark.parametrize('other_signatures', [True, False])
+@pytest.mark.parametrize(
+    'number_verified_signatures, number_unverified_signatures',
+    [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (2, 0)])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_number_verified_validator_node_signatures_correct(
+        mock_get_session, database_session_maker, number_verified_signatures,
+        number_unverified_signatures, other_signatures,
+        initialized_database_session, transfer, other_transfer,
+        destination_forwarder_contract, other_destination_forwarder_contract,
+        validator_node_addresses, signatures):
+    mock_get_session.side_effect = database_session_maker
+    initialized_database_session.add(destination_forwarder_contract)
+    initialized_database_session.add(transfer)
+    excluded_validator_node_address = validator_node_addresses[0]
+    number_signatures = (number_verified_signatures +
+                         number_unverified_signatures)
+    # The first (verified) signature is always the one of the excluded
+    # validator node
+    for i in range(number_signatures + 1):
+        validator_node = ValidatorNode(
+            forwarder_contract=destination_forwarder_contract,
+            address=validator_node_addresses[i])
+        initialized_database_session.add(validator_node)
+        verified = (datetime.datetime.utcnow()
+                    if i <= number_verified_signatures else None)
+        validator_node_signature = ValidatorNodeSignature(
+            transfer=transfer, validator_node=validator_node,
+            signature=signatures[i], verified=verified)
+        initialized_database_session.add(validator_node_signature)
+    if other_signatures:
+        initialized_database_session.add(other_destination_forwarder_contract)
+        initialized_database_session.add(other_transfer)
+        for validator_node_address, signature in zip(validator_node_addresses,
+                                                     signatures):
+            validator_node = ValidatorNode(
+                forwarder_contract=other_destination_forwarder_contract,
+                address=validator_node_address)
+            initialized_database_session.add(validator_node)
+            validator_node_signature = ValidatorNodeSignature(
+                transfer=other_transfer, validator_node=validator_node,
+                signature=signature[:-1], verified=datetime.datetime.utcnow())
+            initialized_database_session.add(validator_node_signature)
+    initialized_database_session.commit()
+
+    number_verified = read_number_verified_validator_node_signatures(
+        transfer.id, excluded_validator_node_address)
+
+    assert number_verified == number_verified_signatures
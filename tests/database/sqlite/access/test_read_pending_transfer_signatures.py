@@ -0,0 +1,52 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import \
+    PendingTransferSignatureResponse
+from vision.validatornode.database.access import \
+    read_pending_transfer_signatures
+from vision.validatornode.database.models import PendingTransferSignature
+
+_SIGNATURES = ['0x' + 'ab' * 65, '0x' + 'cd' * 65]
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_pending_transfer_signatures_correct(mock_get_session,
+                                                  database_session_maker,
+                                                  initialized_database_session,
+                                                  transfer, other_transfer,
+                                                  limit):
+    mock_get_session.side_effect = database_session_maker
+    initialized_database_session.add_all([transfer, other_transfer])
+    initialized_database_session.commit()
+    created = datetime.datetime.now(datetime.timezone.utc)
+    # The signature of the other transfer has been queued first
+    initialized_database_session.add_all([
+        PendingTransferSignature(transfer_id=transfer.id,
+                                 signature=_SIGNATURES[0], created=created),
+        PendingTransferSignature(
+            transfer_id=other_transfer.id, signature=_SIGNATURES[1],
+            created=created - datetime.timedelta(seconds=1))
+    ])
+    initialized_database_session.commit()
+
+    pending_signatures = read_pending_transfer_signatures(limit)
+
+    assert pending_signatures == [
+        PendingTransferSignatureResponse(
+            internal_transfer_id=other_transfer.id, signature=_SIGNATURES[1]),
+        PendingTransferSignatureResponse(internal_transfer_id=transfer.id,
+                                         signature=_SIGNATURES[0])
+    ][:limit]
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_pending_transfer_signatures_empty_correct(
+        mock_get_session, database_session_maker,
+        initialized_database_session):
+    mock_get_session.side_effect = database_session_maker
+
+    assert read_pending_transfer_signatures(10) == []
@@ -0,0 +1,21 @@
+import unittest.mock
+
+from vision.validatornode.database.access import read_performance_metrics
+from vision.validatornode.database.models import PerformanceMetric
+
+_METRICS = {'some_metric': {'count': 3}, 'other_metric': {'count': 1}}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_performance_metrics_correct(mock_get_session,
+                                          database_session_maker,
+                                          initialized_database_session):
+    mock_get_session.side_effect = database_session_maker
+    for name, value in _METRICS.items():
+        initialized_database_session.add(
+            PerformanceMetric(name=name, value=value))
+    initialized_database_session.commit()
+
+    metrics = read_performance_metrics()
+
+    assert metrics == _METRICS
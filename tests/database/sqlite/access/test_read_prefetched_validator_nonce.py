@@ -0,0 +1,27 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import \
+    read_prefetched_validator_nonce
+
+
+@pytest.mark.parametrize('validator_nonce_prefetched', [True, False])
+@pytest.mark.parametrize('transfer_existent', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_prefetched_validator_nonce_correct(
+        mock_get_session, database_session_maker, transfer_existent,
+        validator_nonce_prefetched, initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    if validator_nonce_prefetched:
+        transfer.validator_nonce_prefetched = datetime.datetime.now(
+            datetime.timezone.utc)
+    if transfer_existent:
+        initialized_database_session.add(transfer)
+        initialized_database_session.commit()
+
+    validator_nonce = read_prefetched_validator_nonce(transfer.id)
+
+    assert validator_nonce == (transfer.validator_nonce if transfer_existent
+                               and validator_nonce_prefetched else None)
@@ -0,0 +1,101 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import read_stale_transfers
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STATUSES = (TransferStatus.SOURCE_TRANSACTION_DETECTED,
+             TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED)
+
+_STALE_AFTER = 3600
+
+_LIMIT = 100
+
+
+@pytest.mark.parametrize('updated_age', [None, 2 * _STALE_AFTER])
+@pytest.mark.parametrize('next_attempt_age', [None, 2 * _STALE_AFTER])
+@pytest.mark.parametrize('status', _STATUSES)
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_stale_transfers_correct(mock_get_session, database_session_maker,
+                                      status, next_attempt_age, updated_age,
+                                      initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    _initialize_transfer(transfer, status, 2 * _STALE_AFTER, updated_age,
+                         next_attempt_age)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    stale_transfers = read_stale_transfers(_STATUSES, _STALE_AFTER, _LIMIT)
+
+    assert stale_transfers == [transfer.id]
+
+
+@pytest.mark.parametrize(
+    'status, created_age, updated_age, next_attempt_age, scheduled_step',
+    [(TransferStatus.SOURCE_TRANSACTION_DETECTED, 60, None, None, None),
+     (TransferStatus.SOURCE_TRANSACTION_DETECTED, 2 * _STALE_AFTER, 60, None,
+      None),
+     (TransferStatus.SOURCE_TRANSACTION_DETECTED, 2 * _STALE_AFTER, None, -60,
+      None),
+     (TransferStatus.SOURCE_TRANSACTION_DETECTED, 2 * _STALE_AFTER, None, None,
+      TransferStep.VALIDATE_TRANSFER),
+     (TransferStatus.DESTINATION_TRANSACTION_SUBMITTED, 2 * _STALE_AFTER, None,
+      None, None)])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_stale_transfers_not_stale_correct(
+        mock_get_session, database_session_maker, status, created_age,
+        updated_age, next_attempt_age, scheduled_step,
+        initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    _initialize_transfer(transfer, status, created_age, updated_age,
+                         next_attempt_age)
+    if scheduled_step is not None:
+        transfer.scheduled_step = scheduled_step.value
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    assert read_stale_transfers(_STATUSES, _STALE_AFTER, _LIMIT) == []
+
+
+@pytest.mark.parametrize('task_created_age, task_heartbeat_age, stale',
+                         [(2 * _STALE_AFTER, None, True),
+                          (2 * _STALE_AFTER, 2 * _STALE_AFTER, True),
+                          (60, None, False), (2 * _STALE_AFTER, 60, False)])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_stale_transfers_claimed_task_correct(
+        mock_get_session, database_session_maker, task_created_age,
+        task_heartbeat_age, stale, initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    _initialize_transfer(transfer, TransferStatus.SOURCE_TRANSACTION_DETECTED,
+                         2 * _STALE_AFTER, None, None)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    initialized_database_session.add(
+        TransferTask(
+            transfer_id=transfer.id, step=TransferStep.VALIDATE_TRANSFER.value,
+            task_id='25b1e8b4-8f8c-4a47-b0bd-6c0c7a43b39d',
+            created=now - datetime.timedelta(seconds=task_created_age),
+            heartbeat=(None if task_heartbeat_age is None else now -
+                       datetime.timedelta(seconds=task_heartbeat_age))))
+    initialized_database_session.commit()
+
+    stale_transfers = read_stale_transfers(_STATUSES, _STALE_AFTER, _LIMIT)
+
+    # A transfer is not orphaned as long as its task is alive
+    assert stale_transfers == ([transfer.id] if stale else [])
+
+
+def _initialize_transfer(transfer, status, created_age, updated_age,
+                         next_attempt_age):
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    transfer.status_id = status.value
+    transfer.created = now - datetime.timedelta(seconds=created_age)
+    transfer.updated = (None if updated_age is None else now -
+                        datetime.timedelta(seconds=updated_age))
+    transfer.next_attempt_at = (None if next_attempt_age is None else now -
+                                datetime.timedelta(seconds=next_attempt_age))
@@ -0,0 +1,23 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import \
+    read_transfer_awaiting_signatures
+
+
+@pytest.mark.parametrize('awaiting_signatures', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_transfer_awaiting_signatures_correct(
+        mock_get_session, database_session_maker, awaiting_signatures,
+        initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    if awaiting_signatures:
+        transfer.awaiting_signatures_since = datetime.datetime.now(
+            datetime.timezone.utc)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    assert (read_transfer_awaiting_signatures(transfer.id)
+            is awaiting_signatures)
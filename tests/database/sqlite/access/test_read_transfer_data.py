@@ -0,0 +1,31 @@
+import unittest.mock
+
+from vision.validatornode.database.access import read_transfer_data
+
+_TRANSFER_DATA = {'amount': 1, 'is_reversal_transfer': False}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_transfer_data_correct(mock_get_session, database_session_maker,
+                                    initialized_database_session, transfer):
+    mock_get_session.side_effect = database_session_maker
+    transfer.transfer_data = _TRANSFER_DATA
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    transfer_data = read_transfer_data(
+        [transfer.id, transfer.id, transfer.id + 1])
+
+    assert transfer_data == {transfer.id: _TRANSFER_DATA}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_transfer_data_no_stored_data_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.side_effect = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    assert read_transfer_data([transfer.id]) == {}
+    assert read_transfer_data([]) == {}
@@ -0,0 +1,40 @@
+import unittest.mock
+import uuid
+
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.database.access import UnconfirmedTransferResponse
+from vision.validatornode.database.access import read_unconfirmed_transfers
+
+_INTERNAL_TRANSACTION_ID = uuid.UUID('3c6a0c4e-5d0f-4f6b-9a4e-0b8f2a1d7e93')
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_unconfirmed_transfers_correct(mock_get_session,
+                                            database_session_maker,
+                                            initialized_database_session,
+                                            transfer, destination_blockchain):
+    mock_get_session.side_effect = database_session_maker
+    transfer.internal_transaction_id = str(_INTERNAL_TRANSACTION_ID)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    unconfirmed_transfers = read_unconfirmed_transfers(
+        Blockchain(destination_blockchain.id))
+
+    assert unconfirmed_transfers == [
+        UnconfirmedTransferResponse(transfer.id, _INTERNAL_TRANSACTION_ID)
+    ]
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_unconfirmed_transfers_no_unconfirmed_transfers_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer, source_blockchain, destination_blockchain):
+    mock_get_session.side_effect = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    assert read_unconfirmed_transfers(Blockchain(
+        destination_blockchain.id)) == []
+    assert read_unconfirmed_transfers(Blockchain(source_blockchain.id)) == []
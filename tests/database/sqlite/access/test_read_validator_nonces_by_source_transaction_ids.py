@@ -0,0 +1,47 @@
+import unittest.mock
+
+import pytest
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.database.access import \
+    read_validator_nonces_by_source_transaction_ids
+
+
+@pytest.mark.parametrize('number_transfers', [0, 1, 2])
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+def test_read_validator_nonces_by_source_transaction_ids_correct(
+        mock_get_session, database_session_maker, number_transfers,
+        initialized_database_session, source_token_contract,
+        destination_token_contract, transfer, other_source_token_contract,
+        other_destination_token_contract, other_transfer):
+    mock_get_session.side_effect = database_session_maker
+    if number_transfers > 0:
+        initialized_database_session.add(source_token_contract)
+        initialized_database_session.add(destination_token_contract)
+        initialized_database_session.add(transfer)
+        if number_transfers > 1:
+            initialized_database_session.add(other_source_token_contract)
+            initialized_database_session.add(other_destination_token_contract)
+            initialized_database_session.add(other_transfer)
+        initialized_database_session.commit()
+    source_transaction = (Blockchain(transfer.source_blockchain_id),
+                          transfer.source_transaction_id)
+    other_source_transaction = (Blockchain(
+        other_transfer.source_blockchain_id),
+                                other_transfer.source_transaction_id)
+
+    validator_nonces = read_validator_nonces_by_source_transaction_ids(
+        [source_transaction, other_source_transaction])
+
+    expected_validator_nonces = {}
+    if number_transfers > 0:
+        expected_validator_nonces[source_transaction] = \
+            transfer.validator_nonce
+    if number_transfers > 1:
+        expected_validator_nonces[other_source_transaction] = \
+            other_transfer.validator_nonce
+    assert validator_nonces == expected_validator_nonces
+
+
+def test_read_validator_nonces_by_source_transaction_ids_empty():
+    assert read_validator_nonces_by_source_transaction_ids([]) == {}
@@ -0,0 +1,43 @@
+import datetime
+import unittest.mock
+import uuid
+
+import pytest
+import sqlalchemy
+
+from vision.validatornode.database.access import reassign_transfer_task
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STEP = TransferStep.SUBMIT_TRANSFER_ONCHAIN
+
+_TASK_ID = uuid.UUID('9f3c2a71-5d4e-4b8a-a6f0-2e7d9c1b3a58')
+
+_OTHER_TASK_ID = uuid.UUID('4c76907e-7660-4195-8858-92e6426f55ea')
+
+
+@pytest.mark.parametrize('other_task_in_flight', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_reassign_transfer_task_correct(mock_get_session,
+                                        database_session_maker,
+                                        other_task_in_flight,
+                                        initialized_database_session,
+                                        transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    if other_task_in_flight:
+        initialized_database_session.add(
+            TransferTask(transfer_id=transfer.id, step=_STEP.value,
+                         task_id=str(_OTHER_TASK_ID),
+                         heartbeat=datetime.datetime(2026, 1, 1)))
+        initialized_database_session.commit()
+
+    reassign_transfer_task(transfer.id, _STEP, _TASK_ID)
+
+    initialized_database_session.expire_all()
+    transfer_tasks = initialized_database_session.execute(
+        sqlalchemy.select(TransferTask.task_id, TransferTask.heartbeat).where(
+            TransferTask.transfer_id == transfer.id).where(
+                TransferTask.step == _STEP.value)).all()
+    assert transfer_tasks == [(str(_TASK_ID), None)]
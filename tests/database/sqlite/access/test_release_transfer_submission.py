@@ -0,0 +1,28 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.database.access import release_transfer_submission
+
+_TASK_ID = uuid.UUID('618ce6a4-34c6-45cf-be75-ae8c46377b29')
+
+_OTHER_TASK_ID = uuid.UUID('4c76907e-7660-4195-8858-92e6426f55ea')
+
+
+@pytest.mark.parametrize('existing_task_id, expected_task_id',
+                         [(_TASK_ID, None),
+                          (_OTHER_TASK_ID, str(_OTHER_TASK_ID))])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_release_transfer_submission_correct(
+        mock_get_session, database_session_maker, existing_task_id,
+        expected_task_id, initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.submission_task_id = str(existing_task_id)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    release_transfer_submission(transfer.id, _TASK_ID)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.submission_task_id == expected_task_id
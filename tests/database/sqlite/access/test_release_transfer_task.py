@@ -0,0 +1,96 @@
+import datetime
+import unittest.mock
+import uuid
+
+import pytest
+import sqlalchemy
+
+from vision.validatornode.database.access import release_stale_transfer_tasks
+from vision.validatornode.database.access import release_transfer_task
+from vision.validatornode.database.access import release_transfer_tasks
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STEP = TransferStep.VALIDATE_TRANSFER
+
+_TASK_ID = uuid.UUID('618ce6a4-34c6-45cf-be75-ae8c46377b29')
+
+_OTHER_TASK_ID = uuid.UUID('4c76907e-7660-4195-8858-92e6426f55ea')
+
+_STALE_AFTER = 3600
+
+
+@pytest.mark.parametrize('existing_task_id, expected_task_ids',
+                         [(_TASK_ID, []),
+                          (_OTHER_TASK_ID, [str(_OTHER_TASK_ID)])])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_release_transfer_task_correct(mock_get_session,
+                                       database_session_maker,
+                                       existing_task_id, expected_task_ids,
+                                       initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    _add_transfer_tasks(initialized_database_session, transfer,
+                        {_STEP: existing_task_id})
+
+    release_transfer_task(transfer.id, _STEP, _TASK_ID)
+
+    assert _read_task_ids(initialized_database_session,
+                          transfer.id) == expected_task_ids
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_release_transfer_tasks_correct(mock_get_session,
+                                        database_session_maker,
+                                        initialized_database_session,
+                                        transfer):
+    mock_get_session.return_value = database_session_maker
+    _add_transfer_tasks(initialized_database_session, transfer, {
+        _STEP: _TASK_ID,
+        TransferStep.SUBMIT_TRANSFER_ONCHAIN: _OTHER_TASK_ID
+    })
+
+    release_transfer_tasks(transfer.id)
+
+    assert _read_task_ids(initialized_database_session, transfer.id) == []
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_release_stale_transfer_tasks_correct(mock_get_session,
+                                              database_session_maker,
+                                              initialized_database_session,
+                                              transfer):
+    mock_get_session.return_value = database_session_maker
+    _add_transfer_tasks(initialized_database_session, transfer, {
+        _STEP: _TASK_ID,
+        TransferStep.SUBMIT_TRANSFER_ONCHAIN: _OTHER_TASK_ID
+    })
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    stale_time = now - datetime.timedelta(seconds=2 * _STALE_AFTER)
+    for transfer_task in initialized_database_session.execute(
+            sqlalchemy.select(TransferTask)).scalars():
+        transfer_task.created = stale_time
+        # The task which has started an attempt recently is alive
+        if transfer_task.task_id == str(_OTHER_TASK_ID):
+            transfer_task.heartbeat = now
+    initialized_database_session.commit()
+
+    release_stale_transfer_tasks(transfer.id, _STALE_AFTER)
+
+    assert _read_task_ids(initialized_database_session,
+                          transfer.id) == [str(_OTHER_TASK_ID)]
+
+
+def _add_transfer_tasks(session, transfer, task_ids):
+    session.add(transfer)
+    session.commit()
+    for step, task_id in task_ids.items():
+        session.add(
+            TransferTask(transfer_id=transfer.id, step=step.value,
+                         task_id=str(task_id)))
+    session.commit()
+
+
+def _read_task_ids(session, internal_transfer_id):
+    statement = sqlalchemy.select(TransferTask.task_id).where(
+        TransferTask.transfer_id == internal_transfer_id)
+    return list(session.execute(statement).scalars().all())
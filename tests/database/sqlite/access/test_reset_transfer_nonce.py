@@ -1,6 +1,9 @@
 import unittest.mock
 
+import sqlalchemy
+
 from vision.validatornode.database.access import reset_transfer_nonce
+from vision.validatornode.database.models import FreeNonce
 
 
 @unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
@@ -10,9 +13,13 @@ def test_reset_transfer_nonce_correct(mock_get_session_maker,
     mock_get_session_maker.return_value = initialized_database_session_maker
     if transfer.nonce is None:
         transfer.nonce = 3323
+    nonce = transfer.nonce
     with initialized_database_session_maker() as database_session:
         database_session.add(transfer)
         database_session.commit()
         reset_transfer_nonce(transfer.id)
         database_session.refresh(transfer)
+        free_nonces = database_session.execute(
+            sqlalchemy.select(FreeNonce.blockchain_id, FreeNonce.nonce)).all()
     assert transfer.nonce is None
+    assert free_nonces == [(transfer.destination_blockchain_id, nonce)]
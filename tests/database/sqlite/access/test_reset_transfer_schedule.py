@@ -0,0 +1,44 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import reset_transfer_schedule
+from vision.validatornode.database.enums import TransferStep
+
+_STEP = TransferStep.SUBMIT_TRANSFER_ONCHAIN
+
+
+@pytest.mark.parametrize('scheduled_step',
+                         [_STEP, TransferStep.VALIDATE_TRANSFER])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_reset_transfer_schedule_correct(mock_get_session,
+                                         database_session_maker,
+                                         scheduled_step,
+                                         initialized_database_session,
+                                         transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.scheduled_step = scheduled_step.value
+    transfer.next_attempt_at = datetime.datetime.now(datetime.timezone.utc)
+    transfer.scheduled_attempts = 1
+    transfer.schedule_id = '9e0f6a57-2f0b-4b8c-a4c1-6d3e28b1f4a0'
+    transfer.leased_until = transfer.next_attempt_at
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    reset_transfer_schedule(transfer.id, _STEP)
+
+    initialized_database_session.refresh(transfer)
+    if scheduled_step is _STEP:
+        assert transfer.scheduled_step is None
+        assert transfer.next_attempt_at is None
+        assert transfer.scheduled_attempts is None
+        assert transfer.schedule_id is None
+        assert transfer.leased_until is None
+    else:
+        # Another step has been scheduled in the meantime
+        assert transfer.scheduled_step == scheduled_step.value
+        assert transfer.next_attempt_at is not None
+        assert transfer.scheduled_attempts == 1
+        assert transfer.schedule_id is not None
+        assert transfer.leased_until is not None
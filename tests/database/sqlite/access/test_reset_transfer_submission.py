@@ -0,0 +1,25 @@
+import datetime
+import unittest.mock
+
+from vision.validatornode.database.access import reset_transfer_submission
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_reset_transfer_submission_correct(mock_get_session,
+                                           database_session_maker,
+                                           initialized_database_session,
+                                           transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.submission_task_id = '618ce6a4-34c6-45cf-be75-ae8c46377b29'
+    transfer.awaiting_signatures_since = datetime.datetime.now(
+        datetime.timezone.utc)
+    transfer.internal_transaction_id = '3c6a0c4e-5d0f-4f6b-9a4e-0b8f2a1d7e93'
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    reset_transfer_submission(transfer.id)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.submission_task_id is None
+    assert transfer.awaiting_signatures_since is None
+    assert transfer.internal_transaction_id is None
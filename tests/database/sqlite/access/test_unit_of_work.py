@@ -0,0 +1,94 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.database.access import claim_transfer_task
+from vision.validatornode.database.access import unit_of_work
+from vision.validatornode.database.access import update_transfer_status
+from vision.validatornode.database.access import update_transfer_task_id
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STATUS = TransferStatus.DESTINATION_TRANSACTION_SUBMITTED
+
+_STEP = TransferStep.VALIDATE_TRANSFER
+
+_TASK_ID = uuid.UUID('25b1e8b4-8f8c-4a47-b0bd-6c0c7a43b39d')
+
+_OTHER_TASK_ID = uuid.UUID('c90e7a3c-1b5e-45cf-9d0a-3f0f7fd3d8a2')
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_unit_of_work_correct(mock_get_session, database_session_maker,
+                              initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    with unit_of_work():
+        update_transfer_status(transfer.id, _STATUS)
+        update_transfer_task_id(transfer.id, _TASK_ID)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.status_id == _STATUS.value
+    assert transfer.task_id == str(_TASK_ID)
+    assert mock_get_session.call_count == 1
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_unit_of_work_nested_correct(mock_get_session, database_session_maker,
+                                     initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    with unit_of_work() as session:
+        with unit_of_work() as nested_session:
+            update_transfer_status(transfer.id, _STATUS)
+
+    assert nested_session is session
+    initialized_database_session.refresh(transfer)
+    assert transfer.status_id == _STATUS.value
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_unit_of_work_recoverable_error(mock_get_session,
+                                        database_session_maker,
+                                        initialized_database_session,
+                                        transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    initialized_database_session.add(
+        TransferTask(transfer_id=transfer.id, step=_STEP.value,
+                     task_id=str(_OTHER_TASK_ID)))
+    initialized_database_session.commit()
+
+    with unit_of_work():
+        update_transfer_status(transfer.id, _STATUS)
+        claimed = claim_transfer_task(transfer.id, _STEP, _TASK_ID)
+
+    assert not claimed
+    initialized_database_session.refresh(transfer)
+    assert transfer.status_id == _STATUS.value
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_unit_of_work_rollback(mock_get_session, database_session_maker,
+                               initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    status_id = transfer.status_id
+
+    with pytest.raises(Exception):
+        with unit_of_work():
+            update_transfer_status(transfer.id, _STATUS)
+            update_transfer_task_id(transfer.id, _TASK_ID)
+            raise Exception
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.status_id == status_id
+    assert transfer.task_id != str(_TASK_ID)
@@ -0,0 +1,42 @@
+import unittest.mock
+
+import sqlalchemy
+
+from vision.validatornode.database.access import update_performance_metrics
+from vision.validatornode.database.models import PerformanceMetric
+
+
+def _merge_metric(metric, other_metric):
+    return {'count': metric['count'] + other_metric['count']}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_performance_metrics_correct(mock_get_session_maker,
+                                            database_session_maker,
+                                            initialized_database_session):
+    mock_get_session_maker.return_value = database_session_maker
+    initialized_database_session.add(
+        PerformanceMetric(name='stored', value={'count': 3}))
+    initialized_database_session.commit()
+
+    update_performance_metrics({
+        'stored': {
+            'count': 2
+        },
+        'new': {
+            'count': 1
+        }
+    }, _merge_metric)
+
+    initialized_database_session.expire_all()
+    metrics = initialized_database_session.execute(
+        sqlalchemy.select(PerformanceMetric.name,
+                          PerformanceMetric.value)).all()
+    assert dict(metrics) == {'stored': {'count': 5}, 'new': {'count': 1}}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_performance_metrics_no_metrics(mock_get_session_maker):
+    update_performance_metrics({}, _merge_metric)
+
+    mock_get_session_maker.assert_not_called()
@@ -6,6 +6,8 @@ from vision.common.blockchains.enums import Blockchain
 from tests.database.utilities import modify_model_instance
 from vision.validatornode.database.access import update_reversal_transfer
 
+_TRANSFER_DATA = {'is_reversal_transfer': True}
+
 
 @pytest.mark.parametrize('destination_token_contract_existent', [True, False])
 @unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
@@ -28,7 +30,8 @@ def test_update_reversal_transfer_correct(
     update_reversal_transfer(transfer.id,
                              Blockchain(other_destination_blockchain.id),
                              other_recipient_address,
-                             other_destination_token_contract.address)
+                             other_destination_token_contract.address,
+                             _TRANSFER_DATA)
     initialized_database_session.refresh(transfer)
     assert (
         transfer.destination_blockchain_id == other_destination_blockchain.id)
@@ -37,3 +40,4 @@ def test_update_reversal_transfer_correct(
             transfer.destination_blockchain_id)
     assert (transfer.destination_token_contract.address ==
             other_destination_token_contract.address)
+    assert transfer.transfer_data == _TRANSFER_DATA
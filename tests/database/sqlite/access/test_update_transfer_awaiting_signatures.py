@@ -0,0 +1,35 @@
+import datetime
+import unittest.mock
+
+from vision.validatornode.database.access import \
+    update_transfer_awaiting_signatures
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_awaiting_signatures_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_awaiting_signatures(transfer.id)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.awaiting_signatures_since is not None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_awaiting_signatures_already_awaiting_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    awaiting_signatures_since = datetime.datetime(2026, 1, 1)
+    transfer.awaiting_signatures_since = awaiting_signatures_since
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_awaiting_signatures(transfer.id)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.awaiting_signatures_since == awaiting_signatures_since
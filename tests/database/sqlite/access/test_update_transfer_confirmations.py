@@ -0,0 +1,45 @@
+import unittest.mock
+
+from tests.database.utilities import modify_model_instance
+from vision.validatornode.database.access import TransferConfirmationRequest
+from vision.validatornode.database.access import update_transfer_confirmations
+from vision.validatornode.database.enums import TransferStatus
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_confirmations_correct(
+        mock_get_session_maker, database_session_maker,
+        initialized_database_session, transfer, other_destination_transfer_id,
+        other_destination_transaction_id, other_destination_block_number):
+    mock_get_session_maker.return_value = database_session_maker
+    transfer = modify_model_instance(
+        transfer, destination_transfer_id=None,
+        destination_transaction_id=None, destination_block_number=None,
+        status_id=TransferStatus.DESTINATION_TRANSACTION_SUBMITTED.value,
+        internal_transaction_id='3c6a0c4e-5d0f-4f6b-9a4e-0b8f2a1d7e93')
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_confirmations([
+        TransferConfirmationRequest(
+            transfer.id, other_destination_transfer_id,
+            other_destination_transaction_id, other_destination_block_number,
+            TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+    ])
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.destination_transfer_id == other_destination_transfer_id
+    assert (transfer.destination_transaction_id ==
+            other_destination_transaction_id)
+    assert transfer.destination_block_number == other_destination_block_number
+    assert (transfer.status_id ==
+            TransferStatus.DESTINATION_TRANSACTION_CONFIRMED.value)
+    assert transfer.internal_transaction_id is None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_confirmations_no_requests_correct(
+        mock_get_session_maker):
+    update_transfer_confirmations([])
+
+    mock_get_session_maker.assert_not_called()
@@ -0,0 +1,34 @@
+import unittest.mock
+
+from vision.validatornode.database.access import update_transfer_data
+
+_TRANSFER_DATA = {'source_transfer_id': 8, 'amount': 1000}
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_data_correct(mock_get_session, database_session_maker,
+                                      initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_data(transfer.id, _TRANSFER_DATA)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.transfer_data == _TRANSFER_DATA
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_data_already_stored_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer_data = dict(_TRANSFER_DATA, amount=2000)
+    transfer.transfer_data = transfer_data
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_data(transfer.id, _TRANSFER_DATA)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.transfer_data == transfer_data
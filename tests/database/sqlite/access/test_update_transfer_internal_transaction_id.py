@@ -0,0 +1,25 @@
+import datetime
+import unittest.mock
+import uuid
+
+from vision.validatornode.database.access import \
+    update_transfer_internal_transaction_id
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_internal_transaction_id_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.awaiting_signatures_since = datetime.datetime.now(
+        datetime.timezone.utc)
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    internal_transaction_id = uuid.uuid4()
+
+    update_transfer_internal_transaction_id(transfer.id,
+                                            internal_transaction_id)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.internal_transaction_id == str(internal_transaction_id)
+    assert transfer.awaiting_signatures_since is None
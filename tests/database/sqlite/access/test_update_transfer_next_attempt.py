@@ -0,0 +1,45 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import update_transfer_next_attempt
+from vision.validatornode.database.enums import TransferStep
+
+_STEP = TransferStep.SUBMIT_TRANSFER_TO_PRIMARY_NODE
+
+_DELAY = 300
+
+_ATTEMPTS = 4
+
+
+@pytest.mark.parametrize('scheduled_step',
+                         [_STEP, TransferStep.SUBMIT_TRANSFER_ONCHAIN])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_next_attempt_correct(mock_get_session,
+                                              database_session_maker,
+                                              scheduled_step,
+                                              initialized_database_session,
+                                              transfer):
+    mock_get_session.return_value = database_session_maker
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    transfer.scheduled_step = scheduled_step.value
+    transfer.next_attempt_at = now
+    transfer.scheduled_attempts = _ATTEMPTS
+    transfer.leased_until = now
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_next_attempt(transfer.id, _STEP, _DELAY)
+
+    initialized_database_session.refresh(transfer)
+    if scheduled_step is _STEP:
+        assert (transfer.next_attempt_at
+                >= now + datetime.timedelta(seconds=_DELAY))
+        assert transfer.scheduled_attempts == _ATTEMPTS + 1
+        assert transfer.leased_until is None
+    else:
+        # Another step has been scheduled in the meantime
+        assert transfer.next_attempt_at == now
+        assert transfer.scheduled_attempts == _ATTEMPTS
+        assert transfer.leased_until == now
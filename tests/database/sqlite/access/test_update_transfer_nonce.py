@@ -0,0 +1,197 @@
+import unittest.mock
+
+import sqlalchemy
+from vision.common.blockchains.enums import Blockchain
+
+from tests.database.utilities import modify_model_instance
+from vision.validatornode.database.access import reset_transfer_nonce
+from vision.validatornode.database.access import update_transfer_nonce
+from vision.validatornode.database.access import update_transfer_status
+from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.models import ChainNonce
+from vision.validatornode.database.models import FreeNonce
+from vision.validatornode.database.models import Transfer
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_consecutive_nonces_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 3)
+    for internal_transfer_id in internal_transfer_ids:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, 6, 7]
+    assert _read_next_nonce(initialized_database_session) == 8
+    statuses = initialized_database_session.execute(
+        sqlalchemy.select(Transfer.status_id).filter(
+            Transfer.id.in_(internal_transfer_ids))).scalars().all()
+    assert statuses == [
+        TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED.value
+    ] * 3
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_greater_latest_blockchain_nonce_correct(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 2)
+    update_transfer_nonce(internal_transfer_ids[0], Blockchain.ETHEREUM, 5)
+    update_transfer_nonce(internal_transfer_ids[1], Blockchain.ETHEREUM, 9)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, 9]
+    assert _read_next_nonce(initialized_database_session) == 10
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_failed_nonce_reused(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 4)
+    for internal_transfer_id in internal_transfer_ids[:3]:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5)
+    update_transfer_status(internal_transfer_ids[1],
+                           TransferStatus.DESTINATION_TRANSACTION_FAILED)
+    update_transfer_nonce(internal_transfer_ids[3], Blockchain.ETHEREUM, 5)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, None, 7, 6]
+    assert _read_next_nonce(initialized_database_session) == 8
+    assert initialized_database_session.execute(
+        sqlalchemy.select(FreeNonce)).first() is None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_failed_transfer_new_nonce_assigned(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 2)
+    for internal_transfer_id in internal_transfer_ids:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5)
+    update_transfer_status(internal_transfer_ids[1],
+                           TransferStatus.DESTINATION_TRANSACTION_FAILED)
+    update_transfer_nonce(internal_transfer_ids[1], Blockchain.ETHEREUM, 5)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, 6]
+    status_id = initialized_database_session.execute(
+        sqlalchemy.select(Transfer.status_id).filter(
+            Transfer.id == internal_transfer_ids[1])).scalar_one()
+    assert (status_id == TransferStatus.
+            DESTINATION_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED.value)
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_reset_nonce_reused(mock_get_session,
+                                                  database_session_maker,
+                                                  initialized_database_session,
+                                                  transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 4)
+    for internal_transfer_id in internal_transfer_ids[:3]:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5)
+    reset_transfer_nonce(internal_transfer_ids[1])
+    update_transfer_nonce(internal_transfer_ids[3], Blockchain.ETHEREUM, 5)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, None, 7, 6]
+    assert _read_next_nonce(initialized_database_session) == 8
+    assert initialized_database_session.execute(
+        sqlalchemy.select(FreeNonce)).first() is None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_used_up_free_nonce_discarded(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 3)
+    for internal_transfer_id in internal_transfer_ids[:2]:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5)
+    reset_transfer_nonce(internal_transfer_ids[0])
+    update_transfer_nonce(internal_transfer_ids[2], Blockchain.ETHEREUM, 6)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [None, 6, 7]
+    assert _read_next_nonce(initialized_database_session) == 8
+    assert initialized_database_session.execute(
+        sqlalchemy.select(FreeNonce)).first() is None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_maximum_pending_nonces_reached(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 4)
+    allocated = [
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5, 2)
+        for internal_transfer_id in internal_transfer_ids[:3]
+    ]
+    assert allocated == [True, True, False]
+    # The window advances when pending transactions are included
+    assert update_transfer_nonce(internal_transfer_ids[3], Blockchain.ETHEREUM,
+                                 6, 2)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [5, 6, None, 7]
+    status_id = initialized_database_session.execute(
+        sqlalchemy.select(Transfer.status_id).filter(
+            Transfer.id == internal_transfer_ids[2])).scalar_one()
+    assert status_id == TransferStatus.SOURCE_TRANSACTION_DETECTED.value
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_nonce_maximum_pending_nonces_failed_nonce_reused(
+        mock_get_session, database_session_maker, initialized_database_session,
+        transfer):
+    mock_get_session.return_value = database_session_maker
+    internal_transfer_ids = _create_database_records(
+        initialized_database_session, transfer, 3)
+    for internal_transfer_id in internal_transfer_ids[:2]:
+        update_transfer_nonce(internal_transfer_id, Blockchain.ETHEREUM, 5, 2)
+    update_transfer_status(internal_transfer_ids[0],
+                           TransferStatus.DESTINATION_TRANSACTION_FAILED)
+    assert update_transfer_nonce(internal_transfer_ids[2], Blockchain.ETHEREUM,
+                                 5, 2)
+    assert _read_nonces(initialized_database_session,
+                        internal_transfer_ids) == [None, 6, 5]
+
+
+def _create_database_records(database_session, transfer, number_transfers):
+    internal_transfer_ids = []
+    for i in range(number_transfers):
+        modified_transfer = modify_model_instance(
+            transfer, source_blockchain_id=Blockchain.BNB_CHAIN.value,
+            destination_blockchain_id=Blockchain.ETHEREUM.value,
+            validator_nonce=i, task_id=f'{i}', source_transfer_id=i,
+            destination_transfer_id=i, source_transaction_id=f'{i}',
+            destination_transaction_id=f'{i}', nonce=None,
+            status_id=TransferStatus.SOURCE_TRANSACTION_DETECTED.value)
+        database_session.add(modified_transfer)
+        database_session.flush()
+        internal_transfer_ids.append(modified_transfer.id)
+    database_session.commit()
+    return internal_transfer_ids
+
+
+def _read_next_nonce(database_session):
+    return database_session.execute(
+        sqlalchemy.select(ChainNonce.next_nonce).filter(
+            ChainNonce.blockchain_id ==
+            Blockchain.ETHEREUM.value)).scalar_one()
+
+
+def _read_nonces(database_session, internal_transfer_ids):
+    database_session.expire_all()
+    nonces = dict(
+        database_session.execute(
+            sqlalchemy.select(Transfer.id, Transfer.nonce).filter(
+                Transfer.id.in_(internal_transfer_ids))).all())
+    return [nonces[id_] for id_ in internal_transfer_ids]
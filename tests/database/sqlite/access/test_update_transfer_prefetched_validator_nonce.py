@@ -0,0 +1,27 @@
+import datetime
+import unittest.mock
+
+from vision.validatornode.database.access import \
+    update_transfer_prefetched_validator_nonce
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_prefetched_validator_nonce_correct(
+        mock_get_session_maker, database_session_maker,
+        initialized_database_session, transfer, other_validator_nonce):
+    assert transfer.validator_nonce != other_validator_nonce
+    mock_get_session_maker.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    date_time_before_update = datetime.datetime.now(datetime.timezone.utc)
+
+    update_transfer_prefetched_validator_nonce(transfer.id,
+                                               other_validator_nonce)
+
+    date_time_after_update = datetime.datetime.now(datetime.timezone.utc)
+    initialized_database_session.refresh(transfer)
+    assert transfer.validator_nonce == other_validator_nonce
+    assert (date_time_before_update.replace(tzinfo=None) <
+            transfer.validator_nonce_prefetched <
+            date_time_after_update.replace(tzinfo=None))
+    assert transfer.updated == transfer.validator_nonce_prefetched
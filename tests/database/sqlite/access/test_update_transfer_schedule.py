@@ -0,0 +1,105 @@
+import datetime
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.database.access import claim_scheduled_transfers
+from vision.validatornode.database.access import claim_transfer_submission
+from vision.validatornode.database.access import \
+    read_transfer_awaiting_signatures
+from vision.validatornode.database.access import reset_transfer_schedule
+from vision.validatornode.database.access import \
+    update_transfer_awaiting_signatures
+from vision.validatornode.database.access import \
+    update_transfer_internal_transaction_id
+from vision.validatornode.database.access import update_transfer_schedule
+from vision.validatornode.database.enums import TransferStep
+
+_DELAY = 60
+
+_LEASE = 600
+
+_SCHEDULE_ID = '9e0f6a57-2f0b-4b8c-a4c1-6d3e28b1f4a0'
+
+
+@pytest.mark.parametrize('step', [step for step in TransferStep])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_schedule_correct(mock_get_session,
+                                          database_session_maker, step,
+                                          initialized_database_session,
+                                          transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.scheduled_step = TransferStep.VALIDATE_TRANSFER.value
+    transfer.scheduled_attempts = 5
+    transfer.schedule_id = _SCHEDULE_ID
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    update_transfer_schedule(transfer.id, step, _DELAY)
+
+    initialized_database_session.refresh(transfer)
+    assert transfer.scheduled_step == step.value
+    assert (transfer.next_attempt_at
+            >= now + datetime.timedelta(seconds=_DELAY))
+    assert transfer.scheduled_attempts == 0
+    # The same step keeps its ID for all of its attempts
+    assert ((transfer.schedule_id == _SCHEDULE_ID)
+            is (step is TransferStep.VALIDATE_TRANSFER))
+    assert transfer.schedule_id is not None
+    assert transfer.leased_until is None
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_schedule_leased_correct(mock_get_session,
+                                                 database_session_maker,
+                                                 initialized_database_session,
+                                                 transfer):
+    mock_get_session.return_value = database_session_maker
+    leased_until = datetime.datetime.now(datetime.timezone.utc).replace(
+        tzinfo=None) + datetime.timedelta(seconds=_LEASE)
+    transfer.scheduled_step = TransferStep.SUBMIT_TRANSFER_ONCHAIN.value
+    transfer.next_attempt_at = leased_until
+    transfer.scheduled_attempts = 1
+    transfer.schedule_id = _SCHEDULE_ID
+    transfer.leased_until = leased_until
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_schedule(transfer.id, TransferStep.SUBMIT_TRANSFER_ONCHAIN,
+                             0)
+
+    # An active lease is not shortened
+    initialized_database_session.refresh(transfer)
+    assert transfer.next_attempt_at == leased_until
+    assert transfer.scheduled_attempts == 1
+    assert transfer.leased_until == leased_until
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session')
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_schedule_late_signature_after_submission(
+        mock_get_session_maker, mock_get_session, database_session_maker,
+        initialized_database_session, transfer):
+    mock_get_session_maker.return_value = database_session_maker
+    mock_get_session.side_effect = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    step = TransferStep.SUBMIT_TRANSFER_ONCHAIN
+    update_transfer_schedule(transfer.id, step, 0)
+    update_transfer_awaiting_signatures(transfer.id)
+    scheduled_transfer = claim_scheduled_transfers(step, 1, _LEASE)[0]
+    assert claim_transfer_submission(transfer.id,
+                                     scheduled_transfer.schedule_id)
+    update_transfer_internal_transaction_id(transfer.id, uuid.uuid4())
+    reset_transfer_schedule(transfer.id, step)
+
+    # A late signature must not lead to a second submission
+    assert not read_transfer_awaiting_signatures(transfer.id)
+    update_transfer_schedule(transfer.id, step, 0)
+    late_scheduled_transfer = claim_scheduled_transfers(step, 1, _LEASE)[0]
+    assert (late_scheduled_transfer.schedule_id
+            != scheduled_transfer.schedule_id)
+    assert not claim_transfer_submission(transfer.id,
+                                         late_scheduled_transfer.schedule_id)
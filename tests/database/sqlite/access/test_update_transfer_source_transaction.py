@@ -5,6 +5,8 @@ import pytest
 from vision.validatornode.database.access import \
     update_transfer_source_transaction
 
+_TRANSFER_DATA = {'source_transfer_id': 9652}
+
 
 @pytest.mark.parametrize('source_block_number', [9807193, 258289])
 @pytest.mark.parametrize('source_transfer_id', [9652, 760115])
@@ -18,7 +20,8 @@ def test_update_transfer_source_transaction_correct(
     assert transfer.source_transfer_id != source_transfer_id
     assert transfer.source_block_number != source_block_number
     update_transfer_source_transaction(transfer.id, source_transfer_id,
-                                       source_block_number)
+                                       source_block_number, _TRANSFER_DATA)
     initialized_database_session.refresh(transfer)
     assert transfer.source_transfer_id == source_transfer_id
     assert transfer.source_block_number == source_block_number
+    assert transfer.transfer_data == _TRANSFER_DATA
@@ -1,9 +1,12 @@
 import unittest.mock
 
 import pytest
+import sqlalchemy
 
 from vision.validatornode.database.access import update_transfer_status
 from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.models import ChainNonce
+from vision.validatornode.database.models import FreeNonce
 
 
 @pytest.mark.parametrize('new_transfer_status', TransferStatus)
@@ -19,3 +22,54 @@ def test_update_transfer_status_correct(
     update_transfer_status(transfer.id, new_transfer_status)
     initialized_database_session.refresh(transfer)
     assert transfer.status_id == new_transfer_status.value
+
+
+@pytest.mark.parametrize('failed_transfer_status', [
+    TransferStatus.DESTINATION_TRANSACTION_FAILED,
+    TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED
+])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_status_failed_nonce_freed_once(
+        mock_get_session, database_session_maker, failed_transfer_status,
+        initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.nonce = 0
+    initialized_database_session.add(transfer)
+    initialized_database_session.add(
+        ChainNonce(blockchain_id=transfer.destination_blockchain_id,
+                   next_nonce=1))
+    initialized_database_session.commit()
+    update_transfer_status(transfer.id, failed_transfer_status)
+    update_transfer_status(transfer.id, failed_transfer_status)
+    free_nonces = initialized_database_session.execute(
+        sqlalchemy.select(FreeNonce.blockchain_id, FreeNonce.nonce)).all()
+    assert free_nonces == [(transfer.destination_blockchain_id, 0)]
+
+
+@pytest.mark.parametrize('nonce_already_freed', [True, False])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_status_failed_nonce_freed_concurrently(
+        mock_get_session, database_session_maker, nonce_already_freed,
+        initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    transfer.nonce = 0
+    initialized_database_session.add(transfer)
+    if nonce_already_freed:
+        # Freed by another transaction (otherwise the nonce allocation
+        # state does not exist yet and is created while freeing the
+        # nonce)
+        initialized_database_session.add(
+            ChainNonce(blockchain_id=transfer.destination_blockchain_id,
+                       next_nonce=1))
+        initialized_database_session.add(
+            FreeNonce(blockchain_id=transfer.destination_blockchain_id,
+                      nonce=0))
+    initialized_database_session.commit()
+    update_transfer_status(transfer.id,
+                           TransferStatus.DESTINATION_TRANSACTION_FAILED)
+    initialized_database_session.refresh(transfer)
+    assert (transfer.status_id ==
+            TransferStatus.DESTINATION_TRANSACTION_FAILED.value)
+    free_nonces = initialized_database_session.execute(
+        sqlalchemy.select(FreeNonce.blockchain_id, FreeNonce.nonce)).all()
+    assert free_nonces == [(transfer.destination_blockchain_id, 0)]
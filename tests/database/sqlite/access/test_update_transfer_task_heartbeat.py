@@ -0,0 +1,53 @@
+import unittest.mock
+import uuid
+
+import pytest
+
+from vision.validatornode.database.access import update_transfer_task_heartbeat
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.database.models import TransferTask
+
+_STEP = TransferStep.VALIDATE_TRANSFER
+
+_TASK_ID = uuid.UUID('618ce6a4-34c6-45cf-be75-ae8c46377b29')
+
+_OTHER_TASK_ID = uuid.UUID('4c76907e-7660-4195-8858-92e6426f55ea')
+
+
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_task_heartbeat_correct(mock_get_session,
+                                                database_session_maker,
+                                                initialized_database_session,
+                                                transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    transfer_task = TransferTask(transfer_id=transfer.id, step=_STEP.value,
+                                 task_id=str(_TASK_ID))
+    initialized_database_session.add(transfer_task)
+    initialized_database_session.commit()
+
+    claimed = update_transfer_task_heartbeat(transfer.id, _STEP, _TASK_ID)
+
+    assert claimed
+    initialized_database_session.refresh(transfer_task)
+    assert transfer_task.heartbeat is not None
+
+
+@pytest.mark.parametrize('existing_task_id', [None, _OTHER_TASK_ID])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_task_heartbeat_not_claimed_correct(
+        mock_get_session, database_session_maker, existing_task_id,
+        initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+    if existing_task_id is not None:
+        initialized_database_session.add(
+            TransferTask(transfer_id=transfer.id, step=_STEP.value,
+                         task_id=str(existing_task_id)))
+        initialized_database_session.commit()
+
+    claimed = update_transfer_task_heartbeat(transfer.id, _STEP, _TASK_ID)
+
+    assert not claimed
@@ -0,0 +1,36 @@
+import datetime
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.database.access import \
+    update_transfer_task_next_attempt
+from vision.validatornode.database.enums import TransferStep
+
+_DELAY = 300
+
+
+@pytest.mark.parametrize('scheduled_step',
+                         [None, TransferStep.VALIDATE_TRANSFER])
+@unittest.mock.patch('vision.validatornode.database.access.get_session_maker')
+def test_update_transfer_task_next_attempt_correct(
+        mock_get_session, database_session_maker, scheduled_step,
+        initialized_database_session, transfer):
+    mock_get_session.return_value = database_session_maker
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    if scheduled_step is not None:
+        transfer.scheduled_step = scheduled_step.value
+        transfer.next_attempt_at = now
+        transfer.scheduled_attempts = 0
+    initialized_database_session.add(transfer)
+    initialized_database_session.commit()
+
+    update_transfer_task_next_attempt(transfer.id, _DELAY)
+
+    initialized_database_session.refresh(transfer)
+    if scheduled_step is None:
+        assert (transfer.next_attempt_at
+                >= now + datetime.timedelta(seconds=_DELAY))
+    else:
+        # The scheduled processing step is left unchanged
+        assert transfer.next_attempt_at == now
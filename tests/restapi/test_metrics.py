@@ -0,0 +1,27 @@
+import json
+import unittest.mock
+
+import pytest
+
+_METRICS = {'steps': [], 'blockchain_client_calls': [], 'task_retries': []}
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.read_metrics',
+                     return_value=_METRICS)
+def test_metrics_correct(mock_read_metrics, test_client):
+    response = test_client.get('/health/metrics')
+
+    assert response.status_code == 200
+    assert json.loads(response.text) == _METRICS
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.read_metrics',
+                     side_effect=Exception)
+def test_metrics_internal_server_error(mock_read_metrics, test_client):
+    response = test_client.get('/health/metrics')
+
+    assert response.status_code == 500
@@ -0,0 +1,108 @@
+import json
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.base import DuplicateSignatureError
+from vision.validatornode.business.base import InvalidSignatureError
+from vision.validatornode.business.base import InvalidSignerError
+from vision.validatornode.business.base import UnknownTransferError
+from vision.validatornode.business.signatures import SignatureInteractorError
+from vision.validatornode.restapi import _MAXIMUM_TRANSFER_SIGNATURES
+
+_RESTFUL_RESOURCE = '/transfersignatures'
+
+_SIGNATURE = ('0x89f4bb92379a5f1ab97a8dcf01c73d1eb6d25e173fa17286fa5ed2416e369'
+              '67a3e68f634f808e74c1f018cfd55264c9ce961772fcbda4bba627603f7c196'
+              '1aa11b')
+
+
+@pytest.fixture
+def transfer_signature_request(source_blockchain, source_transaction_id):
+    return {
+        'source_blockchain_id': source_blockchain.value,
+        'source_transaction_id': source_transaction_id,
+        'signature': _SIGNATURE
+    }
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.SignatureInteractor')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_config',
+                     return_value={'active': True})
+def test_transfer_signatures_correct(mock_get_blockchain_config,
+                                     mock_get_blockchain_client,
+                                     mock_signature_interactor,
+                                     transfer_signature_request, test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+    mock_signature_interactor().add_secondary_node_signatures.return_value = [
+        None,
+        DuplicateSignatureError(),
+        InvalidSignatureError(),
+        InvalidSignerError(),
+        UnknownTransferError(),
+        SignatureInteractorError('some error')
+    ]
+    invalid_transfer_signature_request = transfer_signature_request.copy()
+    invalid_transfer_signature_request.pop('signature')
+    signatures = [transfer_signature_request] * 3 + [
+        invalid_transfer_signature_request
+    ] + [transfer_signature_request] * 3
+
+    response = test_client.post(_RESTFUL_RESOURCE,
+                                json={'signatures': signatures})
+
+    assert response.status_code == 200
+    results = json.loads(response.text)['results']
+    assert [result['status_code']
+            for result in results] == [204, 409, 400, 400, 403, 404, 500]
+    assert 'message' not in results[0]
+    assert results[1]['message'] == 'Duplicate signature.'
+    assert results[2]['message'] == 'Invalid signature.'
+    assert 'signature' in results[3]['message']
+    assert results[4]['message'] == 'Invalid signer.'
+    assert results[5]['message'] == 'Unknown transfer.'
+    signature_add_requests = mock_signature_interactor().\
+        add_secondary_node_signatures.call_args.args[0]
+    assert len(signature_add_requests) == 6
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@pytest.mark.parametrize('number_signatures',
+                         [0, _MAXIMUM_TRANSFER_SIGNATURES + 1])
+@unittest.mock.patch('vision.validatornode.restapi.SignatureInteractor')
+def test_transfer_signatures_bad_request_schema_error(
+        mock_signature_interactor, number_signatures,
+        transfer_signature_request, test_client):
+    response = test_client.post(
+        _RESTFUL_RESOURCE,
+        json={'signatures': [transfer_signature_request] * number_signatures})
+
+    assert response.status_code == 400
+    assert 'signatures' in json.loads(response.text)['message']
+    mock_signature_interactor().add_secondary_node_signatures.\
+        assert_not_called()
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.SignatureInteractor')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_config',
+                     return_value={'active': True})
+def test_transfer_signatures_internal_server_error(mock_get_blockchain_config,
+                                                   mock_get_blockchain_client,
+                                                   mock_signature_interactor,
+                                                   transfer_signature_request,
+                                                   test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+    mock_signature_interactor().add_secondary_node_signatures.side_effect = \
+        Exception
+
+    response = test_client.post(
+        _RESTFUL_RESOURCE, json={'signatures': [transfer_signature_request]})
+
+    assert response.status_code == 500
@@ -0,0 +1,113 @@
+import json
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.restapi import _MAXIMUM_VALIDATOR_NONCES
+
+_RESTFUL_RESOURCE = '/validatornonces'
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@pytest.mark.parametrize('http_method', ['get', 'post'])
+@unittest.mock.patch('vision.validatornode.restapi.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_config',
+                     return_value={'active': True})
+def test_validator_nonces_correct(mock_get_blockchain_config,
+                                  mock_get_blockchain_client,
+                                  mock_transfer_interactor, http_method,
+                                  source_blockchain, source_transaction_id,
+                                  validator_nonce, test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+    mock_transfer_interactor().get_validator_nonces.return_value = [
+        validator_nonce, None
+    ]
+    transfers = [(source_blockchain.value, source_transaction_id)] * 2
+
+    response = _send_request(test_client, http_method, transfers)
+
+    assert response.status_code == 200
+    assert json.loads(
+        response.text)['validator_nonces'] == [validator_nonce, None]
+    mock_transfer_interactor().get_validator_nonces.assert_called_once_with(
+        [(source_blockchain, source_transaction_id)] * 2)
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@pytest.mark.parametrize('http_method', ['get', 'post'])
+@pytest.mark.parametrize('number_transfers',
+                         [0, _MAXIMUM_VALIDATOR_NONCES + 1])
+@unittest.mock.patch('vision.validatornode.restapi.TransferInteractor')
+def test_validator_nonces_bad_request_number_transfers_error(
+        mock_transfer_interactor, number_transfers, http_method,
+        source_blockchain, source_transaction_id, test_client):
+    transfers = [(source_blockchain.value, source_transaction_id)
+                 ] * number_transfers
+
+    response = _send_request(test_client, http_method, transfers)
+
+    assert response.status_code == 400
+    assert 'transfers' in json.loads(response.text)['message']
+    mock_transfer_interactor().get_validator_nonces.assert_not_called()
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_config',
+                     return_value={'active': True})
+def test_validator_nonces_bad_request_missing_parameter_error(
+        mock_get_blockchain_config, mock_get_blockchain_client,
+        mock_transfer_interactor, source_blockchain, source_transaction_id,
+        test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+
+    response = test_client.get(
+        f'{_RESTFUL_RESOURCE}?source_blockchain_id={source_blockchain.value}&'
+        f'source_blockchain_id={source_blockchain.value}&'
+        f'source_transaction_id={source_transaction_id}')
+
+    assert response.status_code == 400
+    mock_transfer_interactor().get_validator_nonces.assert_not_called()
+
+
+@pytest.mark.filterwarnings(
+    'ignore:The \'__version__\' attribute is deprecated')
+@unittest.mock.patch('vision.validatornode.restapi.TransferInteractor')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_client')
+@unittest.mock.patch('vision.validatornode.restapi.get_blockchain_config',
+                     return_value={'active': True})
+def test_validator_nonces_internal_server_error(mock_get_blockchain_config,
+                                                mock_get_blockchain_client,
+                                                mock_transfer_interactor,
+                                                source_blockchain,
+                                                source_transaction_id,
+                                                test_client):
+    mock_get_blockchain_client().is_valid_transaction_id.return_value = True
+    mock_transfer_interactor().get_validator_nonces.side_effect = Exception
+
+    response = _send_request(
+        test_client, 'post',
+        [(source_blockchain.value, source_transaction_id)])
+
+    assert response.status_code == 500
+
+
+def _send_request(test_client, http_method, transfers):
+    if http_method == 'get':
+        query = '&'.join(
+            f'source_blockchain_id={source_blockchain_id}&'
+            f'source_transaction_id={source_transaction_id}'
+            for source_blockchain_id, source_transaction_id in transfers)
+        return test_client.get(f'{_RESTFUL_RESOURCE}?{query}')
+    return test_client.post(
+        _RESTFUL_RESOURCE, json={
+            'transfers': [{
+                'source_blockchain_id': source_blockchain_id,
+                'source_transaction_id': source_transaction_id
+            } for source_blockchain_id, source_transaction_id in transfers]
+        })
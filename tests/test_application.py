@@ -162,13 +162,54 @@ def test_initialize_application_initialize_logger_exception(
         initialize_application()
 
 
+@pytest.mark.parametrize('mode_presign_transfers', [('primary', True),
+                                                    ('secondary', True),
+                                                    ('secondary', False)])
+@pytest.mark.parametrize('recovery_enabled', [True, False])
+@pytest.mark.parametrize('scheduler_enabled', [True, False])
+@unittest.mock.patch('vision.validatornode.presigning.run_presigning')
+@unittest.mock.patch('vision.validatornode.recovery.run_recovery')
+@unittest.mock.patch('vision.validatornode.scheduler.run_scheduler')
 @unittest.mock.patch('vision.validatornode.monitor.run_monitor')
 @unittest.mock.patch('vision.validatornode.application.initialize_application')
 @unittest.mock.patch('vision.validatornode.restapi.flask_app')
+@unittest.mock.patch('vision.validatornode.application.config')
 @unittest.mock.patch('vision.validatornode.configuration.config')
-def test_create_application_correct(mock_config, mock_flask_app,
-                                    mock_initialize_application, mock_monitor):
+def test_create_application_correct(mock_config, mock_application_config,
+                                    mock_flask_app,
+                                    mock_initialize_application, mock_monitor,
+                                    mock_scheduler, mock_recovery,
+                                    mock_presigning, scheduler_enabled,
+                                    recovery_enabled, mode_presign_transfers):
+    mode, presign_transfers = mode_presign_transfers
+    mock_config_dict = {
+        'application': {
+            'mode': mode,
+            'presign_transfers': presign_transfers
+        },
+        'scheduler': {
+            'enabled': scheduler_enabled
+        },
+        'recovery': {
+            'enabled': recovery_enabled
+        }
+    }
+    mock_application_config.__getitem__.side_effect = \
+        mock_config_dict.__getitem__
+
     create_application()
 
     mock_initialize_application.assert_called_once_with(True)
     mock_monitor.assert_called_once_with()
+    if scheduler_enabled:
+        mock_scheduler.assert_called_once_with()
+    else:
+        mock_scheduler.assert_not_called()
+    if recovery_enabled:
+        mock_recovery.assert_called_once_with()
+    else:
+        mock_recovery.assert_not_called()
+    if mode == 'secondary' and presign_transfers:
+        mock_presigning.assert_called_once_with()
+    else:
+        mock_presigning.assert_not_called()
@@ -1,8 +1,14 @@
 import unittest.mock
+import uuid
 
 import pytest
+from vision.common.blockchains.enums import Blockchain
 from vision.common.logging import LogFormat
 
+from vision.validatornode.entities import CrossChainTransfer
+
+_DESTINATION_TOKEN_ADDRESS = '0x65333C563e7ee024cfe8D171EEBa654D685E90E3'
+
 
 @pytest.mark.parametrize('file_enabled', [True, False])
 @pytest.mark.parametrize('console_enabled', [True, False])
@@ -70,3 +76,161 @@ def test_setup_logger_initialize_logger_exception(mocked_config,
 
     with pytest.raises(SystemExit):
         setup_logger(mocked_logger)
+
+
+@unittest.mock.patch('vision.validatornode.celery.celery_app')
+def test_forget_task_results_correct(mock_celery_app):
+    from vision.validatornode.celery import forget_task_results
+    task_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    forget_task_results(task_ids)
+
+    mock_celery_app.AsyncResult.assert_has_calls([
+        unittest.mock.call(str(task_ids[0])),
+        unittest.mock.call().forget(),
+        unittest.mock.call(str(task_ids[1])),
+        unittest.mock.call().forget()
+    ])
+
+
+@pytest.mark.parametrize('worker_pool_concurrency_warning',
+                         [('threads', 70, False), ('threads', 71, True),
+                          ('prefork', 71, False)])
+@unittest.mock.patch('vision.validatornode.celery._logger')
+@unittest.mock.patch('vision.validatornode.celery.config')
+def test_check_database_pool_correct(mocked_config, mocked_logger,
+                                     worker_pool_concurrency_warning):
+    from vision.validatornode.celery import check_database_pool
+    worker_pool, concurrency, warning = worker_pool_concurrency_warning
+    mocked_config_dict = {
+        'database': {
+            'pool_size': 20,
+            'max_overflow': 50
+        },
+        'celery': {
+            'worker_pool': worker_pool
+        }
+    }
+    mocked_config.__getitem__.side_effect = mocked_config_dict.__getitem__
+    mocked_worker = unittest.mock.Mock(concurrency=concurrency)
+
+    check_database_pool(sender=mocked_worker)
+
+    assert mocked_logger.warning.called == warning
+
+
+@pytest.mark.parametrize('worker_pool_batch_window_warning',
+                         [('threads', 0.5, False), ('prefork', 0, False),
+                          ('prefork', 0.5, True)])
+@unittest.mock.patch('vision.validatornode.celery._logger')
+@unittest.mock.patch('vision.validatornode.celery.config')
+def test_check_primary_node_batch_window_correct(
+        mocked_config, mocked_logger, worker_pool_batch_window_warning):
+    from vision.validatornode.celery import check_primary_node_batch_window
+    worker_pool, batch_window, warning = worker_pool_batch_window_warning
+    mocked_config_dict = {
+        'application': {
+            'primary_node_batch_window_in_seconds': batch_window
+        },
+        'celery': {
+            'worker_pool': worker_pool
+        }
+    }
+    mocked_config.__getitem__.side_effect = mocked_config_dict.__getitem__
+
+    check_primary_node_batch_window(sender=unittest.mock.Mock())
+
+    assert mocked_logger.warning.called == warning
+
+
+@pytest.mark.parametrize('transfer_task', [
+    'confirm_transfer_task', 'submit_transfer_onchain_task',
+    'submit_transfer_to_primary_node_task', 'validate_transfer_task'
+])
+def test_transfer_task_ignore_result_correct(transfer_task):
+    import vision.validatornode.business.transfers as transfers
+
+    assert getattr(transfers, transfer_task).ignore_result
+
+
+@pytest.mark.parametrize('is_reversal_transfer', [True, False])
+@pytest.mark.parametrize(
+    'task_name,stage',
+    [('vision.validatornode.business.transfers.validate_transfer_task',
+      'validate'),
+     ('vision.validatornode.business.transfers.'
+      'submit_transfer_to_primary_node_task', 'sign'),
+     ('vision.validatornode.business.transfers.submit_transfer_onchain_task',
+      'submit'),
+     ('vision.validatornode.business.transfers.confirm_transfer_task',
+      'confirm')])
+def test_route_task_correct(task_name, stage, is_reversal_transfer):
+    from vision.validatornode.celery import get_task_routing_headers
+    from vision.validatornode.celery import route_task
+    transfer = CrossChainTransfer.from_dict(
+        _create_transfer_dict(is_reversal_transfer))
+
+    route = route_task(task_name, (1, ), {},
+                       {'headers': get_task_routing_headers(transfer)})
+
+    blockchain_name = ('bnb_chain' if stage == 'validate'
+                       or is_reversal_transfer else 'ethereum')
+    queue_name = f'vision.validatornode.{stage}.{blockchain_name}'
+    assert route == {'queue': queue_name, 'routing_key': queue_name}
+
+
+@pytest.mark.parametrize('is_reversal_transfer', [True, False])
+@pytest.mark.parametrize(
+    'task_name,stage',
+    [('vision.validatornode.business.transfers.validate_transfer_task',
+      'validate'),
+     ('vision.validatornode.business.transfers.'
+      'submit_transfer_to_primary_node_task', 'sign'),
+     ('vision.validatornode.business.transfers.submit_transfer_onchain_task',
+      'submit'),
+     ('vision.validatornode.business.transfers.confirm_transfer_task',
+      'confirm')])
+def test_route_task_legacy_arguments_correct(task_name, stage,
+                                             is_reversal_transfer):
+    from vision.validatornode.celery import route_task
+    transfer_dict = _create_transfer_dict(is_reversal_transfer)
+
+    route = route_task(task_name, (1, transfer_dict), {}, {})
+
+    blockchain_name = ('bnb_chain' if stage == 'validate'
+                       or is_reversal_transfer else 'ethereum')
+    queue_name = f'vision.validatornode.{stage}.{blockchain_name}'
+    assert route == {'queue': queue_name, 'routing_key': queue_name}
+
+
+def test_route_task_default_queue():
+    from vision.validatornode.celery import route_task
+    assert route_task('vision.common.blockchains.tasks.some_task',
+                      ('some_argument', ), {}, {}) is None
+
+
+def test_route_task_no_routing_information():
+    from vision.validatornode.celery import route_task
+    assert route_task(
+        'vision.validatornode.business.transfers.validate_transfer_task',
+        (1, ), {}, {}) is None
+
+
+def _create_transfer_dict(is_reversal_transfer):
+    return {
+        'source_blockchain_id': Blockchain.BNB_CHAIN.value,
+        'destination_blockchain_id': Blockchain.ETHEREUM.value,
+        'source_hub_address': '0x716d4D0Ced39fe39fC936420d43B1B07f914F821',
+        'source_transfer_id': 1,
+        'source_transaction_id': '0x' + 64 * '1',
+        'source_block_number': 2,
+        'source_block_hash': '0x' + 64 * '2',
+        'sender_address': '0x20B50a828a042B3F01aCB022e0C8A07e817bc9f5',
+        'recipient_address': '0xC433E88Aa983b552D99Cc98982768f787dE11f18',
+        'source_token_address': '0x1BE63cf4226F24d5e5C7B64B3bCBf4ceB25aAE31',
+        'destination_token_address': _DESTINATION_TOKEN_ADDRESS,
+        'amount': 3,
+        'fee': 4,
+        'service_node_address': '0xBd0E2ce4B8E1E4F28fd7C246F48c853f0CE186C5',
+        'is_reversal_transfer': is_reversal_transfer
+    }
@@ -0,0 +1,215 @@
+import unittest.mock
+
+import pytest
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.metrics import Histogram
+from vision.validatornode.metrics import export_metrics
+from vision.validatornode.metrics import get_metrics
+from vision.validatornode.metrics import instrument_blockchain_client
+from vision.validatornode.metrics import measure_step
+from vision.validatornode.metrics import read_metrics
+from vision.validatornode.metrics import record_cache_hit
+from vision.validatornode.metrics import record_task_retry
+from vision.validatornode.metrics import reset_metrics
+
+_SOURCE_BLOCKCHAIN = Blockchain.ETHEREUM
+
+_DESTINATION_BLOCKCHAIN = Blockchain.POLYGON
+
+_STEP_NAME = 'some_step'
+
+_TASK_NAME = 'some_task'
+
+_RETRY_REASON = 'some_retry_reason'
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.fixture
+def mock_blockchain_client():
+    mock_blockchain_client = unittest.mock.MagicMock()
+    mock_blockchain_client.get_blockchain.return_value = _SOURCE_BLOCKCHAIN
+    return mock_blockchain_client
+
+
+def test_histogram_correct():
+    histogram = Histogram()
+
+    histogram.observe(0.001)
+    histogram.observe(0.3)
+    histogram.observe(100.0)
+    histogram_dict = histogram.to_dict()
+
+    assert histogram_dict['count'] == 3
+    assert histogram_dict['sum'] == pytest.approx(100.301)
+    assert histogram_dict['buckets']['0.005'] == 1
+    assert histogram_dict['buckets']['0.25'] == 1
+    assert histogram_dict['buckets']['0.5'] == 2
+    assert histogram_dict['buckets']['30.0'] == 2
+    assert histogram_dict['buckets']['+Inf'] == 3
+
+
+@pytest.mark.parametrize('client_calls', [0, 1, 3])
+@pytest.mark.parametrize('cache_hits', [0, 2])
+def test_measure_step_correct(cache_hits, client_calls,
+                              mock_blockchain_client):
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        for _ in range(client_calls):
+            blockchain_client.read_block_hashes([1])
+        for _ in range(cache_hits):
+            record_cache_hit()
+
+    steps = get_metrics()['steps']
+    assert len(steps) == 1
+    assert steps[0]['step'] == _STEP_NAME
+    assert steps[0]['source_blockchain'] == _SOURCE_BLOCKCHAIN.name
+    assert steps[0]['destination_blockchain'] == \
+        _DESTINATION_BLOCKCHAIN.name
+    assert steps[0]['wall_time']['count'] == 1
+    assert steps[0]['client_call_count'] == client_calls
+    assert steps[0]['cache_hits'] == cache_hits
+
+
+def test_measure_step_error(mock_blockchain_client):
+    with pytest.raises(ValueError):
+        with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN,
+                          _DESTINATION_BLOCKCHAIN):
+            raise ValueError
+
+    steps = get_metrics()['steps']
+    assert len(steps) == 1
+    assert steps[0]['wall_time']['count'] == 1
+
+
+def test_record_cache_hit_outside_step_correct():
+    record_cache_hit()
+
+    assert get_metrics()['steps'] == []
+
+
+def test_instrument_blockchain_client_correct(mock_blockchain_client):
+    mock_blockchain_client.read_block_hashes.return_value = {1: '0x01'}
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        block_hashes = blockchain_client.read_block_hashes([1])
+        blockchain_client.is_equal_address('0x01', '0x01')
+        blockchain_client.get_utilities().get_number_of_confirmations()
+
+    assert block_hashes == {1: '0x01'}
+    mock_blockchain_client.read_block_hashes.assert_called_once_with([1])
+    metrics = get_metrics()
+    assert metrics['steps'][0]['client_call_count'] == 2
+    calls = {(call['method'], call['blockchain'])
+             for call in metrics['blockchain_client_calls']}
+    assert calls == {('read_block_hashes', _SOURCE_BLOCKCHAIN.name),
+                     ('get_number_of_confirmations', _SOURCE_BLOCKCHAIN.name)}
+
+
+def test_record_task_retry_correct():
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 0, 60)
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 3, 480)
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 1, 120)
+
+    task_retries = get_metrics()['task_retries']
+    assert len(task_retries) == 1
+    assert task_retries[0]['task'] == _TASK_NAME
+    assert task_retries[0]['retry_reason'] == _RETRY_REASON
+    assert task_retries[0]['interval']['count'] == 3
+    assert task_retries[0]['interval']['sum'] == pytest.approx(660)
+    assert task_retries[0]['max_attempt'] == 3
+    assert task_retries[0]['last_interval'] == 120
+
+
+def test_reset_metrics_correct(mock_blockchain_client):
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        blockchain_client.read_block_hashes([1])
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 0, 60)
+
+    reset_metrics()
+
+    assert get_metrics() == {
+        'steps': [],
+        'blockchain_client_calls': [],
+        'task_retries': []
+    }
+
+
+@unittest.mock.patch('vision.validatornode.metrics.database_access')
+def test_export_metrics_correct(mock_database_access, mock_blockchain_client):
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        blockchain_client.read_block_hashes([1])
+
+    export_metrics()
+
+    exported_metrics = \
+        mock_database_access.update_performance_metrics.call_args.args[0]
+    assert len(exported_metrics) == 2
+    assert get_metrics()['steps'] == []
+    assert get_metrics()['blockchain_client_calls'] == []
+
+
+@unittest.mock.patch('vision.validatornode.metrics.database_access')
+def test_export_metrics_error(mock_database_access, mock_blockchain_client):
+    mock_database_access.update_performance_metrics.side_effect = Exception
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        blockchain_client.read_block_hashes([1])
+
+    export_metrics()
+    export_metrics()
+
+    # The metrics not exported are kept for the next export
+    exported_metrics = \
+        mock_database_access.update_performance_metrics.call_args.args[0]
+    assert len(exported_metrics) == 2
+
+
+@unittest.mock.patch('vision.validatornode.metrics.database_access')
+def test_read_metrics_correct(mock_database_access, mock_blockchain_client):
+    blockchain_client = instrument_blockchain_client(mock_blockchain_client)
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        blockchain_client.read_block_hashes([1])
+        record_cache_hit()
+    export_metrics()
+    mock_database_access.read_performance_metrics.return_value = \
+        mock_database_access.update_performance_metrics.call_args.args[0]
+    with measure_step(_STEP_NAME, _SOURCE_BLOCKCHAIN, _DESTINATION_BLOCKCHAIN):
+        blockchain_client.read_block_hashes([1])
+
+    metrics = read_metrics()
+
+    assert len(metrics['steps']) == 1
+    assert metrics['steps'][0]['wall_time']['count'] == 2
+    assert metrics['steps'][0]['wall_time']['buckets']['+Inf'] == 2
+    assert metrics['steps'][0]['client_call_count'] == 2
+    assert metrics['steps'][0]['cache_hits'] == 1
+    assert len(metrics['blockchain_client_calls']) == 1
+    assert metrics['blockchain_client_calls'][0]['wall_time']['count'] == 2
+
+
+@unittest.mock.patch('vision.validatornode.metrics.database_access')
+def test_read_metrics_task_retries_correct(mock_database_access):
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 3, 480)
+    export_metrics()
+    mock_database_access.read_performance_metrics.return_value = \
+        mock_database_access.update_performance_metrics.call_args.args[0]
+    record_task_retry(_TASK_NAME, _RETRY_REASON, 1, 120)
+
+    task_retries = read_metrics()['task_retries']
+
+    assert len(task_retries) == 1
+    assert task_retries[0]['interval']['count'] == 2
+    assert task_retries[0]['interval']['sum'] == pytest.approx(600)
+    assert task_retries[0]['max_attempt'] == 3
+    assert task_retries[0]['last_interval'] == 120
@@ -59,6 +59,7 @@ def _mock_get_blockchain_config(blockchain):
 
 
 @pytest.mark.parametrize('detect_new_transfers_error', [True, False])
+@unittest.mock.patch.object(TransferInteractor, 'confirm_transfers')
 @unittest.mock.patch.object(TransferInteractor, 'detect_new_transfers')
 @unittest.mock.patch('time.sleep', side_effect=_Break)
 @unittest.mock.patch('vision.validatornode.monitor.get_blockchain_config',
@@ -74,7 +75,7 @@ def _mock_get_blockchain_config(blockchain):
                      _MockThreadPoolExecutor)
 @unittest.mock.patch('threading.Thread', _MockThread)
 def test_run_monitor(mock_time_sleep, mock_detect_new_transfers,
-                     detect_new_transfers_error):
+                     mock_confirm_transfers, detect_new_transfers_error):
     if detect_new_transfers_error:
         mock_detect_new_transfers.side_effect = Exception
     with pytest.raises(_Break):
@@ -86,3 +87,5 @@ def test_run_monitor(mock_time_sleep, mock_detect_new_transfers,
         unittest.mock.call(blockchain)
         for blockchain in Blockchain if blockchain not in _INACTIVE_BLOCKCHAINS
     ], any_order=True)
+    assert (mock_confirm_transfers.call_count == len(Blockchain) -
+            len(_INACTIVE_BLOCKCHAINS))
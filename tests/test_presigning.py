@@ -0,0 +1,48 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.presigning import run_presigning
+
+_INTERVAL = 0.5
+
+
+class _Break(Exception):
+    pass
+
+
+class _MockThread:
+    def __init__(self, target):
+        self.__target = target
+
+    def start(self):
+        try:
+            self.__target()
+        except _Break:
+            pass
+
+
+@pytest.mark.parametrize('submission_result', [0, 3, Exception])
+@unittest.mock.patch.object(TransferInteractor,
+                            'submit_pending_transfer_signatures')
+@unittest.mock.patch('time.sleep', side_effect=[None, _Break])
+@unittest.mock.patch(
+    'vision.validatornode.presigning.config',
+    {'application': {
+        'presign_flush_interval_in_seconds': _INTERVAL
+    }})
+@unittest.mock.patch('threading.Thread', _MockThread)
+def test_run_presigning(mock_time_sleep,
+                        mock_submit_pending_transfer_signatures,
+                        submission_result):
+    # An error does not stop any further flushes
+    mock_submit_pending_transfer_signatures.side_effect = [
+        submission_result, 0
+    ]
+
+    run_presigning()
+
+    assert mock_submit_pending_transfer_signatures.call_count == 2
+    assert mock_time_sleep.call_count == 2
+    mock_time_sleep.assert_called_with(_INTERVAL)
@@ -0,0 +1,44 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.recovery import run_recovery
+
+_INTERVAL = 600
+
+
+class _Break(Exception):
+    pass
+
+
+class _MockThread:
+    def __init__(self, target):
+        self.__target = target
+
+    def start(self):
+        try:
+            self.__target()
+        except _Break:
+            pass
+
+
+@pytest.mark.parametrize('recovery_result', [0, 3, Exception])
+@unittest.mock.patch.object(TransferInteractor, 'recover_orphaned_transfers')
+@unittest.mock.patch('time.sleep', side_effect=[None, _Break])
+@unittest.mock.patch('vision.validatornode.recovery.config',
+                     {'recovery': {
+                         'interval': _INTERVAL
+                     }})
+@unittest.mock.patch('threading.Thread', _MockThread)
+def test_run_recovery(mock_time_sleep, mock_recover_orphaned_transfers,
+                      recovery_result):
+    # The first sweep is executed at startup, and an error does not
+    # stop any further sweeps
+    mock_recover_orphaned_transfers.side_effect = [recovery_result, 0]
+
+    run_recovery()
+
+    assert mock_recover_orphaned_transfers.call_count == 2
+    assert mock_time_sleep.call_count == 2
+    mock_time_sleep.assert_called_with(_INTERVAL)
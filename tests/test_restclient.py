@@ -1,3 +1,4 @@
+import concurrent.futures
 import unittest.mock
 
 import pytest
@@ -5,13 +6,17 @@ import requests
 from vision.common.blockchains.enums import Blockchain
 
 from vision.validatornode.restclient import _TRANSFER_SIGNATURE_RESOURCE
+from vision.validatornode.restclient import _TRANSFER_SIGNATURES_RESOURCE
 from vision.validatornode.restclient import _VALIDATOR_NONCE_RESOURCE
+from vision.validatornode.restclient import _VALIDATOR_NONCES_RESOURCE
 from vision.validatornode.restclient import PrimaryNodeClient
 from vision.validatornode.restclient import PrimaryNodeClientError
 from vision.validatornode.restclient import PrimaryNodeDuplicateSignatureError
 from vision.validatornode.restclient import PrimaryNodeInvalidSignatureError
 from vision.validatornode.restclient import PrimaryNodeInvalidSignerError
 from vision.validatornode.restclient import PrimaryNodeUnknownTransferError
+from vision.validatornode.restclient import TransferSignatureBatcher
+from vision.validatornode.restclient import ValidatorNonceBatcher
 
 _PRIMARY_NODE_URL = 'https://some.url'
 
@@ -127,6 +132,52 @@ def test_get_validator_nonce_primary_node_error(mock_requests_get,
             primary_node_error[1])
 
 
+@unittest.mock.patch('vision.validatornode.restclient.requests.post')
+def test_get_validator_nonces_correct(mock_requests_post, primary_node_client,
+                                      validator_nonce_get_request):
+    mock_requests_post().status_code = requests.codes.ok
+    mock_requests_post().json.return_value = {
+        'validator_nonces': [_VALIDATOR_NONCE, None]
+    }
+    mock_requests_post.call_count = 0
+
+    validator_nonces = primary_node_client.get_validator_nonces(
+        [validator_nonce_get_request] * 2)
+
+    assert validator_nonces == [_VALIDATOR_NONCE, None]
+    mock_requests_post.assert_called_once_with(
+        f'{_PRIMARY_NODE_URL}/{_VALIDATOR_NONCES_RESOURCE}', json={
+            'transfers': [{
+                'source_blockchain_id': _SOURCE_BLOCKCHAIN.value,
+                'source_transaction_id': _SOURCE_TRANSACTION_ID
+            }] * 2
+        }, timeout=primary_node_client._PrimaryNodeClient__timeout)
+
+
+@pytest.mark.parametrize('primary_node_response',
+                         [(requests.codes.bad_request, {
+                             'message': 'Some validation error.'
+                         }),
+                          (requests.codes.ok, {
+                              'validator_nonces': [_VALIDATOR_NONCE] * 2
+                          }), (requests.codes.ok, {
+                              'validator_nonces': None
+                          }),
+                          (requests.codes.ok, {
+                              'validator_nonces': ['no integer']
+                          })])
+@unittest.mock.patch('vision.validatornode.restclient.requests.post')
+def test_get_validator_nonces_primary_node_error(mock_requests_post,
+                                                 primary_node_response,
+                                                 primary_node_client,
+                                                 validator_nonce_get_request):
+    mock_requests_post().status_code = primary_node_response[0]
+    mock_requests_post().json.return_value = primary_node_response[1]
+
+    with pytest.raises(PrimaryNodeClientError):
+        primary_node_client.get_validator_nonces([validator_nonce_get_request])
+
+
 @unittest.mock.patch('vision.validatornode.restclient.requests.post')
 def test_post_transfer_signature_correct(mock_requests_post,
                                          primary_node_client,
@@ -203,6 +254,146 @@ def test_post_transfer_signature_primary_node_error(
             primary_node_error[1])
 
 
+@unittest.mock.patch('vision.validatornode.restclient.requests.post')
+def test_post_transfer_signatures_correct(mock_requests_post,
+                                          primary_node_client,
+                                          transfer_signature_post_request):
+    mock_requests_post().status_code = requests.codes.ok
+    mock_requests_post().json.return_value = {
+        'results': [{
+            'status_code': requests.codes.no_content
+        }, {
+            'status_code': requests.codes.conflict,
+            'message': 'Duplicate signature.'
+        }, {
+            'status_code': requests.codes.not_found,
+            'message': 'Unknown transfer.'
+        }, {
+            'status_code': requests.codes.bad_request,
+            'message': {
+                'signature': ['Missing data for required field.']
+            }
+        }]
+    }
+    mock_requests_post.call_count = 0
+
+    errors = primary_node_client.post_transfer_signatures(
+        [transfer_signature_post_request] * 4)
+
+    assert errors[0] is None
+    assert isinstance(errors[1], PrimaryNodeDuplicateSignatureError)
+    assert isinstance(errors[2], PrimaryNodeUnknownTransferError)
+    assert type(errors[3]) is PrimaryNodeClientError
+    mock_requests_post.assert_called_once_with(
+        f'{_PRIMARY_NODE_URL}/{_TRANSFER_SIGNATURES_RESOURCE}', json={
+            'signatures': [{
+                'source_blockchain_id': _SOURCE_BLOCKCHAIN.value,
+                'source_transaction_id': _SOURCE_TRANSACTION_ID,
+                'signature': _SIGNATURE
+            }] * 4
+        }, timeout=primary_node_client._PrimaryNodeClient__timeout)
+
+
+@pytest.mark.parametrize('primary_node_response',
+                         [(requests.codes.bad_request, {
+                             'message': 'Some validation error.'
+                         }),
+                          (requests.codes.ok, {
+                              'results': [{
+                                  'status_code': requests.codes.no_content
+                              }] * 2
+                          }), (requests.codes.ok, {
+                              'results': None
+                          }),
+                          (requests.codes.ok, {
+                              'results': ['no dictionary']
+                          })])
+@unittest.mock.patch('vision.validatornode.restclient.requests.post')
+def test_post_transfer_signatures_primary_node_error(
+        mock_requests_post, primary_node_response, primary_node_client,
+        transfer_signature_post_request):
+    mock_requests_post().status_code = primary_node_response[0]
+    mock_requests_post().json.return_value = primary_node_response[1]
+
+    with pytest.raises(PrimaryNodeClientError):
+        primary_node_client.post_transfer_signatures(
+            [transfer_signature_post_request])
+
+
+def test_transfer_signature_batcher_batch_full_correct(
+        transfer_signature_post_request):
+    mock_primary_node_client = unittest.mock.MagicMock()
+    mock_primary_node_client.post_transfer_signatures.return_value = [
+        None, PrimaryNodeDuplicateSignatureError()
+    ]
+    batcher = TransferSignatureBatcher(mock_primary_node_client, 60,
+                                       maximum_batch_size=2)
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        first_future = executor.submit(batcher.post_transfer_signature,
+                                       transfer_signature_post_request)
+        while batcher._Batcher__batch is None:
+            pass
+        second_future = executor.submit(batcher.post_transfer_signature,
+                                        transfer_signature_post_request)
+        assert first_future.result(timeout=10) is None
+        with pytest.raises(PrimaryNodeDuplicateSignatureError):
+            second_future.result(timeout=10)
+
+    mock_primary_node_client.post_transfer_signatures.assert_called_once_with(
+        [transfer_signature_post_request] * 2)
+
+
+def test_transfer_signature_batcher_window_expired_correct(
+        transfer_signature_post_request):
+    mock_primary_node_client = unittest.mock.MagicMock()
+    mock_primary_node_client.post_transfer_signatures.return_value = [None]
+    batcher = TransferSignatureBatcher(mock_primary_node_client, 0.01)
+
+    batcher.post_transfer_signature(transfer_signature_post_request)
+    batcher.post_transfer_signature(transfer_signature_post_request)
+
+    assert mock_primary_node_client.post_transfer_signatures.call_count == 2
+
+
+@pytest.mark.parametrize('post_error',
+                         [PrimaryNodeClientError('some error'), Exception])
+def test_transfer_signature_batcher_error(post_error,
+                                          transfer_signature_post_request):
+    mock_primary_node_client = unittest.mock.MagicMock()
+    mock_primary_node_client.post_transfer_signatures.side_effect = post_error
+    batcher = TransferSignatureBatcher(mock_primary_node_client, 0)
+
+    with pytest.raises(PrimaryNodeClientError):
+        batcher.post_transfer_signature(transfer_signature_post_request)
+
+    assert batcher._Batcher__batch is None
+
+
+def test_validator_nonce_batcher_correct(validator_nonce_get_request):
+    mock_primary_node_client = unittest.mock.MagicMock()
+    mock_primary_node_client.get_validator_nonces.return_value = [
+        _VALIDATOR_NONCE
+    ]
+    batcher = ValidatorNonceBatcher(mock_primary_node_client, 0)
+
+    validator_nonce = batcher.get_validator_nonce(validator_nonce_get_request)
+
+    assert validator_nonce == _VALIDATOR_NONCE
+    mock_primary_node_client.get_validator_nonces.assert_called_once_with(
+        [validator_nonce_get_request])
+
+
+def test_validator_nonce_batcher_unknown_transfer_error(
+        validator_nonce_get_request):
+    mock_primary_node_client = unittest.mock.MagicMock()
+    mock_primary_node_client.get_validator_nonces.return_value = [None]
+    batcher = ValidatorNonceBatcher(mock_primary_node_client, 0)
+
+    with pytest.raises(PrimaryNodeUnknownTransferError):
+        batcher.get_validator_nonce(validator_nonce_get_request)
+
+
 def _assert_requests_get_call_correct(mock_requests_get, primary_node_client):
     mock_requests_get.assert_called_once_with(
         f'{_PRIMARY_NODE_URL}/{_VALIDATOR_NONCE_RESOURCE}?'
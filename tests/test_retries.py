@@ -0,0 +1,89 @@
+import unittest.mock
+
+import pytest
+import sqlalchemy.exc
+
+from vision.validatornode.blockchains.base import BlockchainClientError
+from vision.validatornode.business.base import InteractorError
+from vision.validatornode.database.exceptions import DatabaseError
+from vision.validatornode.restclient import PrimaryNodeClientError
+from vision.validatornode.retries import RetryPolicy
+from vision.validatornode.retries import RetryReason
+from vision.validatornode.retries import classify_error
+
+_BASE_INTERVAL = 60
+
+_MAX_INTERVAL = 1000
+
+
+@pytest.mark.parametrize('retry_reason',
+                         [retry_reason for retry_reason in RetryReason])
+def test_to_config_key_correct(retry_reason):
+    assert retry_reason.to_config_key() == retry_reason.name.lower()
+
+
+def test_from_config_correct():
+    retry_policy = RetryPolicy.from_config({
+        'backoff_factor': 2.0,
+        'max_interval_in_seconds': _MAX_INTERVAL,
+        'jitter': 0.5
+    })
+
+    assert retry_policy == RetryPolicy(2.0, _MAX_INTERVAL, 0.5)
+
+
+@pytest.mark.parametrize('attempt_interval', [(0, 60), (1, 120), (3, 480),
+                                              (4, 960), (5, 1000),
+                                              (10000, 1000)])
+def test_get_interval_correct(attempt_interval):
+    retry_policy = RetryPolicy(2.0, _MAX_INTERVAL, 0.0)
+
+    interval = retry_policy.get_interval(_BASE_INTERVAL, attempt_interval[0])
+
+    assert interval == attempt_interval[1]
+
+
+@pytest.mark.parametrize('random_value', [0.0, 0.5, 0.999])
+@unittest.mock.patch('vision.validatornode.retries.random.random')
+def test_get_interval_jitter_correct(mock_random, random_value):
+    mock_random.return_value = random_value
+    retry_policy = RetryPolicy(2.0, _MAX_INTERVAL, 0.5)
+
+    interval = retry_policy.get_interval(_BASE_INTERVAL, 2)
+
+    assert interval == round(240 * (1 - 0.5 * random_value))
+
+
+@pytest.mark.parametrize(
+    'error_retry_reason',
+    [(None, RetryReason.TRANSITORY_STATE),
+     (BlockchainClientError(''), RetryReason.RPC_FAILURE),
+     (PrimaryNodeClientError(''), RetryReason.PRIMARY_NODE_UNREACHABLE),
+     (DatabaseError(''), RetryReason.DATABASE_CONFLICT),
+     (sqlalchemy.exc.OperationalError(
+         '', None, Exception()), RetryReason.DATABASE_CONFLICT),
+     (Exception(), RetryReason.UNKNOWN_ERROR)])
+def test_classify_error_correct(error_retry_reason):
+    assert classify_error(error_retry_reason[0]) is error_retry_reason[1]
+
+
+@pytest.mark.parametrize(
+    'inner_error_retry_reason',
+    [(BlockchainClientError(''), RetryReason.RPC_FAILURE),
+     (PrimaryNodeClientError(''), RetryReason.PRIMARY_NODE_UNREACHABLE),
+     (DatabaseError(''), RetryReason.DATABASE_CONFLICT),
+     (Exception(), RetryReason.UNKNOWN_ERROR)])
+def test_classify_error_chained_correct(inner_error_retry_reason):
+    error = _chain_errors(inner_error_retry_reason[0], InteractorError(''))
+
+    assert classify_error(error) is inner_error_retry_reason[1]
+
+
+def _chain_errors(inner_error, outer_error):
+    try:
+        try:
+            raise inner_error
+        except Exception:
+            raise outer_error
+    except Exception as error:
+        return error
@@ -0,0 +1,53 @@
+import unittest.mock
+
+import pytest
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.database.enums import TransferStep
+from vision.validatornode.scheduler import run_scheduler
+
+_INTERVAL = 5
+
+_NUMBER_THREADS = 3
+
+
+class _Break(Exception):
+    pass
+
+
+class _MockThread:
+    def __init__(self, target):
+        self.__target = target
+
+    def start(self):
+        try:
+            self.__target()
+        except _Break:
+            pass
+
+
+@pytest.mark.parametrize('process_error', [True, False])
+@unittest.mock.patch.object(TransferInteractor, 'process_scheduled_transfers')
+@unittest.mock.patch('time.sleep', side_effect=_Break)
+@unittest.mock.patch(
+    'vision.validatornode.scheduler.config',
+    {'scheduler': {
+        'interval': _INTERVAL,
+        'number_threads': _NUMBER_THREADS
+    }})
+@unittest.mock.patch('threading.Thread', _MockThread)
+def test_run_scheduler(mock_time_sleep, mock_process_scheduled_transfers,
+                       process_error):
+    # Each worker waits only after a round without any due transfers
+    first_round = [1, Exception if process_error else 0
+                   ] + [0] * (len(TransferStep) - 2)
+    second_round = [0] * len(TransferStep)
+    mock_process_scheduled_transfers.side_effect = (
+        first_round + second_round) * _NUMBER_THREADS
+
+    run_scheduler()
+
+    assert (mock_process_scheduled_transfers.call_count == 2 *
+            len(TransferStep) * _NUMBER_THREADS)
+    assert mock_time_sleep.call_count == _NUMBER_THREADS
+    mock_time_sleep.assert_called_with(_INTERVAL)
@@ -1,3 +1,20 @@
 #! /bin/sh
+#
+# Usage: vision-validator-node-worker.sh [QUEUES]
+#
+# QUEUES is an optional comma-separated list of the queues the worker
+# consumes (default: all queues, or the VISION_CELERY_QUEUES environment
+# variable if set). The transfer tasks are routed to one queue per
+# processing stage (validate, sign, submit, confirm) and blockchain,
+# e.g. vision.validatornode.validate.ethereum, so that dedicated worker
+# pools can be run for single stages or blockchains. All other tasks
+# are routed to the vision.validatornode queue.
 
-celery -A vision.validatornode worker -l INFO -n vision.validatornode -Q vision.validatornode
+QUEUES=${1:-$VISION_CELERY_QUEUES}
+WORKER_NAME=${VISION_CELERY_WORKER_NAME:-vision.validatornode}
+
+if [ -n "$QUEUES" ]; then
+    celery -A vision.validatornode worker -l INFO -n "$WORKER_NAME" -Q "$QUEUES"
+else
+    celery -A vision.validatornode worker -l INFO -n "$WORKER_NAME"
+fi
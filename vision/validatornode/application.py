@@ -36,6 +36,16 @@ def create_application() -> flask.Flask:
     initialize_application(True)
     from vision.validatornode.monitor import run_monitor
     run_monitor()
+    if config['scheduler']['enabled']:
+        from vision.validatornode.scheduler import run_scheduler
+        run_scheduler()
+    if config['recovery']['enabled']:
+        from vision.validatornode.recovery import run_recovery
+        run_recovery()
+    if (config['application']['mode'] == 'secondary'
+            and config['application']['presign_transfers']):
+        from vision.validatornode.presigning import run_presigning
+        run_presigning()
     from vision.validatornode.restapi import flask_app
     return flask_app
 
@@ -47,6 +47,17 @@ class NonMatchingForwarderError(BlockchainClientError):
         super().__init__('non-matching Forwarder', **kwargs)
 
 
+class PendingTransactionsLimitReachedError(BlockchainClientError):
+    """Exception to be raised if a transaction cannot be submitted yet
+    since the configured maximum number of pending transactions on the
+    blockchain has been reached.
+
+    """
+    def __init__(self, **kwargs: typing.Any):
+        # Docstring inherited
+        super().__init__('limit of pending transactions reached', **kwargs)
+
+
 class SourceTransferIdAlreadyUsedError(BlockchainClientError):
     """Exception to be raised if an incoming token transfer request is
     submitted with a source blockchain Vision transfer ID that was
@@ -267,6 +278,36 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    @abc.abstractmethod
+    def read_block_hashes(
+            self, block_numbers: typing.Iterable[int]) -> dict[int, str]:
+        """Read the hashes of the blocks with the given numbers that are
+        currently part of the canonical chain.
+
+        Parameters
+        ----------
+        block_numbers : iterable of int
+            The numbers of the blocks (duplicates are only looked up
+            once).
+
+        Returns
+        -------
+        dict
+            The block numbers as keys and their corresponding canonical
+            block hashes as values (block numbers not known to the
+            blockchain nodes yet are omitted).
+
+        Raises
+        ------
+        ResultsNotMatchingError
+            If the results given by the configured blockchain
+            nodes do not match.
+        BlockchainClientError
+            If the block hashes cannot be read.
+
+        """
+        pass  # pragma: no cover
+
     @abc.abstractmethod
     def read_external_token_address(
             self, token_address: BlockchainAddress,
@@ -501,6 +542,33 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         """
         pass  # pragma: no cover
 
+    def recover_transfer_to_signer_addresses(
+            self, requests: list[TransferToSignerAddressRecoveryRequest]) \
+            -> list[typing.Optional[BlockchainAddress]]:
+        """Recover the signers' addresses from multiple Vision
+        transferTo signatures.
+
+        Parameters
+        ----------
+        requests : list of TransferToSignerAddressRecoveryRequest
+            The request data for each signature.
+
+        Returns
+        -------
+        list of BlockchainAddress or None
+            The signers' addresses in the order of the requests (None
+            for each signature whose signer cannot be recovered).
+
+        """
+        signer_addresses: list[typing.Optional[BlockchainAddress]] = []
+        for request in requests:
+            try:
+                signer_addresses.append(
+                    self.recover_transfer_to_signer_address(request))
+            except BlockchainClientError:
+                signer_addresses.append(None)
+        return signer_addresses
+
     @dataclasses.dataclass
     class TransferToMessageSignRequest:
         """Request data for signing a Vision transferTo message.
@@ -596,6 +664,10 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
             If the Vision Forwarder of the transferred token does not
             match the Vision Forwarder of the Vision Hub on the
             destination blockchain.
+        PendingTransactionsLimitReachedError
+            If the transferTo submission cannot be submitted yet since
+            the maximum number of pending transactions on the
+            destination blockchain has been reached.
         SourceTransferIdAlreadyUsedError
             If the source blockchain's Vision transfer ID was already
             submitted before for another token transfer.
@@ -633,6 +705,10 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
             The Vision transfer ID on the (eventual) destination
             blockchain (available if the transaction has been
             confirmed).
+        gas_used : int or None
+            The gas used by the transaction (available if the
+            transaction has been confirmed and the blockchain charges
+            fees by gas).
 
         """
         transaction_submission_completed: bool
@@ -640,6 +716,7 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         transaction_id: str | None = None
         block_number: int | None = None
         destination_transfer_id: int | None = None
+        gas_used: int | None = None
 
     def get_transfer_to_submission_status(
             self, internal_transaction_id: uuid.UUID) \
@@ -693,7 +770,72 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
             True, transaction_status=transaction_status,
             transaction_id=transaction_id,
             block_number=data_response.block_number,
-            destination_transfer_id=data_response.destination_transfer_id)
+            destination_transfer_id=data_response.destination_transfer_id,
+            gas_used=data_response.gas_used)
+
+    def get_transfer_to_submission_statuses(
+            self, internal_transaction_ids: list[uuid.UUID]) \
+            -> dict[uuid.UUID, TransferToSubmissionStatusResponse | None]:
+        """Retrieve the statuses of multiple transferTo submissions.
+
+        Parameters
+        ----------
+        internal_transaction_ids : list of uuid.UUID
+            The unique internal transaction IDs.
+
+        Returns
+        -------
+        dict
+            The response data for each internal transaction ID, or None
+            if there has been an unresolvable error during the
+            transferTo submission. Transactions whose submission status
+            cannot be retrieved at the moment are omitted, so that they
+            do not prevent the other statuses from being retrieved.
+
+        """
+        status_responses: dict[
+            uuid.UUID,
+            BlockchainClient.TransferToSubmissionStatusResponse | None] = {}
+        for internal_transaction_id in internal_transaction_ids:
+            extra_info = {'internal_transaction_id': internal_transaction_id}
+            try:
+                status_responses[internal_transaction_id] = \
+                    self.get_transfer_to_submission_status(
+                        internal_transaction_id)
+            except UnresolvableTransferToSubmissionError:
+                _logger.warning(
+                    'unresolvable transferTo transaction submission',
+                    extra=extra_info, exc_info=True)
+                status_responses[internal_transaction_id] = None
+            except Exception:
+                _logger.error(
+                    'unable to retrieve a transferTo submission status',
+                    extra=extra_info, exc_info=True)
+        return status_responses
+
+    def prefetch_transfer_to_transaction_data(self) -> bool:
+        """Prefetch the data of the transferTo transactions included in
+        the blocks added to the blockchain since the last invocation.
+        Subsequently retrieving the statuses of completed transferTo
+        submissions then does not require the blockchain nodes to be
+        queried for each transaction individually.
+
+        Returns
+        -------
+        bool
+            True if a new block has been added to the blockchain since
+            the last invocation (or if this cannot be determined).
+
+        Raises
+        ------
+        ResultsNotMatchingError
+            If the results given by the configured blockchain
+            nodes do not match.
+        BlockchainClientError
+            If the transferTo transaction data cannot be prefetched.
+
+        """
+        return True
 
     @dataclasses.dataclass
     class _TransferToTransactionDataResponse:
@@ -706,10 +848,14 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         destination_transfer_id : int or None
             The Vision transfer ID on the (eventual) destination
             blockchain.
+        gas_used : int or None
+            The gas used by the transaction (only if the Vision
+            transfer ID on the destination blockchain is read).
 
         """
         block_number: int
         destination_transfer_id: int | None = None
+        gas_used: int | None = None
 
     @abc.abstractmethod
     def _read_transfer_to_transaction_data(
@@ -746,6 +892,12 @@ class BlockchainClient(BlockchainHandler, ErrorCreator[BlockchainClientError]):
         return self._create_error(
             specialized_error_class=NonMatchingForwarderError, **kwargs)
 
+    def _create_pending_transactions_limit_reached_error(
+            self, **kwargs: typing.Any) -> BlockchainClientError:
+        return self._create_error(
+            specialized_error_class=PendingTransactionsLimitReachedError,
+            **kwargs)
+
     def _create_source_transfer_id_already_used_error(
             self, **kwargs: typing.Any) -> BlockchainClientError:
         return self._create_error(
@@ -1,14 +1,24 @@
 """Module for Ethereum-specific clients and errors.
 
 """
+import concurrent.futures
+import functools
 import json
 import logging
+import multiprocessing
+import os
 import re
+import threading
+import time
 import typing
 import urllib.parse
 import uuid
 
+import eth_abi
+import eth_abi.exceptions
 import eth_account.messages
+import eth_utils
+import hexbytes
 import web3
 import web3.contract
 import web3.exceptions
@@ -32,6 +42,28 @@ _HUB_TRANSFER_TO_FUNCTION_SELECTOR = '0x92557c8a'
 _HUB_TRANSFER_TO_BASE_GAS = 150000
 _HUB_TRANSFER_TO_GAS_PER_SIGNER = 100000
 
+_FEE_HISTORY_BLOCK_COUNT = 10
+"""Number of recent blocks sampled by the fee history oracles."""
+
+_FEE_HISTORY_REWARD_PERCENTILE = 60
+"""Percentile of the priority fees paid within each sampled block."""
+
+_FEE_HISTORY_MAXIMUM_AGE = 5
+"""Number of block times after which a sampled fee is outdated."""
+
+_TRANSFER_TO_GAS_SAFETY_FACTOR = 1.25
+"""Factor applied to the learned gas usage of transferTo transactions."""
+
+_TRANSFER_TO_RECEIPT_RETENTION_BLOCKS = 64
+"""Number of confirmed blocks whose prefetched transferTo transaction
+receipts are kept."""
+
+_PARALLEL_SIGNER_RECOVERY_MINIMUM_REQUESTS = 16
+
+_PARALLEL_SIGNER_RECOVERY_MAXIMUM_PROCESSES = 4
+"""Maximum number of processes recovering signer addresses in
+parallel."""
+
 _NON_MATCHING_FORWARDER_ERROR = \
     'VisionHub: Forwarder of Hub and transferred token must match'
 _SOURCE_TRANSFER_ID_ALREADY_USED_ERROR = \
@@ -41,6 +73,16 @@ _TRANSACTION_ID_PATTERN = re.compile(r'^0x[a-fA-F0-9]{64}')
 
 _EIP712_DOMAIN_NAME = 'Vision'
 
+_EIP712_DOMAIN_TYPE = ('EIP712Domain(string name,string version,'
+                       'uint256 chainId,address verifyingContract)')
+
+_EIP712_DOMAIN_FIELDS = {
+    'name': 'string',
+    'version': 'string',
+    'chainId': 'uint256',
+    'verifyingContract': 'address'
+}
+
 _TRANSFER_TO_MESSAGE_TYPES = {
     'TransferToRequest': [{
         'name': 'sourceBlockchainId',
@@ -92,6 +134,18 @@ _logger = logging.getLogger(__name__)
 
 _Contract: typing.TypeAlias = NodeConnections.Wrapper[web3.contract.Contract]
 _OnChainTransferToRequest = tuple[int, int, str, str, str, str, str, int, int]
+_BlockHashRead: typing.TypeAlias = concurrent.futures.Future[
+    typing.Optional[str]]
+
+_fee_history_oracles: dict[Blockchain, '_FeeHistoryOracle'] = {}
+_fee_history_oracles_lock = threading.Lock()
+
+_signer_recovery_executor: typing.Optional[
+    concurrent.futures.ProcessPoolExecutor] = None
+_signer_recovery_executor_lock = threading.Lock()
+_signer_recovery_executor_unavailable = False
+"""True if the process pool for recovering signer addresses cannot be
+used in the current execution environment."""
 
 
 class EthereumClientError(BlockchainClientError):
@@ -115,6 +169,13 @@ class EthereumClient(BlockchainClient):
         self.__private_key = self.get_utilities().decrypt_private_key(
             private_key, private_key_password)
         self.__address = self.get_utilities().get_address(self.__private_key)
+        self.__block_receipts_available = True
+        self.__last_prefetched_block_number: typing.Optional[int] = None
+        self.__transfer_to_receipts: dict[str, web3.types.TxReceipt] = {}
+        self.__transfer_to_receipts_lock = threading.Lock()
+        self.__block_hash_reads: dict[
+            int, concurrent.futures.Future[typing.Optional[str]]] = {}
+        self.__block_hash_reads_lock = threading.Lock()
 
     @classmethod
     def get_blockchain(cls) -> Blockchain:
@@ -185,6 +246,81 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         return self.get_utilities().is_equal_address(address_one, address_two)
 
+    def prefetch_transfer_to_transaction_data(self) -> bool:
+        # Docstring inherited
+        try:
+            node_connections = self.__create_node_connections()
+            # Only blocks with the required number of confirmations are
+            # considered since only their receipts are final
+            confirmed_block_number = \
+                node_connections.eth.get_block_number().get_minimum_result() \
+                - self._get_config()['confirmations']
+            last_block_number = self.__last_prefetched_block_number
+            if (last_block_number is not None
+                    and confirmed_block_number <= last_block_number):
+                return False
+            oldest_block_number = (confirmed_block_number -
+                                   _TRANSFER_TO_RECEIPT_RETENTION_BLOCKS + 1)
+            from_block_number = (confirmed_block_number if last_block_number
+                                 is None else max(last_block_number +
+                                                  1, oldest_block_number))
+            transfer_to_receipts: dict[str, web3.types.TxReceipt] = {}
+            for block_number in range(from_block_number,
+                                      confirmed_block_number + 1):
+                for transaction_receipt in \
+                        self.__read_block_transfer_to_receipts(
+                            node_connections, block_number):
+                    transaction_id = \
+                        transaction_receipt['transactionHash'].to_0x_hex()
+                    transfer_to_receipts[transaction_id.lower()] = \
+                        transaction_receipt
+            with self.__transfer_to_receipts_lock:
+                self.__transfer_to_receipts = {
+                    transaction_id: transaction_receipt
+                    for transaction_id, transaction_receipt in
+                    self.__transfer_to_receipts.items() if
+                    transaction_receipt['blockNumber'] >= oldest_block_number
+                } | transfer_to_receipts
+                self.__last_prefetched_block_number = confirmed_block_number
+            return True
+        except ResultsNotMatchingError:
+            raise
+        except Exception:
+            raise self._create_error(
+                'unable to prefetch transferTo transaction data')
+
+    def read_block_hashes(
+            self, block_numbers: typing.Iterable[int]) -> dict[int, str]:
+        # Docstring inherited
+        try:
+            # Transfers of the same block validated concurrently (e.g. by
+            # a Celery worker running the threads pool) share a single
+            # block lookup
+            block_hash_reads: dict[int, _BlockHashRead] = {}
+            own_block_hash_reads: dict[int, _BlockHashRead] = {}
+            with self.__block_hash_reads_lock:
+                for block_number in sorted(set(block_numbers)):
+                    block_hash_read = self.__block_hash_reads.get(block_number)
+                    if block_hash_read is None:
+                        block_hash_read = concurrent.futures.Future()
+                        self.__block_hash_reads[block_number] = \
+                            block_hash_read
+                        own_block_hash_reads[block_number] = block_hash_read
+                    block_hash_reads[block_number] = block_hash_read
+            if len(own_block_hash_reads) > 0:
+                self.__read_own_block_hashes(own_block_hash_reads)
+            block_hashes: dict[int, str] = {}
+            for block_number, block_hash_read in block_hash_reads.items():
+                block_hash = block_hash_read.result()
+                if block_hash is not None:
+                    block_hashes[block_number] = block_hash
+            return block_hashes
+        except ResultsNotMatchingError:
+            raise
+        except Exception:
+            raise self._create_error('unable to read block hashes',
+                                     block_numbers=block_numbers)
+
     def read_external_token_address(
             self, token_address: BlockchainAddress,
             external_blockchain: Blockchain) -> BlockchainAddress | None:
@@ -330,20 +466,7 @@ class EthereumClient(BlockchainClient):
             request: BlockchainClient.TransferToSignerAddressRecoveryRequest) \
             -> BlockchainAddress:
         # Docstring inherited
-        destination_blockchain = self.get_blockchain()
-        hub_address = self._get_config()['hub']
-        forwarder_address = self._get_config()['forwarder']
-        vsn_token_address = self._get_config()['vsn_token']
-        domain_data = self.__get_eip712_domain_data()
-        message_data = self.__get_transfer_to_message_data(
-            request.source_blockchain, destination_blockchain,
-            request.source_transfer_id, request.source_transaction_id,
-            request.sender_address, request.recipient_address,
-            request.source_token_address, request.destination_token_address,
-            request.amount, request.validator_nonce, hub_address,
-            forwarder_address, vsn_token_address)
-        signable_message = eth_account.messages.encode_typed_data(
-            domain_data, _TRANSFER_TO_MESSAGE_TYPES, message_data)
+        signable_message = self.__create_transfer_to_signable_message(request)
         try:
             signer_address = web3.Account.recover_message(
                 signable_message, signature=request.signature)
@@ -352,6 +475,35 @@ class EthereumClient(BlockchainClient):
                                      request=request)
         return BlockchainAddress(signer_address)
 
+    def recover_transfer_to_signer_addresses(
+            self, requests: list[
+                BlockchainClient.TransferToSignerAddressRecoveryRequest]) \
+            -> list[typing.Optional[BlockchainAddress]]:
+        # Docstring inherited
+        signable_messages: list[typing.Optional[
+            eth_account.messages.SignableMessage]] = []
+        for request in requests:
+            try:
+                signable_messages.append(
+                    self.__create_transfer_to_signable_message(request))
+            except Exception:
+                signable_messages.append(None)
+        signatures = [request.signature for request in requests]
+        signer_addresses: typing.Optional[list[typing.Optional[str]]] = None
+        if len(requests) >= _PARALLEL_SIGNER_RECOVERY_MINIMUM_REQUESTS:
+            # The ECDSA public key recovery is CPU-bound, so it is
+            # spread across multiple processes for larger batches
+            signer_addresses = _recover_signer_addresses_in_parallel(
+                signable_messages, signatures)
+        if signer_addresses is None:
+            signer_addresses = list(
+                map(_recover_signer_address, signable_messages, signatures))
+        return [
+            None
+            if signer_address is None else BlockchainAddress(signer_address)
+            for signer_address in signer_addresses
+        ]
+
     def sign_transfer_to_message(
             self,
             request: BlockchainClient.TransferToMessageSignRequest) -> str:
@@ -379,9 +531,10 @@ class EthereumClient(BlockchainClient):
                 request.incoming_transfer.amount, request.validator_nonce,
                 request.destination_hub_address,
                 request.destination_forwarder_address, vsn_token_address)
-            signed_message = web3.Account.sign_typed_data(
-                self.__private_key, domain_data, _TRANSFER_TO_MESSAGE_TYPES,
-                message_data)
+            signable_message = _encode_transfer_to_message(
+                domain_data, message_data)
+            signed_message = web3.Account.sign_message(
+                signable_message, private_key=self.__private_key)
             return signed_message.signature.to_0x_hex()
         except Exception:
             raise self._create_error('unable to sign a transferTo message',
@@ -448,18 +601,32 @@ class EthereumClient(BlockchainClient):
         return self.get_utilities().create_contract(
             token_address, self._versioned_vision_token_abi, node_connections)
 
+    def _read_adaptable_fee_per_gas(self) -> typing.Optional[int]:
+        node_connections = self.__create_node_connections()
+        fee_history = node_connections.eth.fee_history(
+            _FEE_HISTORY_BLOCK_COUNT, 'latest',
+            [_FEE_HISTORY_REWARD_PERCENTILE]).get()
+        rewards = sorted(block_rewards[0]
+                         for block_rewards in fee_history['reward']
+                         if len(block_rewards) > 0)
+        if len(rewards) == 0:
+            return None
+        return rewards[len(rewards) // 2]
+
     def _read_transfer_to_transaction_data(
             self, transaction_id: str, read_destination_transfer_id: bool) \
             -> BlockchainClient._TransferToTransactionDataResponse:
         try:
             node_connections = self.__create_node_connections()
-            transaction_receipt = node_connections.eth.get_transaction_receipt(
-                typing.cast(web3.types.HexStr, transaction_id)).get()
+            transaction_receipt = self.__read_transfer_to_receipt(
+                node_connections, transaction_id)
             _logger.info('transferTo transaction receipt', extra=json.loads(
                 web3.Web3.to_json(transaction_receipt)))  # type: ignore
             block_number = transaction_receipt['blockNumber']
             destination_transfer_id = None
+            gas_used = None
             if read_destination_transfer_id:
+                gas_used = transaction_receipt['gasUsed']
                 hub_contract = self._create_hub_contract(node_connections)
                 event = hub_contract.events.TransferToSucceeded()
                 event_log = event.process_receipt(
@@ -467,7 +634,8 @@ class EthereumClient(BlockchainClient):
                 destination_transfer_id = event_log['args'][
                     'destinationTransferId']
             return BlockchainClient._TransferToTransactionDataResponse(
-                block_number, destination_transfer_id=destination_transfer_id)
+                block_number, destination_transfer_id=destination_transfer_id,
+                gas_used=gas_used)
         except ResultsNotMatchingError:
             raise
         except Exception:
@@ -545,6 +713,24 @@ class EthereumClient(BlockchainClient):
             blockchain_nodes_domains.append(blockchain_node_domain)
         return ', '.join(blockchain_nodes_domains)
 
+    def __create_transfer_to_signable_message(
+            self,
+            request: BlockchainClient.TransferToSignerAddressRecoveryRequest) \
+            -> eth_account.messages.SignableMessage:
+        destination_blockchain = self.get_blockchain()
+        hub_address = self._get_config()['hub']
+        forwarder_address = self._get_config()['forwarder']
+        vsn_token_address = self._get_config()['vsn_token']
+        domain_data = self.__get_eip712_domain_data()
+        message_data = self.__get_transfer_to_message_data(
+            request.source_blockchain, destination_blockchain,
+            request.source_transfer_id, request.source_transaction_id,
+            request.sender_address, request.recipient_address,
+            request.source_token_address, request.destination_token_address,
+            request.amount, request.validator_nonce, hub_address,
+            forwarder_address, vsn_token_address)
+        return _encode_transfer_to_message(domain_data, message_data)
+
     def __get_eip712_domain_data(self) -> dict[str, typing.Any]:
         return {
             'name': _EIP712_DOMAIN_NAME,
@@ -557,9 +743,12 @@ class EthereumClient(BlockchainClient):
                     internal_transfer_id: int) -> int:
         transaction_count = node_connections.eth.get_transaction_count(
             self.__address).get_maximum_result()
-        database_access.update_transfer_nonce(internal_transfer_id,
-                                              self.get_blockchain(),
-                                              transaction_count)
+        if not database_access.update_transfer_nonce(
+                internal_transfer_id, self.get_blockchain(), transaction_count,
+                self._get_config()['max_pending_transactions']):
+            raise self._create_pending_transactions_limit_reached_error(
+                internal_transfer_id=internal_transfer_id,
+                transaction_count=transaction_count)
         nonce = database_access.read_transfer_nonce(internal_transfer_id)
         assert nonce is not None
         return nonce
@@ -591,6 +780,76 @@ class EthereumClient(BlockchainClient):
             'visionToken': vsn_token_address
         }
 
+    def __read_own_block_hashes(
+            self, block_hash_reads: dict[int, _BlockHashRead]) -> None:
+        try:
+            node_connections = self.__create_node_connections()
+            for block_number, block_hash_read in block_hash_reads.items():
+                try:
+                    block = node_connections.eth.get_block(block_number).get()
+                    block_hash_read.set_result(block['hash'].to_0x_hex())
+                except web3.exceptions.BlockNotFound:
+                    block_hash_read.set_result(None)
+                except Exception as error:
+                    block_hash_read.set_exception(error)
+        except Exception as error:
+            for block_hash_read in block_hash_reads.values():
+                if not block_hash_read.done():
+                    block_hash_read.set_exception(error)
+        finally:
+            # Block hashes are only shared while being read, so later
+            # reads observe chain reorganizations
+            with self.__block_hash_reads_lock:
+                for block_number in block_hash_reads:
+                    del self.__block_hash_reads[block_number]
+
+    def __read_block_transfer_to_receipts(
+            self, node_connections: NodeConnections,
+            block_number: int) -> list[web3.types.TxReceipt]:
+        hub_address = self._get_config()['hub']
+        if self.__block_receipts_available:
+            try:
+                # All receipts of the block with a single request
+                # (eth_getBlockReceipts)
+                block_receipts = node_connections.eth.get_block_receipts(
+                    block_number).get()
+            except (AttributeError, ValueError):
+                # Not supported by the installed Web3 library or by the
+                # configured blockchain nodes
+                _logger.warning(
+                    'block receipts not available', extra={
+                        'blockchain': self.get_blockchain_name(),
+                        'block_number': block_number
+                    }, exc_info=True)
+                self.__block_receipts_available = False
+            else:
+                return [
+                    transaction_receipt
+                    for transaction_receipt in block_receipts
+                    if transaction_receipt['to'] is not None and self.
+                    is_equal_address(transaction_receipt['to'], hub_address)
+                ]
+        block = node_connections.eth.get_block(block_number,
+                                               full_transactions=True).get()
+        return [
+            node_connections.eth.get_transaction_receipt(
+                transaction['hash']).get()
+            for transaction in block['transactions']
+            if transaction['to'] is not None
+            and self.is_equal_address(transaction['to'], hub_address)
+        ]
+
+    def __read_transfer_to_receipt(
+            self, node_connections: NodeConnections,
+            transaction_id: str) -> web3.types.TxReceipt:
+        with self.__transfer_to_receipts_lock:
+            transaction_receipt = self.__transfer_to_receipts.get(
+                transaction_id.lower())
+        if transaction_receipt is not None:
+            return transaction_receipt
+        return node_connections.eth.get_transaction_receipt(
+            typing.cast(web3.types.HexStr, transaction_id)).get()
+
     def __sort_validator_node_signatures(
             self, validator_node_signatures: dict[BlockchainAddress, str]) \
             -> tuple[list[BlockchainAddress], list[str]]:
@@ -613,13 +872,23 @@ class EthereumClient(BlockchainClient):
         function_selector = _HUB_TRANSFER_TO_FUNCTION_SELECTOR
         function_args = (on_chain_request, sorted_signer_addresses,
                          sorted_signatures)
-        gas = (_HUB_TRANSFER_TO_BASE_GAS +
-               len(sorted_signer_addresses) * _HUB_TRANSFER_TO_GAS_PER_SIGNER)
+        gas = _estimate_transfer_to_gas(self.get_blockchain(),
+                                        len(sorted_signer_addresses))
         min_adaptable_fee_per_gas = \
             self._get_config()['min_adaptable_fee_per_gas']
         max_total_fee_per_gas = self._get_config().get('max_total_fee_per_gas')
         if max_total_fee_per_gas == 0:
             max_total_fee_per_gas = None
+        # Avoid underpriced first submissions by starting from the fees
+        # recently paid on the blockchain
+        sampled_adaptable_fee_per_gas = _get_fee_history_oracle(
+            self).get_adaptable_fee_per_gas()
+        if sampled_adaptable_fee_per_gas is not None:
+            min_adaptable_fee_per_gas = max(min_adaptable_fee_per_gas,
+                                            sampled_adaptable_fee_per_gas)
+            if max_total_fee_per_gas is not None:
+                min_adaptable_fee_per_gas = min(min_adaptable_fee_per_gas,
+                                                max_total_fee_per_gas)
         amount = None
         nonce = self.__get_nonce(node_connections, internal_transfer_id)
         adaptable_fee_increase_factor = \
@@ -663,3 +932,245 @@ class EthereumClient(BlockchainClient):
                     source_transaction_id=incoming_transfer.
                     source_transaction_id)
             raise
+
+
+class _FeeHistoryOracle:
+    """Oracle that samples the fees recently paid on a blockchain in a
+    background thread once per block, so that they can be read by
+    concurrent transaction submissions without invoking any
+    blockchain node.
+
+    """
+    def __init__(
+            self,
+            read_adaptable_fee_per_gas: typing.Callable[[],
+                                                        typing.Optional[int]],
+            average_block_time: float):
+        self.__read_adaptable_fee_per_gas = read_adaptable_fee_per_gas
+        self.__average_block_time = average_block_time
+        self.__adaptable_fee_per_gas: typing.Optional[int] = None
+        self.__sample_time = 0.0
+        self.__thread: typing.Optional[threading.Thread] = None
+
+    def get_adaptable_fee_per_gas(self) -> typing.Optional[int]:
+        """Get the most recently sampled adaptable fee per gas.
+
+        Returns
+        -------
+        int or None
+            The sampled adaptable fee per gas, or None if no fee has
+            been sampled recently.
+
+        """
+        if (time.monotonic() - self.__sample_time
+                > _FEE_HISTORY_MAXIMUM_AGE * self.__average_block_time):
+            return None
+        return self.__adaptable_fee_per_gas
+
+    def start(self) -> None:
+        """Start sampling the fees in a background thread.
+
+        """
+        # The thread does not survive if the process is forked
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def update(self) -> None:
+        """Sample the fees recently paid on the blockchain.
+
+        """
+        adaptable_fee_per_gas = self.__read_adaptable_fee_per_gas()
+        if adaptable_fee_per_gas is not None:
+            self.__adaptable_fee_per_gas = adaptable_fee_per_gas
+            self.__sample_time = time.monotonic()
+
+    def __run(self) -> None:
+        while True:
+            try:
+                self.update()
+            except Exception:
+                _logger.warning('unable to sample the fee history',
+                                exc_info=True)
+            time.sleep(self.__average_block_time)
+
+
+def _encode_transfer_to_message(
+    domain_data: dict[str, typing.Any],
+    message_data: dict[str,
+                       typing.Any]) -> eth_account.messages.SignableMessage:
+    # Equivalent to eth_account.messages.encode_typed_data, but the
+    # domain separator and the type hashes are only computed once
+    try:
+        for field_name, field_type in _EIP712_DOMAIN_FIELDS.items():
+            _check_eip712_value(field_name, field_type,
+                                domain_data[field_name])
+        domain_separator = _hash_eip712_domain(
+            domain_data['name'], domain_data['version'],
+            domain_data['chainId'], domain_data['verifyingContract'])
+        message_hash = _hash_eip712_struct('TransferTo', message_data)
+    except (KeyError, TypeError, eth_abi.exceptions.EncodingError):
+        # Let eth_account handle (or reject) any unexpected message
+        # data
+        return eth_account.messages.encode_typed_data(
+            domain_data, _TRANSFER_TO_MESSAGE_TYPES, message_data)
+    return eth_account.messages.SignableMessage(hexbytes.HexBytes(b'\x01'),
+                                                domain_separator, message_hash)
+
+
+@functools.cache
+def _hash_eip712_domain(name: str, version: str, chain_id: int,
+                        verifying_contract: str) -> bytes:
+    return eth_utils.keccak(
+        eth_abi.encode(
+            ['bytes32', 'bytes32', 'bytes32', 'uint256', 'address'], [
+                eth_utils.keccak(text=_EIP712_DOMAIN_TYPE),
+                eth_utils.keccak(text=name),
+                eth_utils.keccak(text=version), chain_id, verifying_contract
+            ]))
+
+
+def _hash_eip712_struct(type_name: str, data: dict[str, typing.Any]) -> bytes:
+    abi_types = ['bytes32']
+    values: list[typing.Any] = [_get_eip712_type_hash(type_name)]
+    for field in _TRANSFER_TO_MESSAGE_TYPES[type_name]:
+        value = data[field['name']]
+        _check_eip712_value(field['name'], field['type'], value)
+        if field['type'] in _TRANSFER_TO_MESSAGE_TYPES:
+            abi_types.append('bytes32')
+            values.append(_hash_eip712_struct(field['type'], value))
+        elif field['type'] == 'string':
+            abi_types.append('bytes32')
+            values.append(eth_utils.keccak(text=value))
+        else:
+            abi_types.append(field['type'])
+            values.append(value)
+    return eth_utils.keccak(eth_abi.encode(abi_types, values))
+
+
+def _check_eip712_value(field_name: str, field_type: str,
+                        value: typing.Any) -> None:
+    if field_type in _TRANSFER_TO_MESSAGE_TYPES:
+        expected_type: type = dict
+    elif field_type == 'uint256':
+        expected_type = int
+    else:
+        expected_type = str
+    if not isinstance(value, expected_type):
+        raise TypeError(f'EIP-712 field {field_name} must be of type '
+                        f'{expected_type.__name__}: {value!r}')
+
+
+@functools.cache
+def _get_eip712_type_hash(type_name: str) -> bytes:
+    referenced_type_names: set[str] = set()
+    unvisited_type_names = [type_name]
+    while len(unvisited_type_names) > 0:
+        for field in _TRANSFER_TO_MESSAGE_TYPES[unvisited_type_names.pop()]:
+            if (field['type'] in _TRANSFER_TO_MESSAGE_TYPES
+                    and field['type'] != type_name
+                    and field['type'] not in referenced_type_names):
+                referenced_type_names.add(field['type'])
+                unvisited_type_names.append(field['type'])
+    encoded_type = ''.join(
+        _encode_eip712_type(type_name_)
+        for type_name_ in [type_name] + sorted(referenced_type_names))
+    return eth_utils.keccak(text=encoded_type)
+
+
+def _encode_eip712_type(type_name: str) -> str:
+    fields = ','.join(f'{field["type"]} {field["name"]}'
+                      for field in _TRANSFER_TO_MESSAGE_TYPES[type_name])
+    return f'{type_name}({fields})'
+
+
+def _recover_signer_address(signable_message: typing.Optional[
+    eth_account.messages.SignableMessage],
+                            signature: str) -> typing.Optional[str]:
+    # Must be a module-level function to be executable by the signer
+    # recovery process pool
+    if signable_message is None:
+        return None
+    try:
+        return web3.Account.recover_message(signable_message,
+                                            signature=signature)
+    except Exception:
+        return None
+
+
+def _recover_signer_addresses_in_parallel(
+        signable_messages: list[typing.Optional[
+            eth_account.messages.SignableMessage]],
+        signatures: list[str]) -> typing.Optional[list[typing.Optional[str]]]:
+    global _signer_recovery_executor
+    global _signer_recovery_executor_unavailable
+    if _signer_recovery_executor_unavailable:
+        return None
+    number_workers = min(os.cpu_count() or 1,
+                         _PARALLEL_SIGNER_RECOVERY_MAXIMUM_PROCESSES)
+    try:
+        with _signer_recovery_executor_lock:
+            if _signer_recovery_executor is None:
+                # Forking a process with running threads (e.g. a Celery
+                # worker running the threads pool) is not safe
+                start_method = ('forkserver' if 'forkserver'
+                                in multiprocessing.get_all_start_methods() else
+                                'spawn')
+                _signer_recovery_executor = \
+                    concurrent.futures.ProcessPoolExecutor(
+                        max_workers=number_workers,
+                        mp_context=multiprocessing.get_context(start_method))
+            executor = _signer_recovery_executor
+        chunk_size = max(1, len(signatures) // (4 * number_workers))
+        return list(
+            executor.map(_recover_signer_address, signable_messages,
+                         signatures, chunksize=chunk_size))
+    except Exception:
+        # Process pools are not available in every execution
+        # environment (e.g. within daemonic Celery worker processes),
+        # so the signer addresses are recovered sequentially from now on
+        _logger.warning('parallel signer address recovery not available',
+                        exc_info=True)
+        with _signer_recovery_executor_lock:
+            _signer_recovery_executor_unavailable = True
+            if _signer_recovery_executor is not None:
+                _signer_recovery_executor.shutdown(wait=False)
+                _signer_recovery_executor = None
+        return None
+
+
+def _estimate_transfer_to_gas(blockchain: Blockchain,
+                              number_signers: int) -> int:
+    default_gas = (_HUB_TRANSFER_TO_BASE_GAS +
+                   number_signers * _HUB_TRANSFER_TO_GAS_PER_SIGNER)
+    try:
+        maximum_gas_used = \
+            database_access.read_maximum_transfer_to_gas_usage(
+                blockchain, number_signers)
+    except Exception:
+        # The default gas is always sufficient
+        _logger.warning(
+            'unable to read the learned gas usage of transferTo '
+            'transactions', extra={
+                'blockchain': blockchain.name,
+                'number_signers': number_signers
+            }, exc_info=True)
+        return default_gas
+    if maximum_gas_used is None:
+        return default_gas
+    return min(int(maximum_gas_used * _TRANSFER_TO_GAS_SAFETY_FACTOR),
+               default_gas)
+
+
+def _get_fee_history_oracle(
+        ethereum_client: EthereumClient) -> _FeeHistoryOracle:
+    blockchain = ethereum_client.get_blockchain()
+    with _fee_history_oracles_lock:
+        fee_history_oracle = _fee_history_oracles.get(blockchain)
+        if fee_history_oracle is None:
+            fee_history_oracle = _fee_history_oracles[blockchain] = \
+                _FeeHistoryOracle(
+                    ethereum_client._read_adaptable_fee_per_gas,
+                    ethereum_client._get_config()['average_block_time'])
+        fee_history_oracle.start()
+    return fee_history_oracle
@@ -1,6 +1,7 @@
 """Factory for blockchain clients.
 
 """
+import threading
 import typing
 
 from vision.common.blockchains.enums import Blockchain
@@ -11,6 +12,11 @@ from vision.validatornode.configuration import get_blockchain_config
 _blockchain_clients: typing.Dict[Blockchain, BlockchainClient] = {}
 """Blockchain-specific client objects."""
 
+_blockchain_clients_lock = threading.Lock()
+"""Lock for creating the blockchain client objects, which are shared
+by all threads of a process (e.g. of a Celery worker running the
+threads pool)."""
+
 _blockchain_client_classes = BlockchainClient.find_subclasses()
 """Blockchain-specific client classes."""
 
@@ -20,10 +26,11 @@ def initialize_blockchain_clients() -> None:
     blockchains.
 
     """
-    for blockchain in Blockchain:
-        if get_blockchain_config(blockchain)['active']:
-            blockchain_client = _blockchain_client_classes[blockchain]()
-            _blockchain_clients[blockchain] = blockchain_client
+    with _blockchain_clients_lock:
+        for blockchain in Blockchain:
+            if get_blockchain_config(blockchain)['active']:
+                blockchain_client = _blockchain_client_classes[blockchain]()
+                _blockchain_clients[blockchain] = blockchain_client
 
 
 def get_blockchain_client(blockchain: Blockchain) -> BlockchainClient:
@@ -41,4 +48,14 @@ def get_blockchain_client(blockchain: Blockchain) -> BlockchainClient:
 
     """
     assert get_blockchain_config(blockchain)['active']
-    return _blockchain_clients[blockchain]
+    blockchain_client = _blockchain_clients.get(blockchain)
+    if blockchain_client is None:
+        # The client is created on first use if the blockchain clients
+        # have not been initialized yet, and only once even if
+        # requested by multiple threads concurrently
+        with _blockchain_clients_lock:
+            blockchain_client = _blockchain_clients.get(blockchain)
+            if blockchain_client is None:
+                blockchain_client = _blockchain_client_classes[blockchain]()
+                _blockchain_clients[blockchain] = blockchain_client
+    return blockchain_client
@@ -1,6 +1,7 @@
 """Module for Solana-specific clients and errors.
 
 """
+import typing
 import uuid
 
 from vision.common.blockchains.enums import Blockchain
@@ -56,6 +57,11 @@ class SolanaClient(BlockchainClient):
         # Docstring inherited
         raise NotImplementedError  # pragma: no cover
 
+    def read_block_hashes(
+            self, block_numbers: typing.Iterable[int]) -> dict[int, str]:
+        # Docstring inherited
+        raise NotImplementedError  # pragma: no cover
+
     def read_external_token_address(
             self, token_address: BlockchainAddress,
             external_blockchain: Blockchain) -> BlockchainAddress | None:
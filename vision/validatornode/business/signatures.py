@@ -9,10 +9,10 @@ from vision.common.blockchains.enums import Blockchain
 from vision.common.types import BlockchainAddress
 
 from vision.validatornode.blockchains.base import BlockchainClient
-from vision.validatornode.blockchains.base import BlockchainClientError
 from vision.validatornode.blockchains.factory import get_blockchain_client
 from vision.validatornode.business.base import Interactor
 from vision.validatornode.business.base import InteractorError
+from vision.validatornode.business.transfers import TransferInteractor
 from vision.validatornode.configuration import get_blockchain_config
 from vision.validatornode.database import access as database_access
 from vision.validatornode.database.access import TransferToDataResponse
@@ -83,32 +83,120 @@ class SignatureInteractor(Interactor):
             signature.
 
         """
+        error = self.add_secondary_node_signatures([request])[0]
+        if error is not None:
+            raise error
+
+    def add_secondary_node_signatures(
+            self, requests: list[SecondaryNodeSignatureAddRequest]) \
+            -> list[typing.Optional[InteractorError]]:
+        """Add multiple secondary node signatures for cross-chain
+        transfers. The signers of the signatures are recovered in a
+        single batch for each destination blockchain.
+
+        Parameters
+        ----------
+        requests : list of SecondaryNodeSignatureAddRequest
+            The request data for each signature.
+
+        Returns
+        -------
+        list of InteractorError or None
+            For each request (in the same order), None if the secondary
+            node signature has been added, or the error which occurred
+            during adding it (see add_secondary_node_signature for the
+            specialized errors).
+
+        """
+        errors: list[typing.Optional[InteractorError]] = [None] * len(requests)
+        extra_infos = [vars(request).copy() for request in requests]
+        transfer_to_data: dict[int, TransferToDataResponse] = {}
+        for index, request in enumerate(requests):
+            try:
+                transfer_to_data[index] = self.__read_transfer_to_data(
+                    request, extra_infos[index])
+                extra_infos[index] |= vars(transfer_to_data[index])
+            except InteractorError as error:
+                errors[index] = error
+        indexes_by_blockchain: dict[Blockchain, list[int]] = {}
+        for index, data in transfer_to_data.items():
+            indexes_by_blockchain.setdefault(data.destination_blockchain,
+                                             []).append(index)
+        for destination_blockchain, indexes in indexes_by_blockchain.items():
+            blockchain_errors = self.__add_secondary_node_signatures(
+                destination_blockchain, [requests[index] for index in indexes],
+                [transfer_to_data[index] for index in indexes],
+                [extra_infos[index] for index in indexes])
+            for index, error in zip(indexes, blockchain_errors):
+                errors[index] = error
+        signed_transfer_ids = {
+            transfer_to_data[index].internal_transfer_id
+            for index in transfer_to_data if errors[index] is None
+        }
+        for internal_transfer_id in sorted(signed_transfer_ids):
+            self.__schedule_transfer_onchain_submission(internal_transfer_id)
+        return errors
+
+    def __add_secondary_node_signatures(
+            self, destination_blockchain: Blockchain,
+            requests: list[SecondaryNodeSignatureAddRequest],
+            transfer_to_data: list[TransferToDataResponse],
+            extra_infos: list[dict[str, typing.Any]]) \
+            -> list[typing.Optional[InteractorError]]:
         try:
-            extra_info = vars(request)
-            transfer_to_data = self.__read_transfer_to_data(
-                request, extra_info)
-            extra_info |= vars(transfer_to_data)
             destination_blockchain_client = get_blockchain_client(
-                transfer_to_data.destination_blockchain)
+                destination_blockchain)
             destination_forwarder_address = get_blockchain_config(
-                transfer_to_data.destination_blockchain)['forwarder']
-            signer_address = self.__recover_transfer_to_signer_address(
-                request, transfer_to_data, destination_blockchain_client,
-                extra_info)
+                destination_blockchain)['forwarder']
+            signer_addresses = self.__recover_transfer_to_signer_addresses(
+                requests, transfer_to_data, destination_blockchain_client)
+            validator_node_addresses = \
+                destination_blockchain_client.read_validator_node_addresses()
+        except Exception:
+            _logger.error('unable to add secondary node signatures',
+                          extra={'requests': requests}, exc_info=True)
+            return [
+                self._create_error('unable to add a secondary node signature',
+                                   request=request) for request in requests
+            ]
+        errors: list[typing.Optional[InteractorError]] = []
+        for request, data, signer_address, extra_info in zip(
+                requests, transfer_to_data, signer_addresses, extra_infos):
+            try:
+                self.__add_secondary_node_signature(
+                    request, data, destination_forwarder_address,
+                    signer_address, validator_node_addresses, extra_info)
+                errors.append(None)
+            except InteractorError as error:
+                errors.append(error)
+        return errors
+
+    def __add_secondary_node_signature(
+            self, request: SecondaryNodeSignatureAddRequest,
+            transfer_to_data: TransferToDataResponse,
+            destination_forwarder_address: BlockchainAddress,
+            signer_address: typing.Optional[BlockchainAddress],
+            validator_node_addresses: list[BlockchainAddress],
+            extra_info: dict[str, typing.Any]) -> None:
+        try:
+            if signer_address is None:
+                _logger.warning('unrecoverable secondary node signer',
+                                extra=extra_info)
+                raise self._create_invalid_signature_error(request=request)
             extra_info |= {'signer_address': signer_address}
             self.__verify_signature_not_existing(
                 request, transfer_to_data, destination_forwarder_address,
                 signer_address, extra_info)
-            self.__verify_signer_is_validator_node(
-                request, signer_address, destination_blockchain_client,
-                extra_info)
+            self.__verify_signer_is_validator_node(request, signer_address,
+                                                   validator_node_addresses,
+                                                   extra_info)
             database_access.create_validator_node_signature(
                 transfer_to_data.internal_transfer_id,
                 transfer_to_data.destination_blockchain,
                 destination_forwarder_address, signer_address,
-                request.signature)
+                request.signature, verified=True)
             _logger.info('secondary node signature added', extra=extra_info)
-        except SignatureInteractorError:
+        except InteractorError:
             raise
         except Exception:
             raise self._create_error(
@@ -117,36 +205,47 @@ class SignatureInteractor(Interactor):
     def __read_transfer_to_data(
             self, request: SecondaryNodeSignatureAddRequest,
             extra_info: dict[str, typing.Any]) -> TransferToDataResponse:
-        transfer_to_data = database_access.read_transfer_to_data(
-            request.source_blockchain, request.source_transaction_id)
+        try:
+            transfer_to_data = database_access.read_transfer_to_data(
+                request.source_blockchain, request.source_transaction_id)
+        except Exception:
+            raise self._create_error(
+                'unable to add a secondary node signature', request=request)
         if transfer_to_data is None:
             _logger.warning('unknown transfer for secondary node signature',
                             extra=extra_info)
             raise self._create_unknown_transfer_error(request=request)
         return transfer_to_data
 
-    def __recover_transfer_to_signer_address(
-            self, request: SecondaryNodeSignatureAddRequest,
-            transfer_to_data: TransferToDataResponse,
-            destination_blockchain_client: BlockchainClient,
-            extra_info: dict[str, typing.Any]) -> BlockchainAddress:
-        signer_recovery_request = \
+    def __recover_transfer_to_signer_addresses(
+            self, requests: list[SecondaryNodeSignatureAddRequest],
+            transfer_to_data: list[TransferToDataResponse],
+            destination_blockchain_client: BlockchainClient) \
+            -> list[typing.Optional[BlockchainAddress]]:
+        signer_recovery_requests = [
             BlockchainClient.TransferToSignerAddressRecoveryRequest(
                 request.source_blockchain, request.source_transaction_id,
-                transfer_to_data.source_transfer_id,
-                transfer_to_data.sender_address,
-                transfer_to_data.recipient_address,
-                transfer_to_data.source_token_address,
-                transfer_to_data.destination_token_address,
-                transfer_to_data.amount, transfer_to_data.validator_nonce,
-                request.signature)
+                data.source_transfer_id, data.sender_address,
+                data.recipient_address, data.source_token_address,
+                data.destination_token_address, data.amount,
+                data.validator_nonce, request.signature)
+            for request, data in zip(requests, transfer_to_data)
+        ]
+        return destination_blockchain_client.\
+            recover_transfer_to_signer_addresses(signer_recovery_requests)
+
+    def __schedule_transfer_onchain_submission(
+            self, internal_transfer_id: int) -> None:
+        # The periodically retried submission task remains as a fallback
+        # if the submission cannot be scheduled immediately
         try:
-            return destination_blockchain_client.\
-                recover_transfer_to_signer_address(signer_recovery_request)
-        except BlockchainClientError:
-            _logger.warning('unrecoverable secondary node signer',
-                            extra=extra_info, exc_info=True)
-            raise self._create_invalid_signature_error(request=request)
+            TransferInteractor().schedule_transfer_onchain_submission(
+                internal_transfer_id)
+        except Exception:
+            _logger.warning(
+                'unable to schedule an immediate token transfer submission',
+                extra={'internal_transfer_id': internal_transfer_id},
+                exc_info=True)
 
     def __verify_signature_not_existing(
             self, request: SecondaryNodeSignatureAddRequest,
@@ -167,10 +266,8 @@ class SignatureInteractor(Interactor):
     def __verify_signer_is_validator_node(
             self, request: SecondaryNodeSignatureAddRequest,
             signer_address: BlockchainAddress,
-            destination_blockchain_client: BlockchainClient,
+            validator_node_addresses: list[BlockchainAddress],
             extra_info: dict[str, typing.Any]) -> None:
-        validator_node_addresses = \
-            destination_blockchain_client.read_validator_node_addresses()
         if signer_address not in validator_node_addresses:
             _logger.critical('signer is not a validator node',
                              extra=extra_info)
@@ -3,19 +3,22 @@ transfers.
 
 """
 import abc
+import concurrent.futures
 import logging
 import random
+import threading
+import time
 import typing
 import uuid
 
-import celery.result  # type: ignore
 from vision.common.blockchains.enums import Blockchain
 from vision.common.entities import TransactionStatus
 from vision.common.types import BlockchainAddress
 
 from vision.validatornode.blockchains.base import BlockchainClient
-from vision.validatornode.blockchains.base import BlockchainClientError
 from vision.validatornode.blockchains.base import NonMatchingForwarderError
+from vision.validatornode.blockchains.base import \
+    PendingTransactionsLimitReachedError
 from vision.validatornode.blockchains.base import \
     SourceTransferIdAlreadyUsedError
 from vision.validatornode.blockchains.base import \
@@ -24,19 +27,67 @@ from vision.validatornode.blockchains.factory import get_blockchain_client
 from vision.validatornode.business.base import Interactor
 from vision.validatornode.business.base import InteractorError
 from vision.validatornode.celery import celery_app
+from vision.validatornode.celery import forget_task_results
+from vision.validatornode.celery import get_task_routing_headers
 from vision.validatornode.configuration import config
 from vision.validatornode.configuration import get_blockchain_config
 from vision.validatornode.database import access as database_access
+from vision.validatornode.database.access import ScheduledTransferResponse
+from vision.validatornode.database.access import TransferConfirmationRequest
 from vision.validatornode.database.access import TransferCreationRequest
+from vision.validatornode.database.access import UnconfirmedTransferResponse
 from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
 from vision.validatornode.entities import CrossChainTransfer
 from vision.validatornode.entities import CrossChainTransferDict
+from vision.validatornode.metrics import instrument_blockchain_client
+from vision.validatornode.metrics import measure_step
+from vision.validatornode.metrics import record_cache_hit
+from vision.validatornode.metrics import record_task_retry
 from vision.validatornode.restclient import PrimaryNodeClient
 from vision.validatornode.restclient import PrimaryNodeDuplicateSignatureError
 from vision.validatornode.restclient import PrimaryNodeInvalidSignerError
+from vision.validatornode.restclient import TransferSignatureBatcher
+from vision.validatornode.restclient import ValidatorNonceBatcher
+from vision.validatornode.retries import RetryPolicy
+from vision.validatornode.retries import classify_error
+
+_MINIMUM_SIGNATURES_CACHE_EXPIRY = 60
+
+_PENDING_TRANSFER_SIGNATURES_BATCH_SIZE = 100
+"""Maximum number of presigned transfer signatures posted to the
+primary validator node in a single request."""
+
+_RECOVERABLE_TRANSFER_STATUSES: typing.Final[tuple[TransferStatus, ...]] = (
+    TransferStatus.SOURCE_TRANSACTION_DETECTED,
+    TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED)
+"""Statuses of the transfers which are awaiting the completion of a
+transfer task and can therefore be orphaned if the task is lost."""
+
+_TRANSFER_TO_GAS_SAMPLES = 20
+"""Number of learned gas usages of transferTo transactions kept per
+destination blockchain and number of signers."""
+
+_VALIDATOR_NONCE_PREFETCH_THREADS = 8
 
 _logger = logging.getLogger(__name__)
 
+_confirmation_retry_blockchains: set[Blockchain] = set()
+"""Destination blockchains whose unconfirmed transfers are checked
+again without waiting for a new block since confirming some of them
+has failed."""
+
+_minimum_signatures_cache: dict[Blockchain, tuple[int, float]] = {}
+
+_primary_node_batchers: dict[tuple[type, str], typing.Any] = {}
+
+_primary_node_batchers_lock = threading.Lock()
+
+_validator_nonce_prefetch_executor: \
+    concurrent.futures.ThreadPoolExecutor | None = None
+
+_validator_nonce_prefetch_executor_lock = threading.Lock()
+
 
 class TransferInteractorError(InteractorError):
     """Exception class for all transfer interactor errors.
@@ -97,6 +148,8 @@ class TransferInteractor(Interactor):
                 _logger.error('incoming token transfer failed',
                               extra=extra_info, exc_info=True)
                 self.__restart_validation(internal_transfer_id, transfer)
+                self.__forget_transfer_to_submissions(
+                    [internal_transaction_id])
                 return True
             if not status_response.transaction_submission_completed:
                 _logger.info('incoming token transfer not yet confirmed',
@@ -111,6 +164,8 @@ class TransferInteractor(Interactor):
                 _logger.warning('incoming token transfer reverted',
                                 extra=extra_info)
                 self.__restart_validation(internal_transfer_id, transfer)
+                self.__forget_transfer_to_submissions(
+                    [internal_transaction_id])
                 return True
             assert transaction_status is TransactionStatus.CONFIRMED
             extra_info |= {
@@ -121,6 +176,9 @@ class TransferInteractor(Interactor):
             assert status_response.transaction_id is not None
             assert status_response.block_number is not None
             assert status_response.destination_transfer_id is not None
+            self.__record_transfer_to_gas_usage(
+                internal_transfer_id, transfer.eventual_destination_blockchain,
+                status_response.gas_used)
             database_access.update_transfer_confirmed_destination_transaction(
                 internal_transfer_id, status_response.destination_transfer_id,
                 status_response.transaction_id, status_response.block_number)
@@ -129,6 +187,7 @@ class TransferInteractor(Interactor):
                 TransferStatus.SOURCE_REVERSAL_TRANSACTION_CONFIRMED
                 if transfer.is_reversal_transfer else
                 TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+            self.__forget_transfer_to_submissions([internal_transaction_id])
             return True
         except Exception:
             raise self._create_error(
@@ -137,6 +196,87 @@ class TransferInteractor(Interactor):
                 internal_transaction_id=internal_transaction_id,
                 transfer=transfer)
 
+    def confirm_transfers(self, destination_blockchain: Blockchain) -> None:
+        """Confirm all cross-chain token transfers whose transactions
+        have been submitted to a destination blockchain. The statuses
+        of the transaction submissions are only retrieved if a new
+        block has been added to the blockchain (or if confirming some
+        of the transfers has failed before), and the confirmed
+        transfers are updated all at once. An error for a single
+        transfer does not affect the other transfers.
+
+        Parameters
+        ----------
+        destination_blockchain : Blockchain
+            The (eventual) destination blockchain of the transfers to
+            confirm.
+
+        Raises
+        ------
+        TransferInteractorError
+            If an error occurs during confirming the cross-chain token
+            transfers.
+
+        """
+        try:
+            unconfirmed_transfers = database_access.read_unconfirmed_transfers(
+                destination_blockchain)
+            if len(unconfirmed_transfers) == 0:
+                return
+            blockchain_client = get_blockchain_client(destination_blockchain)
+            if (not blockchain_client.prefetch_transfer_to_transaction_data()
+                    and destination_blockchain
+                    not in _confirmation_retry_blockchains):
+                # The transaction submissions cannot have been completed
+                # without a new block
+                return
+            # The transfers are checked again without waiting for a new
+            # block until all of them have been checked successfully
+            _confirmation_retry_blockchains.add(destination_blockchain)
+            status_responses = \
+                blockchain_client.get_transfer_to_submission_statuses([
+                    unconfirmed_transfer.internal_transaction_id
+                    for unconfirmed_transfer in unconfirmed_transfers
+                ])
+            transfer_data = database_access.read_transfer_data([
+                unconfirmed_transfer.internal_transfer_id
+                for unconfirmed_transfer in unconfirmed_transfers
+            ])
+            confirmation_requests: list[TransferConfirmationRequest] = []
+            completed_transaction_ids: list[uuid.UUID] = []
+            confirmation_failed = False
+            for unconfirmed_transfer in unconfirmed_transfers:
+                internal_transaction_id = \
+                    unconfirmed_transfer.internal_transaction_id
+                try:
+                    confirmation_request = self.__confirm_submitted_transfer(
+                        unconfirmed_transfer, status_responses, transfer_data)
+                except Exception:
+                    _logger.error(
+                        'unable to confirm a token transfer', extra={
+                            'internal_transfer_id': unconfirmed_transfer.
+                            internal_transfer_id,
+                            'internal_transaction_id': unconfirmed_transfer.
+                            internal_transaction_id
+                        }, exc_info=True)
+                    confirmation_failed = True
+                    continue
+                if confirmation_request is not None:
+                    confirmation_requests.append(confirmation_request)
+                status_response = status_responses[internal_transaction_id]
+                if (status_response is None
+                        or status_response.transaction_submission_completed):
+                    completed_transaction_ids.append(internal_transaction_id)
+            database_access.update_transfer_confirmations(
+                confirmation_requests)
+            self.__forget_transfer_to_submissions(completed_transaction_ids)
+            if not confirmation_failed:
+                _confirmation_retry_blockchains.discard(destination_blockchain)
+        except Exception:
+            raise self._create_error(
+                'unable to confirm cross-chain token transfers',
+                destination_blockchain=destination_blockchain)
+
     def detect_new_transfers(self, source_blockchain: Blockchain) -> None:
         """Detect new cross-chain token transfers on a blockchain.
 
@@ -202,17 +342,18 @@ class TransferInteractor(Interactor):
                         found_transfer.source_hub_address,
                         found_transfer.source_transfer_id,
                         found_transfer.source_transaction_id,
-                        found_transfer.source_block_number)
+                        found_transfer.source_block_number,
+                        dict(found_transfer.to_dict()))
                     internal_transfer_id = database_access.create_transfer(
                         transfer_creation_request)
                     # Schedule the cross-chain transfer to be validated
                     # asynchronously
-                    task_result = _schedule_task(validate_transfer_task,
-                                                 internal_transfer_id,
-                                                 found_transfer)
-                    task_id = uuid.UUID(task_result.id)
-                    database_access.update_transfer_task_id(
-                        internal_transfer_id, task_id)
+                    task_id = _schedule_task(validate_transfer_task,
+                                             internal_transfer_id,
+                                             found_transfer)
+                    if task_id is not None:
+                        database_access.update_transfer_task_id(
+                            internal_transfer_id, task_id)
             # Update the maximum block number that has been considered
             # for detecting new cross-chain transfers
             database_access.update_blockchain_last_block_number(
@@ -267,6 +408,168 @@ class TransferInteractor(Interactor):
                 source_blockchain=source_blockchain,
                 source_transaction_id=source_transaction_id)
 
+    def get_validator_nonces(
+            self, source_transactions: list[tuple[Blockchain, str]]) \
+            -> list[typing.Optional[int]]:
+        """Get the validator nonces assigned to multiple cross-chain
+        token transfers.
+
+        Parameters
+        ----------
+        source_transactions : list of tuple
+            Pairs of a transfer's source blockchain and its transaction
+            ID/hash on the source blockchain.
+
+        Returns
+        -------
+        list of int or None
+            For each transfer (in the order of the given pairs), either
+            its validator nonce or None if there is no transfer for the
+            source blockchain and transaction ID/hash.
+
+        Raises
+        ------
+        TransferInteractorError
+            If an error occurs during getting the validator nonces.
+
+        """
+        try:
+            validator_nonces = database_access.\
+                read_validator_nonces_by_source_transaction_ids(
+                    source_transactions)
+            return [
+                validator_nonces.get(source_transaction)
+                for source_transaction in source_transactions
+            ]
+        except Exception:
+            raise self._create_error('unable to get validator nonces',
+                                     number_transfers=len(source_transactions))
+
+    def load_transfer(
+        self, internal_transfer_id: int,
+        transfer_dict: typing.Optional[CrossChainTransferDict] = None
+    ) -> CrossChainTransfer:
+        """Load a cross-chain token transfer for processing it.
+
+        Parameters
+        ----------
+        internal_transfer_id : int
+            The unique internal ID of the transfer.
+        transfer_dict : CrossChainTransferDict, optional
+            The data of the cross-chain token transfer carried by a task
+            scheduled before the transfer data was stored in the
+            database (only used and then stored if there is no stored
+            transfer data).
+
+        Returns
+        -------
+        CrossChainTransfer
+            The loaded cross-chain token transfer.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the transfer cannot be loaded.
+
+        """
+        try:
+            transfer_data = database_access.read_transfer_data(
+                [internal_transfer_id]).get(internal_transfer_id)
+            if transfer_data is None and transfer_dict is not None:
+                # The subsequent processing steps only carry the
+                # transfer ID
+                database_access.update_transfer_data(internal_transfer_id,
+                                                     dict(transfer_dict))
+        except Exception:
+            raise self._create_error('unable to load a token transfer',
+                                     internal_transfer_id=internal_transfer_id)
+        if transfer_data is not None:
+            transfer_dict = typing.cast(CrossChainTransferDict, transfer_data)
+        if transfer_dict is None:
+            raise self._create_unknown_transfer_error(
+                internal_transfer_id=internal_transfer_id)
+        return CrossChainTransfer.from_dict(transfer_dict)
+
+    def process_scheduled_transfers(self, step: TransferStep) -> int:
+        """Claim a batch of cross-chain token transfers whose processing
+        step scheduled in the database is due and execute the step for
+        each of them (alternative to the Celery transfer tasks if the
+        database-backed transfer scheduler is enabled).
+
+        Parameters
+        ----------
+        step : TransferStep
+            The processing step to execute.
+
+        Returns
+        -------
+        int
+            The number of claimed transfers.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the due transfers cannot be claimed.
+
+        """
+        try:
+            scheduled_transfers = database_access.claim_scheduled_transfers(
+                step, config['scheduler']['batch_size'],
+                config['scheduler']['lease_in_seconds'])
+        except Exception:
+            raise self._create_error(
+                'unable to claim scheduled token transfers', step=step)
+        for scheduled_transfer in scheduled_transfers:
+            self.__process_scheduled_transfer(step, scheduled_transfer)
+        return len(scheduled_transfers)
+
+    def recover_orphaned_transfers(self) -> int:
+        """Re-enqueue the validation of a batch of cross-chain token
+        transfers which are orphaned, i.e. awaiting the completion of a
+        transfer task that has been lost (e.g. because the broker has
+        lost its message or the worker executing it has died).
+
+        Returns
+        -------
+        int
+            The number of re-enqueued transfers.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the orphaned transfers cannot be read.
+
+        Notes
+        -----
+        A transfer is considered to be orphaned if it has neither been
+        updated nor been due for the retry of its transfer task for the
+        configured time, and if none of its claimed transfer tasks has
+        been scheduled or started an attempt for the same time. Only the
+        claims of such lost tasks are released. Should a lost task
+        still start after all, it finds its claim released and exits
+        without processing the transfer. Validating a transfer again is
+        harmless since the validation schedules the appropriate next
+        step.
+
+        """
+        recovery_config = config['recovery']
+        try:
+            internal_transfer_ids = database_access.read_stale_transfers(
+                _RECOVERABLE_TRANSFER_STATUSES,
+                recovery_config['stale_after_in_seconds'],
+                recovery_config['batch_size'])
+        except Exception:
+            raise self._create_error('unable to read orphaned token transfers')
+        number_transfers = 0
+        for internal_transfer_id in internal_transfer_ids:
+            # The re-enqueued transfers are spread over time so that a
+            # large recovery does not overwhelm the blockchain nodes
+            delay = number_transfers // recovery_config[
+                'max_transfers_per_second']
+            if self.__recover_orphaned_transfer(internal_transfer_id, delay):
+                number_transfers += 1
+        return number_transfers
+
     def submit_transfer_to_primary_node(self, internal_transfer_id: int,
                                         transfer: CrossChainTransfer) -> bool:
         """Submit the signature for a cross-chain token transfer after
@@ -309,8 +612,8 @@ class TransferInteractor(Interactor):
             # primary node may have changed
             get_request = PrimaryNodeClient.ValidatorNonceGetRequest(
                 transfer.source_blockchain, transfer.source_transaction_id)
-            validator_nonce = primary_node_client.get_validator_nonce(
-                get_request)
+            validator_nonce = _get_validator_nonce(primary_node_client,
+                                                   get_request)
             database_access.update_transfer_validator_nonce(
                 internal_transfer_id, validator_nonce)
 
@@ -339,7 +642,7 @@ class TransferInteractor(Interactor):
                 transfer.source_blockchain, transfer.source_transaction_id,
                 signature)
             try:
-                primary_node_client.post_transfer_signature(post_request)
+                _post_transfer_signature(primary_node_client, post_request)
             except PrimaryNodeDuplicateSignatureError:
                 _logger.warning(
                     'token transfer signature already submitted to the '
@@ -350,18 +653,8 @@ class TransferInteractor(Interactor):
                     'validator node at Vision Forwarder', extra=extra_info)
                 raise
 
-            own_address = destination_blockchain_client.get_own_address()
-            self.__store_validator_node_signature(
-                internal_transfer_id, transfer.eventual_destination_blockchain,
-                destination_forwarder_address, own_address, signature)
-            database_access.update_transfer_submitted_destination_transaction(
-                internal_transfer_id, destination_hub_address,
-                destination_forwarder_address)
-            database_access.update_transfer_status(
-                internal_transfer_id,
-                TransferStatus.SOURCE_REVERSAL_TRANSACTION_SUBMITTED
-                if transfer.is_reversal_transfer else
-                TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
+            self.__complete_signature_submission(internal_transfer_id,
+                                                 transfer, signature)
             return True
         except Exception:
             raise self._create_error(
@@ -369,8 +662,143 @@ class TransferInteractor(Interactor):
                 'node', internal_transfer_id=internal_transfer_id,
                 transfer=transfer)
 
-    def submit_transfer_onchain(self, internal_transfer_id: int,
-                                transfer: CrossChainTransfer) -> bool:
+    def submit_pending_transfer_signatures(self) -> int:
+        """Post a batch of the transfer signatures presigned by a
+        secondary node in pipeline mode to the primary validator node
+        in a single request.
+
+        Returns
+        -------
+        int
+            The number of posted transfer signatures.
+
+        Raises
+        ------
+        TransferInteractorError
+            If the pending transfer signatures cannot be read or
+            posted.
+
+        """
+        try:
+            pending_signatures = \
+                database_access.read_pending_transfer_signatures(
+                    _PENDING_TRANSFER_SIGNATURES_BATCH_SIZE)
+            if len(pending_signatures) == 0:
+                return 0
+            transfers = [
+                self.load_transfer(pending_signature.internal_transfer_id)
+                for pending_signature in pending_signatures
+            ]
+            post_requests = []
+            for pending_signature, transfer in zip(pending_signatures,
+                                                   transfers):
+                post_requests.append(
+                    PrimaryNodeClient.TransferSignaturePostRequest(
+                        transfer.source_blockchain,
+                        transfer.source_transaction_id,
+                        pending_signature.signature))
+            primary_node_client = PrimaryNodeClient(
+                config['application']['primary_url'])
+            post_errors = primary_node_client.post_transfer_signatures(
+                post_requests)
+        except Exception:
+            raise self._create_error(
+                'unable to submit the pending token transfer signatures to '
+                'the primary node')
+        for pending_signature, transfer, post_error in zip(
+                pending_signatures, transfers, post_errors):
+            self.__complete_pending_signature_submission(
+                pending_signature.internal_transfer_id, transfer,
+                pending_signature.signature, post_error)
+        return len(pending_signatures)
+
+    def schedule_transfer_onchain_submission(
+            self, internal_transfer_id: int) -> bool:
+        """Schedule the immediate submission of a cross-chain token
+        transfer to the destination blockchain if the transfer is
+        awaiting more signatures and sufficient signatures are now
+        available. The submission is scheduled at most once, even if
+        this method is invoked concurrently for the same transfer.
+
+        Parameters
+        ----------
+        internal_transfer_id : int
+            The unique internal ID of the transfer.
+
+        Returns
+        -------
+        bool
+            True if the submission has been scheduled.
+
+        Raises
+        ------
+        TransferInteractorError
+            If an error occurs during scheduling the submission.
+
+        """
+        try:
+            assert self._is_primary_node()
+            if not database_access.read_transfer_awaiting_signatures(
+                    internal_transfer_id):
+                # The transfer is not (yet) awaiting more signatures
+                return False
+            transfer = self.load_transfer(internal_transfer_id)
+            extra_info = vars(transfer) | {
+                'interal_transfer_id': internal_transfer_id
+            }
+            destination_blockchain_client = get_blockchain_client(
+                transfer.eventual_destination_blockchain)
+            if not self.__sufficient_secondary_node_signatures(
+                    internal_transfer_id, destination_blockchain_client,
+                    extra_info):
+                return False
+            if config['scheduler']['enabled']:
+                # Scheduling the submission repeatedly is harmless since
+                # a leased step is not rescheduled and the submission is
+                # claimed for the scheduled step
+                database_access.update_transfer_schedule(
+                    internal_transfer_id, TransferStep.SUBMIT_TRANSFER_ONCHAIN,
+                    0)
+            else:
+                task_id = uuid.uuid4()
+                with database_access.unit_of_work():
+                    if not database_access.claim_transfer_submission(
+                            internal_transfer_id, task_id):
+                        return False
+                    # The task polling for more signatures exits once
+                    # the submission step has been claimed for the
+                    # immediate submission, so that at most one task is
+                    # in flight for the step
+                    database_access.reassign_transfer_task(
+                        internal_transfer_id,
+                        TransferStep.SUBMIT_TRANSFER_ONCHAIN, task_id)
+                try:
+                    submit_transfer_onchain_task.apply_async(
+                        args=(internal_transfer_id, ), task_id=str(task_id),
+                        headers=get_task_routing_headers(transfer))
+                except Exception:
+                    # The transfer is re-enqueued by the recovery sweeper
+                    with database_access.unit_of_work():
+                        database_access.release_transfer_submission(
+                            internal_transfer_id, task_id)
+                        database_access.release_transfer_task(
+                            internal_transfer_id,
+                            TransferStep.SUBMIT_TRANSFER_ONCHAIN, task_id)
+                    raise
+                extra_info |= {'task_id': task_id}
+            _logger.info(
+                'token transfer submission to the destination blockchain '
+                'scheduled', extra=extra_info)
+            return True
+        except Exception:
+            raise self._create_error(
+                'unable to schedule a token transfer submission to the '
+                'destination blockchain',
+                internal_transfer_id=internal_transfer_id)
+
+    def submit_transfer_onchain(
+            self, internal_transfer_id: int, transfer: CrossChainTransfer,
+            task_id: typing.Optional[uuid.UUID] = None) -> bool:
         """Submit a cross-chain token transfer after its successful
         validation to the destination blockchain.
 
@@ -380,11 +808,17 @@ class TransferInteractor(Interactor):
             The unique internal ID of the transfer.
         transfer : CrossChainTransfer
             The data of the cross-chain token transfer to submit.
+        task_id : uuid.UUID, optional
+            The unique ID of the Celery task or scheduled processing
+            step executing the submission. If given, the submission is
+            only executed if it can be claimed for the task or step
+            (i.e. it has not been claimed by another one).
 
         Returns
         -------
         bool
-            True if the submission is completed for the transfer.
+            True if the submission is completed for the transfer (or
+            has been claimed by another task).
 
         Raises
         ------
@@ -411,12 +845,13 @@ class TransferInteractor(Interactor):
             destination_hub_address = destination_blockchain_config['hub']
             destination_forwarder_address = destination_blockchain_config[
                 'forwarder']
-            validator_nonce = database_access.\
-                read_validator_nonce_by_internal_transfer_id(
-                    internal_transfer_id)
+            with database_access.unit_of_work():
+                validator_nonce = database_access.\
+                    read_validator_nonce_by_internal_transfer_id(
+                        internal_transfer_id)
+                available_signatures = database_access.\
+                    read_validator_node_signatures(internal_transfer_id)
             assert validator_nonce is not None
-            available_signatures = database_access.\
-                read_validator_node_signatures(internal_transfer_id)
             extra_info |= {
                 'validator_nonce': validator_nonce,
                 'destination_hub_address': destination_hub_address,
@@ -424,12 +859,23 @@ class TransferInteractor(Interactor):
             }
 
             if not self.__sufficient_secondary_node_signatures(
-                    transfer, validator_nonce, available_signatures,
-                    destination_blockchain_client, extra_info):
+                    internal_transfer_id, destination_blockchain_client,
+                    extra_info):
                 _logger.info(
                     'insufficient signatures for submitting a token transfer '
                     'to the destination blockchain', extra=extra_info)
+                # Enable the submission to be scheduled immediately when
+                # the missing signatures are added
+                database_access.update_transfer_awaiting_signatures(
+                    internal_transfer_id)
                 return False
+            if (task_id is not None
+                    and not database_access.claim_transfer_submission(
+                        internal_transfer_id, task_id)):
+                _logger.info(
+                    'token transfer submission to the destination blockchain '
+                    'claimed by another task', extra=extra_info)
+                return True
             self.__add_primary_node_signature(available_signatures, transfer,
                                               validator_nonce,
                                               destination_hub_address,
@@ -445,23 +891,33 @@ class TransferInteractor(Interactor):
 
             primary_node_address = \
                 destination_blockchain_client.get_own_address()
-            self.__store_validator_node_signature(
-                internal_transfer_id, transfer.eventual_destination_blockchain,
-                destination_forwarder_address, primary_node_address,
-                available_signatures[primary_node_address])
-            database_access.update_transfer_submitted_destination_transaction(
-                internal_transfer_id, destination_hub_address,
-                destination_forwarder_address)
-            database_access.update_transfer_status(
-                internal_transfer_id,
-                TransferStatus.SOURCE_REVERSAL_TRANSACTION_SUBMITTED
-                if transfer.is_reversal_transfer else
-                TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
-            _schedule_task(confirm_transfer_task, internal_transfer_id,
-                           transfer, internal_transaction_id)
+            # The submitted transaction and the transfer's new status are
+            # stored atomically
+            with database_access.unit_of_work():
+                self.__store_validator_node_signature(
+                    internal_transfer_id,
+                    transfer.eventual_destination_blockchain,
+                    destination_forwarder_address, primary_node_address,
+                    available_signatures[primary_node_address])
+                database_access.\
+                    update_transfer_submitted_destination_transaction(
+                        internal_transfer_id, destination_hub_address,
+                        destination_forwarder_address)
+                database_access.update_transfer_status(
+                    internal_transfer_id,
+                    TransferStatus.SOURCE_REVERSAL_TRANSACTION_SUBMITTED
+                    if transfer.is_reversal_transfer else
+                    TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
+                # The transfer is confirmed by the destination
+                # blockchain's confirmation tracker (see
+                # confirm_transfers)
+                database_access.update_transfer_internal_transaction_id(
+                    internal_transfer_id, internal_transaction_id)
             return True
         except TransferInteractor.__PermanentTransferSubmissionError:
             return True
+        except TransferInteractor.__DeferredTransferSubmissionError:
+            return False
         except Exception:
             raise self._create_error(
                 'unable to submit a token transfer to the destination '
@@ -495,20 +951,32 @@ class TransferInteractor(Interactor):
             'interal_transfer_id': internal_transfer_id
         }
         _logger.info('validating a token transfer', extra=extra_info)
+        validator_nonce_future = self.__prefetch_validator_nonce(
+            internal_transfer_id, transfer, extra_info)
         try:
-            source_blockchain_client = get_blockchain_client(
-                transfer.source_blockchain)
-            destination_blockchain_client = get_blockchain_client(
-                transfer.destination_blockchain)
-            self.__validate_source_transaction_status(
-                internal_transfer_id, transfer, source_blockchain_client)
-            self.__validate_transfer_in_source_transaction(
-                internal_transfer_id, transfer, source_blockchain_client)
-            self.__validate_source_token_registration(
-                internal_transfer_id, transfer, source_blockchain_client)
-            self.__validate_destination_blockchain_feasibility(
-                internal_transfer_id, transfer, source_blockchain_client,
-                destination_blockchain_client)
+            source_blockchain_client = instrument_blockchain_client(
+                get_blockchain_client(transfer.source_blockchain))
+            destination_blockchain_client = instrument_blockchain_client(
+                get_blockchain_client(transfer.destination_blockchain))
+            chain_pair = (transfer.source_blockchain,
+                          transfer.destination_blockchain)
+            with measure_step('validate_source_transaction_status',
+                              *chain_pair):
+                self.__validate_source_transaction_status(
+                    internal_transfer_id, transfer, source_blockchain_client)
+            with measure_step('validate_transfer_in_source_transaction',
+                              *chain_pair):
+                self.__validate_transfer_in_source_transaction(
+                    internal_transfer_id, transfer, source_blockchain_client)
+            with measure_step('validate_source_token_registration',
+                              *chain_pair):
+                self.__validate_source_token_registration(
+                    internal_transfer_id, transfer, source_blockchain_client)
+            with measure_step('validate_destination_blockchain_feasibility',
+                              *chain_pair):
+                self.__validate_destination_blockchain_feasibility(
+                    internal_transfer_id, transfer, source_blockchain_client,
+                    destination_blockchain_client)
             _logger.info(
                 'incoming token transfer not feasible'
                 if transfer.is_reversal_transfer else
@@ -518,11 +986,14 @@ class TransferInteractor(Interactor):
                     internal_transfer_id,
                     transfer.eventual_destination_blockchain,
                     transfer.eventual_recipient_address,
-                    transfer.eventual_destination_token_address)
+                    transfer.eventual_destination_token_address,
+                    dict(transfer.to_dict()))
             if self._is_primary_node():
                 _schedule_task(submit_transfer_onchain_task,
                                internal_transfer_id, transfer)
-            else:
+            elif not self.__presign_transfer(internal_transfer_id, transfer,
+                                             validator_nonce_future,
+                                             extra_info):
                 _schedule_task(submit_transfer_to_primary_node_task,
                                internal_transfer_id, transfer)
             return True
@@ -535,6 +1006,9 @@ class TransferInteractor(Interactor):
                                      internal_transfer_id=internal_transfer_id,
                                      transfer=transfer)
 
+    class __DeferredTransferSubmissionError(Exception):
+        pass
+
     class __PermanentTransferSubmissionError(Exception):
         pass
 
@@ -551,6 +1025,116 @@ class TransferInteractor(Interactor):
         def is_permanent(self) -> bool:
             return False
 
+    def __complete_pending_signature_submission(
+            self, internal_transfer_id: int, transfer: CrossChainTransfer,
+            signature: str, post_error: typing.Optional[Exception]) -> None:
+        extra_info = vars(transfer) | {
+            'internal_transfer_id': internal_transfer_id
+        }
+        try:
+            if (post_error is None or isinstance(
+                    post_error, PrimaryNodeDuplicateSignatureError)):
+                with database_access.unit_of_work():
+                    self.__complete_signature_submission(
+                        internal_transfer_id, transfer, signature)
+                    database_access.delete_pending_transfer_signature(
+                        internal_transfer_id)
+                return
+            _logger.warning(
+                'presigned token transfer signature rejected by the '
+                'primary node', extra=extra_info | {'error': str(post_error)})
+            # The regularly scheduled submission fetches the validator
+            # nonce again (the transfer is re-enqueued by the recovery
+            # sweeper if it cannot be scheduled)
+            database_access.delete_pending_transfer_signature(
+                internal_transfer_id)
+            _schedule_task(submit_transfer_to_primary_node_task,
+                           internal_transfer_id, transfer)
+        except Exception:
+            _logger.error(
+                'unable to complete the submission of a presigned token '
+                'transfer signature', extra=extra_info, exc_info=True)
+
+    def __complete_signature_submission(self, internal_transfer_id: int,
+                                        transfer: CrossChainTransfer,
+                                        signature: str) -> None:
+        destination_blockchain_config = get_blockchain_config(
+            transfer.eventual_destination_blockchain)
+        destination_hub_address = destination_blockchain_config['hub']
+        destination_forwarder_address = destination_blockchain_config[
+            'forwarder']
+        own_address = get_blockchain_client(
+            transfer.eventual_destination_blockchain).get_own_address()
+        self.__store_validator_node_signature(
+            internal_transfer_id, transfer.eventual_destination_blockchain,
+            destination_forwarder_address, own_address, signature)
+        database_access.update_transfer_submitted_destination_transaction(
+            internal_transfer_id, destination_hub_address,
+            destination_forwarder_address)
+        database_access.update_transfer_status(
+            internal_transfer_id,
+            TransferStatus.SOURCE_REVERSAL_TRANSACTION_SUBMITTED
+            if transfer.is_reversal_transfer else
+            TransferStatus.DESTINATION_TRANSACTION_SUBMITTED)
+
+    def __confirm_submitted_transfer(
+        self, unconfirmed_transfer: UnconfirmedTransferResponse,
+        status_responses: dict[
+            uuid.UUID,
+            BlockchainClient.TransferToSubmissionStatusResponse | None],
+        transfer_data: dict[int, dict[str, typing.Any]]
+    ) -> typing.Optional[TransferConfirmationRequest]:
+        internal_transfer_id = unconfirmed_transfer.internal_transfer_id
+        internal_transaction_id = unconfirmed_transfer.internal_transaction_id
+        if internal_transfer_id not in transfer_data:
+            raise self._create_unknown_transfer_error(
+                internal_transfer_id=internal_transfer_id,
+                internal_transaction_id=internal_transaction_id)
+        transfer = CrossChainTransfer.from_dict(
+            typing.cast(CrossChainTransferDict,
+                        transfer_data[internal_transfer_id]))
+        extra_info = vars(transfer) | {
+            'interal_transfer_id': internal_transfer_id,
+            'internal_transaction_id': internal_transaction_id
+        }
+        if internal_transaction_id not in status_responses:
+            raise self._create_error(
+                'transferTo submission status not retrieved', **extra_info)
+        status_response = status_responses[internal_transaction_id]
+        if status_response is None:
+            _logger.error('incoming token transfer failed', extra=extra_info)
+            self.__restart_validation(internal_transfer_id, transfer)
+            return None
+        if not status_response.transaction_submission_completed:
+            return None
+        extra_info |= {
+            'destination_transaction_id': status_response.transaction_id,
+            'destination_block_number': status_response.block_number
+        }
+        if status_response.transaction_status is TransactionStatus.REVERTED:
+            _logger.warning('incoming token transfer reverted',
+                            extra=extra_info)
+            self.__restart_validation(internal_transfer_id, transfer)
+            return None
+        assert (status_response.transaction_status
+                is TransactionStatus.CONFIRMED)
+        extra_info |= {
+            'destination_transfer_id': status_response.destination_transfer_id
+        }
+        _logger.info('incoming token transfer confirmed', extra=extra_info)
+        assert status_response.transaction_id is not None
+        assert status_response.block_number is not None
+        assert status_response.destination_transfer_id is not None
+        self.__record_transfer_to_gas_usage(
+            internal_transfer_id, transfer.eventual_destination_blockchain,
+            status_response.gas_used)
+        return TransferConfirmationRequest(
+            internal_transfer_id, status_response.destination_transfer_id,
+            status_response.transaction_id, status_response.block_number,
+            TransferStatus.SOURCE_REVERSAL_TRANSACTION_CONFIRMED
+            if transfer.is_reversal_transfer else
+            TransferStatus.DESTINATION_TRANSACTION_CONFIRMED)
+
     def __add_primary_node_signature(
             self, signatures: dict[BlockchainAddress,
                                    str], transfer: CrossChainTransfer,
@@ -580,7 +1164,7 @@ class TransferInteractor(Interactor):
             database_access.create_validator_node_signature(
                 internal_transfer_id, destination_blockchain,
                 destination_forwarder_address, validator_node_address,
-                signature)
+                signature, verified=True)
 
     def __find_unused_validator_nonce(
             self, destination_blockchain: Blockchain) -> int:
@@ -592,15 +1176,161 @@ class TransferInteractor(Interactor):
                     validator_nonce):
                 return validator_nonce
 
+    def __prefetch_validator_nonce(
+        self, internal_transfer_id: int, transfer: CrossChainTransfer,
+        extra_info: dict[str, typing.Any]
+    ) -> typing.Optional[concurrent.futures.Future[int]]:
+        # In pipeline mode, a secondary node speculatively fetches the
+        # validator nonce from the primary node while the transfer is
+        # still being validated (never failing the validation itself)
+        try:
+            if (self._is_primary_node()
+                    or not config['application']['presign_transfers']):
+                return None
+            # The validator nonce is prefetched only once per transfer,
+            # so that retries of the validation reuse it
+            validator_nonce = database_access.read_prefetched_validator_nonce(
+                internal_transfer_id)
+            if validator_nonce is not None:
+                validator_nonce_future: concurrent.futures.Future[int] = \
+                    concurrent.futures.Future()
+                validator_nonce_future.set_result(validator_nonce)
+                return validator_nonce_future
+            primary_node_client = PrimaryNodeClient(
+                config['application']['primary_url'])
+            get_request = PrimaryNodeClient.ValidatorNonceGetRequest(
+                transfer.source_blockchain, transfer.source_transaction_id)
+            return _get_validator_nonce_prefetch_executor().submit(
+                _prefetch_validator_nonce, internal_transfer_id,
+                primary_node_client, get_request)
+        except Exception:
+            _logger.warning('unable to prefetch a validator nonce',
+                            extra=extra_info, exc_info=True)
+            return None
+
+    def __process_scheduled_transfer(
+            self, step: TransferStep,
+            scheduled_transfer: ScheduledTransferResponse) -> None:
+        internal_transfer_id = scheduled_transfer.internal_transfer_id
+        extra_info = {
+            'internal_transfer_id': internal_transfer_id,
+            'step': step.name
+        }
+        step_error: typing.Optional[Exception] = None
+        try:
+            transfer = self.load_transfer(internal_transfer_id)
+            if step is TransferStep.VALIDATE_TRANSFER:
+                step_completed = self.validate_transfer(
+                    internal_transfer_id, transfer)
+            elif step is TransferStep.SUBMIT_TRANSFER_TO_PRIMARY_NODE:
+                step_completed = self.submit_transfer_to_primary_node(
+                    internal_transfer_id, transfer)
+            else:
+                # The submission is claimed for the scheduled step so
+                # that it is executed only once even if the step is
+                # scheduled again (e.g. by a late signature)
+                step_completed = self.submit_transfer_onchain(
+                    internal_transfer_id, transfer,
+                    task_id=scheduled_transfer.schedule_id)
+        except Exception as error:
+            _logger.error('unable to execute a scheduled token transfer step',
+                          extra=extra_info, exc_info=True)
+            step_completed = False
+            step_error = error
+        try:
+            if step_completed:
+                database_access.reset_transfer_schedule(
+                    internal_transfer_id, step)
+            else:
+                retry_interval = _get_retry_interval(
+                    step.name.lower(), scheduled_transfer.attempts, step_error)
+                database_access.update_transfer_next_attempt(
+                    internal_transfer_id, step, retry_interval)
+        except Exception:
+            # The step is attempted again when the transfer's lease
+            # has expired
+            _logger.error('unable to update a scheduled token transfer step',
+                          extra=extra_info, exc_info=True)
+
+    def __record_transfer_to_gas_usage(self, internal_transfer_id: int,
+                                       destination_blockchain: Blockchain,
+                                       gas_used: typing.Optional[int]) -> None:
+        if gas_used is None:
+            return
+        try:
+            # The transferTo transaction has been submitted with all
+            # stored validator node signatures
+            number_signers = len(
+                database_access.read_validator_node_signatures(
+                    internal_transfer_id))
+            database_access.create_transfer_to_gas_usage(
+                destination_blockchain, number_signers, gas_used,
+                _TRANSFER_TO_GAS_SAMPLES)
+        except Exception:
+            # Learning the gas usage must not prevent the confirmation
+            # of the transfer
+            _logger.warning(
+                'unable to record the gas usage of a transferTo '
+                'transaction', extra={
+                    'internal_transfer_id': internal_transfer_id,
+                    'gas_used': gas_used
+                }, exc_info=True)
+
+    def __forget_transfer_to_submissions(
+            self, internal_transaction_ids: list[uuid.UUID]) -> None:
+        # The internal transaction IDs are the IDs of the blockchain
+        # utilities' transaction resubmission tasks, whose results are
+        # no longer needed once the confirmation is completed
+        if len(internal_transaction_ids) == 0:
+            return
+        try:
+            forget_task_results(internal_transaction_ids)
+        except Exception:
+            _logger.error(
+                'unable to delete the results of completed transferTo '
+                'submissions',
+                extra={'internal_transaction_ids': internal_transaction_ids},
+                exc_info=True)
+
+    def __recover_orphaned_transfer(self, internal_transfer_id: int,
+                                    delay: int) -> bool:
+        extra_info = {'internal_transfer_id': internal_transfer_id}
+        try:
+            transfer = self.load_transfer(internal_transfer_id)
+            _logger.warning('re-enqueueing an orphaned token transfer',
+                            extra=extra_info)
+            # The claims of the lost tasks would otherwise prevent the
+            # transfer from ever being processed again
+            with database_access.unit_of_work():
+                database_access.reset_transfer_submission(internal_transfer_id)
+                database_access.release_stale_transfer_tasks(
+                    internal_transfer_id,
+                    config['recovery']['stale_after_in_seconds'])
+            task_id = _schedule_task(validate_transfer_task,
+                                     internal_transfer_id, transfer, delay)
+            if task_id is not None:
+                database_access.update_transfer_task_id(
+                    internal_transfer_id, task_id)
+            return True
+        except Exception:
+            _logger.error('unable to re-enqueue an orphaned token transfer',
+                          extra=extra_info, exc_info=True)
+            return False
+
     def __restart_validation(self, internal_transfer_id: int,
                              transfer: CrossChainTransfer) -> None:
-        database_access.reset_transfer_nonce(internal_transfer_id)
-        database_access.update_transfer_status(
-            internal_transfer_id, TransferStatus.SOURCE_TRANSACTION_DETECTED)
-        task_result = _schedule_task(validate_transfer_task,
-                                     internal_transfer_id, transfer)
-        task_id = uuid.UUID(task_result.id)
-        database_access.update_transfer_task_id(internal_transfer_id, task_id)
+        with database_access.unit_of_work():
+            database_access.reset_transfer_nonce(internal_transfer_id)
+            database_access.reset_transfer_submission(internal_transfer_id)
+            database_access.release_transfer_tasks(internal_transfer_id)
+            database_access.update_transfer_status(
+                internal_transfer_id,
+                TransferStatus.SOURCE_TRANSACTION_DETECTED)
+        task_id = _schedule_task(validate_transfer_task, internal_transfer_id,
+                                 transfer)
+        if task_id is not None:
+            database_access.update_transfer_task_id(internal_transfer_id,
+                                                    task_id)
 
     def __submit_transaction(
             self, internal_transfer_id: int, transfer: CrossChainTransfer,
@@ -611,6 +1341,13 @@ class TransferInteractor(Interactor):
         try:
             return destination_blockchain_client.start_transfer_to_submission(
                 request)
+        except PendingTransactionsLimitReachedError as error:
+            # The submission is retried once some of the pending
+            # transactions have been included in a block
+            _logger.info(
+                'maximum number of pending transactions reached on the '
+                'destination blockchain', extra=error.details)
+            raise TransferInteractor.__DeferredTransferSubmissionError
         except (NonMatchingForwarderError,
                 SourceTransferIdAlreadyUsedError) as error:
             _logger.error(
@@ -632,42 +1369,72 @@ class TransferInteractor(Interactor):
                 TransferStatus.DESTINATION_TRANSACTION_FAILED)
             raise
 
+    def __presign_transfer(self, internal_transfer_id: int,
+                           transfer: CrossChainTransfer,
+                           validator_nonce_future: typing.Optional[
+                               concurrent.futures.Future[int]],
+                           extra_info: dict[str, typing.Any]) -> bool:
+        if validator_nonce_future is None:
+            return False
+        try:
+            validator_nonce = validator_nonce_future.result()
+            destination_blockchain_config = get_blockchain_config(
+                transfer.eventual_destination_blockchain)
+            sign_request = BlockchainClient.TransferToMessageSignRequest(
+                transfer, validator_nonce,
+                destination_blockchain_config['hub'],
+                destination_blockchain_config['forwarder'])
+            signature = get_blockchain_client(
+                transfer.eventual_destination_blockchain).\
+                sign_transfer_to_message(sign_request)
+            # The signature is queued in the database and posted to the
+            # primary node together with other pending signatures (see
+            # submit_pending_transfer_signatures), independently of the
+            # lifetime of the validation task
+            database_access.create_pending_transfer_signature(
+                internal_transfer_id, signature)
+            return True
+        except Exception:
+            # The regularly scheduled submission remains as a fallback
+            _logger.warning('unable to presign a token transfer',
+                            extra=extra_info, exc_info=True)
+            return False
+
     def __sufficient_secondary_node_signatures(
-            self, transfer: CrossChainTransfer, validator_nonce: int,
-            signatures: dict[BlockchainAddress, str],
+            self, internal_transfer_id: int,
             destination_blockchain_client: BlockchainClient,
             extra_info: dict[str, typing.Any]) -> bool:
         assert self._is_primary_node()
-        valid_signatures = 1  # Primary node signature
+        # Secondary node signatures are verified before they are stored,
+        # so only the verified signatures have to be counted here
         primary_node_address = destination_blockchain_client.get_own_address()
-        for signer_address, signature in signatures.items():
-            if signer_address == primary_node_address:
-                continue
-            signer_recovery_request = \
-                BlockchainClient.TransferToSignerAddressRecoveryRequest(
-                    transfer.source_blockchain, transfer.source_transaction_id,
-                    transfer.source_transfer_id, transfer.sender_address,
-                    transfer.recipient_address, transfer.source_token_address,
-                    transfer.eventual_destination_token_address,
-                    transfer.amount, validator_nonce, signature)
-            try:
-                recovered_signer_address = destination_blockchain_client.\
-                    recover_transfer_to_signer_address(signer_recovery_request)
-            except BlockchainClientError:
-                _logger.critical(
-                    'invalid secondary node signature for submitting a token '
-                    'transfer to the destination blockchain',
-                    extra=extra_info | {
-                        'signer_address': signer_address,
-                        'signature': signature
-                    }, exc_info=True)
-                continue
-            assert destination_blockchain_client.is_equal_address(
-                signer_address, recovered_signer_address)
-            valid_signatures += 1
+        verified_signatures = database_access.\
+            read_number_verified_validator_node_signatures(
+                internal_transfer_id, primary_node_address)
+        valid_signatures = verified_signatures + 1  # Primary node signature
+        minimum_signatures = self.__read_minimum_validator_node_signatures(
+            destination_blockchain_client)
+        extra_info |= {
+            'valid_signatures': valid_signatures,
+            'minimum_signatures': minimum_signatures
+        }
+        return valid_signatures >= minimum_signatures
+
+    def __read_minimum_validator_node_signatures(
+            self, destination_blockchain_client: BlockchainClient) -> int:
+        destination_blockchain = destination_blockchain_client.get_blockchain()
+        cached_minimum_signatures = _minimum_signatures_cache.get(
+            destination_blockchain)
+        if (cached_minimum_signatures is not None
+                and time.monotonic() < cached_minimum_signatures[1]):
+            record_cache_hit()
+            return cached_minimum_signatures[0]
         minimum_signatures = destination_blockchain_client.\
             read_minimum_validator_node_signatures()
-        return valid_signatures >= minimum_signatures
+        _minimum_signatures_cache[destination_blockchain] = (
+            minimum_signatures,
+            time.monotonic() + _MINIMUM_SIGNATURES_CACHE_EXPIRY)
+        return minimum_signatures
 
     def __validate_destination_blockchain_feasibility(
             self, internal_transfer_id: int, transfer: CrossChainTransfer,
@@ -778,6 +1545,16 @@ class TransferInteractor(Interactor):
     def __validate_transfer_in_source_transaction(
             self, internal_transfer_id: int, transfer: CrossChainTransfer,
             source_blockchain_client: BlockchainClient) -> None:
+        # The transfer was decoded from the transaction's event logs
+        # during its detection, so the transaction receipt only needs to
+        # be read again if the transaction's block is no longer part of
+        # the canonical chain
+        block_hashes = source_blockchain_client.read_block_hashes(
+            [transfer.source_block_number])
+        if (block_hashes.get(
+                transfer.source_block_number) == transfer.source_block_hash):
+            record_cache_hit()
+            return
         transfers_in_transaction = source_blockchain_client.\
             read_outgoing_transfers_in_transaction(
                 transfer.source_transaction_id, transfer.source_hub_address)
@@ -798,7 +1575,7 @@ class TransferInteractor(Interactor):
                     transfer_found = True
                     database_access.update_transfer_source_transaction(
                         internal_transfer_id, transfer.source_transfer_id,
-                        transfer.source_block_number)
+                        transfer.source_block_number, dict(transfer.to_dict()))
                     break
             if not transfer_found:
                 raise self._create_error(
@@ -852,12 +1629,14 @@ class TransferInteractor(Interactor):
         assert transaction_status is TransactionStatus.CONFIRMED
 
 
-@celery_app.task(bind=True, max_retries=None)
+@celery_app.task(bind=True, max_retries=None, ignore_result=True)
 def confirm_transfer_task(self, internal_transfer_id: int,
                           internal_transaction_id: str,
                           transfer_dict: CrossChainTransferDict) -> bool:
     """Celery task for confirming a cross-chain token transfer on the
-    (eventual) destination blockchain.
+    (eventual) destination blockchain. Only still used for the
+    confirmations scheduled individually before the introduction of
+    the per-blockchain confirmation trackers.
 
     Parameters
     ----------
@@ -887,18 +1666,19 @@ def confirm_transfer_task(self, internal_transfer_id: int,
                 'internal_transaction_id': internal_transaction_id,
                 'task_id': self.request.id
             }, exc_info=True)
-        retry_interval = _get_task_interval(self, after_error=True)
+        retry_interval = _get_task_retry_interval(self, error)
         raise self.retry(countdown=retry_interval, exc=error)
     if not confirmation_completed:
-        retry_interval = _get_task_interval(self)
+        retry_interval = _get_task_retry_interval(self)
         raise self.retry(countdown=retry_interval)
     return True
 
 
-@celery_app.task(bind=True, max_retries=None)
+@celery_app.task(bind=True, max_retries=None, ignore_result=True)
 def submit_transfer_to_primary_node_task(
         self, internal_transfer_id: int,
-        transfer_dict: CrossChainTransferDict) -> bool:
+        transfer_dict: typing.Optional[CrossChainTransferDict] = None) \
+        -> bool:
     """Celery task for submitting the signature for a cross-chain token
     transfer after its successful validation to the primary validator
     node.
@@ -907,8 +1687,10 @@ def submit_transfer_to_primary_node_task(
     ----------
     internal_transfer_id : int
         The unique internal ID of the transfer.
-    transfer_dict : CrossChainTransferDict
-        The data of the cross-chain token transfer to submit.
+    transfer_dict : CrossChainTransferDict, optional
+        The data of the cross-chain token transfer to submit (only
+        given for tasks scheduled before the transfer data was stored
+        in the database).
 
     Returns
     -------
@@ -916,30 +1698,34 @@ def submit_transfer_to_primary_node_task(
         True if the task is executed without error.
 
     """
-    transfer = CrossChainTransfer.from_dict(transfer_dict)
     try:
+        transfer_interactor = TransferInteractor()
+        transfer = transfer_interactor.load_transfer(internal_transfer_id,
+                                                     transfer_dict)
+        if not _start_task(self, internal_transfer_id, transfer_dict):
+            return True
         submission_completed = \
-            TransferInteractor().submit_transfer_to_primary_node(
+            transfer_interactor.submit_transfer_to_primary_node(
                 internal_transfer_id, transfer)
     except Exception as error:
         _logger.error(
             'unable to submit the signature for a token transfer to the '
-            'primary validator node', extra=vars(transfer) | {
+            'primary validator node', extra={
                 'internal_transfer_id': internal_transfer_id,
                 'task_id': self.request.id
             }, exc_info=True)
-        retry_interval = _get_task_interval(self, after_error=True)
-        raise self.retry(countdown=retry_interval, exc=error)
+        raise _retry_task(self, internal_transfer_id, error)
     if not submission_completed:
-        retry_interval = _get_task_interval(self)
-        raise self.retry(countdown=retry_interval)
+        raise _retry_task(self, internal_transfer_id)
+    _release_task(self, internal_transfer_id)
     return True
 
 
-@celery_app.task(bind=True, max_retries=None)
+@celery_app.task(bind=True, max_retries=None, ignore_result=True)
 def submit_transfer_onchain_task(
         self, internal_transfer_id: int,
-        transfer_dict: CrossChainTransferDict) -> bool:
+        transfer_dict: typing.Optional[CrossChainTransferDict] = None) \
+        -> bool:
     """Celery task for submitting a cross-chain token transfer after its
     successful validation to the destination blockchain.
 
@@ -947,8 +1733,10 @@ def submit_transfer_onchain_task(
     ----------
     internal_transfer_id : int
         The unique internal ID of the transfer.
-    transfer_dict : CrossChainTransferDict
-        The data of the cross-chain token transfer to submit.
+    transfer_dict : CrossChainTransferDict, optional
+        The data of the cross-chain token transfer to submit (only
+        given for tasks scheduled before the transfer data was stored
+        in the database).
 
     Returns
     -------
@@ -956,37 +1744,45 @@ def submit_transfer_onchain_task(
         True if the task is executed without error.
 
     """
-    transfer = CrossChainTransfer.from_dict(transfer_dict)
     try:
-        submission_completed = TransferInteractor().submit_transfer_onchain(
-            internal_transfer_id, transfer)
+        task_id = (None
+                   if self.request.id is None else uuid.UUID(self.request.id))
+        transfer_interactor = TransferInteractor()
+        transfer = transfer_interactor.load_transfer(internal_transfer_id,
+                                                     transfer_dict)
+        if not _start_task(self, internal_transfer_id, transfer_dict):
+            return True
+        submission_completed = transfer_interactor.submit_transfer_onchain(
+            internal_transfer_id, transfer, task_id)
     except Exception as error:
         _logger.error(
             'unable to submit a token transfer to the destination blockchain',
-            extra=vars(transfer)
-            | {
+            extra={
                 'internal_transfer_id': internal_transfer_id,
                 'task_id': self.request.id
             }, exc_info=True)
-        retry_interval = _get_task_interval(self, after_error=True)
-        raise self.retry(countdown=retry_interval, exc=error)
+        raise _retry_task(self, internal_transfer_id, error)
     if not submission_completed:
-        retry_interval = _get_task_interval(self)
-        raise self.retry(countdown=retry_interval)
+        raise _retry_task(self, internal_transfer_id)
+    _release_task(self, internal_transfer_id)
     return True
 
 
-@celery_app.task(bind=True, max_retries=None)
-def validate_transfer_task(self, internal_transfer_id: int,
-                           transfer_dict: CrossChainTransferDict) -> bool:
+@celery_app.task(bind=True, max_retries=None, ignore_result=True)
+def validate_transfer_task(
+        self, internal_transfer_id: int,
+        transfer_dict: typing.Optional[CrossChainTransferDict] = None) \
+        -> bool:
     """Celery task for validating a cross-chain token transfer.
 
     Parameters
     ----------
     internal_transfer_id : int
         The unique internal ID of the transfer.
-    transfer_dict : CrossChainTransferDict
-        The data of the cross-chain token transfer to validate.
+    transfer_dict : CrossChainTransferDict, optional
+        The data of the cross-chain token transfer to validate (only
+        given for tasks scheduled before the transfer data was stored
+        in the database).
 
     Returns
     -------
@@ -994,45 +1790,217 @@ def validate_transfer_task(self, internal_transfer_id: int,
         True if the task is executed without error.
 
     """
-    transfer = CrossChainTransfer.from_dict(transfer_dict)
     try:
-        validation_completed = TransferInteractor().validate_transfer(
+        transfer_interactor = TransferInteractor()
+        transfer = transfer_interactor.load_transfer(internal_transfer_id,
+                                                     transfer_dict)
+        if not _start_task(self, internal_transfer_id, transfer_dict):
+            return True
+        validation_completed = transfer_interactor.validate_transfer(
             internal_transfer_id, transfer)
     except Exception as error:
         _logger.error(
-            'unable to validate a token transfer', extra=vars(transfer)
-            | {
+            'unable to validate a token transfer', extra={
                 'internal_transfer_id': internal_transfer_id,
                 'task_id': self.request.id
             }, exc_info=True)
-        retry_interval = _get_task_interval(self, after_error=True)
-        raise self.retry(countdown=retry_interval, exc=error)
+        raise _retry_task(self, internal_transfer_id, error)
     if not validation_completed:
-        retry_interval = _get_task_interval(self)
-        raise self.retry(countdown=retry_interval)
+        raise _retry_task(self, internal_transfer_id)
+    _release_task(self, internal_transfer_id)
     return True
 
 
-def _get_task_interval(task, after_error: bool = False) -> int:
-    task_name = _get_task_name(task)
+def _get_interval(task_name: str, after_error: bool = False) -> int:
     interval_name = ('retry_interval_after_error_in_seconds'
                      if after_error else 'retry_interval_in_seconds')
     return config['tasks'][task_name][interval_name]
 
 
+def _get_primary_node_batcher(batcher_class: type,
+                              primary_node_client: PrimaryNodeClient,
+                              batch_window: float) -> typing.Any:
+    key = (batcher_class, config['application']['primary_url'])
+    with _primary_node_batchers_lock:
+        batcher = _primary_node_batchers.get(key)
+        if batcher is None:
+            # The batcher coalesces the requests issued concurrently by
+            # the worker threads of this process
+            batcher = batcher_class(primary_node_client, batch_window)
+            _primary_node_batchers[key] = batcher
+    return batcher
+
+
+def _get_primary_node_batch_window() -> float:
+    batch_window = config['application'][
+        'primary_node_batch_window_in_seconds']
+    # Only the threads of a worker running the threads pool issue
+    # requests to the primary node concurrently; a worker process of the
+    # prefork pool executes a single task at a time, so that its
+    # requests would only be delayed by the batch window
+    if batch_window <= 0 or config['celery']['worker_pool'] != 'threads':
+        return 0
+    return batch_window
+
+
+def _get_retry_interval(task_name: str, attempt: int,
+                        error: Exception | None = None) -> int:
+    retry_reason = classify_error(error)
+    retry_policy = RetryPolicy.from_config(
+        config['retries'][retry_reason.to_config_key()])
+    retry_interval = retry_policy.get_interval(
+        _get_interval(task_name, after_error=error is not None), attempt)
+    record_task_retry(task_name, retry_reason.to_config_key(), attempt,
+                      retry_interval)
+    return retry_interval
+
+
+def _get_task_interval(task) -> int:
+    return _get_interval(_get_task_name(task))
+
+
 def _get_task_name(task) -> str:
     assert task.__name__.endswith('_task')
     return task.__name__[:-5]
 
 
-def _schedule_task(
-        task, internal_transfer_id: int, transfer: CrossChainTransfer,
-        internal_transaction_id: uuid.UUID | None = None) \
-        -> celery.result.AsyncResult:
-    transfer_dict = transfer.to_dict()
-    args = ((internal_transfer_id,
-             transfer_dict) if internal_transaction_id is None else
-            (internal_transfer_id, str(internal_transaction_id),
-             transfer_dict))
-    countdown = _get_task_interval(task)
-    return task.apply_async(args=args, countdown=countdown)
+def _get_task_retry_interval(task, error: Exception | None = None) -> int:
+    return _get_retry_interval(_get_task_name(task), task.request.retries,
+                               error)
+
+
+def _get_validator_nonce(
+        primary_node_client: PrimaryNodeClient,
+        request: PrimaryNodeClient.ValidatorNonceGetRequest) -> int:
+    batch_window = _get_primary_node_batch_window()
+    if batch_window <= 0:
+        return primary_node_client.get_validator_nonce(request)
+    return _get_primary_node_batcher(ValidatorNonceBatcher,
+                                     primary_node_client,
+                                     batch_window).get_validator_nonce(request)
+
+
+def _get_validator_nonce_prefetch_executor() \
+        -> concurrent.futures.ThreadPoolExecutor:
+    global _validator_nonce_prefetch_executor
+    with _validator_nonce_prefetch_executor_lock:
+        if _validator_nonce_prefetch_executor is None:
+            # Created lazily since Celery worker processes are forked
+            _validator_nonce_prefetch_executor = \
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_VALIDATOR_NONCE_PREFETCH_THREADS,
+                    thread_name_prefix='validator-nonce-prefetch')
+        return _validator_nonce_prefetch_executor
+
+
+def _post_transfer_signature(
+        primary_node_client: PrimaryNodeClient,
+        request: PrimaryNodeClient.TransferSignaturePostRequest) -> None:
+    batch_window = _get_primary_node_batch_window()
+    if batch_window <= 0:
+        primary_node_client.post_transfer_signature(request)
+        return
+    _get_primary_node_batcher(TransferSignatureBatcher, primary_node_client,
+                              batch_window).post_transfer_signature(request)
+
+
+def _prefetch_validator_nonce(
+        internal_transfer_id: int, primary_node_client: PrimaryNodeClient,
+        request: PrimaryNodeClient.ValidatorNonceGetRequest) -> int:
+    validator_nonce = _get_validator_nonce(primary_node_client, request)
+    # Stored right away so that the validator nonce is available even
+    # if the validation waiting for it fails
+    database_access.update_transfer_prefetched_validator_nonce(
+        internal_transfer_id, validator_nonce)
+    return validator_nonce
+
+
+def _release_task(task, internal_transfer_id: int) -> None:
+    if task.request.id is None:
+        return
+    step = TransferStep[_get_task_name(task).upper()]
+    try:
+        database_access.release_transfer_task(internal_transfer_id, step,
+                                              uuid.UUID(task.request.id))
+    except Exception:
+        # The claim is released by the recovery sweeper at the latest
+        _logger.error(
+            'unable to release a completed transfer task', extra={
+                'internal_transfer_id': internal_transfer_id,
+                'task_id': task.request.id
+            }, exc_info=True)
+
+
+def _start_task(
+        task, internal_transfer_id: int,
+        transfer_dict: typing.Optional[CrossChainTransferDict]) -> bool:
+    # Tasks scheduled before the claims were introduced carry the
+    # transfer data and have no claim
+    if task.request.id is None or transfer_dict is not None:
+        return True
+    step = TransferStep[_get_task_name(task).upper()]
+    # Also enables the recovery sweeper to distinguish a running task
+    # from a lost one
+    if database_access.update_transfer_task_heartbeat(
+            internal_transfer_id, step, uuid.UUID(task.request.id)):
+        return True
+    _logger.warning(
+        'claim of a transfer task released in the meantime', extra={
+            'internal_transfer_id': internal_transfer_id,
+            'task_id': task.request.id
+        })
+    return False
+
+
+def _retry_task(task, internal_transfer_id: int,
+                error: Exception | None = None) -> Exception:
+    retry_interval = _get_task_retry_interval(task, error)
+    try:
+        # Enables the recovery sweeper to distinguish a task that is
+        # still being retried from a lost one
+        database_access.update_transfer_task_next_attempt(
+            internal_transfer_id, retry_interval)
+    except Exception:
+        _logger.warning(
+            'unable to record the next retry of a transfer task', extra={
+                'internal_transfer_id': internal_transfer_id,
+                'task_id': task.request.id
+            }, exc_info=True)
+    return task.retry(countdown=retry_interval, exc=error)
+
+
+def _schedule_task(task, internal_transfer_id: int,
+                   transfer: CrossChainTransfer,
+                   delay: int = 0) -> typing.Optional[uuid.UUID]:
+    countdown = _get_task_interval(task) + delay
+    step = TransferStep[_get_task_name(task).upper()]
+    if config['scheduler']['enabled']:
+        # The equivalent processing step is claimed by a scheduler
+        # worker once it is due (no Celery task ID in this case)
+        database_access.update_transfer_schedule(internal_transfer_id, step,
+                                                 countdown)
+        return None
+    # At most one task is in flight per transfer and processing step,
+    # so scheduling a step again is a cheap no-op until the task in
+    # flight has completed
+    task_id = uuid.uuid4()
+    if not database_access.claim_transfer_task(internal_transfer_id, step,
+                                               task_id):
+        _logger.info(
+            'transfer task already in flight', extra={
+                'internal_transfer_id': internal_transfer_id,
+                'step': step.name
+            })
+        return None
+    # The task only carries the internal transfer ID and loads the
+    # transfer data from the database, while the transfer's blockchains
+    # are given in the message headers for routing the task
+    try:
+        task.apply_async(args=(internal_transfer_id, ), task_id=str(task_id),
+                         countdown=countdown,
+                         headers=get_task_routing_headers(transfer))
+    except Exception:
+        database_access.release_transfer_task(internal_transfer_id, step,
+                                              task_id)
+        raise
+    return task_id
@@ -5,22 +5,111 @@ import logging
 import os
 import pathlib
 import sys
+import typing
+import uuid
 
 import celery  # type: ignore
 import certifi  # type: ignore
+import kombu  # type: ignore
+from vision.common.blockchains.enums import Blockchain
 from vision.common.logging import LogFile
 from vision.common.logging import LogFormat
 from vision.common.logging import initialize_logger
 
 from vision.validatornode.application import initialize_application
 from vision.validatornode.configuration import config
+from vision.validatornode.configuration import get_blockchain_config
 from vision.validatornode.configuration import load_config
 from vision.validatornode.database import get_engine
+from vision.validatornode.entities import CrossChainTransfer
+from vision.validatornode.metrics import enable_metrics_export
+from vision.validatornode.metrics import export_metrics
+
+_DEFAULT_TASK_QUEUE = 'vision.validatornode'
+"""Queue of all tasks not routed to a stage- and blockchain-specific
+queue."""
+
+_TRANSFER_TASK_PREFIX = 'vision.validatornode.business.transfers.'
+"""Prefix of the names of the transfer tasks."""
+
+_TASK_STAGES = {
+    _TRANSFER_TASK_PREFIX + 'validate_transfer_task': 'validate',
+    _TRANSFER_TASK_PREFIX + 'submit_transfer_to_primary_node_task': 'sign',
+    _TRANSFER_TASK_PREFIX + 'submit_transfer_onchain_task': 'submit',
+    _TRANSFER_TASK_PREFIX + 'confirm_transfer_task': 'confirm'
+}
+"""Processing stages of the transfer tasks."""
+
+_SOURCE_BLOCKCHAIN_HEADER = 'vision_source_blockchain_id'
+"""Message header with the source blockchain of a transfer task."""
+
+_DESTINATION_BLOCKCHAIN_HEADER = 'vision_destination_blockchain_id'
+"""Message header with the (eventual) destination blockchain of a
+transfer task."""
 
 _logger = logging.getLogger(__name__)
 """Logger for this module."""
 
 
+def forget_task_results(task_ids: typing.Iterable[uuid.UUID]) -> None:
+    """Delete the results of finished tasks from the Celery result
+    backend.
+
+    Parameters
+    ----------
+    task_ids : iterable of uuid.UUID
+        The unique IDs of the tasks.
+
+    """
+    for task_id in task_ids:
+        celery_app.AsyncResult(str(task_id)).forget()
+
+
+def get_task_queue_name(stage: str, blockchain: Blockchain) -> str:
+    """Get the name of the queue for the tasks of a processing stage and
+    blockchain.
+
+    Parameters
+    ----------
+    stage : str
+        The processing stage of the tasks (validate, sign, submit, or
+        confirm).
+    blockchain : Blockchain
+        The blockchain the tasks are routed by (the source blockchain
+        for the validation, the (eventual) destination blockchain for
+        all other stages).
+
+    Returns
+    -------
+    str
+        The name of the queue.
+
+    """
+    return f'{_DEFAULT_TASK_QUEUE}.{stage}.{blockchain.name.lower()}'
+
+
+def get_task_routing_headers(transfer: CrossChainTransfer) -> dict[str, int]:
+    """Get the message headers required for routing a transfer task.
+
+    Parameters
+    ----------
+    transfer : CrossChainTransfer
+        The cross-chain transfer processed by the task.
+
+    Returns
+    -------
+    dict
+        The message headers with the transfer's source and (eventual)
+        destination blockchains.
+
+    """
+    return {
+        _SOURCE_BLOCKCHAIN_HEADER: transfer.source_blockchain.value,
+        _DESTINATION_BLOCKCHAIN_HEADER: transfer.
+        eventual_destination_blockchain.value
+    }
+
+
 def is_main_module() -> bool:
     """Determine if the current process is a Celery worker process.
 
@@ -37,6 +126,55 @@ def is_main_module() -> bool:
             or any(marker in sys.argv for marker in potential_celery_markers))
 
 
+def route_task(name: str, args: typing.Sequence[typing.Any],
+               kwargs: dict[str, typing.Any], options: dict[str, typing.Any],
+               task: typing.Any = None,
+               **kw: typing.Any) -> typing.Optional[dict[str, str]]:
+    """Celery router for sending each transfer task to the queue of its
+    processing stage and blockchain.
+
+    Parameters
+    ----------
+    name : str
+        The name of the task.
+    args : sequence
+        The positional arguments of the task.
+    kwargs : dict
+        The keyword arguments of the task.
+    options : dict
+        The execution options of the task (with the transfer's
+        blockchains in the message headers for transfer tasks).
+    task : celery.Task, optional
+        The task (if available).
+
+    Returns
+    -------
+    dict or None
+        The routing options of the task, or None if the task is to be
+        sent to the default queue.
+
+    """
+    stage = _TASK_STAGES.get(name)
+    if stage is None:
+        return None
+    headers = options.get('headers') or {}
+    if _SOURCE_BLOCKCHAIN_HEADER in headers:
+        blockchain = Blockchain(
+            headers[_SOURCE_BLOCKCHAIN_HEADER if stage ==
+                    'validate' else _DESTINATION_BLOCKCHAIN_HEADER])
+    elif len(args) > 1 and isinstance(args[-1], dict):
+        # Tasks scheduled before the introduction of the routing
+        # headers carry the cross-chain transfer dictionary as their
+        # last argument
+        transfer = CrossChainTransfer.from_dict(args[-1])
+        blockchain = (transfer.source_blockchain if stage == 'validate' else
+                      transfer.eventual_destination_blockchain)
+    else:
+        return None
+    queue_name = get_task_queue_name(stage, blockchain)
+    return {'queue': queue_name, 'routing_key': queue_name}
+
+
 def verify_celery_url_has_ssl() -> bool:
     """Determine if the Celery broker URL has SSL enabled.
 
@@ -99,13 +237,43 @@ def setup_logger(logger: logging.Logger, *args, **kwargs):
         sys.exit(1)
 
 
+def _create_task_queues() -> list[kombu.Queue]:
+    # The stage- and blockchain-specific queues are only declared for
+    # the active blockchains
+    exchange = kombu.Exchange(_DEFAULT_TASK_QUEUE, type='direct')
+    queue_names = [_DEFAULT_TASK_QUEUE] + [
+        get_task_queue_name(stage, blockchain)
+        for stage in dict.fromkeys(_TASK_STAGES.values())
+        for blockchain in Blockchain
+        if get_blockchain_config(blockchain)['active']
+    ]
+    return [
+        kombu.Queue(queue_name, exchange, routing_key=queue_name)
+        for queue_name in queue_names
+    ]
+
+
 # Additional Celery configuration
 celery_app.conf.update(
+    # The transfer tasks ignore their results. The only other results
+    # are the transaction resubmission results of the blockchain
+    # utilities, which must not expire while their transfers are
+    # awaiting confirmation. They are deleted as soon as the
+    # confirmation of their transfers is completed (see
+    # forget_task_results).
     result_expires=None,
-    task_default_exchange='vision.validatornode',
-    task_default_queue='vision.validatornode',
-    task_default_routing_key='vision.validatornode',
+    task_default_exchange=_DEFAULT_TASK_QUEUE,
+    task_default_queue=_DEFAULT_TASK_QUEUE,
+    task_default_routing_key=_DEFAULT_TASK_QUEUE,
+    task_queues=_create_task_queues(),
+    task_routes=(route_task, ),
     task_track_started=True,
+    # The transfer tasks are almost entirely network-bound, so a
+    # worker running the threads pool can keep many tasks in flight
+    # while sharing a single set of blockchain clients and a single
+    # database connection pool (0 means one process or thread per CPU)
+    worker_pool=config['celery']['worker_pool'],
+    worker_concurrency=config['celery']['worker_concurrency'] or None,
     worker_enable_remote_control=False,
     # Make sure the broker crashes if it can't connect on startup
     broker_connection_retry=10,
@@ -113,6 +281,76 @@ celery_app.conf.update(
     broker_connection_retry_on_startup=False)
 
 
+@celery.signals.worker_init.connect
+def check_database_pool(sender: typing.Any = None, **kwargs):
+    """Sent before a Celery worker is started. Used to warn if the
+    threads of a worker running the threads pool can exhaust the
+    database connection pool shared by them.
+
+    Parameters
+    ----------
+    sender : celery.apps.worker.Worker
+        The worker being started.
+
+    """
+    if sender is None or config['celery']['worker_pool'] != 'threads':
+        return
+    database_connections = (config['database']['pool_size'] +
+                            config['database']['max_overflow'])
+    if sender.concurrency > database_connections:
+        _logger.warning(
+            'worker concurrency exceeds the database connection pool', extra={
+                'worker_concurrency': sender.concurrency,
+                'database_connections': database_connections
+            })
+
+
+@celery.signals.worker_init.connect
+def check_primary_node_batch_window(sender: typing.Any = None, **kwargs):
+    """Sent before a Celery worker is started. Used to warn if the
+    requests to the primary validator node are configured to be
+    batched although the worker does not run the threads pool (the
+    only pool whose tasks can issue such requests concurrently).
+
+    Parameters
+    ----------
+    sender : celery.apps.worker.Worker
+        The worker being started.
+
+    """
+    if sender is None:
+        return
+    batch_window = config['application'][
+        'primary_node_batch_window_in_seconds']
+    if batch_window > 0 and config['celery']['worker_pool'] != 'threads':
+        _logger.warning(
+            'primary node batch window ignored by the worker pool', extra={
+                'batch_window': batch_window,
+                'worker_pool': config['celery']['worker_pool']
+            })
+
+
+@celery.signals.worker_init.connect
+def start_metrics_export(**kwargs):
+    """Sent before a Celery worker is started. Used to make the
+    performance metrics collected by the worker (and its pool
+    processes) available to all Validator Node processes.
+
+    """
+    enable_metrics_export()
+
+
+@celery.signals.worker_process_shutdown.connect  # Pool process
+@celery.signals.worker_shutdown.connect  # Worker
+def complete_metrics_export(**kwargs):
+    """Sent when a Celery worker or one of its pool processes is
+    shutting down. Used to export the performance metrics not yet
+    exported.
+
+    """
+    export_metrics()
+
+
 # Source: https://stackoverflow.com/questions/43944787/sqlalchemy-celery-with-scoped-session-error/54751019#54751019 # noqa
 @celery.signals.worker_process_init.connect
 def prep_db_pool(**kwargs):
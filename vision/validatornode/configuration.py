@@ -102,6 +102,11 @@ _VALIDATION_SCHEMA_BLOCKCHAIN = {
         'blocks_until_resubmission': {
             'type': 'integer',
             'required': True
+        },
+        'max_pending_transactions': {
+            'type': 'integer',
+            'min': 0,
+            'default': 0
         }
     }
 }
@@ -169,6 +174,31 @@ _VALIDATION_SCHEMA_TASK = {
 }
 """Schema for validating a task entry in the configuration file."""
 
+_VALIDATION_SCHEMA_RETRY_POLICY = {
+    'type': 'dict',
+    'required': True,
+    'schema': {
+        'backoff_factor': {
+            'type': 'number',
+            'min': 1,
+            'required': True
+        },
+        'max_interval_in_seconds': {
+            'type': 'integer',
+            'min': 1,
+            'required': True
+        },
+        'jitter': {
+            'type': 'number',
+            'min': 0,
+            'max': 1,
+            'required': True
+        }
+    }
+}
+"""Schema for validating a retry policy entry in the configuration
+file."""
+
 _VALIDATION_SCHEMA = {
     'protocol': {
         'type': 'string',
@@ -216,6 +246,20 @@ _VALIDATION_SCHEMA = {
                 'required': True,
                 'empty': False
             },
+            'primary_node_batch_window_in_seconds': {
+                'type': 'number',
+                'min': 0,
+                'default': 0
+            },
+            'presign_transfers': {
+                'type': 'boolean',
+                'default': False
+            },
+            'presign_flush_interval_in_seconds': {
+                'type': 'number',
+                'min': 0.1,
+                'default': 1
+            },
             'log': _VALIDATION_SCHEMA_LOG
         }
     },
@@ -262,6 +306,16 @@ _VALIDATION_SCHEMA = {
                 'type': 'string',
                 'required': True
             },
+            'worker_pool': {
+                'type': 'string',
+                'required': True,
+                'allowed': ['prefork', 'threads']
+            },
+            'worker_concurrency': {
+                'type': 'integer',
+                'required': True,
+                'min': 0
+            },
             'log': _VALIDATION_SCHEMA_LOG
         }
     },
@@ -279,6 +333,64 @@ _VALIDATION_SCHEMA = {
             }
         }
     },
+    'scheduler': {
+        'type': 'dict',
+        'required': True,
+        'schema': {
+            'enabled': {
+                'type': 'boolean',
+                'required': True
+            },
+            'interval': {
+                'type': 'integer',
+                'required': True
+            },
+            'number_threads': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            },
+            'batch_size': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            },
+            'lease_in_seconds': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            }
+        }
+    },
+    'recovery': {
+        'type': 'dict',
+        'required': True,
+        'schema': {
+            'enabled': {
+                'type': 'boolean',
+                'required': True
+            },
+            'interval': {
+                'type': 'integer',
+                'required': True
+            },
+            'stale_after_in_seconds': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            },
+            'batch_size': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            },
+            'max_transfers_per_second': {
+                'type': 'integer',
+                'required': True,
+                'min': 1
+            }
+        }
+    },
     'tasks': {
         'type': 'dict',
         'required': True,
@@ -289,6 +401,17 @@ _VALIDATION_SCHEMA = {
             'validate_transfer': _VALIDATION_SCHEMA_TASK
         }
     },
+    'retries': {
+        'type': 'dict',
+        'required': True,
+        'schema': {
+            'transitory_state': _VALIDATION_SCHEMA_RETRY_POLICY,
+            'rpc_failure': _VALIDATION_SCHEMA_RETRY_POLICY,
+            'primary_node_unreachable': _VALIDATION_SCHEMA_RETRY_POLICY,
+            'database_conflict': _VALIDATION_SCHEMA_RETRY_POLICY,
+            'unknown_error': _VALIDATION_SCHEMA_RETRY_POLICY
+        }
+    },
     'blockchains': {
         'type': 'dict',
         'required': True,
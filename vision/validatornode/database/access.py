@@ -2,13 +2,18 @@
 records.
 
 """
+import contextlib
+import contextvars
 import dataclasses
 import datetime
 import logging
+import threading
 import typing
 import uuid
 
 import sqlalchemy
+import sqlalchemy.dialects.postgresql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.exc
 import sqlalchemy.orm
 from vision.common.blockchains.enums import Blockchain
@@ -17,6 +22,7 @@ from vision.common.types import BlockchainAddress
 from vision.validatornode.database import get_session
 from vision.validatornode.database import get_session_maker
 from vision.validatornode.database.enums import TransferStatus
+from vision.validatornode.database.enums import TransferStep
 from vision.validatornode.database.exceptions import DatabaseError
 from vision.validatornode.database.exceptions import \
     ValidatorNonceNotUniqueError
@@ -24,15 +30,39 @@ from vision.validatornode.database.models import \
     UNIQUE_VALIDATOR_NONCE_CONSTRAINT
 from vision.validatornode.database.models import Base
 from vision.validatornode.database.models import Blockchain as Blockchain_
+from vision.validatornode.database.models import ChainNonce
 from vision.validatornode.database.models import ForwarderContract
+from vision.validatornode.database.models import FreeNonce
 from vision.validatornode.database.models import HubContract
+from vision.validatornode.database.models import PendingTransferSignature
+from vision.validatornode.database.models import PerformanceMetric
 from vision.validatornode.database.models import TokenContract
 from vision.validatornode.database.models import Transfer
+from vision.validatornode.database.models import TransferTask
+from vision.validatornode.database.models import TransferToGasUsage
 from vision.validatornode.database.models import ValidatorNode
 from vision.validatornode.database.models import ValidatorNodeSignature
 
+_FAILED_TRANSFER_STATUS_IDS = (
+    TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
+    TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED.value)
+
+_IDS_CREATED_SESSION_KEY: typing.Final[str] = 'vision_ids_created'
+"""Session info key marking a session in which records have been
+created by _create_with_id."""
+
 _logger = logging.getLogger(__name__)
 
+_id_cache: dict[tuple[str, tuple[tuple[str, typing.Any], ...]], int] = {}
+"""Process-local IDs of the (immutable) contract and validator node
+records by their table and identifying column values."""
+_id_cache_lock = threading.Lock()
+
+_unit_of_work_session: contextvars.ContextVar[typing.Optional[
+    sqlalchemy.orm.Session]] = contextvars.ContextVar('unit_of_work_session',
+                                                      default=None)
+"""Session of the unit of work in progress in the current context."""
+
 B = typing.TypeVar('B', bound=Base)
 
 
@@ -69,6 +99,9 @@ class TransferCreationRequest:
     source_block_number : int
         The number of the transfer transaction's block on the source
         blockchain.
+    transfer_data : dict
+        The cross-chain transfer data to be loaded by the Celery
+        transfer tasks.
 
     """
     source_blockchain: Blockchain
@@ -83,6 +116,173 @@ class TransferCreationRequest:
     source_transfer_id: int
     source_transaction_id: str
     source_block_number: int
+    transfer_data: dict[str, typing.Any]
+
+
+@dataclasses.dataclass
+class ScheduledTransferResponse:
+    """Response data from claiming a transfer whose scheduled
+    processing step is due.
+
+    Attributes
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    attempts : int
+        The number of previous attempts of the scheduled processing
+        step.
+    schedule_id : uuid.UUID
+        The unique ID of the scheduled processing step (the same for
+        all of its attempts).
+
+    """
+    internal_transfer_id: int
+    attempts: int
+    schedule_id: uuid.UUID
+
+
+def claim_scheduled_transfers(
+        step: TransferStep, batch_size: int,
+        lease_in_seconds: int) -> list[ScheduledTransferResponse]:
+    """Claim a batch of transfers whose scheduled processing step is
+    due. The claimed transfers are not due again until their lease has
+    expired, so that each transfer is processed by a single scheduler
+    worker at a time. Transfers locked by concurrent claims are
+    skipped.
+
+    Parameters
+    ----------
+    step : TransferStep
+        The scheduled processing step of the transfers to claim.
+    batch_size : int
+        The maximum number of transfers to claim.
+    lease_in_seconds : int
+        The time (in seconds) after which the claimed transfers are
+        due again if their step has neither been completed nor
+        rescheduled.
+
+    Returns
+    -------
+    list of ScheduledTransferResponse
+        The response data for each claimed transfer (ordered by the
+        time the transfers' processing step has become due).
+
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    # Rows locked by a concurrent claim are skipped instead of waited
+    # for (not supported by SQLite, which is therefore only suitable
+    # for a single scheduler worker)
+    select_statement = sqlalchemy.select(
+        Transfer.id, Transfer.scheduled_attempts, Transfer.schedule_id).where(
+            Transfer.scheduled_step == step.value).where(
+                Transfer.next_attempt_at <= now).order_by(
+                    Transfer.next_attempt_at).limit(
+                        batch_size).with_for_update(skip_locked=True)
+    with _begin_session() as session:
+        results = session.execute(select_statement).all()
+        if len(results) > 0:
+            leased_until = now + datetime.timedelta(seconds=lease_in_seconds)
+            update_statement = sqlalchemy.update(Transfer).where(
+                Transfer.id.in_([result[0] for result in results
+                                 ])).values(next_attempt_at=leased_until,
+                                            leased_until=leased_until)
+            session.execute(update_statement)
+    return [
+        ScheduledTransferResponse(internal_transfer_id=internal_transfer_id,
+                                  attempts=attempts,
+                                  schedule_id=uuid.UUID(schedule_id))
+        for internal_transfer_id, attempts, schedule_id in results
+    ]
+
+
+def claim_transfer_submission(internal_transfer_id: int,
+                              task_id: uuid.UUID) -> bool:
+    """Claim the submission of a transfer to its destination blockchain
+    for a Celery task or a scheduled processing step. A claim can only
+    be made if the submission has not been claimed yet or if it has
+    already been claimed for the same task or step.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    task_id : uuid.UUID
+        The unique ID of the Celery task or scheduled processing step
+        claiming the submission.
+
+    Returns
+    -------
+    bool
+        True if the submission has been claimed for the given task or
+        step.
+
+    """
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            sqlalchemy.or_(
+                Transfer.submission_task_id.is_(None),
+                Transfer.submission_task_id == str(task_id))).values(
+                    submission_task_id=str(task_id),
+                    updated=datetime.datetime.now(datetime.timezone.utc))
+    with _begin_session() as session:
+        return session.execute(statement).rowcount == 1
+
+
+def claim_transfer_task(internal_transfer_id: int, step: TransferStep,
+                        task_id: uuid.UUID) -> bool:
+    """Claim a processing step of a transfer for a Celery transfer
+    task. A claim can only be made if no other task is in flight for
+    the same transfer and step.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step to be executed by the task.
+    task_id : uuid.UUID
+        The unique ID of the Celery task claiming the step.
+
+    Returns
+    -------
+    bool
+        True if the step has been claimed for the given task.
+
+    """
+    statement = sqlalchemy.insert(TransferTask).values(
+        transfer_id=internal_transfer_id, step=step.value,
+        task_id=str(task_id))
+    try:
+        with _begin_session() as session:
+            session.execute(statement)
+    except sqlalchemy.exc.IntegrityError:
+        # Another task is already in flight for the transfer and step
+        return False
+    return True
+
+
+def create_pending_transfer_signature(internal_transfer_id: int,
+                                      signature: str) -> None:
+    """Queue a presigned transfer signature to be posted to the primary
+    validator node. A signature already queued for the transfer is
+    kept.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the signed transfer.
+    signature : str
+        The secondary node's signature for the transfer.
+
+    """
+    with _begin_session() as session:
+        insert = (sqlalchemy.dialects.postgresql.insert
+                  if session.get_bind().dialect.name == 'postgresql' else
+                  sqlalchemy.dialects.sqlite.insert)
+        statement = insert(PendingTransferSignature).values(
+            transfer_id=internal_transfer_id,
+            signature=signature).on_conflict_do_nothing()
+        session.execute(statement)
 
 
 def create_transfer(request: TransferCreationRequest) -> int:
@@ -107,7 +307,7 @@ def create_transfer(request: TransferCreationRequest) -> int:
     """
     transfer_status = TransferStatus.SOURCE_TRANSACTION_DETECTED
     try:
-        with get_session_maker().begin() as session:
+        with _begin_session() as session:
             source_token_contract_id = _read_token_contract_id(
                 session, request.source_blockchain,
                 request.source_token_address)
@@ -140,6 +340,7 @@ def create_transfer(request: TransferCreationRequest) -> int:
                 source_transfer_id=request.source_transfer_id,
                 source_transaction_id=request.source_transaction_id,
                 source_block_number=request.source_block_number,
+                transfer_data=request.transfer_data,
                 status_id=transfer_status.value).returning(Transfer.id)
             return session.execute(statement).scalar_one()
     except sqlalchemy.exc.IntegrityError as error:
@@ -149,10 +350,46 @@ def create_transfer(request: TransferCreationRequest) -> int:
         raise
 
 
+def create_transfer_to_gas_usage(blockchain: Blockchain, number_signers: int,
+                                 gas_used: int, maximum_samples: int) -> None:
+    """Create a new gas usage record of a confirmed transferTo
+    transaction. Only the most recent records per blockchain and number
+    of signers are kept.
+
+    Parameters
+    ----------
+    blockchain : Blockchain
+        The destination blockchain of the transferTo transaction.
+    number_signers : int
+        The number of signers of the transferTo transaction.
+    gas_used : int
+        The gas used by the transferTo transaction.
+    maximum_samples : int
+        The maximum number of records kept per blockchain and number of
+        signers.
+
+    """
+    kept_ids = sqlalchemy.select(TransferToGasUsage.id).where(
+        TransferToGasUsage.blockchain_id == blockchain.value).where(
+            TransferToGasUsage.number_signers == number_signers).order_by(
+                TransferToGasUsage.id.desc()).limit(maximum_samples)
+    with _begin_session() as session:
+        session.execute(
+            sqlalchemy.insert(TransferToGasUsage).values(
+                blockchain_id=blockchain.value, number_signers=number_signers,
+                gas_used=gas_used))
+        session.execute(
+            sqlalchemy.delete(TransferToGasUsage).where(
+                TransferToGasUsage.blockchain_id == blockchain.value).where(
+                    TransferToGasUsage.number_signers == number_signers).where(
+                        TransferToGasUsage.id.not_in(kept_ids)))
+
+
 def create_validator_node_signature(
         internal_transfer_id: int, destination_blockchain: Blockchain,
         destination_forwarder_address: BlockchainAddress,
-        validator_node_address: BlockchainAddress, signature: str) -> None:
+        validator_node_address: BlockchainAddress, signature: str,
+        verified: bool = False) -> None:
     """Create a new validator node signature record.
 
     Parameters
@@ -169,9 +406,12 @@ def create_validator_node_signature(
         blockchain.
     signature : str
         The validator node's signature.
+    verified : bool
+        True if the signature has already been verified to be a valid
+        signature of the validator node for the transfer.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         destination_forwarder_contract_id = _read_forwarder_contract_id(
             session, destination_blockchain, destination_forwarder_address)
         if destination_forwarder_contract_id is None:
@@ -185,7 +425,25 @@ def create_validator_node_signature(
                 validator_node_address)
         statement = sqlalchemy.insert(ValidatorNodeSignature).values(
             transfer_id=internal_transfer_id,
-            validator_node_id=validator_node_id, signature=signature)
+            validator_node_id=validator_node_id, signature=signature,
+            verified=datetime.datetime.now(datetime.timezone.utc)
+            if verified else None)
+        session.execute(statement)
+
+
+def delete_pending_transfer_signature(internal_transfer_id: int) -> None:
+    """Remove a transfer signature from the queue of the presigned
+    transfer signatures to be posted to the primary validator node.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the signed transfer.
+
+    """
+    statement = sqlalchemy.delete(PendingTransferSignature).where(
+        PendingTransferSignature.transfer_id == internal_transfer_id)
+    with _begin_session() as session:
         session.execute(statement)
 
 
@@ -206,13 +464,232 @@ def read_blockchain_last_block_number(blockchain: Blockchain) -> int:
         block has been monitored for the given blockchain.
 
     """
-    with get_session() as session:
+    with _open_session() as session:
         blockchain_ = session.get(Blockchain_, blockchain.value)
         assert blockchain_ is not None
         last_block_number = blockchain_.last_block_number
         return int(last_block_number)
 
 
+def read_maximum_transfer_to_gas_usage(blockchain: Blockchain,
+                                       number_signers: int) -> int | None:
+    """Read the maximum recorded gas usage of transferTo transactions
+    with the given number of signers, or with the next greater number
+    of signers if there is no record for the given number.
+
+    Parameters
+    ----------
+    blockchain : Blockchain
+        The destination blockchain of the transferTo transactions.
+    number_signers : int
+        The number of signers of the transferTo transactions.
+
+    Returns
+    -------
+    int or None
+        The maximum recorded gas usage, or None if there is no record
+        for the same or a greater number of signers.
+
+    """
+    minimum_number_signers = sqlalchemy.select(
+        sqlalchemy.func.min(TransferToGasUsage.number_signers)).where(
+            TransferToGasUsage.blockchain_id == blockchain.value).where(
+                TransferToGasUsage.number_signers >= number_signers)
+    statement = sqlalchemy.select(
+        sqlalchemy.func.max(TransferToGasUsage.gas_used)).where(
+            TransferToGasUsage.blockchain_id == blockchain.value).where(
+                TransferToGasUsage.number_signers ==
+                minimum_number_signers.scalar_subquery())
+    with _open_session() as session:
+        return session.execute(statement).scalar_one()
+
+
+def read_number_verified_validator_node_signatures(
+        internal_transfer_id: int,
+        excluded_validator_node_address: BlockchainAddress) -> int:
+    """Read the number of verified validator node signatures for a
+    cross-chain transfer.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the signed transfer.
+    excluded_validator_node_address : BlockchainAddress
+        The address of a validator node whose signature is not to be
+        counted.
+
+    Returns
+    -------
+    int
+        The number of verified validator node signatures.
+
+    """
+    statement = sqlalchemy.select(sqlalchemy.func.count()).select_from(
+        ValidatorNodeSignature).join(ValidatorNode).where(
+            ValidatorNodeSignature.transfer_id == internal_transfer_id).where(
+                ValidatorNodeSignature.verified.is_not(None)).where(
+                    ValidatorNode.address != excluded_validator_node_address)
+    with _open_session() as session:
+        return session.execute(statement).scalar_one()
+
+
+@dataclasses.dataclass
+class PendingTransferSignatureResponse:
+    """Response data of a presigned transfer signature to be posted to
+    the primary validator node.
+
+    Attributes
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the signed transfer.
+    signature : str
+        The secondary node's signature for the transfer.
+
+    """
+    internal_transfer_id: int
+    signature: str
+
+
+def read_pending_transfer_signatures(
+        limit: int) -> list[PendingTransferSignatureResponse]:
+    """Read the presigned transfer signatures to be posted to the
+    primary validator node.
+
+    Parameters
+    ----------
+    limit : int
+        The maximum number of signatures to read.
+
+    Returns
+    -------
+    list of PendingTransferSignatureResponse
+        The response data for each pending signature (ordered by the
+        time the signatures have been queued).
+
+    """
+    statement = sqlalchemy.select(
+        PendingTransferSignature.transfer_id,
+        PendingTransferSignature.signature).order_by(
+            PendingTransferSignature.created,
+            PendingTransferSignature.transfer_id).limit(limit)
+    with _open_session() as session:
+        results = session.execute(statement).all()
+    return [
+        PendingTransferSignatureResponse(
+            internal_transfer_id=internal_transfer_id, signature=signature)
+        for internal_transfer_id, signature in results
+    ]
+
+
+def read_performance_metrics() -> dict[str, typing.Any]:
+    """Read all performance metrics aggregated over the Validator Node
+    processes.
+
+    Returns
+    -------
+    dict
+        The metric names as keys and their aggregated values as values.
+
+    """
+    statement = sqlalchemy.select(PerformanceMetric.name,
+                                  PerformanceMetric.value).order_by(
+                                      PerformanceMetric.name)
+    with _open_session() as session:
+        results = session.execute(statement).all()
+    return {result[0]: result[1] for result in results}
+
+
+def read_prefetched_validator_nonce(internal_transfer_id: int) -> int | None:
+    """Read the validator nonce of a transfer if it has been prefetched
+    from the primary validator node.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    Returns
+    -------
+    int or None
+        The prefetched validator nonce of the transfer, or None if the
+        validator nonce has not been prefetched or if there is no
+        transfer with the given ID.
+
+    """
+    statement = sqlalchemy.select(Transfer.validator_nonce).where(
+        Transfer.id == internal_transfer_id,
+        Transfer.validator_nonce_prefetched.is_not(None))
+    with _open_session() as session:
+        validator_nonce = session.execute(statement).scalar_one_or_none()
+    if validator_nonce is None:
+        return None
+    return validator_nonce.as_integer_ratio()[0]
+
+
+def read_stale_transfers(statuses: typing.Iterable[TransferStatus],
+                         stale_after_in_seconds: int, limit: int) -> list[int]:
+    """Read the transfers with one of the given statuses which have
+    neither been created, nor updated, nor been due for their next
+    attempt for a given time, for which no processing step is
+    scheduled in the database, and whose claimed Celery transfer tasks
+    (if any) have neither been scheduled nor started an attempt for the
+    same time.
+
+    Parameters
+    ----------
+    statuses : iterable of TransferStatus
+        The statuses of the transfers to read.
+    stale_after_in_seconds : int
+        The time (in seconds) after which a transfer is stale.
+    limit : int
+        The maximum number of transfers to read.
+
+    Returns
+    -------
+    list of int
+        The unique internal IDs of the stale transfers (ordered by
+        the internal transfer ID).
+
+    """
+    stale_before = datetime.datetime.now(
+        datetime.timezone.utc) - datetime.timedelta(
+            seconds=stale_after_in_seconds)
+    statement = _build_stale_transfers_statement(statuses, stale_before, limit)
+    with _open_session() as session:
+        return list(session.execute(statement).scalars().all())
+
+
+def read_transfer_data(
+    internal_transfer_ids: typing.Sequence[int]
+) -> dict[int, dict[str, typing.Any]]:
+    """Read the cross-chain transfer data of multiple transfers at
+    once.
+
+    Parameters
+    ----------
+    internal_transfer_ids : sequence of int
+        The unique internal IDs of the transfers.
+
+    Returns
+    -------
+    dict
+        The cross-chain transfer data by internal transfer ID (without
+        the transfers that are unknown or have no stored data).
+
+    """
+    if len(internal_transfer_ids) == 0:
+        return {}
+    statement = sqlalchemy.select(Transfer.id, Transfer.transfer_data).where(
+        Transfer.id.in_(set(internal_transfer_ids))).where(
+            Transfer.transfer_data.is_not(None))
+    with _open_session() as session:
+        return {
+            internal_transfer_id: transfer_data
+            for internal_transfer_id, transfer_data in session.execute(
+                statement)
+        }
+
+
 def read_transfer_id(source_blockchain: Blockchain,
                      source_transaction_id: str) -> typing.Optional[int]:
     """Read the unique internal ID of the transfer with a given source
@@ -233,10 +710,9 @@ def read_transfer_id(source_blockchain: Blockchain,
         ID/hash.
 
     """
-    statement = sqlalchemy.select(Transfer.id).filter_by(
-        source_blockchain_id=source_blockchain.value,
-        source_transaction_id=source_transaction_id)
-    with get_session() as session:
+    statement = _build_transfer_id_statement(source_blockchain,
+                                             source_transaction_id)
+    with _open_session() as session:
         return session.execute(statement).scalar_one_or_none()
 
 
@@ -259,7 +735,7 @@ def read_transfer_nonce(internal_transfer_id: int) -> int | None:
     """
     statement = sqlalchemy.select(
         Transfer.nonce).filter(Transfer.id == internal_transfer_id)
-    with get_session() as session:
+    with _open_session() as session:
         return session.execute(statement).scalar_one_or_none()
 
 
@@ -303,6 +779,27 @@ class TransferToDataResponse:
     validator_nonce: int
 
 
+def read_transfer_awaiting_signatures(internal_transfer_id: int) -> bool:
+    """Determine if the submission of a transfer to its destination
+    blockchain is awaiting more signatures.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    Returns
+    -------
+    bool
+        True if the submission is awaiting more signatures.
+
+    """
+    statement = sqlalchemy.select(Transfer.awaiting_signatures_since).where(
+        Transfer.id == internal_transfer_id)
+    with _open_session() as session:
+        return session.execute(statement).scalar_one_or_none() is not None
+
+
 def read_transfer_to_data(
         source_blockchain: Blockchain,
         source_transaction_id: str) -> typing.Optional[TransferToDataResponse]:
@@ -337,7 +834,7 @@ def read_transfer_to_data(
         Transfer.destination_token_contract).where(
             Transfer.source_blockchain_id == source_blockchain.value).where(
                 Transfer.source_transaction_id == source_transaction_id)
-    with get_session() as session:
+    with _open_session() as session:
         result = session.execute(statement).one_or_none()
     if result is None:
         return None
@@ -362,6 +859,53 @@ def read_transfer_to_data(
         validator_nonce=validator_nonce)
 
 
+@dataclasses.dataclass
+class UnconfirmedTransferResponse:
+    """Response data from reading a transfer whose transaction
+    submitted to the destination blockchain is awaiting its
+    confirmation.
+
+    Attributes
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    internal_transaction_id : uuid.UUID
+        The unique internal ID of the submitted transaction.
+
+    """
+    internal_transfer_id: int
+    internal_transaction_id: uuid.UUID
+
+
+def read_unconfirmed_transfers(
+        destination_blockchain: Blockchain) \
+        -> list[UnconfirmedTransferResponse]:
+    """Read all transfers whose transactions submitted to a destination
+    blockchain are awaiting their confirmation.
+
+    Parameters
+    ----------
+    destination_blockchain : Blockchain
+        The transfers' (eventual) destination blockchain.
+
+    Returns
+    -------
+    list of UnconfirmedTransferResponse
+        The response data for each unconfirmed transfer (ordered by
+        the internal transfer ID).
+
+    """
+    statement = _build_unconfirmed_transfers_statement(destination_blockchain)
+    with _open_session() as session:
+        results = session.execute(statement).all()
+    return [
+        UnconfirmedTransferResponse(
+            internal_transfer_id=internal_transfer_id,
+            internal_transaction_id=uuid.UUID(internal_transaction_id))
+        for internal_transfer_id, internal_transaction_id in results
+    ]
+
+
 def read_validator_node_signature(
         internal_transfer_id: int, destination_blockchain: Blockchain,
         destination_forwarder_address: BlockchainAddress,
@@ -396,7 +940,7 @@ def read_validator_node_signature(
                 ForwarderContract.blockchain_id == destination_blockchain.value
             ).where(ForwarderContract.address == destination_forwarder_address
                     ).where(ValidatorNode.address == validator_node_address)
-    with get_session() as session:
+    with _open_session() as session:
         return session.execute(statement).scalar_one_or_none()
 
 
@@ -420,7 +964,7 @@ def read_validator_node_signatures(
         ValidatorNode.address, ValidatorNodeSignature.signature).join_from(
             ValidatorNodeSignature, ValidatorNode).where(
                 ValidatorNodeSignature.transfer_id == internal_transfer_id)
-    with get_session() as session:
+    with _open_session() as session:
         results = session.execute(statement).all()
     return {
         BlockchainAddress(result[0]): result[1]  # type: ignore
@@ -446,7 +990,7 @@ def read_validator_nonce_by_internal_transfer_id(
     """
     statement = sqlalchemy.select(
         Transfer.validator_nonce).where(Transfer.id == internal_transfer_id)
-    with get_session() as session:
+    with _open_session() as session:
         validator_nonce = session.execute(statement).scalar_one_or_none()
     if validator_nonce is None:
         return None
@@ -477,13 +1021,88 @@ def read_validator_nonce_by_source_transaction_id(
     statement = sqlalchemy.select(Transfer.validator_nonce).filter_by(
         source_blockchain_id=source_blockchain.value,
         source_transaction_id=source_transaction_id)
-    with get_session() as session:
+    with _open_session() as session:
         validator_nonce = session.execute(statement).scalar_one_or_none()
     if validator_nonce is None:
         return None
     return validator_nonce.as_integer_ratio()[0]
 
 
+def read_validator_nonces_by_source_transaction_ids(
+        source_transactions: list[tuple[Blockchain, str]]) \
+        -> dict[tuple[Blockchain, str], int]:
+    """Read the validator nonces assigned to the transfers with given
+    source blockchains and source transaction IDs/hashes in a single
+    database query.
+
+    Parameters
+    ----------
+    source_transactions : list of tuple
+        Pairs of a transfer's source blockchain and its transaction
+        ID/hash on the source blockchain.
+
+    Returns
+    -------
+    dict
+        The validator nonces assigned to the transfers by their source
+        blockchain and source transaction ID/hash. Unknown transfers are
+        omitted.
+
+    """
+    if len(source_transactions) == 0:
+        return {}
+    statement = sqlalchemy.select(
+        Transfer.source_blockchain_id, Transfer.source_transaction_id,
+        Transfer.validator_nonce).where(
+            sqlalchemy.tuple_(Transfer.source_blockchain_id,
+                              Transfer.source_transaction_id).in_([
+                                  (source_blockchain.value,
+                                   source_transaction_id)
+                                  for source_blockchain, source_transaction_id
+                                  in source_transactions
+                              ]))
+    with _open_session() as session:
+        rows = session.execute(statement).all()
+    validator_nonces: dict[tuple[Blockchain, str], int] = {}
+    for source_blockchain_id, source_transaction_id, validator_nonce in rows:
+        source_transaction = (Blockchain(source_blockchain_id),
+                              source_transaction_id)
+        validator_nonces[source_transaction] = \
+            validator_nonce.as_integer_ratio()[0]
+    return validator_nonces
+
+
+@contextlib.contextmanager
+def unit_of_work() -> typing.Iterator[sqlalchemy.orm.Session]:
+    """Context manager for executing multiple database operations in a
+    single session and transaction. All functions of this module called
+    within the context (by the same thread) join its transaction, which
+    is committed when the context is exited without error and rolled
+    back otherwise. A nested unit of work joins the enclosing one.
+
+    Yields
+    ------
+    sqlalchemy.orm.Session
+        The session of the unit of work.
+
+    Raises
+    ------
+    DatabaseError
+        If the database package has not been initialized.
+
+    """
+    session = _unit_of_work_session.get()
+    if session is not None:
+        yield session
+        return
+    with get_session_maker().begin() as session:
+        token = _unit_of_work_session.set(session)
+        try:
+            yield session
+        finally:
+            _unit_of_work_session.reset(token)
+
+
 def update_blockchain_last_block_number(blockchain: Blockchain,
                                         last_block_number: int) -> None:
     """Update the number of the last block monitored for new Vision
@@ -498,7 +1117,7 @@ def update_blockchain_last_block_number(blockchain: Blockchain,
         The number of the last monitored block on the blockchain.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         blockchain_ = session.get(Blockchain_, blockchain.value)
         assert blockchain_ is not None
         if blockchain_.last_block_number > last_block_number:
@@ -511,10 +1130,54 @@ def update_blockchain_last_block_number(blockchain: Blockchain,
                 sqlalchemy.Column, last_block_number)
 
 
-def update_reversal_transfer(
-        internal_transfer_id: int, destination_blockchain: Blockchain,
-        recipient_address: BlockchainAddress,
-        destination_token_address: BlockchainAddress) -> None:
+def update_performance_metrics(
+    metrics: dict[str, typing.Any],
+    merge_metric: typing.Callable[[typing.Any, typing.Any],
+                                  typing.Any]) -> None:
+    """Add performance metrics collected by a Validator Node process to
+    the aggregated performance metrics.
+
+    Parameters
+    ----------
+    metrics : dict
+        The metric names as keys and their collected values as values.
+    merge_metric : callable
+        Function for merging an aggregated value (first argument) and
+        a collected value (second argument) of a metric.
+
+    """
+    if len(metrics) == 0:
+        return
+    with _begin_session() as session:
+        insert = (sqlalchemy.dialects.postgresql.insert
+                  if session.get_bind().dialect.name == 'postgresql' else
+                  sqlalchemy.dialects.sqlite.insert)
+        # Upsert since the metrics may have been created concurrently by
+        # another Validator Node process
+        statement = insert(PerformanceMetric).values([{
+            'name': name,
+            'value': metrics[name]
+        } for name in sorted(metrics)]).on_conflict_do_nothing().returning(
+            PerformanceMetric.name)
+        created_names = set(session.execute(statement).scalars().all())
+        # Rows are locked in a consistent order to avoid deadlocks
+        statement = sqlalchemy.select(
+            PerformanceMetric.name, PerformanceMetric.value).where(
+                PerformanceMetric.name.in_(
+                    sorted(set(metrics) - created_names))).order_by(
+                        PerformanceMetric.name).with_for_update()
+        for name, value in session.execute(statement).all():
+            session.execute(
+                sqlalchemy.update(PerformanceMetric).where(
+                    PerformanceMetric.name == name).values(
+                        value=merge_metric(value, metrics[name])))
+
+
+def update_reversal_transfer(internal_transfer_id: int,
+                             destination_blockchain: Blockchain,
+                             recipient_address: BlockchainAddress,
+                             destination_token_address: BlockchainAddress,
+                             transfer_data: dict[str, typing.Any]) -> None:
     """Update a reversal transfer's destination blockchain attributes.
 
     Parameters
@@ -528,9 +1191,11 @@ def update_reversal_transfer(
     destination_token_address : BlockchainAddress
         The address of the transferred token on the destination
         blockchain.
+    transfer_data : dict
+        The updated cross-chain transfer data.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         destination_token_contract_id = _read_token_contract_id(
             session, destination_blockchain, destination_token_address)
         if destination_token_contract_id is None:
@@ -541,10 +1206,93 @@ def update_reversal_transfer(
                 destination_blockchain_id=destination_blockchain.value,
                 recipient_address=recipient_address,
                 destination_token_contract_id=destination_token_contract_id,
+                transfer_data=transfer_data,
                 updated=datetime.datetime.now(datetime.timezone.utc))
         session.execute(statement)
 
 
+def update_transfer_awaiting_signatures(internal_transfer_id: int) -> None:
+    """Mark the submission of a transfer to its destination blockchain
+    as awaiting more signatures.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            Transfer.awaiting_signatures_since.is_(None)).values(
+                awaiting_signatures_since=now, updated=now)
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+@dataclasses.dataclass
+class TransferConfirmationRequest:
+    """Request data for updating a transfer whose transaction has been
+    confirmed on the destination blockchain.
+
+    Attributes
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    destination_transfer_id : int
+        The Vision transfer ID on the destination blockchain.
+    destination_transaction_id : str
+        The transaction ID/hash on the destination blockchain.
+    destination_block_number : int
+        The block number on the destination blockchain.
+    status : TransferStatus
+        The new status.
+
+    """
+    internal_transfer_id: int
+    destination_transfer_id: int
+    destination_transaction_id: str
+    destination_block_number: int
+    status: TransferStatus
+
+
+def update_transfer_confirmations(
+        requests: list[TransferConfirmationRequest]) -> None:
+    """Update multiple transfers whose transactions have been confirmed
+    on the destination blockchain within a single database transaction.
+    Their internal IDs of the confirmed transactions are set to NULL.
+
+    Parameters
+    ----------
+    requests : list of TransferConfirmationRequest
+        The request data for each confirmed transfer.
+
+    """
+    if len(requests) == 0:
+        return
+    updated = datetime.datetime.now(datetime.timezone.utc)
+    parameters = [{
+        'id': request.internal_transfer_id,
+        'destination_transfer_id': request.destination_transfer_id,
+        'destination_transaction_id': request.destination_transaction_id,
+        'destination_block_number': request.destination_block_number,
+        'status_id': request.status.value,
+        'updated': updated
+    } for request in requests]
+    internal_transfer_ids = [
+        request.internal_transfer_id for request in requests
+    ]
+    reset_statement = sqlalchemy.update(Transfer).where(
+        Transfer.id.in_(internal_transfer_ids)).values(
+            internal_transaction_id=sqlalchemy.null())
+    with _begin_session() as session:
+        # Bulk UPDATE by primary key (executed as a single
+        # executemany statement)
+        session.execute(sqlalchemy.update(Transfer), parameters)
+        session.execute(reset_statement,
+                        execution_options={'synchronize_session': False})
+
+
 def update_transfer_confirmed_destination_transaction(
         internal_transfer_id: int, destination_transfer_id: int,
         destination_transaction_id: str,
@@ -570,7 +1318,30 @@ def update_transfer_confirmed_destination_transaction(
             destination_transaction_id=destination_transaction_id,
             destination_block_number=destination_block_number,
             updated=datetime.datetime.now(datetime.timezone.utc))
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def update_transfer_data(internal_transfer_id: int,
+                         transfer_data: dict[str, typing.Any]) -> None:
+    """Store the cross-chain transfer data of a transfer detected
+    before the data was stored in the database (the data is not
+    updated if the transfer already has stored data).
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    transfer_data : dict
+        The cross-chain transfer data.
+
+    """
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            Transfer.transfer_data.is_(None)).values(
+                transfer_data=transfer_data,
+                updated=datetime.datetime.now(datetime.timezone.utc))
+    with _begin_session() as session:
         session.execute(statement)
 
 
@@ -591,7 +1362,7 @@ def update_transfer_submitted_destination_transaction(
         blockchain.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         select_statement = sqlalchemy.select(
             Transfer.destination_blockchain_id).where(
                 Transfer.id == internal_transfer_id)
@@ -617,12 +1388,72 @@ def update_transfer_submitted_destination_transaction(
         session.execute(update_statement)
 
 
+def update_transfer_internal_transaction_id(
+        internal_transfer_id: int, internal_transaction_id: uuid.UUID) -> None:
+    """Update a transfer by adding the internal ID of its transaction
+    submitted to the destination blockchain, which marks the transfer
+    as awaiting its confirmation. The submission is no longer awaiting
+    more signatures.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    internal_transaction_id : uuid.UUID
+        The unique internal ID of the submitted transaction.
+
+    """
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).values(
+            internal_transaction_id=str(internal_transaction_id),
+            awaiting_signatures_since=sqlalchemy.null(),
+            updated=datetime.datetime.now(datetime.timezone.utc))
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def update_transfer_next_attempt(internal_transfer_id: int, step: TransferStep,
+                                 delay_in_seconds: int) -> None:
+    """Update a transfer by rescheduling its processing step after an
+    unsuccessful attempt. The transfer is left unchanged if another
+    step has been scheduled in the meantime.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step to reschedule.
+    delay_in_seconds : int
+        The time (in seconds) until the step's next attempt.
+
+    """
+    next_attempt_at = datetime.datetime.now(
+        datetime.timezone.utc) + datetime.timedelta(seconds=delay_in_seconds)
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            Transfer.scheduled_step == step.value).values(
+                next_attempt_at=next_attempt_at,
+                scheduled_attempts=Transfer.scheduled_attempts + 1,
+                leased_until=sqlalchemy.null())
+    with _begin_session() as session:
+        session.execute(statement)
+
+
 def update_transfer_nonce(internal_transfer_id: int,
                           destination_blockchain: Blockchain,
-                          latest_blockchain_nonce: int) -> None:
+                          latest_blockchain_nonce: int,
+                          maximum_pending_nonces: int = 0) -> bool:
     """Update the nonce for a transfer transaction submitted to the
     destination blockchain.
 
+    The lowest freed nonce (i.e. the nonce of a failed transfer
+    transaction or a nonce reset after a failed submission) is reused
+    if there is any. Otherwise, the next nonce of the destination
+    blockchain (or the latest nonce on the destination blockchain if it
+    is greater) is allocated. Concurrent allocations for the same destination
+    blockchain are serialized by locking its nonce allocation state.
+
     Parameters
     ----------
     internal_transfer_id : int
@@ -631,89 +1462,303 @@ def update_transfer_nonce(internal_transfer_id: int,
         The blockchain to which the transfer is submitted.
     latest_blockchain_nonce : int
         The latest nonce on the destination blockchain.
+    maximum_pending_nonces : int, optional
+        The maximum number of allocated nonces greater than or equal
+        to the latest nonce on the destination blockchain (0 if there
+        is no maximum). A new nonce is not allocated if the maximum
+        has been reached, but reusable nonces are.
+
+    Returns
+    -------
+    bool
+        True if a nonce has been allocated for the transfer.
+
+    """
+    with _begin_session() as session:
+        chain_nonce = _lock_chain_nonce(session, destination_blockchain)
+        # Freed nonces below the latest nonce on the destination
+        # blockchain have been used up in the meantime
+        session.execute(
+            sqlalchemy.delete(FreeNonce).where(
+                FreeNonce.blockchain_id == destination_blockchain.value,
+                FreeNonce.nonce < latest_blockchain_nonce))
+        free_nonce = session.execute(
+            sqlalchemy.select(FreeNonce).filter(
+                FreeNonce.blockchain_id ==
+                destination_blockchain.value).order_by(
+                    FreeNonce.nonce).limit(1)).scalar_one_or_none()
+        if free_nonce is not None:
+            nonce = free_nonce.nonce
+            session.delete(free_nonce)
+            # Take the nonce away from the failed transfer
+            session.execute(
+                sqlalchemy.update(Transfer).where(
+                    Transfer.destination_blockchain_id ==
+                    destination_blockchain.value).where(
+                        Transfer.nonce == nonce).where(
+                            Transfer.status_id.in_(_FAILED_TRANSFER_STATUS_IDS)
+                        ).values(nonce=sqlalchemy.null()),
+                execution_options={'synchronize_session': False})
+        else:
+            nonce = latest_blockchain_nonce
+            if (chain_nonce.next_nonce is not None
+                    and chain_nonce.next_nonce > latest_blockchain_nonce):
+                nonce = chain_nonce.next_nonce
+            if (maximum_pending_nonces > 0 and nonce - latest_blockchain_nonce
+                    >= maximum_pending_nonces):
+                return False
+            chain_nonce.next_nonce = typing.cast(sqlalchemy.Column, nonce + 1)
+        status_id = sqlalchemy.case(
+            (Transfer.status_id
+             == TransferStatus.SOURCE_TRANSACTION_DETECTED.value,
+             TransferStatus.SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED.
+             value), (Transfer.status_id
+                      == TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
+                      TransferStatus.
+                      DESTINATION_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED.value),
+            else_=TransferStatus.
+            SOURCE_REVERSAL_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED.value)
+        session.execute(
+            sqlalchemy.update(Transfer).where(
+                Transfer.id == internal_transfer_id).values(
+                    nonce=nonce, status_id=status_id),
+            execution_options={'synchronize_session': False})
+    return True
+
+
+def release_transfer_submission(internal_transfer_id: int,
+                                task_id: uuid.UUID) -> None:
+    """Release the claim of a Celery task for the submission of a
+    transfer to its destination blockchain.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    task_id : uuid.UUID
+        The unique ID of the Celery task which has claimed the
+        submission.
 
     """
-    failed_transactions_expression = sqlalchemy.and_(
-        Transfer.destination_blockchain_id == destination_blockchain.value,
-        Transfer.nonce.is_not(None),  # noqa: E711
-        sqlalchemy.or_(
-            Transfer.status_id ==
-            TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
-            Transfer.status_id ==
-            TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED.value))
-    count_failed_nonces_subquery = sqlalchemy.select(
-        sqlalchemy.func.count()).filter(
-            failed_transactions_expression).scalar_subquery()
-    minimum_failed_nonce_cte = sqlalchemy.select(
-        sqlalchemy.func.min(Transfer.nonce).label('min')).filter(
-            failed_transactions_expression).cte('minimum_failed_nonce_cte')
-    maximum_transfer_nonce_subquery = sqlalchemy.select(
-        sqlalchemy.func.max(Transfer.nonce)).filter(
-            Transfer.destination_blockchain_id ==
-            destination_blockchain.value).scalar_subquery()
     statement = sqlalchemy.update(Transfer).where(
-        sqlalchemy.or_(
-            Transfer.id == internal_transfer_id,
-            sqlalchemy.and_(
-                Transfer.destination_blockchain_id ==
-                destination_blockchain.value,
-                Transfer.nonce == minimum_failed_nonce_cte.c.min))
-    ).values({
-        Transfer.nonce: sqlalchemy.case(
-            (count_failed_nonces_subquery == 0,
-             sqlalchemy.case(
-                 (maximum_transfer_nonce_subquery >= latest_blockchain_nonce,
-                  maximum_transfer_nonce_subquery + 1),
-                 else_=latest_blockchain_nonce)),
-            (Transfer.id
-             == internal_transfer_id, minimum_failed_nonce_cte.c.min),
-            else_=sqlalchemy.null()),
-        Transfer.status_id: sqlalchemy.case(
-            (Transfer.id == internal_transfer_id,
-             sqlalchemy.case(
-                 (Transfer.status_id
-                  == TransferStatus.SOURCE_TRANSACTION_DETECTED.value,
-                  TransferStatus.
-                  SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED.value),
-                 (Transfer.status_id
-                  == TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
-                  TransferStatus.
-                  DESTINATION_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED.value),
-                 else_=TransferStatus.
-                 SOURCE_REVERSAL_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED.value)),
-            else_=sqlalchemy.case(
-                (Transfer.status_id
-                 == TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
-                 TransferStatus.DESTINATION_TRANSACTION_FAILED.value),
-                else_=TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED.value))
-    })
-    with get_session_maker().begin() as session:
-        # Execute the transaction
+        Transfer.id == internal_transfer_id).where(
+            Transfer.submission_task_id == str(task_id)).values(
+                submission_task_id=sqlalchemy.null())
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def release_transfer_task(internal_transfer_id: int, step: TransferStep,
+                          task_id: uuid.UUID) -> None:
+    """Release the claim of a Celery transfer task for a processing
+    step of a transfer.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step executed by the task.
+    task_id : uuid.UUID
+        The unique ID of the Celery task which has claimed the step.
+
+    """
+    statement = sqlalchemy.delete(TransferTask).where(
+        TransferTask.transfer_id == internal_transfer_id).where(
+            TransferTask.step == step.value).where(
+                TransferTask.task_id == str(task_id))
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def reassign_transfer_task(internal_transfer_id: int, step: TransferStep,
+                           task_id: uuid.UUID) -> None:
+    """Claim a processing step of a transfer for a Celery transfer
+    task, taking over the claim of any other task in flight for the
+    same transfer and step (which exits without executing the step
+    when starting its next attempt).
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step to be executed by the task.
+    task_id : uuid.UUID
+        The unique ID of the Celery task claiming the step.
+
+    """
+    with _begin_session() as session:
+        insert = (sqlalchemy.dialects.postgresql.insert
+                  if session.get_bind().dialect.name == 'postgresql' else
+                  sqlalchemy.dialects.sqlite.insert)
+        statement = insert(TransferTask).values(
+            transfer_id=internal_transfer_id, step=step.value,
+            task_id=str(task_id),
+            created=datetime.datetime.now(datetime.timezone.utc))
         session.execute(
-            statement,
-            execution_options=sqlalchemy.util._collections.immutabledict(
-                {'synchronize_session': False}))
+            statement.on_conflict_do_update(
+                index_elements=[TransferTask.transfer_id, TransferTask.step],
+                set_={
+                    'task_id': statement.excluded.task_id,
+                    'created': statement.excluded.created,
+                    'heartbeat': sqlalchemy.null()
+                }))
+
+
+def release_stale_transfer_tasks(internal_transfer_id: int,
+                                 stale_after_in_seconds: int) -> None:
+    """Release the claims of the Celery transfer tasks for the
+    processing steps of a transfer which have neither been scheduled
+    nor started an attempt for a given time (i.e. the tasks are
+    considered to be lost).
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    stale_after_in_seconds : int
+        The time (in seconds) after which a task is considered to be
+        lost.
+
+    """
+    stale_before = datetime.datetime.now(
+        datetime.timezone.utc) - datetime.timedelta(
+            seconds=stale_after_in_seconds)
+    statement = sqlalchemy.delete(TransferTask).where(
+        TransferTask.transfer_id == internal_transfer_id).where(
+            _get_transfer_task_last_alive() < stale_before)
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def release_transfer_tasks(internal_transfer_id: int) -> None:
+    """Release the claims of all Celery transfer tasks for the
+    processing steps of a transfer.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    """
+    statement = sqlalchemy.delete(TransferTask).where(
+        TransferTask.transfer_id == internal_transfer_id)
+    with _begin_session() as session:
+        session.execute(statement)
 
 
 def reset_transfer_nonce(internal_transfer_id: int) -> None:
     """Update a transfer by setting its destination blockchain
-    transaction nonce to NULL.
+    transaction nonce to NULL. The previous nonce is freed to be reused
+    for another transfer to the same destination blockchain.
 
     Parameters
     ----------
     internal_transfer_id : int
         The unique internal ID of the transfer.
 
+    """
+    with _begin_session() as session:
+        transfer = session.get(Transfer, internal_transfer_id)
+        assert transfer is not None
+        if transfer.nonce is not None:
+            _free_transfer_nonce(session, transfer)
+            transfer.nonce = typing.cast(sqlalchemy.Column, None)
+
+
+def reset_transfer_schedule(internal_transfer_id: int,
+                            step: TransferStep) -> None:
+    """Update a transfer by setting its scheduled processing step, the
+    time of the step's next attempt, the number of the step's attempts,
+    the step's ID, and its lease to NULL. The transfer is left unchanged
+    if another step has been scheduled in the meantime.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The completed processing step.
+
     """
     statement = sqlalchemy.update(Transfer).where(
-        Transfer.id == internal_transfer_id).values(nonce=sqlalchemy.null())
-    with get_session_maker().begin() as session:
+        Transfer.id == internal_transfer_id).where(
+            Transfer.scheduled_step == step.value).values(
+                scheduled_step=sqlalchemy.null(),
+                next_attempt_at=sqlalchemy.null(),
+                scheduled_attempts=sqlalchemy.null(),
+                schedule_id=sqlalchemy.null(), leased_until=sqlalchemy.null())
+    with _begin_session() as session:
         session.execute(statement)
 
 
-def update_transfer_source_transaction(internal_transfer_id: int,
-                                       source_transfer_id: int,
-                                       source_block_number: int) -> None:
+def reset_transfer_submission(internal_transfer_id: int) -> None:
+    """Update a transfer by setting its submission claim, its
+    awaiting-signatures marker, and its submitted transaction to NULL.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+
+    """
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).values(
+            submission_task_id=sqlalchemy.null(),
+            awaiting_signatures_since=sqlalchemy.null(),
+            internal_transaction_id=sqlalchemy.null())
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def update_transfer_schedule(internal_transfer_id: int, step: TransferStep,
+                             delay_in_seconds: int) -> None:
+    """Update a transfer by scheduling a processing step to be
+    executed by the database-backed transfer scheduler. If the same
+    step is already scheduled, it keeps its ID and is only rescheduled
+    if it is not currently leased by a scheduler worker.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step to schedule.
+    delay_in_seconds : int
+        The time (in seconds) until the step's first attempt.
+
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    next_attempt_at = now + datetime.timedelta(seconds=delay_in_seconds)
+    new_step_statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            sqlalchemy.or_(Transfer.scheduled_step.is_(None),
+                           Transfer.scheduled_step != step.value)).values(
+                               scheduled_step=step.value,
+                               next_attempt_at=next_attempt_at,
+                               scheduled_attempts=0,
+                               schedule_id=str(uuid.uuid4()),
+                               leased_until=sqlalchemy.null())
+    # Shortening an active lease would enable a second scheduler
+    # worker to execute the step concurrently
+    same_step_statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            Transfer.scheduled_step == step.value).where(
+                sqlalchemy.or_(Transfer.leased_until.is_(None),
+                               Transfer.leased_until
+                               <= now)).values(next_attempt_at=next_attempt_at,
+                                               scheduled_attempts=0,
+                                               leased_until=sqlalchemy.null())
+    with _begin_session() as session:
+        if session.execute(new_step_statement).rowcount == 0:
+            session.execute(same_step_statement)
+
+
+def update_transfer_source_transaction(
+        internal_transfer_id: int, source_transfer_id: int,
+        source_block_number: int, transfer_data: dict[str,
+                                                      typing.Any]) -> None:
     """Update a transfer's attributes related to its source blockchain
     transaction.
 
@@ -726,15 +1771,18 @@ def update_transfer_source_transaction(internal_transfer_id: int,
     source_block_number : int
         The number of the transfer transaction's block on the source
         blockchain.
+    transfer_data : dict
+        The updated cross-chain transfer data.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         transfer = session.get(Transfer, internal_transfer_id)
         assert transfer is not None
         transfer.source_transfer_id = typing.cast(sqlalchemy.Column,
                                                   source_transfer_id)
         transfer.source_block_number = typing.cast(sqlalchemy.Column,
                                                    source_block_number)
+        transfer.transfer_data = typing.cast(sqlalchemy.Column, transfer_data)
         transfer.updated = typing.cast(
             sqlalchemy.Column, datetime.datetime.now(datetime.timezone.utc))
 
@@ -751,12 +1799,15 @@ def update_transfer_status(internal_transfer_id: int,
         The new status.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         transfer = session.get(Transfer, internal_transfer_id)
         assert transfer is not None
         transfer.status_id = typing.cast(sqlalchemy.Column, status.value)
         transfer.updated = typing.cast(
             sqlalchemy.Column, datetime.datetime.now(datetime.timezone.utc))
+        if (status.value in _FAILED_TRANSFER_STATUS_IDS
+                and transfer.nonce is not None):
+            _free_transfer_nonce(session, transfer)
 
 
 def update_transfer_task_id(internal_transfer_id: int,
@@ -771,7 +1822,7 @@ def update_transfer_task_id(internal_transfer_id: int,
         The unique ID of the Celery transfer task.
 
     """
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         transfer = session.get(Transfer, internal_transfer_id)
         assert transfer is not None
         transfer.task_id = typing.cast(sqlalchemy.Column, str(task_id))
@@ -779,6 +1830,84 @@ def update_transfer_task_id(internal_transfer_id: int,
             sqlalchemy.Column, datetime.datetime.now(datetime.timezone.utc))
 
 
+def update_transfer_task_heartbeat(internal_transfer_id: int,
+                                   step: TransferStep,
+                                   task_id: uuid.UUID) -> bool:
+    """Record that a Celery transfer task is starting an attempt of a
+    processing step of a transfer.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    step : TransferStep
+        The processing step executed by the task.
+    task_id : uuid.UUID
+        The unique ID of the Celery task.
+
+    Returns
+    -------
+    bool
+        True if the task still holds the claim of the step (False if
+        the claim has been released in the meantime, e.g. because the
+        task has been considered to be lost).
+
+    """
+    statement = sqlalchemy.update(TransferTask).where(
+        TransferTask.transfer_id == internal_transfer_id).where(
+            TransferTask.step == step.value).where(
+                TransferTask.task_id == str(task_id)).values(
+                    heartbeat=datetime.datetime.now(datetime.timezone.utc))
+    with _begin_session() as session:
+        return session.execute(statement).rowcount == 1
+
+
+def update_transfer_task_next_attempt(internal_transfer_id: int,
+                                      delay_in_seconds: int) -> None:
+    """Update a transfer by setting the time of the next retry of its
+    Celery transfer task. The transfer is left unchanged if a
+    processing step is scheduled in the database.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    delay_in_seconds : int
+        The time (in seconds) until the task's next retry.
+
+    """
+    next_attempt_at = datetime.datetime.now(
+        datetime.timezone.utc) + datetime.timedelta(seconds=delay_in_seconds)
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).where(
+            Transfer.scheduled_step.is_(None)).values(
+                next_attempt_at=next_attempt_at)
+    with _begin_session() as session:
+        session.execute(statement)
+
+
+def update_transfer_prefetched_validator_nonce(internal_transfer_id: int,
+                                               validator_nonce: int) -> None:
+    """Update a transfer's validator nonce with the validator nonce
+    prefetched from the primary validator node.
+
+    Parameters
+    ----------
+    internal_transfer_id : int
+        The unique internal ID of the transfer.
+    validator_nonce : int
+        The prefetched validator nonce of the transfer.
+
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    statement = sqlalchemy.update(Transfer).where(
+        Transfer.id == internal_transfer_id).values(
+            validator_nonce=validator_nonce, validator_nonce_prefetched=now,
+            updated=now)
+    with _begin_session() as session:
+        session.execute(statement)
+
+
 def update_transfer_validator_nonce(internal_transfer_id: int,
                                     validator_nonce: int) -> None:
     """Update a transfer's validator nonce.
@@ -795,14 +1924,49 @@ def update_transfer_validator_nonce(internal_transfer_id: int,
         Transfer.id == internal_transfer_id).values(
             validator_nonce=validator_nonce,
             updated=datetime.datetime.now(datetime.timezone.utc))
-    with get_session_maker().begin() as session:
+    with _begin_session() as session:
         session.execute(statement)
 
 
+@contextlib.contextmanager
+def _begin_session() -> typing.Iterator[sqlalchemy.orm.Session]:
+    unit_of_work_session = _unit_of_work_session.get()
+    if unit_of_work_session is None:
+        with get_session_maker().begin() as session:
+            yield session
+    else:
+        # A savepoint keeps the operation atomic (and its errors
+        # recoverable) within the enclosing unit of work
+        with unit_of_work_session.begin_nested():
+            yield unit_of_work_session
+
+
+@contextlib.contextmanager
+def _open_session() -> typing.Iterator[sqlalchemy.orm.Session]:
+    unit_of_work_session = _unit_of_work_session.get()
+    if unit_of_work_session is None:
+        with get_session() as session:
+            yield session
+    else:
+        yield unit_of_work_session
+
+
 def _read_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
              **kwargs: typing.Any) -> typing.Optional[int]:
+    cache_key = (model.__tablename__, tuple(sorted(kwargs.items())))
+    with _id_cache_lock:
+        id_ = _id_cache.get(cache_key)
+    if id_ is not None:
+        return id_
     statement = sqlalchemy.select(model.id).filter_by(**kwargs)
-    return session.execute(statement).scalar_one_or_none()
+    id_ = session.execute(statement).scalar_one_or_none()
+    # Only committed records are cached, which is not guaranteed if
+    # records have been created within the session (their transaction
+    # may still be rolled back)
+    if id_ is not None and not session.info.get(_IDS_CREATED_SESSION_KEY):
+        with _id_cache_lock:
+            _id_cache[cache_key] = id_
+    return id_
 
 
 def _read_forwarder_contract_id(
@@ -836,17 +2000,20 @@ def _read_validator_node_id(
 
 def _create_with_id(session: sqlalchemy.orm.Session, model: typing.Type[B],
                     **kwargs: typing.Any) -> int:
-    statement = sqlalchemy.insert(model).values(**kwargs).returning(model.id)
-    try:
-        with session.begin_nested():
-            return session.execute(statement).scalar_one()
-    except sqlalchemy.exc.IntegrityError:
-        # Non-critical error that can happen in a parallel execution
-        # environment due to a race condition
-        _logger.warning('instance already created', exc_info=True)
-        id_ = _read_id(session, model, **kwargs)
-        assert id_ is not None
+    insert = (sqlalchemy.dialects.postgresql.insert
+              if session.get_bind().dialect.name == 'postgresql' else
+              sqlalchemy.dialects.sqlite.insert)
+    # Upsert since the instance may have been created concurrently by
+    # another transaction in a parallel execution environment
+    statement = insert(model).values(
+        **kwargs).on_conflict_do_nothing().returning(model.id)
+    id_ = session.execute(statement).scalar_one_or_none()
+    if id_ is not None:
+        session.info[_IDS_CREATED_SESSION_KEY] = True
         return id_
+    id_ = _read_id(session, model, **kwargs)
+    assert id_ is not None
+    return id_
 
 
 def _create_forwarder_contract(session: sqlalchemy.orm.Session,
@@ -876,3 +2043,111 @@ def _create_validator_node(session: sqlalchemy.orm.Session,
     return _create_with_id(session, ValidatorNode,
                            forwarder_contract_id=forwarder_contract_id,
                            address=address)
+
+
+def _lock_chain_nonce(session: sqlalchemy.orm.Session,
+                      destination_blockchain: Blockchain) -> ChainNonce:
+    statement = sqlalchemy.select(ChainNonce).filter(
+        ChainNonce.blockchain_id ==
+        destination_blockchain.value).with_for_update()
+    chain_nonce = session.execute(statement).scalar_one_or_none()
+    if chain_nonce is None:
+        try:
+            with session.begin_nested():
+                _create_chain_nonce(session, destination_blockchain)
+        except sqlalchemy.exc.IntegrityError:
+            # Concurrently created by another transaction
+            pass
+        chain_nonce = session.execute(statement).scalar_one()
+    return chain_nonce
+
+
+def _create_chain_nonce(session: sqlalchemy.orm.Session,
+                        destination_blockchain: Blockchain) -> None:
+    # Derive the initial nonce allocation state from the transfers
+    # already stored for the destination blockchain
+    maximum_nonce = session.execute(
+        _build_maximum_transfer_nonce_statement(
+            destination_blockchain)).scalar_one()
+    session.add(
+        ChainNonce(
+            blockchain_id=destination_blockchain.value,
+            next_nonce=None if maximum_nonce is None else maximum_nonce + 1))
+    session.flush()
+    session.execute(
+        sqlalchemy.insert(FreeNonce).from_select(
+            [FreeNonce.blockchain_id, FreeNonce.nonce],
+            _build_failed_transfer_nonces_statement(destination_blockchain)))
+
+
+def _free_transfer_nonce(session: sqlalchemy.orm.Session,
+                         transfer: Transfer) -> None:
+    session.flush()
+    # Serialized with the nonce allocation and with the creation of the
+    # nonce allocation state (which frees the nonces of all failed
+    # transfers, possibly including this one)
+    _lock_chain_nonce(session, Blockchain(transfer.destination_blockchain_id))
+    insert = (sqlalchemy.dialects.postgresql.insert
+              if session.get_bind().dialect.name == 'postgresql' else
+              sqlalchemy.dialects.sqlite.insert)
+    session.execute(
+        insert(FreeNonce).values(
+            blockchain_id=transfer.destination_blockchain_id,
+            nonce=transfer.nonce).on_conflict_do_nothing())
+
+
+def _get_transfer_task_last_alive() -> sqlalchemy.ColumnElement:
+    # A task which has not started an attempt yet has last been known
+    # to be alive when it was scheduled
+    return sqlalchemy.func.coalesce(TransferTask.heartbeat,
+                                    TransferTask.created)
+
+
+def _build_failed_transfer_nonces_statement(
+        destination_blockchain: Blockchain) -> sqlalchemy.Select:
+    return sqlalchemy.select(
+        Transfer.destination_blockchain_id, Transfer.nonce).where(
+            Transfer.destination_blockchain_id == destination_blockchain.value,
+            Transfer.nonce.is_not(None),
+            Transfer.status_id.in_(_FAILED_TRANSFER_STATUS_IDS))
+
+
+def _build_maximum_transfer_nonce_statement(
+        destination_blockchain: Blockchain) -> sqlalchemy.Select:
+    return sqlalchemy.select(sqlalchemy.func.max(Transfer.nonce)).where(
+        Transfer.destination_blockchain_id == destination_blockchain.value)
+
+
+def _build_stale_transfers_statement(statuses: typing.Iterable[TransferStatus],
+                                     stale_before: datetime.datetime,
+                                     limit: int) -> sqlalchemy.Select:
+    live_transfer_tasks = sqlalchemy.select(TransferTask.transfer_id).where(
+        TransferTask.transfer_id == Transfer.id,
+        _get_transfer_task_last_alive() >= stale_before)
+    # The transfers are first narrowed down by the index on their
+    # status
+    return sqlalchemy.select(Transfer.id).where(
+        Transfer.status_id.in_([status.value for status in statuses]),
+        Transfer.scheduled_step.is_(None), Transfer.created < stale_before,
+        sqlalchemy.or_(Transfer.updated.is_(None), Transfer.updated
+                       < stale_before),
+        sqlalchemy.or_(Transfer.next_attempt_at.is_(None),
+                       Transfer.next_attempt_at < stale_before),
+        ~live_transfer_tasks.exists()).order_by(Transfer.id).limit(limit)
+
+
+def _build_transfer_id_statement(source_blockchain: Blockchain,
+                                 source_transaction_id: str) \
+        -> sqlalchemy.Select:
+    return sqlalchemy.select(Transfer.id).where(
+        Transfer.source_blockchain_id == source_blockchain.value,
+        Transfer.source_transaction_id == source_transaction_id)
+
+
+def _build_unconfirmed_transfers_statement(
+        destination_blockchain: Blockchain) -> sqlalchemy.Select:
+    return sqlalchemy.select(
+        Transfer.id, Transfer.internal_transaction_id).where(
+            Transfer.destination_blockchain_id == destination_blockchain.value,
+            Transfer.internal_transaction_id.is_not(None)).order_by(
+                Transfer.id)
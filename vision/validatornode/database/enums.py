@@ -20,3 +20,14 @@ class TransferStatus(enum.IntEnum):
     SOURCE_TRANSACTION_DETECTED_NEW_NONCE_ASSIGNED = 100
     DESTINATION_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED = 103
     SOURCE_REVERSAL_TRANSACTION_FAILED_NEW_NONCE_ASSIGNED = 106
+
+
+class TransferStep(enum.IntEnum):
+    """Enumeration of the transfer processing steps executed by the
+    database-backed transfer scheduler (the enum names correspond to
+    the names of the equivalent Celery transfer tasks).
+
+    """
+    VALIDATE_TRANSFER = 0
+    SUBMIT_TRANSFER_TO_PRIMARY_NODE = 1
+    SUBMIT_TRANSFER_ONCHAIN = 2
@@ -0,0 +1,25 @@
+"""transfer_task_heartbeat
+
+Revision ID: 3f8a6d1c2e95
+Revises: b7f4c1e9a263
+Create Date: 2026-10-21 10:14:52.736918
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '3f8a6d1c2e95'
+down_revision = 'b7f4c1e9a263'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfer_tasks',
+        sqlalchemy.Column('heartbeat', sqlalchemy.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('transfer_tasks', 'heartbeat')
@@ -0,0 +1,30 @@
+"""transfer_submission_claim
+
+Revision ID: 4a7d1c9e2f60
+Revises: 9c2f4e7a1b3d
+Create Date: 2026-10-19 11:02:44.126385
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '4a7d1c9e2f60'
+down_revision = '9c2f4e7a1b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('submission_task_id', sqlalchemy.Text(),
+                          nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('submission_data', sqlalchemy.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('transfers', 'submission_data')
+    alembic.op.drop_column('transfers', 'submission_task_id')
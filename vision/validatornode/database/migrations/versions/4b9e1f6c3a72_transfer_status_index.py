@@ -0,0 +1,23 @@
+"""transfer_status_index
+
+Revision ID: 4b9e1f6c3a72
+Revises: e2a7c4d9b381
+Create Date: 2026-10-19 21:14:08.305617
+
+"""
+import alembic
+
+# revision identifiers, used by Alembic.
+revision = '4b9e1f6c3a72'
+down_revision = 'e2a7c4d9b381'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.create_index('ix_transfers_status_id', 'transfers',
+                            ['status_id'])
+
+
+def downgrade() -> None:
+    alembic.op.drop_index('ix_transfers_status_id', table_name='transfers')
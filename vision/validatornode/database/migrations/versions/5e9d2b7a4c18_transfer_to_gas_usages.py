@@ -0,0 +1,41 @@
+"""transfer_to_gas_usages
+
+Revision ID: 5e9d2b7a4c18
+Revises: 8a4c2e7f1d35
+Create Date: 2026-10-20 14:27:51.308846
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '5e9d2b7a4c18'
+down_revision = '8a4c2e7f1d35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.create_table(
+        'transfer_to_gas_usages',
+        sqlalchemy.Column('id', sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.Column('blockchain_id', sqlalchemy.Integer(),
+                          nullable=False),
+        sqlalchemy.Column('number_signers', sqlalchemy.Integer(),
+                          nullable=False),
+        sqlalchemy.Column('gas_used', sqlalchemy.BigInteger(), nullable=False),
+        sqlalchemy.Column('created', sqlalchemy.DateTime(), nullable=False),
+        sqlalchemy.ForeignKeyConstraint(
+            ['blockchain_id'],
+            ['blockchains.id'],
+        ), sqlalchemy.PrimaryKeyConstraint('id'))
+    alembic.op.create_index(
+        'ix_transfer_to_gas_usages_blockchain_id_number_signers',
+        'transfer_to_gas_usages', ['blockchain_id', 'number_signers', 'id'])
+
+
+def downgrade() -> None:
+    alembic.op.drop_index(
+        'ix_transfer_to_gas_usages_blockchain_id_number_signers',
+        table_name='transfer_to_gas_usages')
+    alembic.op.drop_table('transfer_to_gas_usages')
@@ -0,0 +1,38 @@
+"""transfer_partial_indexes
+
+Revision ID: 6d1c8e3f5a94
+Revises: a3d8f5b2c617
+Create Date: 2026-10-19 23:41:27.918364
+
+"""
+import alembic
+import sqlalchemy
+
+from vision.validatornode.database.enums import TransferStatus
+
+# revision identifiers, used by Alembic.
+revision = '6d1c8e3f5a94'
+down_revision = 'a3d8f5b2c617'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Failed transfers whose nonces are reused by the nonce allocation
+    alembic.op.create_index(
+        'ix_transfers_failed_nonces', 'transfers',
+        ['destination_blockchain_id', 'nonce'],
+        postgresql_where=sqlalchemy.column('status_id').in_([
+            TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
+            TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED.value
+        ]))
+    # Transfers with a submitted transaction awaiting its confirmation
+    alembic.op.create_index(
+        'ix_transfers_unconfirmed', 'transfers',
+        ['destination_blockchain_id', 'id'], postgresql_where=sqlalchemy.text(
+            'internal_transaction_id IS NOT NULL'))
+
+
+def downgrade() -> None:
+    alembic.op.drop_index('ix_transfers_unconfirmed', table_name='transfers')
+    alembic.op.drop_index('ix_transfers_failed_nonces', table_name='transfers')
@@ -0,0 +1,54 @@
+"""chain_nonce_allocation
+
+Revision ID: 7e3b5a2c9d14
+Revises: 4a7d1c9e2f60
+Create Date: 2026-10-19 13:27:05.381942
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '7e3b5a2c9d14'
+down_revision = '4a7d1c9e2f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.create_table(
+        'chain_nonces',
+        sqlalchemy.Column('blockchain_id', sqlalchemy.Integer(),
+                          nullable=False),
+        sqlalchemy.Column('next_nonce', sqlalchemy.BigInteger(),
+                          nullable=True),
+        sqlalchemy.ForeignKeyConstraint(
+            ['blockchain_id'],
+            ['blockchains.id'],
+        ), sqlalchemy.PrimaryKeyConstraint('blockchain_id'))
+    alembic.op.create_table(
+        'free_nonces',
+        sqlalchemy.Column('blockchain_id', sqlalchemy.Integer(),
+                          nullable=False),
+        sqlalchemy.Column('nonce', sqlalchemy.BigInteger(), nullable=False),
+        sqlalchemy.ForeignKeyConstraint(
+            ['blockchain_id'],
+            ['chain_nonces.blockchain_id'],
+        ), sqlalchemy.PrimaryKeyConstraint('blockchain_id', 'nonce'))
+    # Nonce allocation state of the destination blockchains with
+    # already assigned transfer nonces
+    alembic.op.execute(
+        'INSERT INTO chain_nonces (blockchain_id, next_nonce) '
+        'SELECT destination_blockchain_id, MAX(nonce) + 1 FROM transfers '
+        'WHERE nonce IS NOT NULL GROUP BY destination_blockchain_id')
+    # Nonces of failed transfers (DESTINATION_TRANSACTION_FAILED and
+    # SOURCE_REVERSAL_TRANSACTION_FAILED)
+    alembic.op.execute(
+        'INSERT INTO free_nonces (blockchain_id, nonce) '
+        'SELECT destination_blockchain_id, nonce FROM transfers '
+        'WHERE nonce IS NOT NULL AND status_id IN (3, 6)')
+
+
+def downgrade() -> None:
+    alembic.op.drop_table('free_nonces')
+    alembic.op.drop_table('chain_nonces')
@@ -0,0 +1,33 @@
+"""transfer_schedule_lease
+
+Revision ID: 8a4c2e7f1d35
+Revises: f3b6a9d2c478
+Create Date: 2026-10-20 11:06:14.729583
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '8a4c2e7f1d35'
+down_revision = 'f3b6a9d2c478'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('schedule_id', sqlalchemy.Text(), nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('leased_until', sqlalchemy.DateTime(),
+                          nullable=True))
+    alembic.op.execute('UPDATE transfers '
+                       'SET schedule_id = gen_random_uuid()::text '
+                       'WHERE scheduled_step IS NOT NULL')
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('transfers', 'leased_until')
+    alembic.op.drop_column('transfers', 'schedule_id')
@@ -0,0 +1,37 @@
+"""pending_transfer_signatures
+
+Revision ID: 8e2d5f3a7c41
+Revises: 3f8a6d1c2e95
+Create Date: 2026-10-21 14:32:08.164275
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '8e2d5f3a7c41'
+down_revision = '3f8a6d1c2e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('validator_nonce_prefetched', sqlalchemy.DateTime(),
+                          nullable=True))
+    alembic.op.create_table(
+        'pending_transfer_signatures',
+        sqlalchemy.Column('transfer_id', sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.Column('signature', sqlalchemy.String(length=132),
+                          nullable=False),
+        sqlalchemy.Column('created', sqlalchemy.DateTime(), nullable=False),
+        sqlalchemy.ForeignKeyConstraint(
+            ['transfer_id'],
+            ['transfers.id'],
+        ), sqlalchemy.PrimaryKeyConstraint('transfer_id'))
+
+
+def downgrade() -> None:
+    alembic.op.drop_table('pending_transfer_signatures')
+    alembic.op.drop_column('transfers', 'validator_nonce_prefetched')
@@ -0,0 +1,29 @@
+"""validator_node_signature_verified
+
+Revision ID: 9c2f4e7a1b3d
+Revises: e648dd961dfc
+Create Date: 2026-10-19 09:41:27.503118
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = '9c2f4e7a1b3d'
+down_revision = 'e648dd961dfc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'validator_node_signatures',
+        sqlalchemy.Column('verified', sqlalchemy.DateTime(), nullable=True))
+    # All previously stored signatures have been verified before they
+    # were added
+    alembic.op.execute('UPDATE validator_node_signatures '
+                       'SET verified = created')
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('validator_node_signatures', 'verified')
@@ -0,0 +1,32 @@
+"""transfer_tasks
+
+Revision ID: a3d8f5b2c617
+Revises: 4b9e1f6c3a72
+Create Date: 2026-10-19 22:41:37.518204
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'a3d8f5b2c617'
+down_revision = '4b9e1f6c3a72'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.create_table(
+        'transfer_tasks',
+        sqlalchemy.Column('transfer_id', sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.Column('step', sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.Column('task_id', sqlalchemy.Text(), nullable=False),
+        sqlalchemy.Column('created', sqlalchemy.DateTime(), nullable=False),
+        sqlalchemy.ForeignKeyConstraint(
+            ['transfer_id'],
+            ['transfers.id'],
+        ), sqlalchemy.PrimaryKeyConstraint('transfer_id', 'step'))
+
+
+def downgrade() -> None:
+    alembic.op.drop_table('transfer_tasks')
@@ -0,0 +1,31 @@
+"""transfer_confirmation_tracking
+
+Revision ID: b5e8d2f1a6c3
+Revises: 7e3b5a2c9d14
+Create Date: 2026-10-19 15:12:38.604217
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'b5e8d2f1a6c3'
+down_revision = '7e3b5a2c9d14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('internal_transaction_id', sqlalchemy.Text(),
+                          nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('confirmation_data', sqlalchemy.JSON(),
+                          nullable=True))
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('transfers', 'confirmation_data')
+    alembic.op.drop_column('transfers', 'internal_transaction_id')
@@ -0,0 +1,28 @@
+"""performance_metrics
+
+Revision ID: b7f4c1e9a263
+Revises: 5e9d2b7a4c18
+Create Date: 2026-10-20 16:52:08.614273
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'b7f4c1e9a263'
+down_revision = '5e9d2b7a4c18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.create_table(
+        'performance_metrics',
+        sqlalchemy.Column('name', sqlalchemy.Text(), nullable=False),
+        sqlalchemy.Column('value', sqlalchemy.JSON(), nullable=False),
+        sqlalchemy.Column('updated', sqlalchemy.DateTime(), nullable=False),
+        sqlalchemy.PrimaryKeyConstraint('name'))
+
+
+def downgrade() -> None:
+    alembic.op.drop_table('performance_metrics')
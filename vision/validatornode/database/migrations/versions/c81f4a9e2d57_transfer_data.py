@@ -0,0 +1,25 @@
+"""transfer_data
+
+Revision ID: c81f4a9e2d57
+Revises: b5e8d2f1a6c3
+Create Date: 2026-10-19 17:41:09.218350
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'c81f4a9e2d57'
+down_revision = 'b5e8d2f1a6c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('transfer_data', sqlalchemy.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    alembic.op.drop_column('transfers', 'transfer_data')
@@ -0,0 +1,40 @@
+"""transfer_scheduler
+
+Revision ID: e2a7c4d9b381
+Revises: c81f4a9e2d57
+Create Date: 2026-10-19 19:03:52.471926
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7c4d9b381'
+down_revision = 'c81f4a9e2d57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('scheduled_step', sqlalchemy.Integer(),
+                          nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('next_attempt_at', sqlalchemy.DateTime(),
+                          nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('scheduled_attempts', sqlalchemy.Integer(),
+                          nullable=True))
+    alembic.op.create_index('ix_transfers_scheduled_step_next_attempt_at',
+                            'transfers', ['scheduled_step', 'next_attempt_at'])
+
+
+def downgrade() -> None:
+    alembic.op.drop_index('ix_transfers_scheduled_step_next_attempt_at',
+                          table_name='transfers')
+    alembic.op.drop_column('transfers', 'scheduled_attempts')
+    alembic.op.drop_column('transfers', 'next_attempt_at')
+    alembic.op.drop_column('transfers', 'scheduled_step')
@@ -0,0 +1,51 @@
+"""transfer_awaiting_signatures
+
+Revision ID: f3b6a9d2c478
+Revises: 6d1c8e3f5a94
+Create Date: 2026-10-20 09:17:52.381046
+
+"""
+import alembic
+import sqlalchemy
+
+# revision identifiers, used by Alembic.
+revision = 'f3b6a9d2c478'
+down_revision = '6d1c8e3f5a94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('awaiting_signatures_since', sqlalchemy.DateTime(),
+                          nullable=True))
+    alembic.op.execute('UPDATE transfers '
+                       'SET awaiting_signatures_since = '
+                       'COALESCE(updated, created) '
+                       'WHERE submission_data IS NOT NULL')
+    # Transfers detected before their data was stored in the database
+    # only have the copies of the data
+    alembic.op.execute('UPDATE transfers '
+                       'SET transfer_data = '
+                       'COALESCE(confirmation_data, submission_data) '
+                       'WHERE transfer_data IS NULL')
+    alembic.op.drop_column('transfers', 'confirmation_data')
+    alembic.op.drop_column('transfers', 'submission_data')
+
+
+def downgrade() -> None:
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('submission_data', sqlalchemy.JSON(), nullable=True))
+    alembic.op.add_column(
+        'transfers',
+        sqlalchemy.Column('confirmation_data', sqlalchemy.JSON(),
+                          nullable=True))
+    alembic.op.execute('UPDATE transfers '
+                       'SET submission_data = transfer_data '
+                       'WHERE awaiting_signatures_since IS NOT NULL')
+    alembic.op.execute('UPDATE transfers '
+                       'SET confirmation_data = transfer_data '
+                       'WHERE internal_transaction_id IS NOT NULL')
+    alembic.op.drop_column('transfers', 'awaiting_signatures_since')
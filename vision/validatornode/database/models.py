@@ -7,8 +7,16 @@ import typing
 import sqlalchemy
 import sqlalchemy.orm
 
+from vision.validatornode.database import enums
+
 UNIQUE_BLOCKCHAIN_NONCE_CONSTRAINT = 'unique_blockchain_nonce'
 UNIQUE_VALIDATOR_NONCE_CONSTRAINT = 'unique_validator_nonce'
+SCHEDULED_TRANSFERS_INDEX = 'ix_transfers_scheduled_step_next_attempt_at'
+TRANSFER_STATUS_INDEX = 'ix_transfers_status_id'
+FAILED_TRANSFER_NONCES_INDEX = 'ix_transfers_failed_nonces'
+UNCONFIRMED_TRANSFERS_INDEX = 'ix_transfers_unconfirmed'
+TRANSFER_TO_GAS_USAGES_INDEX = \
+    'ix_transfer_to_gas_usages_blockchain_id_number_signers'
 
 Base: typing.Any = sqlalchemy.orm.declarative_base()
 """SQLAlchemy base class for declarative class definitions."""
@@ -179,6 +187,10 @@ class ValidatorNodeSignature(Base):
         transfer.
     created : sqlalchemy.Column
         The timestamp when the signature was added.
+    verified : sqlalchemy.Column
+        The timestamp when the signature was verified to be a valid
+        signature of the validator node for the transfer (None if it
+        has not been verified).
 
     """
     __tablename__ = 'validator_node_signatures'
@@ -192,6 +204,7 @@ class ValidatorNodeSignature(Base):
                                   nullable=False)
     created = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
                                 default=datetime.datetime.utcnow)
+    verified = sqlalchemy.Column(sqlalchemy.DateTime, nullable=True)
     transfer = sqlalchemy.orm.relationship(
         'Transfer', back_populates='validator_node_signatures')
     validator_node = sqlalchemy.orm.relationship('ValidatorNode',
@@ -281,6 +294,43 @@ class Transfer(Base):
         reused in another transaction).
     status_id : sqlalchemy.Column
         The ID of the transfer status (foreign key).
+    submission_task_id : sqlalchemy.Column
+        The unique ID of the Celery task which has claimed the
+        submission of the transfer to the destination blockchain (NULL
+        if no task has claimed it yet).
+    awaiting_signatures_since : sqlalchemy.Column
+        The timestamp since when the submission of the transfer to the
+        destination blockchain has been awaiting more signatures (NULL
+        if the submission is not awaiting more signatures).
+    transfer_data : sqlalchemy.Column
+        The cross-chain transfer data loaded by the Celery transfer
+        tasks (NULL for transfers detected before the data was stored
+        in the database).
+    internal_transaction_id : sqlalchemy.Column
+        The unique internal ID of the transaction submitted to the
+        destination blockchain (NULL if there is no submitted
+        transaction awaiting its confirmation).
+    scheduled_step : sqlalchemy.Column
+        The processing step scheduled to be executed by the
+        database-backed transfer scheduler (NULL if no step is
+        scheduled).
+    next_attempt_at : sqlalchemy.Column
+        The time of the next attempt of the scheduled processing step
+        or, if no step is scheduled, of the next retry of the Celery
+        transfer task (NULL if unknown).
+    scheduled_attempts : sqlalchemy.Column
+        The number of unsuccessful attempts of the scheduled processing
+        step (NULL if no step is scheduled).
+    schedule_id : sqlalchemy.Column
+        The unique ID of the scheduled processing step, which is kept
+        for all of its attempts (NULL if no step is scheduled).
+    leased_until : sqlalchemy.Column
+        The time until which the scheduled processing step is leased
+        by a scheduler worker (NULL if the step is not being executed).
+    validator_nonce_prefetched : sqlalchemy.Column
+        The timestamp when the validator nonce was prefetched from the
+        primary validator node by a secondary node in pipeline mode
+        (NULL if the validator nonce has not been prefetched).
     created : sqlalchemy.Column
         The timestamp when the transfer request was received.
     updated : sqlalchemy.Column
@@ -335,6 +385,16 @@ class Transfer(Base):
     status_id = sqlalchemy.Column(sqlalchemy.Integer,
                                   sqlalchemy.ForeignKey('transfer_status.id'),
                                   nullable=False)
+    submission_task_id = sqlalchemy.Column(sqlalchemy.Text)
+    awaiting_signatures_since = sqlalchemy.Column(sqlalchemy.DateTime)
+    transfer_data = sqlalchemy.Column(sqlalchemy.JSON)
+    internal_transaction_id = sqlalchemy.Column(sqlalchemy.Text)
+    scheduled_step = sqlalchemy.Column(sqlalchemy.Integer)
+    next_attempt_at = sqlalchemy.Column(sqlalchemy.DateTime)
+    scheduled_attempts = sqlalchemy.Column(sqlalchemy.Integer)
+    schedule_id = sqlalchemy.Column(sqlalchemy.Text)
+    leased_until = sqlalchemy.Column(sqlalchemy.DateTime)
+    validator_nonce_prefetched = sqlalchemy.Column(sqlalchemy.DateTime)
     created = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
                                 default=datetime.datetime.utcnow)
     updated = sqlalchemy.Column(sqlalchemy.DateTime)
@@ -363,17 +423,186 @@ class Transfer(Base):
     validator_node_signatures = sqlalchemy.orm.relationship(
         'ValidatorNodeSignature', back_populates='transfer')
     status = sqlalchemy.orm.relationship('TransferStatus')
-    __table_args__ = (sqlalchemy.UniqueConstraint(
-        destination_forwarder_contract_id, validator_nonce,
-        name=UNIQUE_VALIDATOR_NONCE_CONSTRAINT),
-                      sqlalchemy.UniqueConstraint(
-                          destination_blockchain_id, nonce, deferrable=True,
-                          name=UNIQUE_BLOCKCHAIN_NONCE_CONSTRAINT),
-                      sqlalchemy.UniqueConstraint(source_blockchain_id,
-                                                  source_transfer_id),
-                      sqlalchemy.UniqueConstraint(destination_blockchain_id,
-                                                  destination_transfer_id),
-                      sqlalchemy.UniqueConstraint(source_blockchain_id,
-                                                  source_transaction_id),
-                      sqlalchemy.UniqueConstraint(destination_blockchain_id,
-                                                  destination_transaction_id))
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint(destination_forwarder_contract_id,
+                                    validator_nonce,
+                                    name=UNIQUE_VALIDATOR_NONCE_CONSTRAINT),
+        sqlalchemy.UniqueConstraint(destination_blockchain_id, nonce,
+                                    deferrable=True,
+                                    name=UNIQUE_BLOCKCHAIN_NONCE_CONSTRAINT),
+        sqlalchemy.UniqueConstraint(source_blockchain_id, source_transfer_id),
+        sqlalchemy.UniqueConstraint(destination_blockchain_id,
+                                    destination_transfer_id),
+        sqlalchemy.UniqueConstraint(source_blockchain_id,
+                                    source_transaction_id),
+        sqlalchemy.UniqueConstraint(destination_blockchain_id,
+                                    destination_transaction_id),
+        sqlalchemy.Index(SCHEDULED_TRANSFERS_INDEX, scheduled_step,
+                         next_attempt_at),
+        sqlalchemy.Index(TRANSFER_STATUS_INDEX, status_id),
+        sqlalchemy.Index(
+            FAILED_TRANSFER_NONCES_INDEX, destination_blockchain_id, nonce,
+            postgresql_where=status_id.in_([
+                enums.TransferStatus.DESTINATION_TRANSACTION_FAILED.value,
+                enums.TransferStatus.SOURCE_REVERSAL_TRANSACTION_FAILED.value
+            ])),
+        sqlalchemy.Index(
+            UNCONFIRMED_TRANSFERS_INDEX, destination_blockchain_id, id,
+            postgresql_where=internal_transaction_id.is_not(None)))
+
+
+class ChainNonce(Base):
+    """Model class for the "chain_nonces" database table. Each instance
+    represents the transaction nonce allocation state of the Validator
+    Node on a destination blockchain.
+
+    Attributes
+    ----------
+    blockchain_id : sqlalchemy.Column
+        The unique ID of the destination blockchain (primary key,
+        foreign key).
+    next_nonce : sqlalchemy.Column
+        The next nonce to be allocated if no failed nonce can be
+        reused (NULL if no nonce has been allocated yet).
+
+    """
+    __tablename__ = 'chain_nonces'
+    blockchain_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                      sqlalchemy.ForeignKey('blockchains.id'),
+                                      primary_key=True)
+    next_nonce = sqlalchemy.Column(sqlalchemy.BigInteger)
+    blockchain = sqlalchemy.orm.relationship('Blockchain')
+
+
+class FreeNonce(Base):
+    """Model class for the "free_nonces" database table. Each instance
+    represents a nonce of a failed transfer transaction that can be
+    reused for another transfer to the same destination blockchain.
+
+    Attributes
+    ----------
+    blockchain_id : sqlalchemy.Column
+        The unique ID of the destination blockchain (primary key,
+        foreign key).
+    nonce : sqlalchemy.Column
+        The reusable nonce (primary key).
+
+    """
+    __tablename__ = 'free_nonces'
+    blockchain_id = sqlalchemy.Column(
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey('chain_nonces.blockchain_id'), primary_key=True)
+    nonce = sqlalchemy.Column(sqlalchemy.BigInteger, primary_key=True)
+
+
+class TransferTask(Base):
+    """Model class for the "transfer_tasks" database table. Each
+    instance represents the Celery transfer task in flight for a
+    processing step of a transfer (at most one task per transfer and
+    step).
+
+    Attributes
+    ----------
+    transfer_id : sqlalchemy.Column
+        The unique ID of the transfer (primary key, foreign key).
+    step : sqlalchemy.Column
+        The processing step executed by the task (primary key, equal
+        to the TransferStep enum value).
+    task_id : sqlalchemy.Column
+        The unique ID of the Celery transfer task.
+    created : sqlalchemy.Column
+        The timestamp when the task was scheduled.
+    heartbeat : sqlalchemy.Column
+        The timestamp when the task has last started an attempt of the
+        processing step (NULL if the task has not started yet).
+
+    """
+    __tablename__ = 'transfer_tasks'
+    transfer_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                    sqlalchemy.ForeignKey('transfers.id'),
+                                    primary_key=True)
+    step = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    task_id = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
+    created = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
+                                default=datetime.datetime.utcnow)
+    heartbeat = sqlalchemy.Column(sqlalchemy.DateTime)
+
+
+class PendingTransferSignature(Base):
+    """Model class for the "pending_transfer_signatures" database
+    table. Each instance represents a transfer signature presigned by a
+    secondary node in pipeline mode which is still to be posted to the
+    primary validator node.
+
+    Attributes
+    ----------
+    transfer_id : sqlalchemy.Column
+        The unique ID of the transfer (primary key, foreign key).
+    signature : sqlalchemy.Column
+        The secondary node's signature for the transfer.
+    created : sqlalchemy.Column
+        The timestamp when the signature was queued.
+
+    """
+    __tablename__ = 'pending_transfer_signatures'
+    transfer_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                    sqlalchemy.ForeignKey('transfers.id'),
+                                    primary_key=True)
+    signature = sqlalchemy.Column(sqlalchemy.String(132), nullable=False)
+    created = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
+                                default=datetime.datetime.utcnow)
+
+
+class PerformanceMetric(Base):
+    """Model class for the "performance_metrics" database table. Each
+    instance represents a performance metric aggregated over all
+    Validator Node processes.
+
+    Attributes
+    ----------
+    name : sqlalchemy.Column
+        The unique name of the metric (primary key).
+    value : sqlalchemy.Column
+        The aggregated value of the metric.
+    updated : sqlalchemy.Column
+        The timestamp when the metric was last updated.
+
+    """
+    __tablename__ = 'performance_metrics'
+    name = sqlalchemy.Column(sqlalchemy.Text, primary_key=True)
+    value = sqlalchemy.Column(sqlalchemy.JSON, nullable=False)
+    updated = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
+                                default=datetime.datetime.utcnow,
+                                onupdate=datetime.datetime.utcnow)
+
+
+class TransferToGasUsage(Base):
+    """Model class for the "transfer_to_gas_usages" database table.
+    Each instance represents the gas used by a confirmed transferTo
+    transaction on a destination blockchain.
+
+    Attributes
+    ----------
+    id : sqlalchemy.Column
+        The unique ID of the gas usage sample (primary key).
+    blockchain_id : sqlalchemy.Column
+        The unique ID of the destination blockchain (foreign key).
+    number_signers : sqlalchemy.Column
+        The number of signers of the transferTo transaction.
+    gas_used : sqlalchemy.Column
+        The gas used by the transferTo transaction.
+    created : sqlalchemy.Column
+        The timestamp when the gas usage was recorded.
+
+    """
+    __tablename__ = 'transfer_to_gas_usages'
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    blockchain_id = sqlalchemy.Column(sqlalchemy.Integer,
+                                      sqlalchemy.ForeignKey('blockchains.id'),
+                                      nullable=False)
+    number_signers = sqlalchemy.Column(sqlalchemy.Integer, nullable=False)
+    gas_used = sqlalchemy.Column(sqlalchemy.BigInteger, nullable=False)
+    created = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False,
+                                default=datetime.datetime.utcnow)
+    __table_args__ = (sqlalchemy.Index(TRANSFER_TO_GAS_USAGES_INDEX,
+                                       blockchain_id, number_signers, id), )
@@ -0,0 +1,477 @@
+"""Module for collecting lightweight performance metrics of the
+Validator Node (e.g. the timings of the transfer validation steps).
+The metrics are collected in-process and periodically exported to the
+database, where they are aggregated over all Validator Node processes.
+
+"""
+import bisect
+import contextlib
+import contextvars
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+import typing
+
+from vision.common.blockchains.enums import Blockchain
+
+from vision.validatornode.blockchains.base import BlockchainClient
+from vision.validatornode.database import access as database_access
+
+_HISTOGRAM_BUCKET_BOUNDS: typing.Final[tuple[float,
+                                             ...]] = (0.005, 0.01, 0.025, 0.05,
+                                                      0.1, 0.25, 0.5, 1.0, 2.5,
+                                                      5.0, 10.0, 30.0)
+"""Upper bounds (in seconds) of the wall time histogram buckets."""
+
+_LOCAL_BLOCKCHAIN_CLIENT_METHODS: typing.Final[frozenset[str]] = frozenset({
+    'get_blockchain', 'get_blockchain_name', 'get_error_class',
+    'get_own_address', 'is_equal_address', 'is_valid_recipient_address',
+    'is_valid_transaction_id'
+})
+"""Blockchain client methods that do not invoke any blockchain node."""
+
+_METRICS_EXPORT_INTERVAL = 15
+"""Interval (in seconds) between two exports of the metrics collected by
+a process to the database."""
+
+_HISTOGRAM_METRIC_FIELDS: typing.Final[frozenset[str]] = frozenset(
+    {'wall_time', 'interval'})
+"""Fields of the exported metrics holding histograms."""
+
+_COUNTER_METRIC_FIELDS: typing.Final[frozenset[str]] = frozenset(
+    {'client_call_count', 'cache_hits'})
+"""Fields of the exported metrics holding counters."""
+
+_MAXIMUM_METRIC_FIELDS: typing.Final[frozenset[str]] = frozenset(
+    {'max_attempt'})
+"""Fields of the exported metrics holding maximum values."""
+
+_LAST_VALUE_METRIC_FIELDS: typing.Final[frozenset[str]] = frozenset(
+    {'last_interval'})
+"""Fields of the exported metrics holding the last observed value."""
+
+_METRIC_KINDS: typing.Final[tuple[str,
+                                  ...]] = ('steps', 'blockchain_client_calls',
+                                           'task_retries')
+"""Kinds of the collected metrics."""
+
+_logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Cumulative histogram of observed wall times.
+
+    """
+    def __init__(self):
+        self.__bucket_counts = [0] * (len(_HISTOGRAM_BUCKET_BOUNDS) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observed value to the histogram.
+
+        Parameters
+        ----------
+        value : float
+            The observed value (in seconds).
+
+        """
+        self.__bucket_counts[bisect.bisect_left(_HISTOGRAM_BUCKET_BOUNDS,
+                                                value)] += 1
+        self.__count += 1
+        self.__sum += value
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        """Convert the histogram to a dictionary.
+
+        Returns
+        -------
+        dict
+            The dictionary representation of the histogram with
+            cumulative bucket counts.
+
+        """
+        buckets: dict[str, int] = {}
+        cumulative_count = 0
+        for bound, bucket_count in zip(
+                list(map(str, _HISTOGRAM_BUCKET_BOUNDS)) + ['+Inf'],
+                self.__bucket_counts):
+            cumulative_count += bucket_count
+            buckets[bound] = cumulative_count
+        return {'count': self.__count, 'sum': self.__sum, 'buckets': buckets}
+
+
+@dataclasses.dataclass
+class _StepMetrics:
+    wall_time: Histogram = dataclasses.field(default_factory=Histogram)
+    client_call_count: int = 0
+    cache_hits: int = 0
+
+
+@dataclasses.dataclass
+class _StepMeasurement:
+    client_call_count: int = 0
+    cache_hits: int = 0
+
+
+@dataclasses.dataclass
+class _TaskRetryMetrics:
+    interval: Histogram = dataclasses.field(default_factory=Histogram)
+    max_attempt: int = 0
+    last_interval: float = 0.0
+
+
+_StepKey: typing.TypeAlias = tuple[str, Blockchain, Blockchain]
+_CallKey: typing.TypeAlias = tuple[str, Blockchain]
+_TaskRetryKey: typing.TypeAlias = tuple[str, str]
+_BlockchainClient = typing.TypeVar('_BlockchainClient', bound=BlockchainClient)
+
+_lock = threading.Lock()
+_step_metrics: dict[_StepKey, _StepMetrics] = {}
+_call_metrics: dict[_CallKey, Histogram] = {}
+_task_retry_metrics: dict[_TaskRetryKey, _TaskRetryMetrics] = {}
+_current_step_measurement: contextvars.ContextVar[_StepMeasurement | None] = \
+    contextvars.ContextVar('current_step_measurement', default=None)
+
+_export_enabled = False
+"""True if the metrics collected by the current process (and all
+processes forked from it) are to be exported to the database."""
+
+_export_lock = threading.Lock()
+_export_thread_pid: int | None = None
+_unexported_metrics: dict[str, dict[str, typing.Any]] = {}
+"""Collected metrics whose export to the database has failed."""
+
+
+@contextlib.contextmanager
+def measure_step(step_name: str, source_blockchain: Blockchain,
+                 destination_blockchain: Blockchain) -> typing.Iterator[None]:
+    """Context manager for measuring the wall time, the number of
+    blockchain client calls invoking a blockchain node (each issuing
+    one or more RPCs), and the number of cache hits of a processing
+    step of a cross-chain transfer.
+
+    Parameters
+    ----------
+    step_name : str
+        The name of the processing step.
+    source_blockchain : Blockchain
+        The transfer's source blockchain.
+    destination_blockchain : Blockchain
+        The transfer's destination blockchain.
+
+    """
+    measurement = _StepMeasurement()
+    token = _current_step_measurement.set(measurement)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - start_time
+        _current_step_measurement.reset(token)
+        key = (step_name, source_blockchain, destination_blockchain)
+        with _lock:
+            _start_metrics_export()
+            step_metrics = _step_metrics.get(key)
+            if step_metrics is None:
+                step_metrics = _step_metrics[key] = _StepMetrics()
+            step_metrics.wall_time.observe(wall_time)
+            step_metrics.client_call_count += measurement.client_call_count
+            step_metrics.cache_hits += measurement.cache_hits
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                'transfer processing step measured', extra={
+                    'step': step_name,
+                    'source_blockchain': source_blockchain.name,
+                    'destination_blockchain': destination_blockchain.name,
+                    'wall_time': wall_time,
+                    'client_call_count': measurement.client_call_count,
+                    'cache_hits': measurement.cache_hits
+                })
+
+
+def record_cache_hit() -> None:
+    """Record a cache hit for the currently measured processing step
+    (if any).
+
+    """
+    measurement = _current_step_measurement.get()
+    if measurement is not None:
+        measurement.cache_hits += 1
+
+
+def record_task_retry(task_name: str, retry_reason: str, attempt: int,
+                      interval: float) -> None:
+    """Record a scheduled retry of a Celery task.
+
+    Parameters
+    ----------
+    task_name : str
+        The name of the retried task.
+    retry_reason : str
+        The reason for retrying the task.
+    attempt : int
+        The number of retries of the task so far.
+    interval : float
+        The interval (in seconds) until the task is retried.
+
+    """
+    key = (task_name, retry_reason)
+    with _lock:
+        _start_metrics_export()
+        task_retry_metrics = _task_retry_metrics.get(key)
+        if task_retry_metrics is None:
+            task_retry_metrics = _task_retry_metrics[key] = \
+                _TaskRetryMetrics()
+        task_retry_metrics.interval.observe(interval)
+        task_retry_metrics.max_attempt = max(task_retry_metrics.max_attempt,
+                                             attempt)
+        task_retry_metrics.last_interval = interval
+
+
+def instrument_blockchain_client(
+        blockchain_client: _BlockchainClient) -> _BlockchainClient:
+    """Wrap a blockchain client so that the wall time of each of its
+    method calls is measured and each of its calls invoking a
+    blockchain node is counted for the currently measured processing
+    step.
+
+    Parameters
+    ----------
+    blockchain_client : BlockchainClient
+        The blockchain client to instrument.
+
+    Returns
+    -------
+    BlockchainClient
+        The instrumented blockchain client.
+
+    """
+    return typing.cast(
+        _BlockchainClient,
+        _InstrumentedBlockchainClient(blockchain_client,
+                                      blockchain_client.get_blockchain()))
+
+
+def enable_metrics_export() -> None:
+    """Enable the periodic export of the metrics collected by the
+    current process (and all processes forked from it) to the database.
+
+    """
+    global _export_enabled
+    _export_enabled = True
+
+
+def export_metrics() -> None:
+    """Export the metrics collected by the current process since their
+    last export to the database.
+
+    """
+    global _unexported_metrics
+    with _export_lock:
+        with _lock:
+            metrics = _get_named_metrics()
+            _clear_metrics()
+        unexported_metrics = _merge_named_metrics(_unexported_metrics, metrics)
+        try:
+            database_access.update_performance_metrics(unexported_metrics,
+                                                       _merge_metric)
+        except Exception:
+            # The metrics are exported again with the next export
+            _logger.warning('unable to export the performance metrics',
+                            exc_info=True)
+            _unexported_metrics = unexported_metrics
+        else:
+            _unexported_metrics = {}
+
+
+def get_metrics() -> dict[str, typing.Any]:
+    """Get a snapshot of all metrics collected by the current process
+    (since their last export to the database).
+
+    Returns
+    -------
+    dict
+        The step metrics per chain pair, the blockchain client call
+        metrics per blockchain, and the task retry metrics per retry
+        reason.
+
+    """
+    with _lock:
+        return _group_named_metrics(_get_named_metrics())
+
+
+def read_metrics() -> dict[str, typing.Any]:
+    """Read all metrics collected by the Validator Node processes,
+    including the metrics of the current process not yet exported to
+    the database.
+
+    Returns
+    -------
+    dict
+        The step metrics per chain pair, the blockchain client call
+        metrics per blockchain, and the task retry metrics per retry
+        reason.
+
+    """
+    metrics = database_access.read_performance_metrics()
+    with _export_lock:
+        metrics = _merge_named_metrics(metrics, _unexported_metrics)
+    with _lock:
+        metrics = _merge_named_metrics(metrics, _get_named_metrics())
+    return _group_named_metrics(metrics)
+
+
+def reset_metrics() -> None:
+    """Discard all metrics collected by the current process.
+
+    """
+    global _unexported_metrics
+    with _export_lock:
+        _unexported_metrics = {}
+    with _lock:
+        _clear_metrics()
+
+
+def _get_named_metrics() -> dict[str, dict[str, typing.Any]]:
+    # Requires the metrics lock to be held
+    metrics: dict[str, dict[str, typing.Any]] = {}
+    for (step_name, source_blockchain,
+         destination_blockchain), step_metrics in _step_metrics.items():
+        metrics[_get_metric_name(
+            'steps', step_name, source_blockchain.name,
+            destination_blockchain.name)] = {
+                'step': step_name,
+                'source_blockchain': source_blockchain.name,
+                'destination_blockchain': destination_blockchain.name,
+                'wall_time': step_metrics.wall_time.to_dict(),
+                'client_call_count': step_metrics.client_call_count,
+                'cache_hits': step_metrics.cache_hits
+            }
+    for (method_name, blockchain), histogram in _call_metrics.items():
+        metrics[_get_metric_name('blockchain_client_calls', method_name,
+                                 blockchain.name)] = {
+                                     'method': method_name,
+                                     'blockchain': blockchain.name,
+                                     'wall_time': histogram.to_dict()
+                                 }
+    for (task_name,
+         retry_reason), task_retry_metrics in _task_retry_metrics.items():
+        metrics[_get_metric_name('task_retries', task_name, retry_reason)] = {
+            'task': task_name,
+            'retry_reason': retry_reason,
+            'interval': task_retry_metrics.interval.to_dict(),
+            'max_attempt': task_retry_metrics.max_attempt,
+            'last_interval': task_retry_metrics.last_interval
+        }
+    return metrics
+
+
+def _clear_metrics() -> None:
+    # Requires the metrics lock to be held
+    _step_metrics.clear()
+    _call_metrics.clear()
+    _task_retry_metrics.clear()
+
+
+def _get_metric_name(kind: str, *key: str) -> str:
+    return json.dumps([kind, *key])
+
+
+def _group_named_metrics(
+        metrics: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
+    grouped_metrics: dict[str, list[dict[str, typing.Any]]] = {
+        kind: []
+        for kind in _METRIC_KINDS
+    }
+    for name, metric in metrics.items():
+        grouped_metrics[json.loads(name)[0]].append(metric)
+    return grouped_metrics
+
+
+def _merge_named_metrics(
+    metrics: dict[str, dict[str, typing.Any]],
+    other_metrics: dict[str, dict[str, typing.Any]]
+) -> dict[str, dict[str, typing.Any]]:
+    merged_metrics = dict(metrics)
+    for name, metric in other_metrics.items():
+        merged_metrics[name] = (metric if name not in merged_metrics else
+                                _merge_metric(merged_metrics[name], metric))
+    return merged_metrics
+
+
+def _merge_metric(
+        metric: dict[str, typing.Any],
+        other_metric: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    merged_metric = dict(metric)
+    for field in _HISTOGRAM_METRIC_FIELDS & other_metric.keys():
+        merged_metric[field] = {
+            'count': metric[field]['count'] + other_metric[field]['count'],
+            'sum': metric[field]['sum'] + other_metric[field]['sum'],
+            'buckets': {
+                bound: bucket_count +
+                other_metric[field]['buckets'].get(bound, 0)
+                for bound, bucket_count in metric[field]['buckets'].items()
+            }
+        }
+    for field in _COUNTER_METRIC_FIELDS & other_metric.keys():
+        merged_metric[field] = metric[field] + other_metric[field]
+    for field in _MAXIMUM_METRIC_FIELDS & other_metric.keys():
+        merged_metric[field] = max(metric[field], other_metric[field])
+    for field in _LAST_VALUE_METRIC_FIELDS & other_metric.keys():
+        merged_metric[field] = other_metric[field]
+    return merged_metric
+
+
+def _start_metrics_export() -> None:
+    # Requires the metrics lock to be held; the export thread is
+    # started in each (forked) process collecting metrics
+    global _export_thread_pid
+    if not _export_enabled or _export_thread_pid == os.getpid():
+        return
+    _export_thread_pid = os.getpid()
+    threading.Thread(target=_export_metrics_periodically, daemon=True).start()
+
+
+def _export_metrics_periodically() -> None:
+    while True:
+        time.sleep(_METRICS_EXPORT_INTERVAL)
+        export_metrics()
+
+
+class _InstrumentedBlockchainClient:
+    def __init__(self, blockchain_client: typing.Any, blockchain: Blockchain):
+        self.__blockchain_client = blockchain_client
+        self.__blockchain = blockchain
+
+    def __getattr__(self, name: str) -> typing.Any:
+        attribute = getattr(self.__blockchain_client, name)
+        if not callable(attribute) or name in _LOCAL_BLOCKCHAIN_CLIENT_METHODS:
+            return attribute
+        if name == 'get_utilities':
+            return lambda: _InstrumentedBlockchainClient(
+                attribute(), self.__blockchain)
+        blockchain = self.__blockchain
+
+        def instrumented_method(*args: typing.Any,
+                                **kwargs: typing.Any) -> typing.Any:
+            measurement = _current_step_measurement.get()
+            if measurement is not None:
+                measurement.client_call_count += 1
+            start_time = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - start_time
+                key = (name, blockchain)
+                with _lock:
+                    _start_metrics_export()
+                    histogram = _call_metrics.get(key)
+                    if histogram is None:
+                        histogram = _call_metrics[key] = Histogram()
+                    histogram.observe(wall_time)
+
+        return instrumented_method
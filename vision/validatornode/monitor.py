@@ -1,5 +1,6 @@
 """Module for monitoring the cross-chain transfers on each supported and
-active blockchain.
+active blockchain (i.e. detecting new transfers and confirming the
+submitted transfers).
 
 """
 import concurrent.futures
@@ -35,10 +36,11 @@ def _run_monitor_workers() -> None:
             max_workers=max_workers) as executor:
         while True:
             futures_blockchains = {
-                executor.submit(
-                    TransferInteractor().detect_new_transfers,  # yapf bug
-                    blockchain): blockchain
+                executor.submit(monitor_function, blockchain): blockchain
                 for blockchain in active_blockchains
+                for monitor_function in (
+                    TransferInteractor().detect_new_transfers,
+                    TransferInteractor().confirm_transfers)
             }
             for future in concurrent.futures.as_completed(futures_blockchains):
                 blockchain = futures_blockchains[future]
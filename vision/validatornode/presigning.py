@@ -0,0 +1,32 @@
+"""Module for running the flusher of the transfer signatures presigned
+by a secondary node in pipeline mode, which periodically posts the
+queued signatures to the primary validator node in batches.
+
+"""
+import logging
+import threading
+import time
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.configuration import config
+
+_logger = logging.getLogger(__name__)
+
+
+def run_presigning() -> None:
+    """Run the flusher of the presigned transfer signatures.
+
+    """
+    threading.Thread(target=_run_signature_flusher).start()
+
+
+def _run_signature_flusher() -> None:
+    interval = config['application']['presign_flush_interval_in_seconds']
+    while True:
+        try:
+            TransferInteractor().submit_pending_transfer_signatures()
+        except Exception:
+            _logger.error(
+                'error while submitting the presigned token '
+                'transfer signatures', exc_info=True)
+        time.sleep(interval)
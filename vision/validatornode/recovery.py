@@ -0,0 +1,36 @@
+"""Module for running the crash-recovery sweeper, which re-enqueues the
+cross-chain transfers orphaned by lost transfer tasks (e.g. if the
+broker has lost messages or a worker has died) at startup and
+periodically afterwards.
+
+"""
+import logging
+import threading
+import time
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.configuration import config
+
+_logger = logging.getLogger(__name__)
+
+
+def run_recovery() -> None:
+    """Run the crash-recovery sweeper.
+
+    """
+    threading.Thread(target=_run_recovery_sweeper).start()
+
+
+def _run_recovery_sweeper() -> None:
+    interval = config['recovery']['interval']
+    while True:
+        try:
+            number_transfers = \
+                TransferInteractor().recover_orphaned_transfers()
+            if number_transfers > 0:
+                _logger.warning(f'{number_transfers} orphaned token transfers '
+                                're-enqueued')
+        except Exception:
+            _logger.critical('error while recovering orphaned token transfers',
+                             exc_info=True)
+        time.sleep(interval)
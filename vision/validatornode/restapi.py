@@ -1,6 +1,8 @@
 """Module that implements the primary validator node's REST API.
 
 """
+import http
+import itertools
 import logging
 import typing
 
@@ -8,6 +10,7 @@ import flask
 import flask_restful  # type: ignore
 import marshmallow
 import marshmallow.fields
+import marshmallow.validate
 from vision.common.blockchains.enums import Blockchain
 from vision.common.restapi import Live
 from vision.common.restapi import bad_request
@@ -20,12 +23,20 @@ from vision.common.restapi import resource_not_found
 
 from vision.validatornode.blockchains.factory import get_blockchain_client
 from vision.validatornode.business.base import DuplicateSignatureError
+from vision.validatornode.business.base import InteractorError
 from vision.validatornode.business.base import InvalidSignatureError
 from vision.validatornode.business.base import InvalidSignerError
 from vision.validatornode.business.base import UnknownTransferError
 from vision.validatornode.business.signatures import SignatureInteractor
 from vision.validatornode.business.transfers import TransferInteractor
 from vision.validatornode.configuration import get_blockchain_config
+from vision.validatornode.metrics import read_metrics
+
+_MAXIMUM_TRANSFER_SIGNATURES = 100
+"""Maximum number of transfer signatures in a single batch request."""
+
+_MAXIMUM_VALIDATOR_NONCES = 100
+"""Maximum number of validator nonces in a single batch request."""
 
 flask_app = flask.Flask(__name__)
 
@@ -79,6 +90,18 @@ class _TransferSignatureSchema(_Schema):
                                       data['source_transaction_id'])
 
 
+class _TransferSignaturesSchema(_Schema):
+    """Validation schema for adding multiple secondary node signatures
+    for cross-chain token transfers. The individual transfer signatures
+    are validated separately.
+
+    """
+    signatures = marshmallow.fields.List(
+        marshmallow.fields.Dict(), required=True,
+        validate=marshmallow.validate.Length(min=1,
+                                             max=_MAXIMUM_TRANSFER_SIGNATURES))
+
+
 class _ValidatorNonceSchema(_Schema):
     """Validation schema for getting the validator nonce for a
     cross-chain token transfer.
@@ -102,6 +125,32 @@ class _ValidatorNonceSchema(_Schema):
                                       data['source_transaction_id'])
 
 
+class _ValidatorNoncesSchema(_Schema):
+    """Validation schema for getting the validator nonces for multiple
+    cross-chain token transfers.
+
+    """
+    transfers = marshmallow.fields.List(
+        marshmallow.fields.Nested(_ValidatorNonceSchema), required=True,
+        validate=marshmallow.validate.Length(min=1,
+                                             max=_MAXIMUM_VALIDATOR_NONCES))
+
+
+class _Metrics(flask_restful.Resource):
+    """RESTful resource for getting the performance metrics collected by
+    all validator node processes.
+
+    """
+    def get(self) -> flask.Response:
+        try:
+            metrics = read_metrics()
+        except Exception:
+            _logger.critical('unable to process a metrics request',
+                             exc_info=True)
+            internal_server_error()
+        return ok_response(metrics)
+
+
 class _TransferSignature(flask_restful.Resource):
     """RESTful resource for adding a secondary node signature for a
     cross-chain token transfer.
@@ -139,6 +188,82 @@ class _TransferSignature(flask_restful.Resource):
         return no_content_response()
 
 
+class _TransferSignatures(flask_restful.Resource):
+    """RESTful resource for adding multiple secondary node signatures
+    for cross-chain token transfers. Each transfer signature gets its
+    own status code (and message) equal to the ones returned by the
+    single transfer signature resource.
+
+    """
+    def post(self) -> flask.Response:
+        arguments = flask_restful.request.json
+        try:
+            signatures = _TransferSignaturesSchema().load(
+                arguments)['signatures']
+        except marshmallow.ValidationError as error:
+            bad_request(error.messages)
+        _logger.info('new transfer signatures request',
+                     extra={'number_signatures': len(signatures)})
+        results: list[typing.Optional[dict[str, typing.Any]]] = []
+        signature_add_requests: list[
+            SignatureInteractor.SecondaryNodeSignatureAddRequest] = []
+        for signature in signatures:
+            try:
+                validated_arguments = _TransferSignatureSchema().load(
+                    signature)
+            except marshmallow.ValidationError as error:
+                results.append(
+                    self.__create_result(http.HTTPStatus.BAD_REQUEST,
+                                         error.messages))
+                continue
+            results.append(None)
+            signature_add_requests.append(
+                SignatureInteractor.SecondaryNodeSignatureAddRequest(
+                    Blockchain(validated_arguments['source_blockchain_id']),
+                    validated_arguments['source_transaction_id'],
+                    validated_arguments['signature']))
+        try:
+            errors = SignatureInteractor().add_secondary_node_signatures(
+                signature_add_requests)
+        except Exception:
+            _logger.critical('unable to process a transfer signatures request',
+                             exc_info=True)
+            internal_server_error()
+        errors_iterator = iter(errors)
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = self.__to_result(next(errors_iterator))
+        return ok_response({'results': results})
+
+    def __create_result(self, status: http.HTTPStatus,
+                        message: typing.Any = None) -> dict[str, typing.Any]:
+        result: dict[str, typing.Any] = {'status_code': status.value}
+        if message is not None:
+            result['message'] = message
+        return result
+
+    def __to_result(
+            self,
+            error: typing.Optional[InteractorError]) -> dict[str, typing.Any]:
+        if error is None:
+            return self.__create_result(http.HTTPStatus.NO_CONTENT)
+        if isinstance(error, DuplicateSignatureError):
+            return self.__create_result(http.HTTPStatus.CONFLICT,
+                                        'Duplicate signature.')
+        if isinstance(error, InvalidSignatureError):
+            return self.__create_result(http.HTTPStatus.BAD_REQUEST,
+                                        'Invalid signature.')
+        if isinstance(error, InvalidSignerError):
+            return self.__create_result(http.HTTPStatus.FORBIDDEN,
+                                        'Invalid signer.')
+        if isinstance(error, UnknownTransferError):
+            return self.__create_result(http.HTTPStatus.NOT_FOUND,
+                                        'Unknown transfer.')
+        _logger.critical('unable to process a transfer signature',
+                         exc_info=error)
+        return self.__create_result(http.HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
 class _ValidatorNonce(flask_restful.Resource):
     """RESTful resource for getting the validator nonce for a
     cross-chain token transfer.
@@ -166,8 +291,51 @@ class _ValidatorNonce(flask_restful.Resource):
         return ok_response({'validator_nonce': validator_nonce})
 
 
+class _ValidatorNonces(flask_restful.Resource):
+    """RESTful resource for getting the validator nonces for multiple
+    cross-chain token transfers. The transfers are given either as
+    repeated query parameters (GET) or as a JSON list (POST). The
+    validator nonce of an unknown transfer is null.
+
+    """
+    def get(self) -> flask.Response:
+        arguments = flask_restful.request.args
+        transfers = [
+            {
+                'source_blockchain_id': source_blockchain_id,
+                'source_transaction_id': source_transaction_id
+            } for source_blockchain_id, source_transaction_id in
+            itertools.zip_longest(arguments.getlist('source_blockchain_id'),
+                                  arguments.getlist('source_transaction_id'))
+        ]
+        return self.__get_validator_nonces({'transfers': transfers})
+
+    def post(self) -> flask.Response:
+        return self.__get_validator_nonces(flask_restful.request.json)
+
+    def __get_validator_nonces(self, arguments: typing.Any) -> flask.Response:
+        try:
+            transfers = _ValidatorNoncesSchema().load(arguments)['transfers']
+            _logger.info('new validator nonces request',
+                         extra={'number_transfers': len(transfers)})
+            validator_nonces = TransferInteractor().get_validator_nonces([
+                (Blockchain(transfer['source_blockchain_id']),
+                 transfer['source_transaction_id']) for transfer in transfers
+            ])
+        except marshmallow.ValidationError as error:
+            bad_request(error.messages)
+        except Exception:
+            _logger.critical('unable to process a validator nonces request',
+                             exc_info=True)
+            internal_server_error()
+        return ok_response({'validator_nonces': validator_nonces})
+
+
 # Register the RESTful resources
 _restful_api = flask_restful.Api(flask_app)
 _restful_api.add_resource(Live, '/health/live')
+_restful_api.add_resource(_Metrics, '/health/metrics')
 _restful_api.add_resource(_TransferSignature, '/transfersignature')
+_restful_api.add_resource(_TransferSignatures, '/transfersignatures')
 _restful_api.add_resource(_ValidatorNonce, '/validatornonce')
+_restful_api.add_resource(_ValidatorNonces, '/validatornonces')
@@ -2,8 +2,10 @@
 secondary validator node.
 
 """
+import abc
 import dataclasses
 import logging
+import threading
 import typing
 
 import requests
@@ -12,7 +14,12 @@ from vision.common.blockchains.enums import Blockchain
 from vision.validatornode.exceptions import ValidatorNodeError
 
 _TRANSFER_SIGNATURE_RESOURCE = 'transfersignature'
+_TRANSFER_SIGNATURES_RESOURCE = 'transfersignatures'
 _VALIDATOR_NONCE_RESOURCE = 'validatornonce'
+_VALIDATOR_NONCES_RESOURCE = 'validatornonces'
+
+_BatchRequest = typing.TypeVar('_BatchRequest')
+_BatchResult = typing.TypeVar('_BatchResult')
 
 _logger = logging.getLogger(__name__)
 
@@ -148,6 +155,59 @@ class PrimaryNodeClient:
         assert isinstance(validator_nonce, int)
         return validator_nonce
 
+    def get_validator_nonces(
+            self, get_requests: list[ValidatorNonceGetRequest]) \
+            -> list[typing.Optional[int]]:
+        """Get the validator nonces for multiple cross-chain token
+        transfers from the primary validator node in a single request.
+
+        Parameters
+        ----------
+        get_requests : list of ValidatorNonceGetRequest
+            The request data for each transfer.
+
+        Returns
+        -------
+        list of int or None
+            For each transfer (in the order of the requests), either
+            its validator nonce or None if the primary validator node
+            does not know the transfer.
+
+        Raises
+        ------
+        PrimaryNodeClientError
+            If an error occurs during getting the validator nonces.
+
+        """
+        url = f'{self.__primary_node_url}{_VALIDATOR_NONCES_RESOURCE}'
+        extra_info: dict[str, typing.Any] = {
+            'number_transfers': len(get_requests),
+            'url': url,
+            'timeout': self.__timeout
+        }
+        json_request = {
+            'transfers': [{
+                'source_blockchain_id': request.source_blockchain.value,
+                'source_transaction_id': request.source_transaction_id
+            } for request in get_requests]
+        }
+        response = self.__send_post_request(url, json_request, extra_info)
+        extra_info |= {'status_code': response.status_code}
+        json_response = self.__decode_json_response(response, extra_info)
+        if response.status_code != requests.codes.ok:
+            self.__extract_response_message(json_response, extra_info)
+            raise PrimaryNodeClientError('unable to get validator nonces',
+                                         **extra_info)
+        validator_nonces = json_response.get('validator_nonces')
+        if (not isinstance(validator_nonces, list)
+                or len(validator_nonces) != len(get_requests)
+                or not all(validator_nonce is None
+                           or isinstance(validator_nonce, int)
+                           for validator_nonce in validator_nonces)):
+            raise PrimaryNodeClientError('invalid validator nonces response',
+                                         **extra_info)
+        return validator_nonces
+
     @dataclasses.dataclass
     class TransferSignaturePostRequest:
         """Request data for posting the signature for a cross-chain
@@ -199,35 +259,104 @@ class PrimaryNodeClient:
         """
         url = (f'{self.__primary_node_url}{_TRANSFER_SIGNATURE_RESOURCE}')
         extra_info = vars(request) | {'url': url, 'timeout': self.__timeout}
-        json_request = {
-            'source_blockchain_id': request.source_blockchain.value,
-            'source_transaction_id': request.source_transaction_id,
-            'signature': request.signature
-        }
+        json_request = self.__to_transfer_signature_json(request)
         response = self.__send_post_request(url, json_request, extra_info)
         if response.status_code != requests.codes.no_content:
             extra_info |= {'status_code': response.status_code}
             json_response = self.__decode_json_response(response, extra_info)
             response_message = self.__extract_response_message(
                 json_response, extra_info)
-            if (response.status_code == requests.codes.bad_request
-                    and response_message is not None
-                    and 'Invalid signature.' in response_message):
-                raise PrimaryNodeInvalidSignatureError(**extra_info)
-            if response.status_code == requests.codes.conflict:
-                assert response_message is not None
-                assert 'Duplicate signature.' in response_message
-                raise PrimaryNodeDuplicateSignatureError(**extra_info)
-            if response.status_code == requests.codes.forbidden:
-                assert response_message is not None
-                assert 'Invalid signer.' in response_message
-                raise PrimaryNodeInvalidSignerError(**extra_info)
-            if response.status_code == requests.codes.not_found:
-                assert response_message is not None
-                assert 'Unknown transfer.' in response_message
-                raise PrimaryNodeUnknownTransferError(**extra_info)
-            raise PrimaryNodeClientError('unable to post a transfer signature',
+            raise self.__create_transfer_signature_error(
+                response.status_code, response_message, extra_info)
+
+    def post_transfer_signatures(
+            self, post_requests: list[TransferSignaturePostRequest]) \
+            -> list[typing.Optional[PrimaryNodeClientError]]:
+        """Post the signatures for multiple cross-chain token transfers
+        to the primary validator node in a single request.
+
+        Parameters
+        ----------
+        post_requests : list of TransferSignaturePostRequest
+            The request data for each transfer signature.
+
+        Returns
+        -------
+        list of PrimaryNodeClientError or None
+            For each transfer signature (in the order of the requests),
+            either None if the signature has been accepted or the error
+            that would have been raised by post_transfer_signature.
+
+        Raises
+        ------
+        PrimaryNodeClientError
+            If the transfer signatures cannot be posted at all.
+
+        """
+        url = f'{self.__primary_node_url}{_TRANSFER_SIGNATURES_RESOURCE}'
+        extra_info: dict[str, typing.Any] = {
+            'number_signatures': len(post_requests),
+            'url': url,
+            'timeout': self.__timeout
+        }
+        json_request = {
+            'signatures': [
+                self.__to_transfer_signature_json(request)
+                for request in post_requests
+            ]
+        }
+        response = self.__send_post_request(url, json_request, extra_info)
+        extra_info |= {'status_code': response.status_code}
+        json_response = self.__decode_json_response(response, extra_info)
+        if response.status_code != requests.codes.ok:
+            self.__extract_response_message(json_response, extra_info)
+            raise PrimaryNodeClientError('unable to post transfer signatures',
                                          **extra_info)
+        results = json_response.get('results')
+        if (not isinstance(results, list) or len(results) != len(post_requests)
+                or not all(isinstance(result, dict) for result in results)):
+            raise PrimaryNodeClientError(
+                'invalid transfer signatures response', **extra_info)
+        errors: list[typing.Optional[PrimaryNodeClientError]] = []
+        for request, result in zip(post_requests, results):
+            status_code = result.get('status_code')
+            if status_code == requests.codes.no_content:
+                errors.append(None)
+                continue
+            item_extra_info = vars(request) | {
+                'url': url,
+                'status_code': status_code
+            }
+            response_message = self.__extract_response_message(
+                result, item_extra_info)
+            errors.append(
+                self.__create_transfer_signature_error(status_code,
+                                                       response_message,
+                                                       item_extra_info))
+        return errors
+
+    def __create_transfer_signature_error(
+            self, status_code: typing.Optional[int],
+            response_message: typing.Optional[str],
+            extra_info: dict[str, typing.Any]) -> PrimaryNodeClientError:
+        if (status_code == requests.codes.bad_request
+                and response_message is not None
+                and 'Invalid signature.' in response_message):
+            return PrimaryNodeInvalidSignatureError(**extra_info)
+        if status_code == requests.codes.conflict:
+            assert response_message is not None
+            assert 'Duplicate signature.' in response_message
+            return PrimaryNodeDuplicateSignatureError(**extra_info)
+        if status_code == requests.codes.forbidden:
+            assert response_message is not None
+            assert 'Invalid signer.' in response_message
+            return PrimaryNodeInvalidSignerError(**extra_info)
+        if status_code == requests.codes.not_found:
+            assert response_message is not None
+            assert 'Unknown transfer.' in response_message
+            return PrimaryNodeUnknownTransferError(**extra_info)
+        return PrimaryNodeClientError('unable to post a transfer signature',
+                                      **extra_info)
 
     def __decode_json_response(self, response: requests.Response,
                                extra_info: dict[str, typing.Any]) -> dict:
@@ -269,3 +398,202 @@ class PrimaryNodeClient:
             raise PrimaryNodeClientError('POST request timeout', **extra_info)
         except requests.RequestException:
             raise PrimaryNodeClientError('POST request error', **extra_info)
+
+    def __to_transfer_signature_json(
+            self,
+            request: TransferSignaturePostRequest) -> dict[str, typing.Any]:
+        return {
+            'source_blockchain_id': request.source_blockchain.value,
+            'source_transaction_id': request.source_transaction_id,
+            'signature': request.signature
+        }
+
+
+class _Batcher(abc.ABC, typing.Generic[_BatchRequest, _BatchResult]):
+    """Base class for coalescing the requests to the primary validator
+    node issued concurrently within a time window into a single bulk
+    request. The first request of a batch waits for the time window to
+    expire (or the batch to be full) and then issues the bulk request on
+    behalf of all requests of the batch. Only the requests issued by
+    the threads of the same process can be coalesced.
+
+    """
+    def __init__(self, window: float, maximum_batch_size: int):
+        self.__window = window
+        self.__maximum_batch_size = maximum_batch_size
+        self.__lock = threading.Lock()
+        self.__batch: typing.Optional[_Batch] = None
+
+    def _submit(self, request: _BatchRequest) -> _BatchResult:
+        with self.__lock:
+            batch = self.__batch
+            is_leader = batch is None
+            if batch is None:
+                batch = self.__batch = _Batch()
+            index = len(batch.requests)
+            batch.requests.append(request)
+            if len(batch.requests) >= self.__maximum_batch_size:
+                self.__batch = None
+                batch.full.set()
+        if is_leader:
+            self.__process_batch(batch)
+        else:
+            batch.processed.wait()
+        result = batch.results[index]
+        if isinstance(result, PrimaryNodeClientError):
+            raise result
+        return result
+
+    @abc.abstractmethod
+    def _process_requests(
+        self, requests_: list[_BatchRequest]
+    ) -> list[typing.Union[_BatchResult, PrimaryNodeClientError]]:
+        pass  # pragma: no cover
+
+    def __process_batch(self, batch: '_Batch') -> None:
+        batch.full.wait(self.__window)
+        with self.__lock:
+            if self.__batch is batch:
+                self.__batch = None
+        number_requests = len(batch.requests)
+        results: list[typing.Any] = [
+            PrimaryNodeClientError('unable to process a batch of requests',
+                                   number_requests=number_requests)
+        ] * number_requests
+        try:
+            results = self._process_requests(batch.requests)
+        except PrimaryNodeClientError as error:
+            results = [error] * number_requests
+        except Exception:
+            _logger.error('unable to process a batch of requests',
+                          extra={'number_requests': number_requests},
+                          exc_info=True)
+        finally:
+            batch.results = results
+            batch.processed.set()
+
+
+class TransferSignatureBatcher(
+        _Batcher[PrimaryNodeClient.TransferSignaturePostRequest, None]):
+    """Wrapper of a primary node client that coalesces the transfer
+    signatures posted concurrently within a time window into a single
+    request to the primary validator node.
+
+    """
+    def __init__(self, primary_node_client: PrimaryNodeClient, window: float,
+                 maximum_batch_size: int = 100):
+        """Initialize a transfer signature batcher instance.
+
+        Parameters
+        ----------
+        primary_node_client : PrimaryNodeClient
+            The client used for posting the coalesced transfer
+            signatures.
+        window : float
+            The maximum time (in seconds) a transfer signature waits
+            for other transfer signatures to be posted with.
+        maximum_batch_size : int, optional
+            The maximum number of transfer signatures posted in a
+            single request (default: 100).
+
+        """
+        super().__init__(window, maximum_batch_size)
+        self.__primary_node_client = primary_node_client
+
+    def post_transfer_signature(
+            self,
+            request: PrimaryNodeClient.TransferSignaturePostRequest) -> None:
+        """Post the signature for a cross-chain token transfer to the
+        primary validator node together with the other transfer
+        signatures posted within the same time window.
+
+        Parameters
+        ----------
+        request : PrimaryNodeClient.TransferSignaturePostRequest
+            The request data.
+
+        Raises
+        ------
+        PrimaryNodeClientError
+            The same errors as PrimaryNodeClient.post_transfer_signature.
+
+        """
+        self._submit(request)
+
+    def _process_requests(
+        self, requests_: list[PrimaryNodeClient.TransferSignaturePostRequest]
+    ) -> list[typing.Optional[PrimaryNodeClientError]]:
+        # Docstring inherited
+        return self.__primary_node_client.post_transfer_signatures(requests_)
+
+
+class ValidatorNonceBatcher(
+        _Batcher[PrimaryNodeClient.ValidatorNonceGetRequest, int]):
+    """Wrapper of a primary node client that coalesces the validator
+    nonces requested concurrently within a time window into a single
+    request to the primary validator node.
+
+    """
+    def __init__(self, primary_node_client: PrimaryNodeClient, window: float,
+                 maximum_batch_size: int = 100):
+        """Initialize a validator nonce batcher instance.
+
+        Parameters
+        ----------
+        primary_node_client : PrimaryNodeClient
+            The client used for getting the coalesced validator nonces.
+        window : float
+            The maximum time (in seconds) a validator nonce request
+            waits for other validator nonce requests to be sent with.
+        maximum_batch_size : int, optional
+            The maximum number of validator nonces requested in a
+            single request (default: 100).
+
+        """
+        super().__init__(window, maximum_batch_size)
+        self.__primary_node_client = primary_node_client
+
+    def get_validator_nonce(
+            self, request: PrimaryNodeClient.ValidatorNonceGetRequest) -> int:
+        """Get the validator nonce for a cross-chain token transfer from
+        the primary validator node together with the other validator
+        nonces requested within the same time window.
+
+        Parameters
+        ----------
+        request : PrimaryNodeClient.ValidatorNonceGetRequest
+            The request data.
+
+        Returns
+        -------
+        int
+            The validator nonce.
+
+        Raises
+        ------
+        PrimaryNodeClientError
+            The same errors as PrimaryNodeClient.get_validator_nonce.
+
+        """
+        return self._submit(request)
+
+    def _process_requests(
+        self, requests_: list[PrimaryNodeClient.ValidatorNonceGetRequest]
+    ) -> list[typing.Union[int, PrimaryNodeClientError]]:
+        # Docstring inherited
+        validator_nonces = self.__primary_node_client.get_validator_nonces(
+            requests_)
+        return [
+            PrimaryNodeUnknownTransferError(**vars(request))
+            if validator_nonce is None else validator_nonce
+            for request, validator_nonce in zip(requests_, validator_nonces)
+        ]
+
+
+@dataclasses.dataclass
+class _Batch:
+    requests: list[typing.Any] = dataclasses.field(default_factory=list)
+    results: list[typing.Any] = dataclasses.field(default_factory=list)
+    full: threading.Event = dataclasses.field(default_factory=threading.Event)
+    processed: threading.Event = dataclasses.field(
+        default_factory=threading.Event)
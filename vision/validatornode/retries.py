@@ -0,0 +1,148 @@
+"""Module for determining the retry intervals of the Validator Node's
+Celery tasks depending on the reason of a retry.
+
+"""
+import dataclasses
+import enum
+import random
+import typing
+
+import sqlalchemy.exc
+from vision.common.blockchains.base import BlockchainUtilitiesError
+from vision.common.blockchains.base import ResultsNotMatchingError
+
+from vision.validatornode.blockchains.base import BlockchainClientError
+from vision.validatornode.database.exceptions import DatabaseError
+from vision.validatornode.restclient import PrimaryNodeClientError
+
+
+class RetryReason(enum.Enum):
+    """Enumeration of possible reasons for retrying a task.
+
+    """
+    TRANSITORY_STATE = 0
+    RPC_FAILURE = 1
+    PRIMARY_NODE_UNREACHABLE = 2
+    DATABASE_CONFLICT = 3
+    UNKNOWN_ERROR = 4
+
+    def to_config_key(self) -> str:
+        """Get the key of the retry reason's policy in the
+        configuration.
+
+        Returns
+        -------
+        str
+            The configuration key of the retry reason.
+
+        """
+        return self.name.lower()
+
+
+_ERROR_CLASSIFICATIONS: typing.Final[tuple[
+    tuple[tuple[type[BaseException], ...], RetryReason],
+    ...]] = (((BlockchainClientError, BlockchainUtilitiesError,
+               ResultsNotMatchingError),
+              RetryReason.RPC_FAILURE), ((PrimaryNodeClientError, ),
+                                         RetryReason.PRIMARY_NODE_UNREACHABLE),
+             ((DatabaseError, sqlalchemy.exc.OperationalError,
+               sqlalchemy.exc.IntegrityError), RetryReason.DATABASE_CONFLICT))
+"""Error types and their corresponding retry reasons."""
+
+
+@dataclasses.dataclass
+class RetryPolicy:
+    """Exponential backoff policy for retrying a task.
+
+    Attributes
+    ----------
+    backoff_factor : float
+        The factor by which the retry interval grows with each
+        further attempt.
+    max_interval : int
+        The maximum retry interval (in seconds).
+    jitter : float
+        The maximum fraction (between 0 and 1) by which the retry
+        interval is randomly shortened.
+
+    """
+    backoff_factor: float
+    max_interval: int
+    jitter: float
+
+    @staticmethod
+    def from_config(policy_config: dict[str, typing.Any]) -> 'RetryPolicy':
+        """Create a retry policy from its configuration.
+
+        Parameters
+        ----------
+        policy_config : dict
+            The configuration entry of the retry policy.
+
+        Returns
+        -------
+        RetryPolicy
+            The created retry policy.
+
+        """
+        return RetryPolicy(policy_config['backoff_factor'],
+                           policy_config['max_interval_in_seconds'],
+                           policy_config['jitter'])
+
+    def get_interval(self, base_interval: int, attempt: int) -> int:
+        """Get the interval until the next attempt of a task.
+
+        Parameters
+        ----------
+        base_interval : int
+            The retry interval (in seconds) after the first attempt.
+        attempt : int
+            The number of retries of the task so far.
+
+        Returns
+        -------
+        int
+            The retry interval (in seconds).
+
+        """
+        # The exponent is bounded to prevent a float overflow for
+        # tasks that have been retried for a very long time
+        interval = min(float(self.max_interval),
+                       base_interval * self.backoff_factor**min(attempt, 64))
+        # Randomly shortening the interval spreads out the retries of
+        # tasks that have failed at the same time
+        interval *= 1 - self.jitter * random.random()
+        return max(1, round(interval))
+
+
+def classify_error(error: typing.Optional[BaseException]) -> RetryReason:
+    """Determine the reason for retrying a task.
+
+    Parameters
+    ----------
+    error : BaseException or None
+        The error raised by the task, or None if the task has not been
+        completed yet without any error.
+
+    Returns
+    -------
+    RetryReason
+        The reason for retrying the task. The innermost classifiable
+        error of the error chain is decisive.
+
+    """
+    if error is None:
+        return RetryReason.TRANSITORY_STATE
+    retry_reason = RetryReason.UNKNOWN_ERROR
+    visited_errors: set[int] = set()
+    current_error: typing.Optional[BaseException] = error
+    while (current_error is not None
+           and id(current_error) not in visited_errors):
+        visited_errors.add(id(current_error))
+        for error_types, error_retry_reason in _ERROR_CLASSIFICATIONS:
+            if isinstance(current_error, error_types):
+                retry_reason = error_retry_reason
+                break
+        current_error = (current_error.__cause__ if current_error.__cause__
+                         is not None else current_error.__context__)
+    return retry_reason
@@ -0,0 +1,39 @@
+"""Module for running the database-backed transfer scheduler, which
+executes the scheduled processing steps of the cross-chain transfers
+instead of the Celery transfer tasks if enabled.
+
+"""
+import logging
+import threading
+import time
+
+from vision.validatornode.business.transfers import TransferInteractor
+from vision.validatornode.configuration import config
+from vision.validatornode.database.enums import TransferStep
+
+_logger = logging.getLogger(__name__)
+
+
+def run_scheduler() -> None:
+    """Run the configured number of transfer scheduler workers.
+
+    """
+    for _ in range(config['scheduler']['number_threads']):
+        threading.Thread(target=_run_scheduler_worker).start()
+
+
+def _run_scheduler_worker() -> None:
+    interval = config['scheduler']['interval']
+    while True:
+        number_transfers = 0
+        for step in TransferStep:
+            try:
+                number_transfers += \
+                    TransferInteractor().process_scheduled_transfers(step)
+            except Exception:
+                _logger.critical(
+                    f'error while processing scheduled {step.name} steps',
+                    exc_info=True)
+        if number_transfers == 0:
+            # Only wait if no transfer has been due
+            time.sleep(interval)